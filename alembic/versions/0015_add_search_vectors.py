@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0015_search_vectors"
+down_revision = "0014_doc_suppress"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("research_chunks", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.add_column("intel_article_sections", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE research_chunks c
+        SET search_vector =
+            setweight(to_tsvector('english', coalesce(d.title, '')), 'A') ||
+            setweight(
+                to_tsvector(
+                    'english',
+                    coalesce(d.summary_short, '') || ' ' ||
+                    coalesce(d.why_it_matters, '') || ' ' ||
+                    coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.topic_tags)), ' '), '') || ' ' ||
+                    coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.decision_domains)), ' '), '')
+                ),
+                'B'
+            ) ||
+            setweight(to_tsvector('english', coalesce(c.content, '')), 'C') ||
+            setweight(
+                to_tsvector(
+                    'english',
+                    coalesce(
+                        (
+                            SELECT string_agg(i.text, ' ')
+                            FROM research_document_insights i
+                            WHERE i.document_id = c.document_id
+                              AND i.chunk_id = c.chunk_id
+                        ),
+                        ''
+                    )
+                ),
+                'D'
+            )
+        FROM research_documents d
+        WHERE d.document_id = c.document_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE intel_article_sections
+        SET search_vector = to_tsvector('english', coalesce(content, ''))
+        """
+    )
+
+    op.create_index(
+        "ix_research_chunks_search_vector",
+        "research_chunks",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_intel_article_sections_search_vector",
+        "intel_article_sections",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.execute("DROP INDEX IF EXISTS ix_research_chunks_search")
+    op.execute("DROP INDEX IF EXISTS ix_intel_article_sections_search")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX ix_intel_article_sections_search
+        ON intel_article_sections
+        USING GIN (
+            to_tsvector('english', coalesce(content, ''))
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX ix_research_chunks_search
+        ON research_chunks
+        USING GIN (
+            to_tsvector('english', coalesce(content, ''))
+        )
+        """
+    )
+    op.drop_index("ix_intel_article_sections_search_vector", table_name="intel_article_sections")
+    op.drop_index("ix_research_chunks_search_vector", table_name="research_chunks")
+    op.drop_column("intel_article_sections", "search_vector")
+    op.drop_column("research_chunks", "search_vector")
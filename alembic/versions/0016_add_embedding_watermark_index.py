@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0016_embedding_watermark"
+down_revision = "0015_search_vectors"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_research_embeddings_model_created",
+        "research_embeddings",
+        ["embedding_model_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_research_embeddings_model_created", table_name="research_embeddings")
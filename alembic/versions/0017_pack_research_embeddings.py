@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import struct
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0017_packed_embeddings"
+down_revision = "0016_embedding_watermark"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    op.add_column("research_embeddings", sa.Column("vector_packed", sa.LargeBinary(), nullable=True))
+    op.add_column("research_embeddings", sa.Column("vector_encoding", sa.Text(), nullable=True))
+    op.add_column("research_embeddings", sa.Column("vector_scale", sa.Float(), nullable=True))
+    op.alter_column("research_embeddings", "vector", nullable=True)
+    op.create_check_constraint(
+        "ck_research_embeddings_vector_present",
+        "research_embeddings",
+        "vector IS NOT NULL OR vector_packed IS NOT NULL",
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    select_sql = sa.text(
+        """
+        SELECT document_id, chunk_id, embedding_model_id, vector_packed, vector_encoding, vector_scale
+        FROM research_embeddings
+        WHERE vector IS NULL
+          AND vector_packed IS NOT NULL
+        LIMIT :limit
+        """
+    )
+    update_sql = sa.text(
+        """
+        UPDATE research_embeddings
+        SET vector = CAST(:vector AS jsonb),
+            vector_packed = NULL
+        WHERE document_id = :document_id
+          AND chunk_id = :chunk_id
+          AND embedding_model_id = :embedding_model_id
+        """
+    )
+    formats = {"float32": ("f", 4), "float16": ("e", 2), "int8": ("b", 1)}
+    while True:
+        rows = conn.execute(select_sql, {"limit": BATCH_SIZE}).mappings().all()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            code, width = formats.get(row["vector_encoding"] or "float32", formats["float32"])
+            data = bytes(row["vector_packed"])
+            values = list(struct.unpack(f"<{len(data) // width}{code}", data))
+            if row["vector_encoding"] == "int8":
+                scale = float(row["vector_scale"] or 1.0)
+                values = [value * scale for value in values]
+            updates.append(
+                {
+                    "document_id": row["document_id"],
+                    "chunk_id": row["chunk_id"],
+                    "embedding_model_id": row["embedding_model_id"],
+                    "vector": json.dumps(values),
+                }
+            )
+        conn.execute(update_sql, updates)
+
+    op.drop_constraint("ck_research_embeddings_vector_present", "research_embeddings", type_="check")
+    op.alter_column("research_embeddings", "vector", nullable=False)
+    op.drop_column("research_embeddings", "vector_scale")
+    op.drop_column("research_embeddings", "vector_encoding")
+    op.drop_column("research_embeddings", "vector_packed")
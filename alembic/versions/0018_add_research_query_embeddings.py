@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0018_query_embeddings"
+down_revision = "0017_packed_embeddings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "research_query_embeddings",
+        sa.Column("embedding_model_id", sa.Text(), nullable=False),
+        sa.Column("query_hash", sa.Text(), nullable=False),
+        sa.Column("query_text", sa.Text(), nullable=False),
+        sa.Column("vector_packed", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("embedding_model_id", "query_hash"),
+    )
+    op.create_index(
+        "ix_research_query_embeddings_expires_at",
+        "research_query_embeddings",
+        ["expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_research_query_embeddings_expires_at", table_name="research_query_embeddings")
+    op.drop_table("research_query_embeddings")
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0020_query_stage_timings"
+down_revision = "0019_corpus_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "research_query_logs",
+        sa.Column("endpoint", sa.Text(), nullable=False, server_default=sa.text("'context_pack'")),
+    )
+    op.add_column(
+        "research_query_logs",
+        sa.Column("stage_timings", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+    )
+    op.create_index(
+        "ix_research_query_logs_topic_endpoint_created",
+        "research_query_logs",
+        ["topic_key", "endpoint", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_research_query_logs_topic_endpoint_created", table_name="research_query_logs")
+    op.drop_column("research_query_logs", "stage_timings")
+    op.drop_column("research_query_logs", "endpoint")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0021_document_filter_indexes"
+down_revision = "0020_query_stage_timings"
+branch_labels = None
+depends_on = None
+
+_PARTIAL_INDEXES = {
+    "ix_research_documents_with_metrics": "metrics <> '[]'::jsonb",
+    "ix_research_documents_with_quotes": "notable_quotes <> '[]'::jsonb",
+    "ix_research_documents_with_recommendations": "recommendations <> '[]'::jsonb",
+    "ix_research_documents_with_tradeoffs": "tradeoffs <> '[]'::jsonb",
+    "ix_research_documents_internal_authoritative": "source_class = 'internal_authoritative'",
+}
+
+
+def upgrade() -> None:
+    op.create_index("ix_research_documents_published_at", "research_documents", ["published_at"])
+    op.create_index(
+        "ix_research_documents_recency",
+        "research_documents",
+        [sa.text("coalesce(published_at, discovered_at)")],
+    )
+    for name, predicate in _PARTIAL_INDEXES.items():
+        op.create_index(
+            name,
+            "research_documents",
+            ["source_id", "document_id"],
+            postgresql_where=sa.text(predicate),
+        )
+
+
+def downgrade() -> None:
+    for name in reversed(list(_PARTIAL_INDEXES)):
+        op.drop_index(name, table_name="research_documents")
+    op.drop_index("ix_research_documents_recency", table_name="research_documents")
+    op.drop_index("ix_research_documents_published_at", table_name="research_documents")
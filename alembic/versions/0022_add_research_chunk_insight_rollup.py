@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0022_chunk_insight_rollup"
+down_revision = "0021_document_filter_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "research_chunk_insight_rollup",
+        sa.Column(
+            "document_id",
+            sa.Text(),
+            sa.ForeignKey("research_documents.document_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("chunk_id", sa.Text(), primary_key=True),
+        sa.Column("insight_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("max_confidence", sa.Float(), nullable=False, server_default=sa.text("0.0")),
+        sa.Column("max_evidence_quality", sa.Float(), nullable=False, server_default=sa.text("0.0")),
+        sa.Column("max_freshness_score", sa.Float(), nullable=False, server_default=sa.text("0.0")),
+        sa.Column("max_coverage_score", sa.Float(), nullable=False, server_default=sa.text("0.0")),
+        sa.Column("corroboration_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("contradiction_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("insight_types", postgresql.ARRAY(sa.Text()), nullable=False, server_default=sa.text("ARRAY[]::text[]")),
+        sa.Column("problem_tags", postgresql.ARRAY(sa.Text()), nullable=False, server_default=sa.text("ARRAY[]::text[]")),
+        sa.Column("intervention_tags", postgresql.ARRAY(sa.Text()), nullable=False, server_default=sa.text("ARRAY[]::text[]")),
+        sa.Column("tradeoff_dimensions", postgresql.ARRAY(sa.Text()), nullable=False, server_default=sa.text("ARRAY[]::text[]")),
+        sa.Column("insight_text", sa.Text(), nullable=False, server_default=sa.text("''")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.execute(
+        """
+        INSERT INTO research_chunk_insight_rollup (
+            document_id, chunk_id, insight_count, max_confidence, max_evidence_quality, max_freshness_score,
+            max_coverage_score, corroboration_count, contradiction_count, insight_types, problem_tags,
+            intervention_tags, tradeoff_dimensions, insight_text
+        )
+        SELECT
+            i.document_id,
+            i.chunk_id,
+            count(*) AS insight_count,
+            max(i.confidence) AS max_confidence,
+            max(i.evidence_quality) AS max_evidence_quality,
+            max(i.freshness_score) AS max_freshness_score,
+            max(i.coverage_score) AS max_coverage_score,
+            max(i.corroboration_count) AS corroboration_count,
+            max(i.contradiction_count) AS contradiction_count,
+            array_agg(DISTINCT i.insight_type ORDER BY i.insight_type) AS insight_types,
+            ARRAY(
+                SELECT DISTINCT tag.value
+                FROM research_document_insights t,
+                     jsonb_array_elements_text(coalesce(t.problem_tags, '[]'::jsonb)) AS tag(value)
+                WHERE t.document_id = i.document_id AND t.chunk_id = i.chunk_id
+                ORDER BY tag.value
+            ) AS problem_tags,
+            ARRAY(
+                SELECT DISTINCT tag.value
+                FROM research_document_insights t,
+                     jsonb_array_elements_text(coalesce(t.intervention_tags, '[]'::jsonb)) AS tag(value)
+                WHERE t.document_id = i.document_id AND t.chunk_id = i.chunk_id
+                ORDER BY tag.value
+            ) AS intervention_tags,
+            ARRAY(
+                SELECT DISTINCT tag.value
+                FROM research_document_insights t,
+                     jsonb_array_elements_text(coalesce(t.tradeoff_dimensions, '[]'::jsonb)) AS tag(value)
+                WHERE t.document_id = i.document_id AND t.chunk_id = i.chunk_id
+                ORDER BY tag.value
+            ) AS tradeoff_dimensions,
+            string_agg(i.text, ' ' ORDER BY i.created_at, i.insight_id) AS insight_text
+        FROM research_document_insights i
+        GROUP BY i.document_id, i.chunk_id
+        """
+    )
+    for column in ("insight_types", "problem_tags", "intervention_tags", "tradeoff_dimensions"):
+        op.create_index(
+            f"ix_research_chunk_insight_rollup_{column}",
+            "research_chunk_insight_rollup",
+            [column],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("research_chunk_insight_rollup")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0023_topic_key_denormalization"
+down_revision = "0022_chunk_insight_rollup"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("research_documents", sa.Column("topic_key", sa.Text(), nullable=True))
+    op.add_column("research_chunks", sa.Column("topic_key", sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE research_documents d
+        SET topic_key = s.topic_key
+        FROM research_sources s
+        WHERE s.source_id = d.source_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE research_chunks c
+        SET topic_key = d.topic_key
+        FROM research_documents d
+        WHERE d.document_id = c.document_id
+        """
+    )
+    op.alter_column("research_documents", "topic_key", nullable=False)
+    op.alter_column("research_chunks", "topic_key", nullable=False)
+    op.create_index(
+        "ix_research_documents_topic_status",
+        "research_documents",
+        ["topic_key", "status"],
+    )
+    op.create_index(
+        "ix_research_documents_topic_live_recency",
+        "research_documents",
+        ["topic_key", sa.text("coalesce(published_at, discovered_at) DESC NULLS LAST")],
+        postgresql_where=sa.text("status IN ('embedded', 'extracted', 'enriched') AND NOT suppressed"),
+    )
+    op.create_index(
+        "ix_research_chunks_topic_key",
+        "research_chunks",
+        ["topic_key", "document_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_research_chunks_topic_key", table_name="research_chunks")
+    op.drop_index("ix_research_documents_topic_live_recency", table_name="research_documents")
+    op.drop_index("ix_research_documents_topic_status", table_name="research_documents")
+    op.drop_column("research_chunks", "topic_key")
+    op.drop_column("research_documents", "topic_key")
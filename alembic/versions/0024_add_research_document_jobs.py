@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0024_research_document_jobs"
+down_revision = "0023_topic_key_denormalization"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "research_ingestion_runs",
+        sa.Column("jobs_enqueued_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "research_document_jobs",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "run_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("research_ingestion_runs.run_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("source_id", sa.Text(), nullable=False),
+        sa.Column("item_url", sa.Text(), nullable=False),
+        sa.Column("item", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("source", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("status", sa.Text(), nullable=False, server_default=sa.text("'queued'")),
+        sa.Column("outcome", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("lease_owner", sa.Text(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("run_id", "source_id", "item_url", name="uq_research_document_jobs_run_item"),
+    )
+    op.create_index(
+        "ix_research_document_jobs_claimable",
+        "research_document_jobs",
+        ["available_at", "created_at"],
+        postgresql_where=sa.text("status IN ('queued', 'retry')"),
+    )
+    op.create_index(
+        "ix_research_document_jobs_leased",
+        "research_document_jobs",
+        ["lease_expires_at"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+    op.create_index("ix_research_document_jobs_run_status", "research_document_jobs", ["run_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_research_document_jobs_run_status", table_name="research_document_jobs")
+    op.drop_index("ix_research_document_jobs_leased", table_name="research_document_jobs")
+    op.drop_index("ix_research_document_jobs_claimable", table_name="research_document_jobs")
+    op.drop_table("research_document_jobs")
+    op.drop_column("research_ingestion_runs", "jobs_enqueued_at")
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0025_research_robots_policies"
+down_revision = "0024_research_document_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "research_ingestion_runs",
+        sa.Column("metrics", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'{}'::jsonb")),
+    )
+    op.create_table(
+        "research_robots_policies",
+        sa.Column("origin", sa.Text(), primary_key=True),
+        sa.Column("status_code", sa.Integer(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False, server_default=sa.text("''")),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_research_robots_policies_expires_at", "research_robots_policies", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_research_robots_policies_expires_at", table_name="research_robots_policies")
+    op.drop_table("research_robots_policies")
+    op.drop_column("research_ingestion_runs", "metrics")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0026_research_conditional_get"
+down_revision = "0025_research_robots_policies"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("research_source_policies", sa.Column("listing_etag", sa.Text(), nullable=True))
+    op.add_column("research_source_policies", sa.Column("listing_last_modified", sa.Text(), nullable=True))
+    op.add_column(
+        "research_source_policies",
+        sa.Column("listing_bytes", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("research_source_policies", "listing_bytes")
+    op.drop_column("research_source_policies", "listing_last_modified")
+    op.drop_column("research_source_policies", "listing_etag")
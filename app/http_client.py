@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from app.metrics import REGISTRY, Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+# Named process-wide clients: "fetch" for source/article fetches (redirects followed), "openai"
+# for embedding and chat completion calls. Each keeps its own keep-alive pool per origin.
+_CLIENT_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "fetch": {"follow_redirects": True, "max_redirects": 5, "timeout": 20.0},
+    "openai": {"follow_redirects": False, "max_redirects": 0, "timeout": 30.0},
+}
+
+_CLIENTS: Dict[str, "SharedHTTPClient"] = {}
+_CLIENTS_LOCK = threading.Lock()
+_HTTP2_WARNED = False
+
+
+def _get_int_env(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _get_float_env(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class DNSCache:
+    # getaddrinfo results per (host, port) for HTTP_CLIENT_DNS_CACHE_TTL_S; a failed connect to
+    # every cached address drops the entry so the next attempt resolves again.
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses: List[str] = []
+        for info in infos:
+            address = str(info[4][0])
+            if address not in addresses:
+                addresses.append(address)
+        with self._lock:
+            self._entries[(host, port)] = (now + self.ttl_seconds, addresses)
+        return addresses
+
+    def forget(self, host: str, port: int) -> None:
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+class _CachingNetworkBackend(httpcore.SyncBackend):
+    # TLS still uses the origin host name for SNI and certificate checks; only the TCP connect
+    # goes to the cached address.
+    def __init__(self, cache: DNSCache) -> None:
+        self._cache = cache
+
+    def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None, local_address: Optional[str] = None, socket_options: Any = None) -> httpcore.NetworkStream:
+        try:
+            addresses = self._cache.resolve(host, port)
+        except OSError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return super().connect_tcp(address, port, timeout=timeout, local_address=local_address, socket_options=socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_error = exc
+        self._cache.forget(host, port)
+        raise last_error or httpcore.ConnectError(f"no addresses for {host}")
+
+
+# httpcore exception -> httpx exception, most specific first, as httpx's own transport maps them.
+_HTTPCORE_ERRORS: List[Tuple[type, type]] = [
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+]
+
+
+@contextmanager
+def _httpx_errors() -> Iterator[None]:
+    try:
+        yield
+    except Exception as exc:
+        for source, target in _HTTPCORE_ERRORS:
+            if isinstance(exc, source):
+                raise target(str(exc)) from exc
+        raise
+
+
+class _ResponseStream(httpx.SyncByteStream):
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        with _httpx_errors():
+            for part in self._stream:
+                yield part
+
+    def close(self) -> None:
+        if hasattr(self._stream, "close"):
+            self._stream.close()
+
+
+class _CachingDNSTransport(httpx.BaseTransport):
+    # httpx.HTTPTransport does not take a network backend, so this transport builds the httpcore
+    # connection pool itself with the DNS-caching backend.
+    def __init__(self, *, limits: httpx.Limits, http2: bool, cache: DNSCache) -> None:
+        self._pool = httpcore.ConnectionPool(
+            ssl_context=httpx.create_ssl_context(http2=http2),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=_CachingNetworkBackend(cache),
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors():
+            response = self._pool.handle_request(core_request)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class ClientStats:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_requests = 0
+        self.handshake_seconds = 0.0
+
+    def record(self, *, connections: int, handshake_seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            if connections:
+                self.new_connections += connections
+                self.handshake_seconds += handshake_seconds
+            else:
+                self.reused_requests += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = self.requests
+            new_connections = self.new_connections
+            reused = self.reused_requests
+            handshake_seconds = self.handshake_seconds
+        average = handshake_seconds / new_connections if new_connections else 0.0
+        return {
+            "client": self.name,
+            "requests": requests,
+            "new_connections": new_connections,
+            "reused_requests": reused,
+            "reuse_ratio": round(reused / requests, 4) if requests else 0.0,
+            "handshake_seconds": handshake_seconds,
+            # Estimate: every reused request skipped one average TCP (+TLS) handshake.
+            "handshake_seconds_saved": reused * average,
+        }
+
+
+class _RequestTrace:
+    # httpcore trace hook: connect_tcp/start_tls events only fire when a request opens a new
+    # connection, so their absence means the request went over a pooled keep-alive connection.
+    def __init__(self) -> None:
+        self.connections = 0
+        self.handshake_seconds = 0.0
+        self._started: Optional[float] = None
+
+    def __call__(self, event: str, _info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.started":
+            self.connections += 1
+            self._started = time.perf_counter()
+        elif event in {"connection.connect_tcp.complete", "connection.start_tls.complete"} and self._started is not None:
+            now = time.perf_counter()
+            self.handshake_seconds += now - self._started
+            self._started = now
+
+
+class SharedHTTPClient(httpx.Client):
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.name = name
+        self.stats = ClientStats(name)
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        trace = _RequestTrace()
+        request.extensions = {**request.extensions, "trace": trace}
+        response = super().send(request, **kwargs)
+        self.stats.record(connections=trace.connections, handshake_seconds=trace.handshake_seconds)
+        return response
+
+
+_DNS_CACHE = DNSCache(ttl_seconds=300.0)
+
+
+def _http2_enabled() -> bool:
+    global _HTTP2_WARNED
+    if os.getenv("HTTP_CLIENT_HTTP2", "false").strip().lower() not in {"1", "true", "yes", "on"}:
+        return False
+    if importlib.util.find_spec("h2") is None:  # pragma: no cover - optional dependency
+        if not _HTTP2_WARNED:
+            logger.warning("HTTP_CLIENT_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+            _HTTP2_WARNED = True
+        return False
+    return True
+
+
+def _build_client(name: str) -> SharedHTTPClient:
+    defaults = _CLIENT_DEFAULTS.get(name) or _CLIENT_DEFAULTS["openai"]
+    limits = httpx.Limits(
+        max_connections=max(_get_int_env("HTTP_CLIENT_MAX_CONNECTIONS", 100), 1),
+        max_keepalive_connections=max(_get_int_env("HTTP_CLIENT_MAX_KEEPALIVE", 20), 0),
+        keepalive_expiry=max(_get_float_env("HTTP_CLIENT_KEEPALIVE_EXPIRY_S", 30.0), 0.0),
+    )
+    http2 = _http2_enabled()
+    ttl_seconds = _get_float_env("HTTP_CLIENT_DNS_CACHE_TTL_S", 300.0)
+    transport: httpx.BaseTransport
+    if ttl_seconds > 0:
+        _DNS_CACHE.ttl_seconds = ttl_seconds
+        transport = _CachingDNSTransport(limits=limits, http2=http2, cache=_DNS_CACHE)
+    else:
+        transport = httpx.HTTPTransport(limits=limits, http2=http2)
+    return SharedHTTPClient(
+        name,
+        transport=transport,
+        timeout=defaults["timeout"],
+        follow_redirects=defaults["follow_redirects"],
+        max_redirects=defaults["max_redirects"],
+    )
+
+
+def get_http_client(name: str = "fetch") -> SharedHTTPClient:
+    client = _CLIENTS.get(name)
+    if client is not None:
+        return client
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(name)
+        if client is None:
+            client = _build_client(name)
+            _CLIENTS[name] = client
+        return client
+
+
+def close_http_clients() -> None:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+def http_client_stats() -> Dict[str, Any]:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+    return {
+        "clients": [client.stats.stats() for client in clients],
+        "dns_cache": {"hits": _DNS_CACHE.hits, "misses": _DNS_CACHE.misses},
+    }
+
+
+def _collect_http_client_metrics() -> List[Any]:
+    snapshot = http_client_stats()
+    requests = Counter(
+        "context_api_http_client_requests_total",
+        "Outbound requests through the shared HTTP clients by connection reuse.",
+        ("client", "connection"),
+    )
+    handshake = Counter(
+        "context_api_http_client_handshake_seconds_total",
+        "Time spent on TCP/TLS handshakes for new outbound connections.",
+        ("client",),
+    )
+    saved = Gauge(
+        "context_api_http_client_handshake_seconds_saved",
+        "Estimated handshake time avoided by keep-alive connection reuse.",
+        ("client",),
+    )
+    reuse = Gauge(
+        "context_api_http_client_connection_reuse_ratio",
+        "Share of outbound requests served on a pooled connection.",
+        ("client",),
+    )
+    for row in snapshot["clients"]:
+        client = row["client"]
+        requests.inc(row["reused_requests"], client=client, connection="reused")
+        requests.inc(row["requests"] - row["reused_requests"], client=client, connection="new")
+        handshake.inc(row["handshake_seconds"], client=client)
+        saved.set(row["handshake_seconds_saved"], client=client)
+        reuse.set(row["reuse_ratio"], client=client)
+    dns = Counter("context_api_dns_cache_lookups_total", "Shared HTTP client DNS cache lookups.", ("result",))
+    dns.inc(snapshot["dns_cache"]["hits"], result="hit")
+    dns.inc(snapshot["dns_cache"]["misses"], result="miss")
+    return [requests, handshake, saved, reuse, dns]
+
+
+REGISTRY.register_collector(_collect_http_client_metrics)
@@ -4,9 +4,10 @@ import json
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
 from pydantic import BaseModel, Field, ValidationError
 
+from app.http_client import get_http_client
+
 PROMPT_VERSION = "v1"
 DEFAULT_MAX_SIGNALS = 8
 DEFAULT_MAX_SUMMARY_CHARS = 900
@@ -86,7 +87,7 @@ def call_llm(prompt: str, *, model: str, api_key: str) -> Tuple[Dict[str, Any],
         ],
     }
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    response = httpx.post(url, json=payload, headers=headers, timeout=30)
+    response = get_http_client("openai").post(url, json=payload, headers=headers, timeout=30)
     response.raise_for_status()
     data = response.json()
     content = data["choices"][0]["message"]["content"]
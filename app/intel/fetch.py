@@ -1,18 +1,40 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
-from typing import Any, Dict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
 from urllib.parse import urlparse
 
-import httpx
+from app.http_client import get_http_client
+from app.metrics import REGISTRY
 
 DEFAULT_MAX_BYTES = 2_000_000
 DEFAULT_TIMEOUT_S = 20
-DEFAULT_MAX_REDIRECTS = 5
 DEFAULT_USER_AGENT = "context_api/1.0"
+DEFAULT_HOST_MAX_CONCURRENCY = 2
 
+# Per-host politeness state shared by every fetching thread in the process.
+_HOST_LOCK = threading.Lock()
 _HOST_LAST_REQUEST: Dict[str, float] = {}
+_HOST_SLOTS: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+
+FETCH_SECONDS = REGISTRY.histogram(
+    "context_api_fetch_seconds",
+    "URL fetch latency (excluding host throttle wait).",
+    ("status_class",),
+)
+FETCH_BYTES = REGISTRY.counter(
+    "context_api_fetch_bytes_total",
+    "Response body bytes fetched.",
+    ("status_class",),
+)
+HOST_THROTTLE_WAIT_SECONDS = REGISTRY.counter(
+    "context_api_host_throttle_wait_seconds_total",
+    "Time spent sleeping for per-host politeness throttles.",
+    ("host", "throttle"),
+)
 
 
 def _get_int_env(name: str, default: int) -> int:
@@ -26,28 +48,60 @@ def _throttle_host(host: str) -> None:
     throttle_ms = _get_int_env("INTEL_HOST_THROTTLE_MS", 1200)
     if throttle_ms <= 0:
         return
-    now = time.monotonic()
-    last = _HOST_LAST_REQUEST.get(host)
-    if last is not None:
-        wait_s = (throttle_ms / 1000.0) - (now - last)
-        if wait_s > 0:
-            time.sleep(wait_s)
-    _HOST_LAST_REQUEST[host] = time.monotonic()
+    # Reserve the next start time under the lock so concurrent callers for one host stay
+    # throttle_ms apart instead of all waking after the same sleep.
+    with _HOST_LOCK:
+        now = time.monotonic()
+        last = _HOST_LAST_REQUEST.get(host)
+        start_at = now if last is None else max(now, last + throttle_ms / 1000.0)
+        _HOST_LAST_REQUEST[host] = start_at
+    wait_s = start_at - time.monotonic()
+    if wait_s > 0:
+        time.sleep(wait_s)
+        HOST_THROTTLE_WAIT_SECONDS.inc(wait_s, host=host, throttle="host")
+
+
+@contextmanager
+def _host_slot(host: str) -> Iterator[None]:
+    limit = max(_get_int_env("INTEL_HOST_MAX_CONCURRENCY", DEFAULT_HOST_MAX_CONCURRENCY), 1)
+    with _HOST_LOCK:
+        slot = _HOST_SLOTS.setdefault((host, limit), threading.BoundedSemaphore(limit))
+    started = time.perf_counter()
+    slot.acquire()
+    waited = time.perf_counter() - started
+    if waited > 0.001:
+        HOST_THROTTLE_WAIT_SECONDS.inc(waited, host=host, throttle="concurrency")
+    try:
+        yield
+    finally:
+        slot.release()
 
 
-def fetch_url(url: str) -> Dict[str, Any]:
+def fetch_url(url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     max_bytes = _get_int_env("INTEL_FETCH_MAX_BYTES", DEFAULT_MAX_BYTES)
     timeout_s = _get_int_env("INTEL_FETCH_TIMEOUT_S", DEFAULT_TIMEOUT_S)
-    headers = {"User-Agent": os.getenv("INTEL_USER_AGENT", DEFAULT_USER_AGENT)}
+    # Extra request headers (e.g. If-None-Match / If-Modified-Since) are sent as given.
+    headers = {"User-Agent": os.getenv("INTEL_USER_AGENT", DEFAULT_USER_AGENT), **(headers or {})}
     host = urlparse(url).netloc
-    if host:
+    if not host:
+        return _fetch_response(url, headers=headers, timeout_s=timeout_s, max_bytes=max_bytes)
+    # At most INTEL_HOST_MAX_CONCURRENCY requests in flight per host, each start spaced by the
+    # host throttle.
+    with _host_slot(host):
         _throttle_host(host)
+        return _fetch_response(url, headers=headers, timeout_s=timeout_s, max_bytes=max_bytes)
+
+
+def _fetch_response(url: str, *, headers: Dict[str, str], timeout_s: int, max_bytes: int) -> Dict[str, Any]:
     response_headers: Dict[str, str] = {}
     truncated = False
     html = ""
     content_bytes = b""
-    with httpx.Client(follow_redirects=True, timeout=timeout_s, max_redirects=DEFAULT_MAX_REDIRECTS) as client:
-        with client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+    started = time.perf_counter()
+    try:
+        # Shared keep-alive client: consecutive items from one host reuse the connection.
+        client = get_http_client("fetch")
+        with client.stream("GET", url, headers=headers, follow_redirects=True, timeout=timeout_s) as response:
             response_headers = {key.lower(): value for key, value in response.headers.items()}
             chunks = []
             total = 0
@@ -66,6 +120,12 @@ def fetch_url(url: str) -> Dict[str, Any]:
             html = content_bytes.decode("utf-8", errors="ignore")
             final_url = str(response.url)
             status_code = response.status_code
+    except Exception:
+        FETCH_SECONDS.observe(time.perf_counter() - started, status_class="error")
+        raise
+    status_class = f"{status_code // 100}xx"
+    FETCH_SECONDS.observe(time.perf_counter() - started, status_class=status_class)
+    FETCH_BYTES.inc(len(content_bytes), status_class=status_class)
     return {
         "final_url": final_url,
         "status_code": status_code,
@@ -10,6 +10,7 @@ from app.intel.enrich import enrich_article
 from app.intel.extract import extract_readable_text
 from app.intel.fetch import fetch_url
 from app.intel.sectionise import sectionise
+from app.metrics import PIPELINE_ITEMS, PIPELINE_STAGE_SECONDS, configure_worker_metrics, write_metrics_file
 from app.storage.db import (
     claim_next_job,
     get_intel_article,
@@ -29,6 +30,11 @@ def _safe_log(message: str, **kwargs: Any) -> None:
     logger.info(message, extra=safe)
 
 
+def _set_job_status(engine: Any, *, job_id: Any, status: str, last_error: Optional[str] = None) -> None:
+    update_job_status(engine, job_id=job_id, status=status, last_error=last_error)
+    PIPELINE_ITEMS.inc(pipeline="intel", outcome=status)
+
+
 def process_job(
     engine: Any,
     job: Dict[str, Any],
@@ -43,20 +49,21 @@ def process_job(
     article_id = job.get("article_id")
     url = job.get("url_canonical") or job.get("url_original")
     if not article_id or not url:
-        update_job_status(engine, job_id=job_id, status="failed", last_error="missing job data")
+        _set_job_status(engine, job_id=job_id, status="failed", last_error="missing job data")
         return
 
     try:
-        fetch_result = fetcher(url)
+        with PIPELINE_STAGE_SECONDS.time(pipeline="intel", stage="fetch"):
+            fetch_result = fetcher(url)
     except Exception as exc:
-        update_job_status(engine, job_id=job_id, status="failed", last_error=str(exc))
+        _set_job_status(engine, job_id=job_id, status="failed", last_error=str(exc))
         mark_article_failed(engine, article_id=article_id)
         return
 
     html = fetch_result.get("html") or ""
     status_code = fetch_result.get("status_code")
     if status_code and int(status_code) >= 400:
-        update_job_status(
+        _set_job_status(
             engine,
             job_id=job_id,
             status="failed",
@@ -65,18 +72,20 @@ def process_job(
         mark_article_failed(engine, article_id=article_id)
         return
     if not html:
-        update_job_status(engine, job_id=job_id, status="failed", last_error="empty html")
+        _set_job_status(engine, job_id=job_id, status="failed", last_error="empty html")
         mark_article_failed(engine, article_id=article_id)
         return
 
-    extract_result = extractor(html, url)
+    with PIPELINE_STAGE_SECONDS.time(pipeline="intel", stage="extract"):
+        extract_result = extractor(html, url)
     text = extract_result.get("text") or ""
     if not text:
-        update_job_status(engine, job_id=job_id, status="failed", last_error="empty extracted text")
+        _set_job_status(engine, job_id=job_id, status="failed", last_error="empty extracted text")
         mark_article_failed(engine, article_id=article_id)
         return
 
-    sectionised = sectioniser(text)
+    with PIPELINE_STAGE_SECONDS.time(pipeline="intel", stage="sectionise"):
+        sectionised = sectioniser(text)
     sections = sectionised.get("sections") or []
     outline = sectionised.get("outline") or []
     replace_intel_sections(engine, article_id=article_id, sections=sections)
@@ -111,7 +120,7 @@ def process_job(
     )
 
     if not enrich:
-        update_job_status(engine, job_id=job_id, status="done")
+        _set_job_status(engine, job_id=job_id, status="done")
         _safe_log("intel_job_done", job_id=str(job_id), article_id=article_id, status="extracted")
         return
 
@@ -119,13 +128,14 @@ def process_job(
     model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
     api_key = os.getenv("OPENAI_API_KEY", "")
     try:
-        enriched, enrichment_meta = enricher(
-            title=extract_result.get("title"),
-            url=url,
-            sections=sections,
-            model=model,
-            api_key=api_key,
-        )
+        with PIPELINE_STAGE_SECONDS.time(pipeline="intel", stage="enrich"):
+            enriched, enrichment_meta = enricher(
+                title=extract_result.get("title"),
+                url=url,
+                sections=sections,
+                model=model,
+                api_key=api_key,
+            )
         topics = enriched.get("topics") or (article_row.get("topics") or [])
         mark_article_enriched(
             engine,
@@ -137,7 +147,7 @@ def process_job(
             outline=outline,
             status="enriched",
         )
-        update_job_status(engine, job_id=job_id, status="done")
+        _set_job_status(engine, job_id=job_id, status="done")
         _safe_log("intel_job_done", job_id=str(job_id), article_id=article_id, status="enriched")
     except Exception as exc:
         mark_article_enriched(
@@ -150,7 +160,7 @@ def process_job(
             outline=outline,
             status="partial",
         )
-        update_job_status(engine, job_id=job_id, status="failed", last_error=str(exc))
+        _set_job_status(engine, job_id=job_id, status="failed", last_error=str(exc))
         _safe_log("intel_job_failed", job_id=str(job_id), article_id=article_id, error=str(exc))
 
 
@@ -172,11 +182,14 @@ def main() -> None:
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
         raise RuntimeError("DATABASE_URL is not set")
-    engine = create_db_engine(database_url)
+    engine = create_db_engine(database_url, role="intel_worker")
     enrich_enabled = os.getenv("INTEL_ENRICH", "true").lower() != "false"
+    metrics_file = configure_worker_metrics("INTEL_WORKER")
 
     while True:
         processed = run_once(engine, enrich=enrich_enabled)
+        if metrics_file:
+            write_metrics_file(metrics_file)
         if args.once:
             break
         if not processed:
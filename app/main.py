@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import time
@@ -10,11 +11,13 @@ import re
 from datetime import datetime, timezone
 from collections import Counter, defaultdict, deque
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
+import httpx
 from fastapi import Depends, FastAPI, Header, HTTPException, status
-from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, Response
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text
 
@@ -38,6 +41,10 @@ from app.research.contracts import (
     ResearchContextPackResponse,
     ResearchContextPackTrace,
     ResearchContextPack,
+    ResearchContextPackCacheStats,
+    ResearchOpsLatencyResponse,
+    ResearchStageLatency,
+    ResearchTelemetryWriterStats,
     ResearchContextPackItem,
     ResearchCitation,
     ResearchIngestRunRequest,
@@ -51,9 +58,14 @@ from app.research.contracts import (
     ResearchDocumentStagesResponse,
     ResearchDocumentStageCount,
     ResearchStorageUsageResponse,
+    ResearchOpsCachesResponse,
+    ResearchOpsPoolResponse,
+    ResearchDbPoolStats,
     ResearchOpsProgressResponse,
+    ResearchQueryEmbeddingCacheStats,
     ResearchRunProgressRecord,
     ResearchAiUsageModelRecord,
+    ResearchPipelineStageRecord,
     ResearchQuote,
     ResearchScoreBreakdown,
     ResearchSignal,
@@ -88,8 +100,21 @@ from app.research.contracts import (
     ResearchEvidenceCompareCluster,
     ResearchEvidenceCompareResponse,
 )
-from app.research.embeddings import embed_texts, resolve_embedding_runtime
-from app.research.scoring import blend_score, cosine_similarity, embedding_score, lexical_score, recency_score, source_weight_score
+from app.research.embedding_cache import QueryEmbeddingCache
+from app.research.pack_cache import ContextPackCache, context_pack_cache_key
+from app.research.stage_timer import StageTimer
+from app.research.telemetry import ResearchTelemetryWriter
+from app.research.embeddings import embed_texts_async, resolve_embedding_runtime
+from app.research.scoring import (
+    blend_score,
+    embedding_score,
+    lexical_score,
+    recency_cutoff_days,
+    recency_score,
+    reciprocal_rank_fusion,
+    source_weight_score,
+)
+from app.research.vector_index import TopicVectorIndexRegistry
 from app.research.ids import compute_source_id
 from app.dashboard import (
     build_inbox,
@@ -128,14 +153,16 @@ from app.models import (
     UpcomingResponse,
     TaskSearchRequest,
 )
+from app.metrics import CONTENT_TYPE, REGISTRY, Counter as MetricCounter, Gauge as MetricGauge, RequestMetricsMiddleware
+from app.storage.pool import engine_pool_metrics
 from app.storage.db import (
     check_db,
     canonicalize_url,
     create_research_ingestion_run,
     compute_article_id,
     create_intel_ingest_job,
+    create_async_db_engine,
     create_db_engine,
-    create_research_query_log,
     get_research_ingestion_run,
     get_research_ingestion_run_by_idempotency,
     get_project,
@@ -147,8 +174,6 @@ from app.storage.db import (
     search_intel_articles,
     search_intel_sections,
     list_research_sources,
-    list_research_embeddings_for_documents,
-    insert_research_relevance_scores,
     insert_research_retrieval_feedback,
     get_research_ops_summary,
     list_research_review_queue,
@@ -158,14 +183,21 @@ from app.storage.db import (
     list_research_source_metrics,
     list_research_document_stage_counts,
     get_research_storage_usage,
+    get_research_corpus_version,
+    get_research_query_stage_latency,
+    list_frequent_research_queries,
+    measure_research_embedding_reads,
     list_research_run_progress,
     get_research_pipeline_counts,
+    list_research_pipeline_stats,
     get_research_ai_usage_by_model,
     get_context_db_size_bytes,
     redact_research_raw_payloads,
     list_recent_research_documents,
     list_research_document_insights,
     list_research_evidence_relations,
+    rank_research_chunk_candidates,
+    search_research_chunk_candidates,
     search_research_chunks,
     search_research_evidence,
     search_research_document_chunks,
@@ -181,6 +213,12 @@ from app.storage.db import (
     list_tasks_with_projects,
     upsert_projects,
     upsert_tasks,
+    run_db,
+    statement_timeout,
+    AsyncUnitOfWork,
+    UnitOfWork,
+    async_unit_of_work,
+    unit_of_work,
     list_research_documents_for_topic,
     list_research_source_metrics_for_topic,
     list_research_topics,
@@ -202,9 +240,18 @@ DEFAULT_RESEARCH_MAX_ITEMS = 3
 DEFAULT_RESEARCH_MAX_CHUNKS = 3
 MAX_RESEARCH_MAX_CHUNKS = 10
 DEFAULT_RESEARCH_MAX_CHARS = 600
+RESEARCH_CANDIDATE_FACTOR = 4
+MAX_RESEARCH_CANDIDATE_FACTOR = 32
+RESEARCH_RECENT_MIN_SCORE = 0.4
 DEFAULT_BOOTSTRAP_MAX_SUGGESTIONS = 200
 DEFAULT_BOOTSTRAP_CALLS_PER_MINUTE = 20
 
+RETRIEVAL_STAGE_SECONDS = REGISTRY.histogram(
+    "context_api_retrieval_stage_seconds",
+    "Research retrieval stage duration per request.",
+    ("endpoint", "stage"),
+)
+
 _bootstrap_rate_lock = Lock()
 _bootstrap_rate_state: Dict[str, deque[float]] = {}
 _THEME_WORD_RE = re.compile(r"[a-z][a-z0-9_-]{3,}")
@@ -589,6 +636,30 @@ def _to_int(value: Any) -> int:
         return 0
 
 
+def _research_scoring_config() -> Dict[str, Any]:
+    return {
+        "lexical": float(os.getenv("RESEARCH_SCORE_WEIGHT_LEXICAL", "0.45")),
+        "embedding": float(os.getenv("RESEARCH_SCORE_WEIGHT_EMBEDDING", "0.35")),
+        "recency": float(os.getenv("RESEARCH_SCORE_WEIGHT_RECENCY", "0.15")),
+        "source_weight": float(os.getenv("RESEARCH_SCORE_WEIGHT_SOURCE", "0.05")),
+        "rrf_k": int(os.getenv("RESEARCH_HYBRID_RRF_K", "60")),
+        "sql_scoring": os.getenv("RESEARCH_SQL_SCORING", "").strip().lower() in {"1", "true", "yes", "on"},
+    }
+
+
+def _chunk_key(row: Dict[str, Any]) -> Tuple[str, str]:
+    return (str(row.get("document_id") or ""), str(row.get("chunk_id") or ""))
+
+
+def _research_candidate_limit(payload: ResearchContextPackRequest, *, max_items: int) -> int:
+    factor = RESEARCH_CANDIDATE_FACTOR
+    if payload.min_relevance_score is not None:
+        factor *= 2
+    if payload.sort_mode != "relevance":
+        factor *= 2
+    return max_items * min(factor, MAX_RESEARCH_CANDIDATE_FACTOR)
+
+
 def _elapsed_seconds(started_at: Any, finished_at: Any) -> int:
     if not started_at:
         return 0
@@ -615,6 +686,32 @@ def _elapsed_seconds(started_at: Any, finished_at: Any) -> int:
     return max(int((end_utc - started_utc).total_seconds()), 0)
 
 
+def _pipeline_stage_records(rows: List[Dict[str, Any]]) -> List[ResearchPipelineStageRecord]:
+    order = ["fetch", "extract", "enrich", "embed"]
+    totals: Dict[str, Dict[str, float]] = {}
+    for row in rows:
+        for stage in row.get("stages") or []:
+            name = str(stage.get("stage") or "")
+            if not name:
+                continue
+            current = totals.setdefault(name, {})
+            for key in ("workers", "queue_depth", "queue_capacity", "in_flight", "processed", "failed", "throughput_per_min"):
+                current[key] = current.get(key, 0.0) + float(stage.get(key) or 0.0)
+    names = sorted(totals, key=lambda name: (order.index(name) if name in order else len(order), name))
+    return [
+        ResearchPipelineStageRecord(
+            stage=name,
+            workers=int(totals[name]["workers"]),
+            queue_depth=int(totals[name]["queue_depth"]),
+            queue_capacity=int(totals[name]["queue_capacity"]),
+            in_flight=int(totals[name]["in_flight"]),
+            processed=int(totals[name]["processed"]),
+            failed=int(totals[name]["failed"]),
+            throughput_per_min=round(totals[name]["throughput_per_min"], 2),
+        )
+        for name in names
+    ]
+
 def _read_meminfo_bytes() -> Dict[str, int]:
     values_kib: Dict[str, int] = {}
     try:
@@ -779,6 +876,14 @@ OPS_DASHBOARD_HTML = """<!doctype html>
       <div class="k">Storage Usage</div>
       <table><thead><tr><th>Component</th><th>Bytes</th><th>MiB</th></tr></thead><tbody id="storageBody"></tbody></table>
     </div>
+    <div class="card" style="margin-top:10px;">
+      <div class="k">Retrieval Latency (24h)</div>
+      <table><thead><tr><th>Endpoint</th><th>Stage</th><th>Samples</th><th>p50 ms</th><th>p95 ms</th><th>Max ms</th></tr></thead><tbody id="latencyBody"></tbody></table>
+    </div>
+    <div class="card" style="margin-top:10px;">
+      <div class="k">DB Connection Pools</div>
+      <table><thead><tr><th>Engine</th><th>In Use</th><th>Size</th><th>Overflow</th><th>Checkouts</th><th>Wait p50 ms</th><th>Wait p95 ms</th><th>Wait Max ms</th><th>Overflow Checkouts</th><th>Timeouts</th></tr></thead><tbody id="poolBody"></tbody></table>
+    </div>
     <div class="card" style="margin-top:10px;">
       <div class="k">AI Usage</div>
       <table><thead><tr><th>Model</th><th>External API</th><th>Docs</th><th>Chunks</th><th>Est Tokens</th><th>Est Tokens 24h</th></tr></thead><tbody id="aiBody"></tbody></table>
@@ -814,6 +919,8 @@ OPS_DASHBOARD_HTML = """<!doctype html>
     const processBody = el("processBody");
     const stagesBody = el("stagesBody");
     const storageBody = el("storageBody");
+    const latencyBody = el("latencyBody");
+    const poolBody = el("poolBody");
     const aiBody = el("aiBody");
     const resourceBody = el("resourceBody");
     const sourcesBody = el("sourcesBody");
@@ -910,6 +1017,8 @@ OPS_DASHBOARD_HTML = """<!doctype html>
         processBody.innerHTML = "";
         stagesBody.innerHTML = "";
         storageBody.innerHTML = "";
+        latencyBody.innerHTML = "";
+        poolBody.innerHTML = "";
         aiBody.innerHTML = "";
         resourceBody.innerHTML = "";
         sourcesBody.innerHTML = "";
@@ -923,7 +1032,9 @@ OPS_DASHBOARD_HTML = """<!doctype html>
           jget(`/v2/research/ops/sources?topic_key=${topic}&limit=20`),
           jget(`/v2/research/ops/documents?topic_key=${topic}`),
           jget(`/v2/research/ops/storage?topic_key=${topic}`),
-          jget(`/v2/research/ops/progress?topic_key=${topic}&run_limit=12`)
+          jget(`/v2/research/ops/progress?topic_key=${topic}&run_limit=12`),
+          jget(`/v2/research/ops/latency?topic_key=${topic}`),
+          jget(`/v2/research/ops/pool`)
         ]);
         const errors = results.filter(r => r.status === "rejected").map(r => String(r.reason));
         const summary = results[0].status === "fulfilled" ? results[0].value : null;
@@ -931,6 +1042,8 @@ OPS_DASHBOARD_HTML = """<!doctype html>
         const stages = results[2].status === "fulfilled" ? results[2].value : { items: [] };
         const storage = results[3].status === "fulfilled" ? results[3].value : null;
         const progress = results[4].status === "fulfilled" ? results[4].value : null;
+        const latency = results[5].status === "fulfilled" ? results[5].value : { stages: [] };
+        const pools = results[6].status === "fulfilled" ? results[6].value : { pools: [] };
 
         cards.innerHTML = summary ? [
           card("Sources", summary.sources_total),
@@ -966,11 +1079,16 @@ OPS_DASHBOARD_HTML = """<!doctype html>
           ["discovered", progress.stages?.discovered || 0],
           ["fetched", progress.stages?.fetched || 0],
           ["extracted", progress.stages?.extracted || 0],
+          ["enriched", progress.stages?.enriched || 0],
           ["embedded", progress.stages?.embedded || 0],
           ["failed", progress.stages?.failed || 0],
           ["chunks_count", progress.chunks_count || 0],
           ["embeddings_count", progress.embeddings_count || 0],
           ["embedding_coverage_pct", `${Number(progress.embedding_coverage_pct || 0).toFixed(1)}%`],
+          ...(progress.pipeline_stages || []).map(s => [
+            `pipeline_${s.stage}`,
+            `${s.queue_depth}/${s.queue_capacity} queued, ${s.in_flight} in flight, ${Number(s.throughput_per_min || 0).toFixed(1)}/min`,
+          ]),
         ].map(x => `<tr><td>${x[0]}</td><td>${x[1]}</td></tr>`).join("")
           : `<tr><td colspan="2" class="muted">Pipeline progress unavailable.</td></tr>`;
 
@@ -983,10 +1101,38 @@ OPS_DASHBOARD_HTML = """<!doctype html>
           ["Extracted Text", storage.extracted_text_bytes],
           ["Chunks", storage.chunks_bytes],
           ["Embeddings", storage.embeddings_bytes],
+          ["Embeddings (packed)", storage.embeddings_packed_bytes],
+          ["Embeddings (jsonb)", storage.embeddings_jsonb_bytes],
           ["Total", storage.total_bytes]
         ].map(x => `<tr><td>${x[0]}</td><td>${x[1]}</td><td>${mib(x[1])}</td></tr>`).join("")
           : `<tr><td colspan="3" class="muted">Storage metrics unavailable.</td></tr>`;
 
+        latencyBody.innerHTML = (latency.stages || []).length
+          ? (latency.stages || []).map(x => `<tr>
+            <td>${esc(x.endpoint)}</td>
+            <td>${esc(x.stage)}</td>
+            <td>${x.samples}</td>
+            <td>${x.p50_ms}</td>
+            <td>${x.p95_ms}</td>
+            <td>${x.max_ms}</td>
+          </tr>`).join("")
+          : `<tr><td colspan="6" class="muted">No retrieval queries in the last 24h.</td></tr>`;
+
+        poolBody.innerHTML = (pools.pools || []).length
+          ? (pools.pools || []).map(p => `<tr>
+            <td>${esc(p.role)}/${esc(p.engine)}</td>
+            <td>${p.checked_out}</td>
+            <td>${p.pool_size} (+${p.max_overflow})</td>
+            <td>${p.overflow}</td>
+            <td>${p.checkouts}</td>
+            <td>${p.checkout_wait_p50_ms}</td>
+            <td>${p.checkout_wait_p95_ms}</td>
+            <td>${p.checkout_wait_max_ms}</td>
+            <td>${p.overflow_checkouts}</td>
+            <td>${p.timeouts}</td>
+          </tr>`).join("")
+          : `<tr><td colspan="10" class="muted">Pool metrics unavailable.</td></tr>`;
+
         aiBody.innerHTML = progress && (progress.ai_models || []).length
           ? (progress.ai_models || []).map(a => `<tr>
             <td>${a.embedding_model_id}</td>
@@ -1072,9 +1218,36 @@ OPS_DASHBOARD_HTML = """<!doctype html>
 def create_app(app_settings: Settings | None = None) -> FastAPI:
     app_settings = app_settings or default_settings
     app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
 
     app.state.settings = app_settings
-    app.state.engine = create_db_engine(app_settings.database_url)
+    app.state.engine = create_db_engine(app_settings.database_url, role="api")
+    app.state.async_engine = create_async_db_engine(app_settings.database_url, role="api")
+    app.state.http_client = httpx.AsyncClient(timeout=30)
+    app.state.vector_indexes = TopicVectorIndexRegistry(
+        app.state.engine,
+        refresh_interval_seconds=float(os.getenv("RESEARCH_VECTOR_INDEX_REFRESH_SECONDS", "0")),
+    )
+    app.state.query_embeddings = QueryEmbeddingCache(
+        max_entries=int(os.getenv("RESEARCH_QUERY_EMBEDDING_CACHE_SIZE", "1024")),
+        ttl_seconds=int(os.getenv("RESEARCH_QUERY_EMBEDDING_CACHE_TTL_S", "3600")),
+        engine=app.state.engine,
+        shared=os.getenv("RESEARCH_QUERY_EMBEDDING_CACHE_SHARED", "").strip().lower() in {"1", "true", "yes", "on"},
+        async_engine=app.state.async_engine,
+        async_embedder=embed_texts_async,
+        http_client=app.state.http_client,
+    )
+    app.state.context_pack_cache = ContextPackCache(
+        max_entries=int(os.getenv("RESEARCH_CONTEXT_PACK_CACHE_SIZE", "256")),
+        ttl_seconds=int(os.getenv("RESEARCH_CONTEXT_PACK_CACHE_TTL_S", "300")),
+    )
+    app.state.telemetry = ResearchTelemetryWriter(
+        app.state.engine,
+        max_queue=int(os.getenv("RESEARCH_TELEMETRY_QUEUE_SIZE", "10000")),
+        batch_size=int(os.getenv("RESEARCH_TELEMETRY_BATCH_SIZE", "500")),
+        flush_interval_seconds=float(os.getenv("RESEARCH_TELEMETRY_FLUSH_INTERVAL_S", "0.25")),
+        overflow=os.getenv("RESEARCH_TELEMETRY_OVERFLOW", "drop"),
+    )
     app.state.runtime_banner = _runtime_banner_context(app_settings)
     app.state.runtime_guard = {
         "guard_enabled": bool(app_settings.context_api_expect_persistent_corpus),
@@ -1089,8 +1262,17 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
     }
 
     @app.on_event("startup")
-    def _startup_validate_runtime() -> None:
-        app.state.runtime_guard = _validate_runtime_corpus(app_settings, app.state.engine)
+    async def _startup_validate_runtime() -> None:
+        app.state.runtime_guard = await run_in_threadpool(_validate_runtime_corpus, app_settings, app.state.engine)
+        prewarm_limit = int(os.getenv("RESEARCH_CONTEXT_PACK_CACHE_PREWARM", "0"))
+        if prewarm_limit > 0 and app.state.context_pack_cache.enabled:
+            app.state.prewarm_task = asyncio.get_running_loop().create_task(_prewarm_context_pack_cache(prewarm_limit))
+
+    @app.on_event("shutdown")
+    async def _shutdown_flush_telemetry() -> None:
+        await run_in_threadpool(app.state.telemetry.close)
+        await app.state.http_client.aclose()
+        await app.state.async_engine.dispose()
 
     def get_settings() -> Settings:
         return app.state.settings
@@ -1109,6 +1291,26 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid bearer token")
         return token
 
+    def _statement_timeout_dependency(endpoint_class: str) -> Any:
+        milliseconds = int(os.getenv(f"RESEARCH_STATEMENT_TIMEOUT_MS_{endpoint_class.upper()}", "0") or 0)
+
+        async def apply_statement_timeout() -> AsyncIterator[None]:
+            with statement_timeout(milliseconds):
+                yield
+
+        return Depends(apply_statement_timeout)
+
+    retrieval_timeout = _statement_timeout_dependency("retrieval")
+    ops_timeout = _statement_timeout_dependency("ops")
+
+    async def research_db() -> AsyncIterator[AsyncUnitOfWork]:
+        async with async_unit_of_work(app.state.async_engine) as db:
+            yield db
+
+    def research_db_sync() -> Iterator[UnitOfWork]:
+        with unit_of_work(app.state.engine) as db:
+            yield db
+
     @app.get("/health")
     def health() -> Dict[str, str]:
         try:
@@ -1976,75 +2178,140 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 items_deduped=int(run.get("items_deduped") or 0),
                 items_failed=int(run.get("items_failed") or 0),
             ),
+            metrics={str(key): float(value) for key, value in (run.get("metrics") or {}).items()},
             errors=[str(item) for item in (run.get("errors") or [])],
         )
 
-    @app.post("/v2/research/context/pack", response_model=ResearchContextPackResponse)
-    def research_context_pack_endpoint(
+    async def _submit_telemetry(submit: Callable[..., Any], **fields: Any) -> None:
+        # Synchronous writes and the block overflow policy can wait, so they run in the thread pool.
+        endpoint = str(fields.get("endpoint") or "")
+        for stage, elapsed_ms in (fields.get("stage_timings") or {}).items():
+            RETRIEVAL_STAGE_SECONDS.observe(float(elapsed_ms) / 1000.0, endpoint=endpoint, stage=stage)
+        if app.state.telemetry.may_block:
+            await run_in_threadpool(lambda: submit(**fields))
+        else:
+            submit(**fields)
+
+    async def _build_research_context_pack(
         payload: ResearchContextPackRequest,
-        _: None = Depends(require_bearer),
-    ) -> ResearchContextPackResponse:
-        trace_id = str(uuid.uuid4())
-        start_time = time.perf_counter()
-        max_items = max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1)
-        topic_key = payload.topic_key.strip().lower()
-        embedding_runtime = _embedding_runtime()
-        embedding_model_id = str(embedding_runtime["model"])
-        lexical_weight = float(os.getenv("RESEARCH_SCORE_WEIGHT_LEXICAL", "0.45"))
-        embedding_weight = float(os.getenv("RESEARCH_SCORE_WEIGHT_EMBEDDING", "0.35"))
-        recency_weight = float(os.getenv("RESEARCH_SCORE_WEIGHT_RECENCY", "0.15"))
-        source_weight_factor = float(os.getenv("RESEARCH_SCORE_WEIGHT_SOURCE", "0.05"))
+        *,
+        topic_key: str,
+        max_items: int,
+        embedding_model_id: str,
+        scoring_config: Dict[str, Any],
+        timer: StageTimer,
+        db: AsyncUnitOfWork,
+    ) -> Dict[str, Any]:
+        lexical_weight = float(scoring_config["lexical"])
+        embedding_weight = float(scoring_config["embedding"])
+        recency_weight = float(scoring_config["recency"])
+        source_weight_factor = float(scoring_config["source_weight"])
+        rrf_k = int(scoring_config["rrf_k"])
+        candidate_limit = _research_candidate_limit(payload, max_items=max_items)
+        max_candidate_limit = max_items * MAX_RESEARCH_CANDIDATE_FACTOR
         query_vector: List[float] = []
-        try:
-            rows = search_research_chunks(
-                app.state.engine,
-                topic_key=topic_key,
-                query=payload.query,
-                source_ids=payload.source_ids or None,
-                recency_days=payload.recency_days,
-                decision_domain=payload.decision_domain,
-                content_types=payload.content_types or None,
-                source_classes=payload.source_classes or None,
-                publisher_types=payload.publisher_types or None,
-                exclude_content_types=payload.exclude_content_types or None,
-                evidence_types=payload.evidence_types or None,
-                problem_tags=payload.problem_tags or None,
-                intervention_tags=payload.intervention_tags or None,
-                tradeoff_dimensions=payload.tradeoff_dimensions or None,
-                corpus_preference=payload.corpus_preference,
-                source_trust_min=payload.source_trust_min,
-                limit=max_items * 15,
-            )
+        search_filters: Dict[str, Any] = {
+            "source_ids": payload.source_ids or None,
+            "recency_days": payload.recency_days,
+            "decision_domain": payload.decision_domain,
+            "content_types": payload.content_types or None,
+            "source_classes": payload.source_classes or None,
+            "publisher_types": payload.publisher_types or None,
+            "exclude_content_types": payload.exclude_content_types or None,
+            "evidence_types": payload.evidence_types or None,
+            "problem_tags": [tag.strip().lower() for tag in payload.problem_tags if tag.strip()] or None,
+            "intervention_tags": [tag.strip().lower() for tag in payload.intervention_tags if tag.strip()] or None,
+            "tradeoff_dimensions": payload.tradeoff_dimensions or None,
+            "corpus_preference": payload.corpus_preference,
+            "source_trust_min": payload.source_trust_min,
+            "must_have": [value for value in payload.must_have if value != "recent"] or None,
+            "recent_within_days": recency_cutoff_days(RESEARCH_RECENT_MIN_SCORE) if "recent" in payload.must_have else None,
+        }
+
+        vector_index: Any = None
+
+        async def embed_query() -> List[float]:
+            stage_started = time.perf_counter()
             try:
-                vectors = embed_texts(
-                    texts=[payload.query],
+                vector = await app.state.query_embeddings.embed_query_async(
+                    query=payload.query,
                     model=embedding_model_id,
                     api_key=os.getenv("OPENAI_API_KEY", ""),
                 )
-                if vectors:
-                    query_vector = vectors[0]
             except Exception:
-                query_vector = []
+                vector = []
+            timer.record("query_embedding", stage_started)
+            return vector
 
-            doc_ids = sorted({str(row.get("document_id") or "") for row in rows if row.get("document_id")})
-            embedding_rows = list_research_embeddings_for_documents(
-                app.state.engine,
-                document_ids=doc_ids,
-                embedding_model_id=embedding_model_id,
+        query_embedding = asyncio.ensure_future(embed_query())
+
+        async def collect_candidates(limit: int) -> Tuple[List[Dict[str, Any]], bool]:
+            nonlocal query_vector, vector_index
+            stage_started = time.perf_counter()
+            try:
+                lexical_rows = await db.run(
+                    search_research_chunk_candidates,
+                    topic_key=topic_key,
+                    query=payload.query,
+                    limit=limit,
+                    **search_filters,
+                )
+            except BaseException:
+                query_embedding.cancel()
+                raise
+            timer.record("lexical", stage_started)
+            timer.count("lexical_candidates", len(lexical_rows))
+
+            if not query_embedding.done():
+                # Do not hold a pooled connection in an open transaction across the embedding call.
+                await db.release()
+            query_vector = await query_embedding
+            stage_started = time.perf_counter()
+            if query_vector and vector_index is None:
+                vector_index = await run_in_threadpool(app.state.vector_indexes.get, topic_key, embedding_model_id)
+            lexical_keys = [_chunk_key(row) for row in lexical_rows]
+            rows_by_key: Dict[Tuple[str, str], Dict[str, Any]] = dict(zip(lexical_keys, lexical_rows))
+            vector_keys: List[Tuple[str, str]] = []
+            nearest: List[Tuple[Tuple[str, str], float]] = []
+            if vector_index is not None:
+                nearest = vector_index.search(query_vector, k=limit, source_ids=payload.source_ids or None)
+                vector_keys = [key for key, _ in nearest]
+                missing_keys = [key for key in vector_keys if key not in rows_by_key]
+                if missing_keys:
+                    for row in await db.run(
+                        search_research_chunk_candidates,
+                        topic_key=topic_key,
+                        query=payload.query,
+                        chunk_keys=missing_keys,
+                        limit=len(missing_keys),
+                        **search_filters,
+                    ):
+                        rows_by_key[_chunk_key(row)] = row
+            vector_keys = [key for key in vector_keys if key in rows_by_key]
+            timer.record("vector", stage_started)
+            timer.count("vector_candidates", len(vector_keys))
+
+            stage_started = time.perf_counter()
+            fused = reciprocal_rank_fusion(
+                [lexical_keys, vector_keys],
+                k=rrf_k,
             )
-            embedding_map = {
-                (str(row.get("document_id")), str(row.get("chunk_id"))): row.get("vector") or []
-                for row in embedding_rows
-            }
+            rows = [rows_by_key[key] for key in sorted(fused, key=lambda key: fused[key], reverse=True)][:limit]
+            timer.record("fusion", stage_started)
+            timer.count("fused_candidates", len(rows))
+            saturated = len(lexical_rows) >= limit or len(nearest) >= limit
+            return rows, saturated
+
+        def score_candidates(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            similarity = vector_index.score(query_vector, [_chunk_key(row) for row in rows]) if vector_index else {}
             ranked: List[Dict[str, Any]] = []
             for row in rows:
                 document_id = str(row.get("document_id") or "")
                 chunk_id = str(row.get("chunk_id") or "")
                 if not document_id or not chunk_id:
                     continue
-                chunk_vector = embedding_map.get((document_id, chunk_id)) or []
                 lexical_value = lexical_score(float(row.get("lexical_score") or 0.0))
-                cosine = cosine_similarity(query_vector, chunk_vector) if query_vector and chunk_vector else 0.0
+                cosine = similarity.get((document_id, chunk_id), 0.0)
                 embedding_value = embedding_score(cosine)
                 recency_value = recency_score(row.get("published_at"))
                 source_weight_value = source_weight_score(float(row.get("source_weight") or 1.0))
@@ -2055,32 +2322,10 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 if payload.intent_mode == "decision_support":
                     if payload.decision_domain and payload.decision_domain in (row.get("decision_domains") or []):
                         intent_fit = 1.0
-                    elif row.get("recommendations") or row.get("tradeoffs"):
+                    elif row.get("has_recommendations") or row.get("has_tradeoffs"):
                         intent_fit = 0.8
                 elif payload.intent_mode == "editorial":
-                    has_metric = bool(row.get("metrics"))
-                    has_quote = bool(row.get("notable_quotes"))
-                    intent_fit = 1.0 if has_metric or has_quote else 0.55
-                if "metrics" in payload.must_have and not row.get("metrics"):
-                    continue
-                if "quotes" in payload.must_have and not row.get("notable_quotes"):
-                    continue
-                if "recommendations" in payload.must_have and not row.get("recommendations"):
-                    continue
-                if "tradeoffs" in payload.must_have and not row.get("tradeoffs"):
-                    continue
-                if "internal" in payload.must_have and source_class != "internal_authoritative":
-                    continue
-                if "recent" in payload.must_have and recency_value < 0.4:
-                    continue
-                if payload.problem_tags:
-                    row_problem_tags = {str(value) for value in (row.get("problem_tags") or [])}
-                    if not row_problem_tags.intersection({tag.strip().lower() for tag in payload.problem_tags}):
-                        continue
-                if payload.intervention_tags:
-                    row_intervention_tags = {str(value) for value in (row.get("intervention_tags") or [])}
-                    if not row_intervention_tags.intersection({tag.strip().lower() for tag in payload.intervention_tags}):
-                        continue
+                    intent_fit = 1.0 if row.get("has_metrics") or row.get("has_quotes") else 0.55
                 score = blend_score(
                     lexical=lexical_value,
                     embedding=embedding_value,
@@ -2098,204 +2343,438 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 merged = dict(row)
                 merged["_score"] = score
                 ranked.append(merged)
-            if payload.sort_mode == "recent":
-                ranked.sort(key=lambda row: (row.get("published_at") or datetime.fromtimestamp(0, tz=timezone.utc), float((row.get("_score") or {}).get("total") or 0.0)), reverse=True)
-            elif payload.sort_mode == "signal":
-                ranked.sort(key=lambda row: (float(row.get("document_signal_score") or 0.0), float((row.get("_score") or {}).get("total") or 0.0)), reverse=True)
-            elif payload.sort_mode == "novelty":
-                ranked.sort(key=lambda row: (len(row.get("topic_tags") or []), float((row.get("_score") or {}).get("total") or 0.0)), reverse=True)
-            else:
-                ranked.sort(
-                    key=lambda row: (
-                        float((row.get("_score") or {}).get("total") or 0.0),
-                        float((row.get("_score") or {}).get("lexical") or 0.0),
-                    ),
-                    reverse=True,
-                )
-            candidate_count = len(rows)
-            items: List[ResearchContextPackItem] = []
-            seen_docs = set()
-            returned_chunk_ids: List[str] = []
-            top_score = float((ranked[0].get("_score") or {}).get("total") or 0.0) if ranked else 0.0
-            grouped_rows: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-            for row in ranked:
-                document_id = str(row.get("document_id") or "")
-                if document_id:
-                    grouped_rows[document_id].append(row)
+            return ranked
 
-            for document_id, doc_rows in grouped_rows.items():
-                if document_id in seen_docs:
-                    continue
-                best = doc_rows[0]
-                score = best.get("_score") or {}
-                total_score = float(score.get("total") or 0.0)
-                if payload.min_relevance_score is not None and total_score < payload.min_relevance_score:
-                    continue
-                citations: List[ResearchCitation] = []
-                signals: List[ResearchSignal] = []
-                summary_parts: List[str] = []
-                for row in doc_rows[:3]:
-                    chunk_id = str(row.get("chunk_id") or "")
-                    snippet = _clean_snippet(str(row.get("snippet") or row.get("content") or ""))
-                    if not chunk_id or not snippet:
-                        continue
-                    citation = ResearchCitation(document_id=document_id, chunk_id=chunk_id)
-                    citations.append(citation)
-                    returned_chunk_ids.append(chunk_id)
-                    heading_path = []
-                    chunk_meta = row.get("chunk_meta") or {}
-                    if isinstance(chunk_meta, dict):
-                        heading_path = [str(part) for part in (chunk_meta.get("heading_path") or []) if str(part).strip()]
-                    why = "Hybrid relevance from lexical, embedding, recency, and source weighting."
-                    if heading_path:
-                        why = f"{why} Section context: {' > '.join(heading_path[:3])}."
-                    signals.append(
-                        ResearchSignal(
-                            claim=_trim_text(snippet, 240),
-                            why=why,
-                            cite=citation,
-                        )
-                    )
-                    summary_parts.append(snippet)
-                if not citations:
+        async def rank_candidates_in_sql(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            similarity = vector_index.score(query_vector, [_chunk_key(row) for row in rows]) if vector_index else {}
+            ranked_rows = await db.run(
+                rank_research_chunk_candidates,
+                query=payload.query,
+                candidates=[
+                    {
+                        "document_id": row["document_id"],
+                        "chunk_id": row["chunk_id"],
+                        "cosine": similarity.get(_chunk_key(row), 0.0),
+                    }
+                    for row in rows
+                ],
+                weights=scoring_config,
+                intent_mode=payload.intent_mode,
+                decision_domain=payload.decision_domain,
+                max_documents=max_items,
+                limit=max_items * 5,
+            )
+            return [
+                {
+                    "document_id": row["document_id"],
+                    "chunk_id": row["chunk_id"],
+                    "_score": {
+                        name: float(row[name])
+                        for name in ("total", "lexical", "embedding", "recency", "source_weight", "signal", "trust", "intent_fit")
+                    },
+                }
+                for row in ranked_rows
+            ]
+
+        # SQL-side scoring only covers the default relevance ordering.
+        use_sql_scoring = bool(scoring_config.get("sql_scoring")) and payload.sort_mode == "relevance"
+        passes = 0
+        while True:
+            passes += 1
+            rows, saturated = await collect_candidates(candidate_limit)
+            stage_started = time.perf_counter()
+            ranked = await rank_candidates_in_sql(rows) if use_sql_scoring else score_candidates(rows)
+            timer.record("scoring", stage_started)
+            qualifying_documents = {
+                str(row.get("document_id"))
+                for row in ranked
+                if payload.min_relevance_score is None
+                or float((row.get("_score") or {}).get("total") or 0.0) >= payload.min_relevance_score
+            }
+            if len(qualifying_documents) >= max_items or not saturated or candidate_limit >= max_candidate_limit:
+                break
+            candidate_limit = min(candidate_limit * 2, max_candidate_limit)
+        timer.count("candidate_passes", passes)
+
+        stage_started = time.perf_counter()
+        if payload.sort_mode == "recent":
+            ranked.sort(key=lambda row: (row.get("published_at") or datetime.fromtimestamp(0, tz=timezone.utc), float((row.get("_score") or {}).get("total") or 0.0)), reverse=True)
+        elif payload.sort_mode == "signal":
+            ranked.sort(key=lambda row: (float(row.get("document_signal_score") or 0.0), float((row.get("_score") or {}).get("total") or 0.0)), reverse=True)
+        elif payload.sort_mode == "novelty":
+            ranked.sort(key=lambda row: (int(row.get("topic_tag_count") or 0), float((row.get("_score") or {}).get("total") or 0.0)), reverse=True)
+        elif not use_sql_scoring:
+            ranked.sort(
+                key=lambda row: (
+                    float((row.get("_score") or {}).get("total") or 0.0),
+                    float((row.get("_score") or {}).get("lexical") or 0.0),
+                ),
+                reverse=True,
+            )
+        timer.record("scoring", stage_started)
+
+        stage_started = time.perf_counter()
+        ranked_by_document: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in ranked:
+            document_id = str(row.get("document_id") or "")
+            if document_id:
+                ranked_by_document[document_id].append(row)
+        selected: List[Dict[str, Any]] = []
+        selected_documents = 0
+        for doc_rows in ranked_by_document.values():
+            if selected_documents >= max_items:
+                break
+            total_score = float((doc_rows[0].get("_score") or {}).get("total") or 0.0)
+            if payload.min_relevance_score is not None and total_score < payload.min_relevance_score:
+                continue
+            selected.extend(doc_rows[:3])
+            selected_documents += 1
+        hydrated_by_key = {
+            _chunk_key(row): row
+            for row in await db.run(
+                search_research_chunks,
+                topic_key=topic_key,
+                query=payload.query,
+                chunk_keys=[_chunk_key(row) for row in selected],
+                limit=len(selected),
+                **search_filters,
+            )
+        }
+        timer.record("hydration", stage_started)
+        timer.count("hydrated_chunks", len(hydrated_by_key))
+
+        stage_started = time.perf_counter()
+        candidate_count = len(rows)
+        items: List[ResearchContextPackItem] = []
+        seen_docs = set()
+        returned_chunk_ids: List[str] = []
+        top_score = float((ranked[0].get("_score") or {}).get("total") or 0.0) if ranked else 0.0
+        grouped_rows: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in selected:
+            hydrated = hydrated_by_key.get(_chunk_key(row))
+            if hydrated is not None:
+                grouped_rows[str(row.get("document_id"))].append({**hydrated, "_score": row["_score"]})
+
+        for document_id, doc_rows in grouped_rows.items():
+            if document_id in seen_docs:
+                continue
+            best = doc_rows[0]
+            score = best.get("_score") or {}
+            total_score = float(score.get("total") or 0.0)
+            if payload.min_relevance_score is not None and total_score < payload.min_relevance_score:
+                continue
+            citations: List[ResearchCitation] = []
+            signals: List[ResearchSignal] = []
+            summary_parts: List[str] = []
+            for row in doc_rows[:3]:
+                chunk_id = str(row.get("chunk_id") or "")
+                snippet = _clean_snippet(str(row.get("snippet") or row.get("content") or ""))
+                if not chunk_id or not snippet:
                     continue
-                items.append(
-                    ResearchContextPackItem(
-                        document_id=document_id,
-                        source_id=str(best.get("source_id") or ""),
-                        title=str(best.get("title") or ""),
-                        canonical_url=str(best.get("canonical_url") or ""),
-                        published_at=best.get("published_at"),
-                        summary=_trim_text(str(best.get("summary_short") or " ".join(summary_parts)), DEFAULT_RESEARCH_MAX_CHARS),
-                        content_type=str(best.get("content_type") or "company_blog"),
-                        publisher_type=str(best.get("publisher_type") or "independent"),
-                        source_class=str(best.get("source_class") or "external_commentary"),
-                        topic_tags=[str(value) for value in (best.get("topic_tags") or [])],
-                        decision_domains=[str(value) for value in (best.get("decision_domains") or [])],
-                        metrics=_map_metric_items(best.get("metrics")),
-                        notable_quotes=_map_quote_items(best.get("notable_quotes")),
-                        tradeoffs=_map_tradeoff_items(best.get("tradeoffs")),
-                        recommendations=_map_recommendation_items(best.get("recommendations")),
-                        document_signal_score=float(best.get("document_signal_score") or 0.0),
-                        evidence_quality=float(best.get("evidence_quality") or 0.0),
-                        corroboration_count=int(best.get("corroboration_count") or 0),
-                        contradiction_count=int(best.get("contradiction_count") or 0),
-                        freshness_score=float(best.get("freshness_score") or 0.0),
-                        coverage_score=float(best.get("coverage_score") or 0.0),
-                        problem_tags=_map_text_list(best.get("problem_tags")),
-                        intervention_tags=_map_text_list(best.get("intervention_tags")),
-                        tradeoff_dimensions=_map_text_list(best.get("tradeoff_dimensions")),
-                        signals=signals,
-                        citations=citations,
-                        score_breakdown=ResearchScoreBreakdown(
-                            total=total_score,
-                            lexical=float(score.get("lexical") or 0.0),
-                            embedding=float(score.get("embedding") or 0.0),
-                            recency=float(score.get("recency") or 0.0),
-                            source_weight=float(score.get("source_weight") or 0.0),
-                            signal=float(score.get("signal") or 0.0),
-                            trust=float(score.get("trust") or 0.0),
-                            intent_fit=float(score.get("intent_fit") or 0.0),
-                        ),
+                citation = ResearchCitation(document_id=document_id, chunk_id=chunk_id)
+                citations.append(citation)
+                returned_chunk_ids.append(chunk_id)
+                heading_path = []
+                chunk_meta = row.get("chunk_meta") or {}
+                if isinstance(chunk_meta, dict):
+                    heading_path = [str(part) for part in (chunk_meta.get("heading_path") or []) if str(part).strip()]
+                why = "Hybrid relevance from lexical, embedding, recency, and source weighting."
+                if heading_path:
+                    why = f"{why} Section context: {' > '.join(heading_path[:3])}."
+                signals.append(
+                    ResearchSignal(
+                        claim=_trim_text(snippet, 240),
+                        why=why,
+                        cite=citation,
                     )
                 )
-                seen_docs.add(document_id)
-                if len(items) >= max_items:
-                    break
+                summary_parts.append(snippet)
+            if not citations:
+                continue
+            items.append(
+                ResearchContextPackItem(
+                    document_id=document_id,
+                    source_id=str(best.get("source_id") or ""),
+                    title=str(best.get("title") or ""),
+                    canonical_url=str(best.get("canonical_url") or ""),
+                    published_at=best.get("published_at"),
+                    summary=_trim_text(str(best.get("summary_short") or " ".join(summary_parts)), DEFAULT_RESEARCH_MAX_CHARS),
+                    content_type=str(best.get("content_type") or "company_blog"),
+                    publisher_type=str(best.get("publisher_type") or "independent"),
+                    source_class=str(best.get("source_class") or "external_commentary"),
+                    topic_tags=[str(value) for value in (best.get("topic_tags") or [])],
+                    decision_domains=[str(value) for value in (best.get("decision_domains") or [])],
+                    metrics=_map_metric_items(best.get("metrics")),
+                    notable_quotes=_map_quote_items(best.get("notable_quotes")),
+                    tradeoffs=_map_tradeoff_items(best.get("tradeoffs")),
+                    recommendations=_map_recommendation_items(best.get("recommendations")),
+                    document_signal_score=float(best.get("document_signal_score") or 0.0),
+                    evidence_quality=float(best.get("evidence_quality") or 0.0),
+                    corroboration_count=int(best.get("corroboration_count") or 0),
+                    contradiction_count=int(best.get("contradiction_count") or 0),
+                    freshness_score=float(best.get("freshness_score") or 0.0),
+                    coverage_score=float(best.get("coverage_score") or 0.0),
+                    problem_tags=_map_text_list(best.get("problem_tags")),
+                    intervention_tags=_map_text_list(best.get("intervention_tags")),
+                    tradeoff_dimensions=_map_text_list(best.get("tradeoff_dimensions")),
+                    signals=signals,
+                    citations=citations,
+                    score_breakdown=ResearchScoreBreakdown(
+                        total=total_score,
+                        lexical=float(score.get("lexical") or 0.0),
+                        embedding=float(score.get("embedding") or 0.0),
+                        recency=float(score.get("recency") or 0.0),
+                        source_weight=float(score.get("source_weight") or 0.0),
+                        signal=float(score.get("signal") or 0.0),
+                        trust=float(score.get("trust") or 0.0),
+                        intent_fit=float(score.get("intent_fit") or 0.0),
+                    ),
+                )
+            )
+            seen_docs.add(document_id)
+            if len(items) >= max_items:
+                break
 
-            insert_research_relevance_scores(
-                app.state.engine,
-                trace_id=trace_id,
+        relevance_items = [
+            {
+                "document_id": str(row.get("document_id") or ""),
+                "chunk_id": str(row.get("chunk_id") or ""),
+                "score_total": float((row.get("_score") or {}).get("total") or 0.0),
+                "score_lexical": float((row.get("_score") or {}).get("lexical") or 0.0),
+                "score_embedding": float((row.get("_score") or {}).get("embedding") or 0.0),
+                "score_recency": float((row.get("_score") or {}).get("recency") or 0.0),
+                "score_source_weight": float((row.get("_score") or {}).get("source_weight") or 0.0),
+            }
+            for row in ranked[: max_items * 5]
+        ]
+        retrieved_document_ids = [item.document_id for item in items]
+        cited_signals = len(items[0].signals) if items else 0
+        confidence = _determine_confidence(top_score, cited_signals)
+        next_action = _determine_next_action(confidence, payload.query)
+        timer.record("assembly", stage_started)
+        return {
+            "items": items,
+            "retrieved_document_ids": retrieved_document_ids,
+            "returned_chunk_ids": returned_chunk_ids,
+            "candidate_count": candidate_count,
+            "relevance_items": relevance_items,
+            "confidence": confidence,
+            "next_action": next_action,
+            "query_embedding_missing": not query_vector,
+        }
+
+    def _context_pack_cache_key(
+        payload: ResearchContextPackRequest,
+        *,
+        topic_key: str,
+        max_items: int,
+        embedding_model_id: str,
+        scoring_config: Dict[str, Any],
+    ) -> str:
+        return context_pack_cache_key(
+            {
+                "request": payload.model_dump(mode="json", exclude={"token_budget"}),
+                "topic_key": topic_key,
+                "max_items": max_items,
+                "embedding_model_id": embedding_model_id,
+                "scoring": scoring_config,
+            }
+        )
+
+    async def _prewarm_context_pack_cache(limit: int) -> None:
+        embedding_model_id = str(_embedding_runtime()["model"])
+        scoring_config = _research_scoring_config()
+        for row in await run_db(app.state.async_engine, list_frequent_research_queries, limit=limit):
+            try:
+                payload = ResearchContextPackRequest(query=str(row["query_text"]), topic_key=str(row["topic_key"]))
+                topic_key = payload.topic_key.strip().lower()
+                max_items = DEFAULT_RESEARCH_MAX_ITEMS
+                cache_key = _context_pack_cache_key(
+                    payload,
+                    topic_key=topic_key,
+                    max_items=max_items,
+                    embedding_model_id=embedding_model_id,
+                    scoring_config=scoring_config,
+                )
+                async with async_unit_of_work(app.state.async_engine) as db:
+                    corpus_version = await db.run(get_research_corpus_version, topic_key=topic_key)
+                    result = await _build_research_context_pack(
+                        payload,
+                        topic_key=topic_key,
+                        max_items=max_items,
+                        embedding_model_id=embedding_model_id,
+                        scoring_config=scoring_config,
+                        timer=StageTimer(),
+                        db=db,
+                    )
+                if not result["query_embedding_missing"]:
+                    app.state.context_pack_cache.put(cache_key, result, corpus_version=corpus_version, prewarm=True)
+            except Exception as exc:
+                logger.warning("context pack prewarm failed for %s: %s", row.get("topic_key"), exc)
+
+    async def _submit_research_query_log(
+        payload: ResearchContextPackRequest,
+        *,
+        endpoint: str,
+        trace_id: str,
+        topic_key: str,
+        max_items: Optional[int],
+        timer: StageTimer,
+        candidate_count: int = 0,
+        returned_document_ids: Optional[List[str]] = None,
+        returned_chunk_ids: Optional[List[str]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        await _submit_telemetry(
+            app.state.telemetry.submit_query_log,
+            trace_id=trace_id,
+            topic_key=topic_key,
+            query_text=payload.query,
+            source_ids=payload.source_ids,
+            token_budget=payload.token_budget,
+            max_items=max_items,
+            recency_days=payload.recency_days,
+            min_relevance_score=payload.min_relevance_score,
+            candidate_count=candidate_count,
+            returned_document_ids=returned_document_ids or [],
+            returned_chunk_ids=returned_chunk_ids or [],
+            timing_ms=timer.total_ms(),
+            status="error" if error else "ok",
+            error=error,
+            endpoint=endpoint,
+            stage_timings=timer.stages,
+        )
+
+    async def _run_research_context_pack(
+        payload: ResearchContextPackRequest,
+        *,
+        trace_id: str,
+        timer: StageTimer,
+        db: AsyncUnitOfWork,
+    ) -> Tuple[ResearchContextPackResponse, Dict[str, Any]]:
+        max_items = max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1)
+        topic_key = payload.topic_key.strip().lower()
+        embedding_runtime = _embedding_runtime()
+        embedding_model_id = str(embedding_runtime["model"])
+        scoring_config = _research_scoring_config()
+        with timer.stage("cache_lookup"):
+            cache_key = _context_pack_cache_key(
+                payload,
                 topic_key=topic_key,
-                query_text=payload.query,
-                items=[
-                    {
-                        "document_id": str(row.get("document_id") or ""),
-                        "chunk_id": str(row.get("chunk_id") or ""),
-                        "score_total": float((row.get("_score") or {}).get("total") or 0.0),
-                        "score_lexical": float((row.get("_score") or {}).get("lexical") or 0.0),
-                        "score_embedding": float((row.get("_score") or {}).get("embedding") or 0.0),
-                        "score_recency": float((row.get("_score") or {}).get("recency") or 0.0),
-                        "score_source_weight": float((row.get("_score") or {}).get("source_weight") or 0.0),
-                    }
-                    for row in ranked[: max_items * 5]
-                ],
+                max_items=max_items,
+                embedding_model_id=embedding_model_id,
+                scoring_config=scoring_config,
             )
-            retrieved_document_ids = [item.document_id for item in items]
-            cited_signals = len(items[0].signals) if items else 0
-            confidence = _determine_confidence(top_score, cited_signals)
-            next_action = _determine_next_action(confidence, payload.query)
-            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-            create_research_query_log(
-                app.state.engine,
+            corpus_version = await db.run(get_research_corpus_version, topic_key=topic_key)
+            result = app.state.context_pack_cache.get(cache_key, corpus_version=corpus_version)
+        cache_hit = result is not None
+        if result is None:
+            result = await _build_research_context_pack(
+                payload,
+                topic_key=topic_key,
+                max_items=max_items,
+                embedding_model_id=embedding_model_id,
+                scoring_config=scoring_config,
+                timer=timer,
+                db=db,
+            )
+            if not result["query_embedding_missing"]:
+                app.state.context_pack_cache.put(cache_key, result, corpus_version=corpus_version)
+        with timer.stage("telemetry"):
+            await _submit_telemetry(
+                app.state.telemetry.submit_relevance_scores,
                 trace_id=trace_id,
                 topic_key=topic_key,
                 query_text=payload.query,
-                source_ids=payload.source_ids,
-                token_budget=payload.token_budget,
-                max_items=max_items,
-                recency_days=payload.recency_days,
-                min_relevance_score=payload.min_relevance_score,
-                candidate_count=candidate_count,
-                returned_document_ids=retrieved_document_ids,
-                returned_chunk_ids=returned_chunk_ids,
-                timing_ms=elapsed_ms,
-                status="ok",
+                items=result["relevance_items"],
             )
-            return ResearchContextPackResponse(
-                pack=ResearchContextPack(items=items),
-                retrieval_confidence=confidence,
-                next_action=next_action,
+        with timer.stage("response"):
+            response = ResearchContextPackResponse(
+                pack=ResearchContextPack(items=result["items"]),
+                retrieval_confidence=result["confidence"],
+                next_action=result["next_action"],
                 trace=ResearchContextPackTrace(
                     trace_id=trace_id,
-                    retrieved_document_ids=retrieved_document_ids,
-                    timing_ms={"total": elapsed_ms},
+                    retrieved_document_ids=result["retrieved_document_ids"],
                     embedding_model_id=embedding_model_id,
                     embedding_mode=str(embedding_runtime["mode"]),
                     embedding_warning=embedding_runtime.get("warning"),
+                    cache_hit=cache_hit,
                 ),
             )
+        return response, result
+
+    async def _research_context_pack(
+        payload: ResearchContextPackRequest,
+        *,
+        endpoint: str,
+        db: AsyncUnitOfWork,
+        finalize: Optional[Callable[[ResearchContextPackResponse, StageTimer], Any]] = None,
+    ) -> Any:
+        trace_id = str(uuid.uuid4())
+        timer = StageTimer()
+        max_items = max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1)
+        topic_key = payload.topic_key.strip().lower()
+        try:
+            pack, result = await _run_research_context_pack(payload, trace_id=trace_id, timer=timer, db=db)
+            response = finalize(pack, timer) if finalize else pack
         except Exception as exc:
-            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-            create_research_query_log(
-                app.state.engine,
+            await _submit_research_query_log(
+                payload,
+                endpoint=endpoint,
                 trace_id=trace_id,
                 topic_key=topic_key,
-                query_text=payload.query,
-                source_ids=payload.source_ids,
-                token_budget=payload.token_budget,
                 max_items=max_items,
-                recency_days=payload.recency_days,
-                min_relevance_score=payload.min_relevance_score,
-                candidate_count=0,
-                returned_document_ids=[],
-                returned_chunk_ids=[],
-                timing_ms=elapsed_ms,
-                status="error",
+                timer=timer,
                 error=str(exc),
             )
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Research retrieval failed")
+        await _submit_research_query_log(
+            payload,
+            endpoint=endpoint,
+            trace_id=trace_id,
+            topic_key=topic_key,
+            max_items=max_items,
+            timer=timer,
+            candidate_count=result["candidate_count"],
+            returned_document_ids=result["retrieved_document_ids"],
+            returned_chunk_ids=result["returned_chunk_ids"],
+        )
+        response.trace.timing_ms = timer.trace_timing()
+        return response
+
+    @app.post("/v2/research/context/pack", response_model=ResearchContextPackResponse, dependencies=[retrieval_timeout])
+    async def research_context_pack_endpoint(
+        payload: ResearchContextPackRequest,
+        _: None = Depends(require_bearer),
+        db: AsyncUnitOfWork = Depends(research_db),
+    ) -> ResearchContextPackResponse:
+        return await _research_context_pack(payload, endpoint="context_pack", db=db)
 
     @app.post(
         "/v2/research/documents/{document_id}/chunks:search",
         response_model=ResearchChunkSearchResponse,
+        dependencies=[retrieval_timeout],
     )
-    def research_document_chunks_endpoint(
+    async def research_document_chunks_endpoint(
         document_id: str,
         payload: ResearchChunkSearchRequest,
         _: None = Depends(require_bearer),
     ) -> ResearchChunkSearchResponse:
-        doc = get_research_document(app.state.engine, document_id=document_id)
-        if not doc:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
         max_chunks = min(max(payload.max_chunks or DEFAULT_RESEARCH_MAX_CHUNKS, 1), MAX_RESEARCH_MAX_CHUNKS)
         max_chars = max(payload.max_chars or DEFAULT_RESEARCH_MAX_CHARS, 80)
-        rows = search_research_document_chunks(
-            app.state.engine,
-            document_id=document_id,
-            query=payload.query,
-            limit=max_chunks,
+        doc, rows = await asyncio.gather(
+            run_db(app.state.async_engine, get_research_document, document_id=document_id),
+            run_db(
+                app.state.async_engine,
+                search_research_document_chunks,
+                document_id=document_id,
+                query=payload.query,
+                limit=max_chunks,
+            ),
         )
+        if not doc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
         chunks = []
         for row in rows:
             snippet = _clean_snippet(str(row.get("snippet") or ""))
@@ -2313,52 +2792,71 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             )
         return ResearchChunkSearchResponse(document_id=document_id, chunks=chunks)
 
-    @app.post("/v2/research/evidence/search", response_model=ResearchEvidenceSearchResponse)
-    def research_evidence_search_endpoint(
+    async def _evidence_vector_scores(topic_key: str, query: str, limit: int, timer: StageTimer) -> Dict[Tuple[str, str], float]:
+        embedding_model_id = str(_embedding_runtime()["model"])
+        stage_started = time.perf_counter()
+        try:
+            query_vector = await app.state.query_embeddings.embed_query_async(
+                query=query,
+                model=embedding_model_id,
+                api_key=os.getenv("OPENAI_API_KEY", ""),
+            )
+        except Exception:
+            query_vector = []
+        timer.record("query_embedding", stage_started)
+        if not query_vector:
+            return {}
+        with timer.stage("vector"):
+            vector_index = await run_in_threadpool(app.state.vector_indexes.get, topic_key, embedding_model_id)
+            return dict(vector_index.search(query_vector, k=max(limit * 3, 10)))
+
+    @app.post("/v2/research/evidence/search", response_model=ResearchEvidenceSearchResponse, dependencies=[retrieval_timeout])
+    async def research_evidence_search_endpoint(
         payload: ResearchContextPackRequest,
         _: None = Depends(require_bearer),
     ) -> ResearchEvidenceSearchResponse:
         trace_id = str(uuid.uuid4())
-        start_time = time.perf_counter()
+        timer = StageTimer()
         topic_key = payload.topic_key.strip().lower()
-        rows = search_research_evidence(
-            app.state.engine,
-            topic_key=topic_key,
-            query=payload.query,
-            evidence_types=payload.evidence_types or None,
-            problem_tags=payload.problem_tags or None,
-            intervention_tags=payload.intervention_tags or None,
-            tradeoff_dimensions=payload.tradeoff_dimensions or None,
-            decision_domain=payload.decision_domain,
-            corpus_preference=payload.corpus_preference,
-            source_trust_min=payload.source_trust_min,
-            recency_days=payload.recency_days,
-            limit=max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1) * 4,
-        )
-        items = [_map_evidence_item(row) for row in rows]
-        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-        contradictions_present = any(item.contradiction_count > 0 for item in items)
-        coverage_summary = {
-            "mean_coverage_score": round(sum(item.coverage_score for item in items) / max(len(items), 1), 4),
-            "mean_evidence_quality": round(sum(item.evidence_quality for item in items) / max(len(items), 1), 4),
-            "internal_coverage_score": round(sum(item.internal_coverage_score for item in items) / max(len(items), 1), 4),
-            "external_coverage_score": round(sum(item.external_coverage_score for item in items) / max(len(items), 1), 4),
-        }
-        create_research_query_log(
-            app.state.engine,
+        limit = max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1) * 4
+        vector_scores = await _evidence_vector_scores(topic_key, payload.query, limit, timer)
+        with timer.stage("evidence_sql"):
+            rows = await run_db(
+                app.state.async_engine,
+                search_research_evidence,
+                topic_key=topic_key,
+                query=payload.query,
+                evidence_types=payload.evidence_types or None,
+                problem_tags=payload.problem_tags or None,
+                intervention_tags=payload.intervention_tags or None,
+                tradeoff_dimensions=payload.tradeoff_dimensions or None,
+                decision_domain=payload.decision_domain,
+                corpus_preference=payload.corpus_preference,
+                source_trust_min=payload.source_trust_min,
+                recency_days=payload.recency_days,
+                vector_scores=vector_scores,
+                limit=limit,
+            )
+        timer.count("evidence_candidates", len(rows))
+        with timer.stage("assembly"):
+            items = [_map_evidence_item(row) for row in rows]
+            contradictions_present = any(item.contradiction_count > 0 for item in items)
+            coverage_summary = {
+                "mean_coverage_score": round(sum(item.coverage_score for item in items) / max(len(items), 1), 4),
+                "mean_evidence_quality": round(sum(item.evidence_quality for item in items) / max(len(items), 1), 4),
+                "internal_coverage_score": round(sum(item.internal_coverage_score for item in items) / max(len(items), 1), 4),
+                "external_coverage_score": round(sum(item.external_coverage_score for item in items) / max(len(items), 1), 4),
+            }
+        await _submit_research_query_log(
+            payload,
+            endpoint="evidence_search",
             trace_id=trace_id,
             topic_key=topic_key,
-            query_text=payload.query,
-            source_ids=payload.source_ids,
-            token_budget=payload.token_budget,
             max_items=payload.max_items,
-            recency_days=payload.recency_days,
-            min_relevance_score=payload.min_relevance_score,
+            timer=timer,
             candidate_count=len(rows),
             returned_document_ids=[item.document_id for item in items],
             returned_chunk_ids=[item.chunk_id for item in items],
-            timing_ms=elapsed_ms,
-            status="ok",
         )
         return ResearchEvidenceSearchResponse(
             query=payload.query,
@@ -2369,52 +2867,78 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             trace=ResearchContextPackTrace(
                 trace_id=trace_id,
                 retrieved_document_ids=[item.document_id for item in items],
-                timing_ms={"total": elapsed_ms},
+                timing_ms=timer.trace_timing(),
                 embedding_model_id=str(_embedding_runtime()["model"]),
                 embedding_mode=str(_embedding_runtime()["mode"]),
                 embedding_warning=_embedding_runtime().get("warning"),
             ),
         )
 
-    @app.post("/v2/research/evidence/related", response_model=ResearchEvidenceRelatedResponse)
-    def research_evidence_related_endpoint(
+    @app.post("/v2/research/evidence/related", response_model=ResearchEvidenceRelatedResponse, dependencies=[retrieval_timeout])
+    async def research_evidence_related_endpoint(
         payload: ResearchContextPackRequest,
         _: None = Depends(require_bearer),
     ) -> ResearchEvidenceRelatedResponse:
+        trace_id = str(uuid.uuid4())
+        timer = StageTimer()
         topic_key = payload.topic_key.strip().lower()
-        seed_rows = search_research_evidence(
-            app.state.engine,
-            topic_key=topic_key,
-            query=payload.query,
-            evidence_types=payload.evidence_types or None,
-            problem_tags=payload.problem_tags or None,
-            intervention_tags=payload.intervention_tags or None,
-            tradeoff_dimensions=payload.tradeoff_dimensions or None,
-            decision_domain=payload.decision_domain,
-            corpus_preference=payload.corpus_preference,
-            source_trust_min=payload.source_trust_min,
-            recency_days=payload.recency_days,
-            limit=max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1),
-        )
+        limit = max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1)
+        vector_scores = await _evidence_vector_scores(topic_key, payload.query, limit, timer)
+        with timer.stage("evidence_sql"):
+            seed_rows = await run_db(
+                app.state.async_engine,
+                search_research_evidence,
+                topic_key=topic_key,
+                query=payload.query,
+                evidence_types=payload.evidence_types or None,
+                problem_tags=payload.problem_tags or None,
+                intervention_tags=payload.intervention_tags or None,
+                tradeoff_dimensions=payload.tradeoff_dimensions or None,
+                decision_domain=payload.decision_domain,
+                corpus_preference=payload.corpus_preference,
+                source_trust_min=payload.source_trust_min,
+                recency_days=payload.recency_days,
+                vector_scores=vector_scores,
+                limit=limit,
+            )
         seed_items = [_map_evidence_item(row) for row in seed_rows]
         relation_types = None
         if payload.relation_intent == "supporting":
             relation_types = ["supports", "refines"]
         elif payload.relation_intent == "conflicting":
             relation_types = ["contradicts", "supersedes"]
-        relation_rows = list_research_evidence_relations(
-            app.state.engine,
-            insight_ids=[item.insight_id for item in seed_items],
-            relation_types=relation_types,
-            limit=max((payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS) * 10, 20),
-        )
-        related_ids = []
-        for relation in relation_rows:
-            related_ids.append(str(relation.get("from_insight_id")))
-            related_ids.append(str(relation.get("to_insight_id")))
-        related_ids = [value for value in related_ids if value and value not in {item.insight_id for item in seed_items}]
-        related_lookup = {str(row.get("insight_id") or ""): row for row in list_research_document_insights(app.state.engine, topic_key=topic_key, limit=200)}
-        related_items = [_map_evidence_item(related_lookup[item_id]) for item_id in related_ids if item_id in related_lookup][: max(payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS, 1) * 4]
+        with timer.stage("relations_sql"):
+            relation_rows, topic_insights = await asyncio.gather(
+                run_db(
+                    app.state.async_engine,
+                    list_research_evidence_relations,
+                    insight_ids=[item.insight_id for item in seed_items],
+                    relation_types=relation_types,
+                    limit=max((payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS) * 10, 20),
+                ),
+                run_db(app.state.async_engine, list_research_document_insights, topic_key=topic_key, limit=200),
+            )
+            related_ids = []
+            for relation in relation_rows:
+                related_ids.append(str(relation.get("from_insight_id")))
+                related_ids.append(str(relation.get("to_insight_id")))
+            related_ids = [value for value in related_ids if value and value not in {item.insight_id for item in seed_items}]
+            related_lookup = {str(row.get("insight_id") or ""): row for row in topic_insights}
+        with timer.stage("assembly"):
+            related_items = [_map_evidence_item(related_lookup[item_id]) for item_id in related_ids if item_id in related_lookup][: limit * 4]
+        timer.count("evidence_candidates", len(seed_rows))
+        timer.count("relation_candidates", len(relation_rows))
+        await _submit_research_query_log(
+            payload,
+            endpoint="evidence_related",
+            trace_id=trace_id,
+            topic_key=topic_key,
+            max_items=payload.max_items,
+            timer=timer,
+            candidate_count=len(seed_rows) + len(relation_rows),
+            returned_document_ids=[item.document_id for item in seed_items + related_items],
+            returned_chunk_ids=[item.chunk_id for item in seed_items + related_items],
+        )
         return ResearchEvidenceRelatedResponse(
             topic_key=topic_key,
             relation_intent=payload.relation_intent or "related",
@@ -2435,30 +2959,45 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 "seed_count": float(len(seed_items)),
                 "related_count": float(len(related_items)),
             },
+            trace=ResearchContextPackTrace(
+                trace_id=trace_id,
+                retrieved_document_ids=sorted({item.document_id for item in seed_items + related_items}),
+                timing_ms=timer.trace_timing(),
+                embedding_model_id=str(_embedding_runtime()["model"]),
+                embedding_mode=str(_embedding_runtime()["mode"]),
+                embedding_warning=_embedding_runtime().get("warning"),
+            ),
         )
 
-    @app.post("/v2/research/evidence/compare", response_model=ResearchEvidenceCompareResponse)
-    def research_evidence_compare_endpoint(
+    @app.post("/v2/research/evidence/compare", response_model=ResearchEvidenceCompareResponse, dependencies=[retrieval_timeout])
+    async def research_evidence_compare_endpoint(
         payload: ResearchContextPackRequest,
         _: None = Depends(require_bearer),
     ) -> ResearchEvidenceCompareResponse:
         trace_id = str(uuid.uuid4())
-        start_time = time.perf_counter()
+        timer = StageTimer()
         topic_key = payload.topic_key.strip().lower()
-        rows = search_research_evidence(
-            app.state.engine,
-            topic_key=topic_key,
-            query=payload.query,
-            evidence_types=payload.evidence_types or None,
-            problem_tags=payload.problem_tags or None,
-            intervention_tags=payload.intervention_tags or None,
-            tradeoff_dimensions=payload.tradeoff_dimensions or None,
-            decision_domain=payload.decision_domain,
-            corpus_preference=payload.corpus_preference,
-            source_trust_min=payload.source_trust_min,
-            recency_days=payload.recency_days,
-            limit=max((payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS) * 8, 12),
-        )
+        limit = max((payload.max_items or DEFAULT_RESEARCH_MAX_ITEMS) * 8, 12)
+        vector_scores = await _evidence_vector_scores(topic_key, payload.query, limit, timer)
+        with timer.stage("evidence_sql"):
+            rows = await run_db(
+                app.state.async_engine,
+                search_research_evidence,
+                topic_key=topic_key,
+                query=payload.query,
+                evidence_types=payload.evidence_types or None,
+                problem_tags=payload.problem_tags or None,
+                intervention_tags=payload.intervention_tags or None,
+                tradeoff_dimensions=payload.tradeoff_dimensions or None,
+                decision_domain=payload.decision_domain,
+                corpus_preference=payload.corpus_preference,
+                source_trust_min=payload.source_trust_min,
+                recency_days=payload.recency_days,
+                vector_scores=vector_scores,
+                limit=limit,
+            )
+        timer.count("evidence_candidates", len(rows))
+        stage_started = time.perf_counter()
         grouped: Dict[str, List[ResearchEvidenceItem]] = defaultdict(list)
         for row in rows:
             item = _map_evidence_item(row)
@@ -2487,7 +3026,19 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                     ),
                 )
             )
-        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        timer.record("clustering", stage_started)
+        compared_items = [item for cluster in clusters for item in cluster.items]
+        await _submit_research_query_log(
+            payload,
+            endpoint="evidence_compare",
+            trace_id=trace_id,
+            topic_key=topic_key,
+            max_items=payload.max_items,
+            timer=timer,
+            candidate_count=len(rows),
+            returned_document_ids=[item.document_id for item in compared_items],
+            returned_chunk_ids=[item.chunk_id for item in compared_items],
+        )
         return ResearchEvidenceCompareResponse(
             query=payload.query,
             topic_key=topic_key,
@@ -2500,18 +3051,19 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             },
             trace=ResearchContextPackTrace(
                 trace_id=trace_id,
-                retrieved_document_ids=sorted({item.document_id for cluster in clusters for item in cluster.items}),
-                timing_ms={"total": elapsed_ms},
+                retrieved_document_ids=sorted({item.document_id for item in compared_items}),
+                timing_ms=timer.trace_timing(),
                 embedding_model_id=str(_embedding_runtime()["model"]),
                 embedding_mode=str(_embedding_runtime()["mode"]),
                 embedding_warning=_embedding_runtime().get("warning"),
             ),
         )
 
-    @app.post("/v2/research/decision/pack", response_model=ResearchDecisionPackResponse)
-    def research_decision_pack_endpoint(
+    @app.post("/v2/research/decision/pack", response_model=ResearchDecisionPackResponse, dependencies=[retrieval_timeout])
+    async def research_decision_pack_endpoint(
         payload: ResearchContextPackRequest,
         _: None = Depends(require_bearer),
+        db: AsyncUnitOfWork = Depends(research_db),
     ) -> ResearchDecisionPackResponse:
         effective_payload = payload.model_copy(
             update={
@@ -2520,66 +3072,72 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 "must_have": payload.must_have or [],
             }
         )
-        pack = research_context_pack_endpoint(effective_payload, None)
-        items = list(pack.pack.items)
-        alternatives: List[ResearchDecisionAlternative] = []
-        tradeoffs: List[ResearchTradeoff] = []
-        workflow_recommendations: List[ResearchRecommendation] = []
-        citations: List[ResearchCitation] = []
-        for item in items:
-            if item.citations:
-                citations.extend(item.citations[:1])
-            if item.tradeoffs:
-                tradeoffs.extend(item.tradeoffs[:2])
-            if item.recommendations:
-                workflow_recommendations.extend(item.recommendations[:2])
-            alternatives.append(
-                ResearchDecisionAlternative(
-                    title=item.title,
-                    summary=item.summary,
-                    citations=item.citations[:2],
-                )
-            )
-        recommended = workflow_recommendations[0].action if workflow_recommendations else (items[0].summary if items else "Gather more evidence before committing to a single approach.")
-        risks = [
-            ResearchDecisionRisk(
-                risk="Evidence is skewed toward the currently indexed corpus.",
-                mitigation="Cross-check against additional internal artifacts and recent primary sources.",
-            )
-        ]
-        if payload.decision_domain:
-            risks.append(
-                ResearchDecisionRisk(
-                    risk=f"Domain fit may be incomplete for {payload.decision_domain}.",
-                    mitigation="Add more domain-specific sources or internal artifacts to the topic.",
+
+        def _assemble(pack: ResearchContextPackResponse, timer: StageTimer) -> ResearchDecisionPackResponse:
+            with timer.stage("decision_assembly"):
+                items = list(pack.pack.items)
+                alternatives: List[ResearchDecisionAlternative] = []
+                tradeoffs: List[ResearchTradeoff] = []
+                workflow_recommendations: List[ResearchRecommendation] = []
+                citations: List[ResearchCitation] = []
+                for item in items:
+                    if item.citations:
+                        citations.extend(item.citations[:1])
+                    if item.tradeoffs:
+                        tradeoffs.extend(item.tradeoffs[:2])
+                    if item.recommendations:
+                        workflow_recommendations.extend(item.recommendations[:2])
+                    alternatives.append(
+                        ResearchDecisionAlternative(
+                            title=item.title,
+                            summary=item.summary,
+                            citations=item.citations[:2],
+                        )
+                    )
+                recommended = workflow_recommendations[0].action if workflow_recommendations else (items[0].summary if items else "Gather more evidence before committing to a single approach.")
+                risks = [
+                    ResearchDecisionRisk(
+                        risk="Evidence is skewed toward the currently indexed corpus.",
+                        mitigation="Cross-check against additional internal artifacts and recent primary sources.",
+                    )
+                ]
+                if payload.decision_domain:
+                    risks.append(
+                        ResearchDecisionRisk(
+                            risk=f"Domain fit may be incomplete for {payload.decision_domain}.",
+                            mitigation="Add more domain-specific sources or internal artifacts to the topic.",
+                        )
+                    )
+                return ResearchDecisionPackResponse(
+                    query=payload.query,
+                    topic_key=payload.topic_key.strip().lower(),
+                    decision_domain=(payload.decision_domain or "").strip().lower(),
+                    recommended_approach=recommended,
+                    alternatives=alternatives[:3],
+                    tradeoffs=tradeoffs[:5],
+                    risks=risks,
+                    workflow_recommendations=workflow_recommendations[:5],
+                    implementation_notes=[item.summary for item in items[:3]],
+                    supporting_evidence=items,
+                    open_questions=[] if items else ["No supporting evidence returned from the current corpus."],
+                    confidence=pack.retrieval_confidence,
+                    trace=pack.trace,
                 )
-            )
-        return ResearchDecisionPackResponse(
-            query=payload.query,
-            topic_key=payload.topic_key.strip().lower(),
-            decision_domain=(payload.decision_domain or "").strip().lower(),
-            recommended_approach=recommended,
-            alternatives=alternatives[:3],
-            tradeoffs=tradeoffs[:5],
-            risks=risks,
-            workflow_recommendations=workflow_recommendations[:5],
-            implementation_notes=[item.summary for item in items[:3]],
-            supporting_evidence=items,
-            open_questions=[] if items else ["No supporting evidence returned from the current corpus."],
-            confidence=pack.retrieval_confidence,
-            trace=pack.trace,
-        )
+
+        return await _research_context_pack(effective_payload, endpoint="decision_pack", db=db, finalize=_assemble)
 
     @app.post("/v2/research/retrieval/feedback", response_model=ResearchFeedbackResponse)
     def research_feedback_endpoint(
         payload: ResearchFeedbackRequest,
         _: None = Depends(require_bearer),
+        db: UnitOfWork = Depends(research_db_sync),
     ) -> ResearchFeedbackResponse:
-        doc = get_research_document(app.state.engine, document_id=payload.document_id)
+        doc = get_research_document(db, document_id=payload.document_id)
         if not doc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+        app.state.telemetry.ensure_written(payload.trace_id)
         feedback_id = insert_research_retrieval_feedback(
-            app.state.engine,
+            db,
             trace_id=payload.trace_id,
             query_log_id=payload.query_log_id,
             document_id=payload.document_id,
@@ -2589,18 +3147,17 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
         )
         return ResearchFeedbackResponse(feedback_id=feedback_id, status="recorded")
 
-    @app.get("/v2/research/ops/summary", response_model=ResearchOpsSummaryResponse)
-    def research_ops_summary_endpoint(
+    @app.get("/v2/research/ops/summary", response_model=ResearchOpsSummaryResponse, dependencies=[ops_timeout])
+    async def research_ops_summary_endpoint(
         topic_key: str,
         _: None = Depends(require_bearer),
     ) -> ResearchOpsSummaryResponse:
         normalized_topic = topic_key.strip().lower()
-        summary = get_research_ops_summary(
-            app.state.engine,
-            topic_key=normalized_topic,
+        summary, guard_state = await asyncio.gather(
+            run_db(app.state.async_engine, get_research_ops_summary, topic_key=normalized_topic),
+            run_db(app.state.async_engine, lambda engine: _validate_runtime_corpus(app.state.settings, engine)),
         )
         embedding_runtime = _embedding_runtime()
-        guard_state = _validate_runtime_corpus(app.state.settings, app.state.engine)
         app.state.runtime_guard = guard_state
         return ResearchOpsSummaryResponse(
             topic_key=normalized_topic,
@@ -2628,15 +3185,16 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             embedding_warning=embedding_runtime.get("warning"),
         )
 
-    @app.get("/v2/research/ops/sources", response_model=ResearchSourceMetricsResponse)
+    @app.get("/v2/research/ops/sources", response_model=ResearchSourceMetricsResponse, dependencies=[ops_timeout])
     def research_ops_sources_endpoint(
         topic_key: str,
         limit: int = 20,
         _: None = Depends(require_bearer),
+        db: UnitOfWork = Depends(research_db_sync),
     ) -> ResearchSourceMetricsResponse:
         normalized_topic = topic_key.strip().lower()
         rows = list_research_source_metrics(
-            app.state.engine,
+            db,
             topic_key=normalized_topic,
             limit=limit,
         )
@@ -2658,14 +3216,15 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
         ]
         return ResearchSourceMetricsResponse(topic_key=normalized_topic, items=items)
 
-    @app.get("/v2/research/ops/documents", response_model=ResearchDocumentStagesResponse)
+    @app.get("/v2/research/ops/documents", response_model=ResearchDocumentStagesResponse, dependencies=[ops_timeout])
     def research_ops_documents_endpoint(
         topic_key: str,
         _: None = Depends(require_bearer),
+        db: UnitOfWork = Depends(research_db_sync),
     ) -> ResearchDocumentStagesResponse:
         normalized_topic = topic_key.strip().lower()
         rows = list_research_document_stage_counts(
-            app.state.engine,
+            db,
             topic_key=normalized_topic,
         )
         items = [
@@ -2677,20 +3236,102 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
         ]
         return ResearchDocumentStagesResponse(topic_key=normalized_topic, items=items)
 
-    @app.get("/v2/research/ops/storage", response_model=ResearchStorageUsageResponse)
+    @app.get("/v2/research/ops/latency", response_model=ResearchOpsLatencyResponse, dependencies=[ops_timeout])
+    def research_ops_latency_endpoint(
+        topic_key: str,
+        since_hours: int = 24,
+        endpoint: Optional[str] = None,
+        _: None = Depends(require_bearer),
+        db: UnitOfWork = Depends(research_db_sync),
+    ) -> ResearchOpsLatencyResponse:
+        normalized_topic = topic_key.strip().lower()
+        bounded_hours = min(max(since_hours, 1), 24 * 30)
+        rows = get_research_query_stage_latency(
+            db,
+            topic_key=normalized_topic,
+            since_hours=bounded_hours,
+            endpoint=endpoint.strip().lower() if endpoint else None,
+        )
+        return ResearchOpsLatencyResponse(
+            topic_key=normalized_topic,
+            since_hours=bounded_hours,
+            stages=[
+                ResearchStageLatency(
+                    endpoint=str(row.get("endpoint") or ""),
+                    stage=str(row.get("stage") or ""),
+                    samples=int(row.get("samples") or 0),
+                    p50_ms=round(float(row.get("p50_ms") or 0.0), 2),
+                    p95_ms=round(float(row.get("p95_ms") or 0.0), 2),
+                    max_ms=round(float(row.get("max_ms") or 0.0), 2),
+                )
+                for row in rows
+            ],
+        )
+
+    @app.get("/v2/research/ops/caches", response_model=ResearchOpsCachesResponse)
+    def research_ops_caches_endpoint(
+        _: None = Depends(require_bearer),
+    ) -> ResearchOpsCachesResponse:
+        return ResearchOpsCachesResponse(
+            query_embedding=ResearchQueryEmbeddingCacheStats(**app.state.query_embeddings.stats()),
+            context_pack=ResearchContextPackCacheStats(**app.state.context_pack_cache.stats()),
+            telemetry=ResearchTelemetryWriterStats(**app.state.telemetry.stats()),
+        )
+
+    @app.get("/v2/research/ops/pool", response_model=ResearchOpsPoolResponse)
+    def research_ops_pool_endpoint(
+        _: None = Depends(require_bearer),
+    ) -> ResearchOpsPoolResponse:
+        pools = [engine_pool_metrics(engine) for engine in (app.state.engine, app.state.async_engine)]
+        return ResearchOpsPoolResponse(pools=[ResearchDbPoolStats(**metrics.stats()) for metrics in pools if metrics])
+
+    def _collect_app_metrics() -> List[Any]:
+        cache_events = MetricCounter("context_api_cache_events_total", "In-process cache events.", ("cache", "event"))
+        cache_entries = MetricGauge("context_api_cache_entries", "In-process cache entries.", ("cache",))
+        embedding_stats = app.state.query_embeddings.stats()
+        pack_stats = app.state.context_pack_cache.stats()
+        for cache, stats, events in (
+            ("query_embedding", embedding_stats, ("hits", "shared_hits", "misses", "coalesced", "errors", "evictions")),
+            ("context_pack", pack_stats, ("hits", "misses", "stale", "evictions", "prewarmed")),
+        ):
+            for event_name in events:
+                cache_events.inc(float(stats.get(event_name) or 0), cache=cache, event=event_name)
+            cache_entries.set(float(stats.get("entries") or 0), cache=cache)
+        in_flight = MetricGauge("context_api_query_embedding_in_flight", "Query embeddings currently being computed.")
+        in_flight.set(float(embedding_stats.get("in_flight") or 0))
+        telemetry_stats = app.state.telemetry.stats()
+        telemetry_events = MetricCounter("context_api_telemetry_records_total", "Query telemetry writer records by event.", ("event",))
+        for event_name in ("enqueued", "written_query_logs", "written_relevance_scores", "batches", "dropped", "blocked", "write_errors"):
+            telemetry_events.inc(float(telemetry_stats.get(event_name) or 0), event=event_name)
+        telemetry_queued = MetricGauge("context_api_telemetry_queue_depth", "Query telemetry records waiting to be written.")
+        telemetry_queued.set(float(telemetry_stats.get("queued") or 0))
+        return [cache_events, cache_entries, in_flight, telemetry_events, telemetry_queued]
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics_endpoint(
+        _: None = Depends(require_bearer),
+    ) -> Response:
+        return Response(content=REGISTRY.render([_collect_app_metrics]), media_type=CONTENT_TYPE)
+
+    @app.get("/v2/research/ops/storage", response_model=ResearchStorageUsageResponse, dependencies=[ops_timeout])
     def research_ops_storage_endpoint(
         topic_key: str,
         _: None = Depends(require_bearer),
+        db: UnitOfWork = Depends(research_db_sync),
     ) -> ResearchStorageUsageResponse:
         normalized_topic = topic_key.strip().lower()
         usage = get_research_storage_usage(
-            app.state.engine,
+            db,
             topic_key=normalized_topic,
         )
         raw_payload_bytes = int(usage.get("raw_payload_bytes") or 0)
         extracted_text_bytes = int(usage.get("extracted_text_bytes") or 0)
         chunks_bytes = int(usage.get("chunks_bytes") or 0)
         embeddings_bytes = int(usage.get("embeddings_bytes") or 0)
+        read_sample = measure_research_embedding_reads(
+            db,
+            topic_key=normalized_topic,
+        )
         return ResearchStorageUsageResponse(
             topic_key=normalized_topic,
             documents_count=int(usage.get("documents_count") or 0),
@@ -2701,23 +3342,32 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             chunks_bytes=chunks_bytes,
             embeddings_bytes=embeddings_bytes,
             total_bytes=raw_payload_bytes + extracted_text_bytes + chunks_bytes + embeddings_bytes,
+            embeddings_packed_count=int(usage.get("embeddings_packed_count") or 0),
+            embeddings_jsonb_count=int(usage.get("embeddings_jsonb_count") or 0),
+            embeddings_packed_bytes=int(usage.get("embeddings_packed_bytes") or 0),
+            embeddings_jsonb_bytes=int(usage.get("embeddings_jsonb_bytes") or 0),
+            embedding_read_sample_rows=int(read_sample.get("rows") or 0),
+            embedding_read_ms=float(read_sample.get("read_ms") or 0.0),
         )
 
-    @app.get("/v2/research/ops/progress", response_model=ResearchOpsProgressResponse)
-    def research_ops_progress_endpoint(
+    @app.get("/v2/research/ops/progress", response_model=ResearchOpsProgressResponse, dependencies=[ops_timeout])
+    async def research_ops_progress_endpoint(
         topic_key: str,
         run_limit: int = 10,
         _: None = Depends(require_bearer),
     ) -> ResearchOpsProgressResponse:
         normalized_topic = topic_key.strip().lower()
         embedding_runtime = _embedding_runtime()
-        guard_state = _validate_runtime_corpus(app.state.settings, app.state.engine)
-        app.state.runtime_guard = guard_state
-        run_rows = list_research_run_progress(
-            app.state.engine,
-            topic_key=normalized_topic,
-            limit=max(min(run_limit, 50), 1),
+        stats_max_age_s = float(os.getenv("RESEARCH_PIPELINE_STATS_MAX_AGE_S", "300"))
+        guard_state, run_rows, pipeline, ai_rows, db_size_bytes, pipeline_rows = await asyncio.gather(
+            run_db(app.state.async_engine, lambda engine: _validate_runtime_corpus(app.state.settings, engine)),
+            run_db(app.state.async_engine, list_research_run_progress, topic_key=normalized_topic, limit=max(min(run_limit, 50), 1)),
+            run_db(app.state.async_engine, get_research_pipeline_counts, topic_key=normalized_topic),
+            run_db(app.state.async_engine, get_research_ai_usage_by_model, topic_key=normalized_topic),
+            run_db(app.state.async_engine, get_context_db_size_bytes),
+            run_db(app.state.async_engine, list_research_pipeline_stats, max_age_seconds=stats_max_age_s),
         )
+        app.state.runtime_guard = guard_state
         runs: List[ResearchRunProgressRecord] = []
         queued_runs = 0
         running_runs = 0
@@ -2744,14 +3394,12 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 )
             )
 
-        pipeline = get_research_pipeline_counts(app.state.engine, topic_key=normalized_topic)
         chunks_count = int(pipeline.get("chunks_count") or 0)
         embeddings_count = int(pipeline.get("embeddings_count") or 0)
         embedding_coverage_pct = 0.0
         if chunks_count > 0:
             embedding_coverage_pct = min(100.0, (float(embeddings_count) / float(chunks_count)) * 100.0)
 
-        ai_rows = get_research_ai_usage_by_model(app.state.engine, topic_key=normalized_topic)
         ai_models: List[ResearchAiUsageModelRecord] = []
         ai_external_calls_estimate = 0
         ai_estimated_tokens_total = 0
@@ -2778,7 +3426,6 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 )
             )
 
-        db_size_bytes = get_context_db_size_bytes(app.state.engine)
         disk_total_bytes = 0
         disk_free_bytes = 0
         try:
@@ -2813,6 +3460,7 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                 "discovered": int(pipeline.get("discovered_count") or 0),
                 "fetched": int(pipeline.get("fetched_count") or 0),
                 "extracted": int(pipeline.get("extracted_count") or 0),
+                "enriched": int(pipeline.get("enriched_count") or 0),
                 "embedded": int(pipeline.get("embedded_count") or 0),
                 "failed": int(pipeline.get("failed_count") or 0),
             },
@@ -2847,15 +3495,17 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             active_embedding_mode=str(embedding_runtime["mode"]),
             embedding_warning=embedding_runtime.get("warning"),
             ai_models=ai_models,
+            pipeline_workers=len(pipeline_rows),
+            pipeline_stages=_pipeline_stage_records(pipeline_rows),
             runs=runs,
         )
 
-    @app.get("/v2/research/topics", response_model=ResearchTopicListResponse)
-    def research_topics_endpoint(
+    @app.get("/v2/research/topics", response_model=ResearchTopicListResponse, dependencies=[retrieval_timeout])
+    async def research_topics_endpoint(
         limit: int = 20,
         _: None = Depends(require_bearer),
     ) -> ResearchTopicListResponse:
-        rows = list_research_topics(app.state.engine, limit=max(min(limit, 50), 1))
+        rows = await run_db(app.state.async_engine, list_research_topics, limit=max(min(limit, 50), 1))
         return ResearchTopicListResponse(
             items=[
                 ResearchTopicSummary(
@@ -2872,13 +3522,13 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             ]
         )
 
-    @app.get("/v2/research/topics/search", response_model=ResearchTopicSearchResponse)
-    def research_topics_search_endpoint(
+    @app.get("/v2/research/topics/search", response_model=ResearchTopicSearchResponse, dependencies=[retrieval_timeout])
+    async def research_topics_search_endpoint(
         query: str,
         limit: int = 10,
         _: None = Depends(require_bearer),
     ) -> ResearchTopicSearchResponse:
-        rows = list_research_topics(app.state.engine, query=query, limit=max(min(limit, 25), 1))
+        rows = await run_db(app.state.async_engine, list_research_topics, query=query, limit=max(min(limit, 25), 1))
         return ResearchTopicSearchResponse(
             query=query,
             items=[
@@ -2896,17 +3546,19 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             ],
         )
 
-    @app.get("/v2/research/topics/{topic_key}", response_model=ResearchTopicDetailResponse)
-    def research_topic_detail_endpoint(
+    @app.get("/v2/research/topics/{topic_key}", response_model=ResearchTopicDetailResponse, dependencies=[retrieval_timeout])
+    async def research_topic_detail_endpoint(
         topic_key: str,
         _: None = Depends(require_bearer),
     ) -> ResearchTopicDetailResponse:
         normalized_topic = topic_key.strip().lower()
-        detail = get_research_topic_detail(app.state.engine, topic_key=normalized_topic)
+        detail, top_sources, top_themes = await asyncio.gather(
+            run_db(app.state.async_engine, get_research_topic_detail, topic_key=normalized_topic),
+            run_db(app.state.async_engine, list_research_source_metrics_for_topic, topic_key=normalized_topic, limit=5),
+            run_db(app.state.async_engine, collect_research_topic_themes, topic_key=normalized_topic, limit=6),
+        )
         if not detail:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found")
-        top_sources = list_research_source_metrics_for_topic(app.state.engine, topic_key=normalized_topic, limit=5)
-        top_themes = collect_research_topic_themes(app.state.engine, topic_key=normalized_topic, limit=6)
         suggested_queries = [
             f"best practices for {normalized_topic.replace('_', ' ')}",
             f"recent changes in {normalized_topic.replace('_', ' ')}",
@@ -2944,16 +3596,17 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             suggested_queries=suggested_queries,
         )
 
-    @app.get("/v2/research/topics/{topic_key}/documents", response_model=ResearchTopicDocumentsResponse)
-    def research_topic_documents_endpoint(
+    @app.get("/v2/research/topics/{topic_key}/documents", response_model=ResearchTopicDocumentsResponse, dependencies=[retrieval_timeout])
+    async def research_topic_documents_endpoint(
         topic_key: str,
         limit: int = 10,
         sort: str = "recent",
         _: None = Depends(require_bearer),
     ) -> ResearchTopicDocumentsResponse:
         normalized_topic = topic_key.strip().lower()
-        rows = list_research_documents_for_topic(
-            app.state.engine,
+        rows = await run_db(
+            app.state.async_engine,
+            list_research_documents_for_topic,
             topic_key=normalized_topic,
             limit=max(min(limit, 25), 1),
             sort=sort,
@@ -2981,24 +3634,35 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             ],
         )
 
-    @app.post("/v2/research/topics/{topic_key}/summarize", response_model=ResearchTopicSummarizeResponse)
-    def research_topic_summarize_endpoint(
+    @app.post("/v2/research/topics/{topic_key}/summarize", response_model=ResearchTopicSummarizeResponse, dependencies=[retrieval_timeout])
+    async def research_topic_summarize_endpoint(
         topic_key: str,
         payload: ResearchTopicSummarizeRequest,
         _: None = Depends(require_bearer),
     ) -> ResearchTopicSummarizeResponse:
+        trace_id = str(uuid.uuid4())
+        timer = StageTimer()
         normalized_topic = topic_key.strip().lower()
         focus_query = payload.focus.strip() if payload.focus else normalized_topic.replace("_", " ")
-        detail = get_research_topic_detail(app.state.engine, topic_key=normalized_topic)
+        detail, topic_search, themes = await asyncio.gather(
+            timer.timed("topic_detail", run_db(app.state.async_engine, get_research_topic_detail, topic_key=normalized_topic)),
+            timer.timed(
+                "lexical",
+                run_db(
+                    app.state.async_engine,
+                    search_research_chunks,
+                    topic_key=normalized_topic,
+                    query=focus_query,
+                    recency_days=payload.recency_days,
+                    limit=max(payload.max_items * 4, payload.max_items),
+                ),
+            ),
+            timer.timed("themes", run_db(app.state.async_engine, collect_research_topic_themes, topic_key=normalized_topic, limit=6)),
+        )
         if not detail:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found")
-        topic_search = search_research_chunks(
-            app.state.engine,
-            topic_key=normalized_topic,
-            query=focus_query,
-            recency_days=payload.recency_days,
-            limit=max(payload.max_items * 4, payload.max_items),
-        )
+        timer.count("lexical_candidates", len(topic_search))
+        stage_started = time.perf_counter()
         grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for row in topic_search:
             document_id = str(row.get("document_id") or "")
@@ -3036,16 +3700,35 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
                     citations=row_citations,
                 )
             )
-        themes = collect_research_topic_themes(app.state.engine, topic_key=normalized_topic, limit=6)
+        timer.record("assembly", stage_started)
         suggested_queries = [
             f"{focus_query} implementation patterns",
             f"{focus_query} architecture tradeoffs",
             f"{focus_query} recent recommendations",
         ]
+        with timer.stage("synthesis"):
+            synthesis = _summarize_topic_documents(normalized_topic, [item.model_dump(mode="python") for item in items], themes, payload.focus)
+        await _submit_telemetry(
+            app.state.telemetry.submit_query_log,
+            trace_id=trace_id,
+            topic_key=normalized_topic,
+            query_text=focus_query,
+            source_ids=[],
+            token_budget=None,
+            max_items=payload.max_items,
+            recency_days=payload.recency_days,
+            min_relevance_score=None,
+            candidate_count=len(topic_search),
+            returned_document_ids=[item.document_id for item in items],
+            returned_chunk_ids=[citation.chunk_id for citation in citations],
+            timing_ms=timer.total_ms(),
+            endpoint="topic_summarize",
+            stage_timings=timer.stages,
+        )
         return ResearchTopicSummarizeResponse(
             topic_key=normalized_topic,
             focus=payload.focus,
-            synthesis=_summarize_topic_documents(normalized_topic, [item.model_dump(mode="python") for item in items], themes, payload.focus),
+            synthesis=synthesis,
             themes=[
                 ResearchTopicTheme(name=str(row.get("name") or ""), score=float(row.get("score") or 0.0))
                 for row in themes
@@ -3053,17 +3736,22 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             suggested_queries=suggested_queries,
             items=items,
             citations=citations[: payload.max_items * 2],
+            trace=ResearchContextPackTrace(
+                trace_id=trace_id,
+                retrieved_document_ids=[item.document_id for item in items],
+                timing_ms=timer.trace_timing(),
+            ),
         )
 
-    @app.get("/v2/research/topics/{topic_key}/weekly", response_model=ResearchWeeklyDigestResponse)
-    def research_topic_weekly_endpoint(
+    @app.get("/v2/research/topics/{topic_key}/weekly", response_model=ResearchWeeklyDigestResponse, dependencies=[retrieval_timeout])
+    async def research_topic_weekly_endpoint(
         topic_key: str,
         days: int = 7,
         limit: int = 5,
         _: None = Depends(require_bearer),
     ) -> ResearchWeeklyDigestResponse:
         normalized_topic = topic_key.strip().lower()
-        rows = list_recent_research_documents(app.state.engine, topic_key=normalized_topic, days=max(days, 1), limit=max(limit * 6, 12))
+        rows = await run_db(app.state.async_engine, list_recent_research_documents, topic_key=normalized_topic, days=max(days, 1), limit=max(limit * 6, 12))
         grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for row in rows:
             tags = [str(value).strip().lower() for value in (row.get("topic_tags") or []) if str(value).strip()]
@@ -3093,16 +3781,17 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             )
         return ResearchWeeklyDigestResponse(topic_key=normalized_topic, days=max(days, 1), items=items)
 
-    @app.get("/v2/research/topics/{topic_key}/domains/{decision_domain}/summary", response_model=ResearchDomainSummaryResponse)
-    def research_topic_domain_summary_endpoint(
+    @app.get("/v2/research/topics/{topic_key}/domains/{decision_domain}/summary", response_model=ResearchDomainSummaryResponse, dependencies=[retrieval_timeout])
+    async def research_topic_domain_summary_endpoint(
         topic_key: str,
         decision_domain: str,
         _: None = Depends(require_bearer),
     ) -> ResearchDomainSummaryResponse:
         normalized_topic = topic_key.strip().lower()
         normalized_domain = decision_domain.strip().lower()
-        insights = list_research_document_insights(
-            app.state.engine,
+        insights = await run_db(
+            app.state.async_engine,
+            list_research_document_insights,
             topic_key=normalized_topic,
             decision_domain=normalized_domain,
             limit=40,
@@ -3160,15 +3849,16 @@ def create_app(app_settings: Settings | None = None) -> FastAPI:
             redacted_documents=redacted,
         )
 
-    @app.get("/v2/research/review/queue", response_model=ResearchReviewQueueResponse)
+    @app.get("/v2/research/review/queue", response_model=ResearchReviewQueueResponse, dependencies=[ops_timeout])
     def research_review_queue_endpoint(
         topic_key: str,
         limit: int = 20,
         _: None = Depends(require_bearer),
+        db: UnitOfWork = Depends(research_db_sync),
     ) -> ResearchReviewQueueResponse:
         normalized_topic = topic_key.strip().lower()
         rows = list_research_review_queue(
-            app.state.engine,
+            db,
             topic_key=normalized_topic,
             limit=limit,
         )
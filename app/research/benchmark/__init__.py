@@ -0,0 +1,14 @@
+"""Synthetic-corpus retrieval and ingestion benchmarks."""
+
+from app.research.benchmark.corpus import RandomProjectionEmbedder, SyntheticCorpusSpec, seed_synthetic_corpus
+from app.research.benchmark.runner import run_retrieval_benchmark, write_results
+from app.research.benchmark.seeding import run_seed_benchmark
+
+__all__ = [
+    "RandomProjectionEmbedder",
+    "SyntheticCorpusSpec",
+    "seed_synthetic_corpus",
+    "run_retrieval_benchmark",
+    "run_seed_benchmark",
+    "write_results",
+]
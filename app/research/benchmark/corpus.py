@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.research.embeddings import embed_texts
+from app.research.ids import compute_chunk_id, compute_document_id, compute_source_id
+from app.storage.db import (
+    mark_research_document_embedded,
+    mark_research_document_enriched,
+    mark_research_document_extracted,
+    mark_research_document_fetched,
+    replace_research_chunks,
+    replace_research_document_insights,
+    replace_research_embeddings,
+    upsert_research_document_seed,
+    upsert_research_source,
+)
+
+THEMES: Dict[str, List[str]] = {
+    "gpu_supply": ["gpu", "supply", "allocation", "lead", "times", "foundry", "packaging", "capacity"],
+    "retrieval": ["retrieval", "ranking", "embedding", "index", "recall", "latency", "reranker", "hybrid"],
+    "agents": ["agent", "planning", "tool", "checkpoint", "drift", "guardrail", "review", "workflow"],
+    "evaluation": ["evaluation", "benchmark", "regression", "dataset", "metric", "judge", "baseline", "variance"],
+    "inference": ["inference", "batching", "quantization", "throughput", "cache", "kernel", "memory", "serving"],
+    "governance": ["policy", "audit", "compliance", "retention", "redaction", "approval", "risk", "control"],
+}
+FILLER = [
+    "the", "team", "reported", "that", "during", "rollout", "we", "observed", "a", "clear", "shift",
+    "in", "how", "operators", "handle", "production", "systems", "with", "careful", "measurement",
+]
+INSIGHT_TYPES = ["recommendation", "tradeoff", "claim", "metric", "decision_pattern"]
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class SyntheticCorpusSpec:
+    topic_key: str
+    sources: int = 4
+    documents: int = 100
+    chunks_per_document: int = 10
+    insights_per_document: int = 3
+    words_per_chunk: int = 80
+    embedding_model_id: str = "hash-64"
+    embedding_mode: str = "projection"
+    seed: int = 7
+
+    @property
+    def total_chunks(self) -> int:
+        return self.documents * self.chunks_per_document
+
+
+class RandomProjectionEmbedder:
+    """Bag-of-words hashed into buckets and projected through a seeded Gaussian matrix."""
+
+    def __init__(self, *, dims: int = 64, buckets: int = 4096, seed: int = 7) -> None:
+        self.dims = dims
+        self.buckets = buckets
+        rng = np.random.default_rng(seed)
+        self._projection = rng.standard_normal((buckets, dims)).astype(np.float32) / np.sqrt(dims)
+
+    def _bucket(self, token: str) -> int:
+        return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little") % self.buckets
+
+    def __call__(self, *, texts: List[str], model: str = "", api_key: str = "") -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for text in texts:
+            counts = np.zeros(self.buckets, dtype=np.float32)
+            for token in TOKEN_RE.findall(str(text).lower()):
+                counts[self._bucket(token)] += 1.0
+            vector = counts @ self._projection
+            norm = float(np.linalg.norm(vector))
+            vectors.append((vector / norm if norm else vector).tolist())
+        return vectors
+
+
+def corpus_embedder(spec: SyntheticCorpusSpec) -> Callable[..., List[List[float]]]:
+    if spec.embedding_mode == "projection":
+        dims = int(spec.embedding_model_id.split("-", 1)[1]) if spec.embedding_model_id.startswith("hash-") else 64
+        return RandomProjectionEmbedder(dims=dims, seed=spec.seed)
+    return embed_texts
+
+
+def _sentence(rng: random.Random, words: List[str], length: int) -> str:
+    return " ".join(rng.choice(words) for _ in range(max(length, 4))).capitalize() + "."
+
+
+def _chunk_text(rng: random.Random, theme_words: List[str], words: int) -> str:
+    vocabulary = theme_words * 2 + FILLER
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        length = min(rng.randint(8, 16), remaining)
+        sentences.append(_sentence(rng, vocabulary, length))
+        remaining -= length
+    return " ".join(sentences)
+
+
+def build_query_mix(spec: SyntheticCorpusSpec, *, count: int, source_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    rng = random.Random(spec.seed + 1)
+    theme_names = sorted(THEMES)
+    queries: List[Dict[str, Any]] = []
+    for idx in range(count):
+        theme_words = THEMES[theme_names[idx % len(theme_names)]]
+        request: Dict[str, Any] = {
+            "query": " ".join(rng.sample(theme_words, k=rng.randint(2, 3))),
+            "topic_key": spec.topic_key,
+            "max_items": rng.choice([3, 5, 8]),
+        }
+        bucket = idx % 10
+        if bucket == 7:
+            request["recency_days"] = 30
+        elif bucket == 8 and source_ids:
+            request["source_ids"] = [rng.choice(source_ids)]
+        elif bucket == 9:
+            request["query"] = f"unmatched query {idx}"
+        queries.append(request)
+    return queries
+
+
+def seed_synthetic_corpus(
+    engine: Any,
+    spec: SyntheticCorpusSpec,
+    *,
+    embedder: Optional[Callable[..., List[List[float]]]] = None,
+    storage_format: str = "float32",
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    rng = random.Random(spec.seed)
+    embed = embedder or corpus_embedder(spec)
+    theme_names = sorted(THEMES)
+    now = datetime.now(timezone.utc)
+    source_ids: List[str] = []
+    for idx in range(max(spec.sources, 1)):
+        base_url = f"https://bench-{idx}.example.com/feed"
+        source_id = compute_source_id(topic_key=spec.topic_key, kind="rss", base_url=base_url)
+        upsert_research_source(
+            engine,
+            source_id=source_id,
+            topic_key=spec.topic_key,
+            kind="rss",
+            name=f"Benchmark source {idx}",
+            base_url_original=base_url,
+            base_url_canonical=base_url,
+            enabled=True,
+            tags=["benchmark"],
+            publisher_type="independent",
+            source_class="external_secondary",
+            default_decision_domains=["retrieval"],
+            poll_interval_minutes=1440,
+            rate_limit_per_hour=60,
+            robots_mode="ignore",
+            max_items_per_run=100,
+            source_weight=round(0.5 + rng.random(), 3),
+        )
+        source_ids.append(source_id)
+
+    chunk_total = 0
+    insight_total = 0
+    for doc_idx in range(spec.documents):
+        source_id = source_ids[doc_idx % len(source_ids)]
+        theme = theme_names[rng.randrange(len(theme_names))]
+        theme_words = THEMES[theme]
+        canonical_url = f"https://bench-{doc_idx % len(source_ids)}.example.com/posts/{doc_idx}"
+        document_id = compute_document_id(source_id=source_id, canonical_url=canonical_url)
+        title = f"{theme.replace('_', ' ').title()} notes {doc_idx}"
+        published_at = now - timedelta(days=rng.randint(0, 365))
+        chunks = []
+        for ordinal in range(spec.chunks_per_document):
+            content = _chunk_text(rng, theme_words, spec.words_per_chunk)
+            chunks.append(
+                {
+                    "chunk_id": compute_chunk_id(document_id=document_id, ordinal=ordinal, content=content),
+                    "ordinal": ordinal,
+                    "content": content,
+                    "content_hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+                    "chunk_meta": {"heading_path": [title], "section_type": "discussion", "tags": [theme]},
+                }
+            )
+        extracted_text = "\n\n".join(chunk["content"] for chunk in chunks)
+
+        upsert_research_document_seed(
+            engine,
+            document_id=document_id,
+            source_id=source_id,
+            run_id=None,
+            canonical_url=canonical_url,
+            url_original=canonical_url,
+        )
+        mark_research_document_fetched(
+            engine,
+            document_id=document_id,
+            title=title,
+            raw_payload="",
+            content_hash=hashlib.sha256(extracted_text.encode("utf-8")).hexdigest(),
+            fetch_meta={"http_status": 200, "benchmark": True},
+            published_at=published_at,
+        )
+        mark_research_document_extracted(
+            engine,
+            document_id=document_id,
+            extracted_text=extracted_text,
+            extraction_meta={"method": "synthetic", "confidence": 1.0},
+            published_at=published_at,
+        )
+        replace_research_chunks(engine, document_id=document_id, chunks=chunks)
+        mark_research_document_enriched(
+            engine,
+            document_id=document_id,
+            enrichment={
+                "content_type": "company_blog",
+                "publisher_type": "independent",
+                "source_class": "external_secondary",
+                "summary_short": chunks[0]["content"][:320] if chunks else title,
+                "topic_tags": [theme] + rng.sample(theme_words, k=2),
+                "decision_domains": ["retrieval"],
+                "document_signal_score": round(rng.random(), 3),
+                "novelty_score": round(rng.random(), 3),
+                "evidence_density_score": round(rng.random(), 3),
+                "embedding_ready": True,
+            },
+        )
+        insights = []
+        for insight_idx in range(min(spec.insights_per_document, len(chunks))):
+            chunk = chunks[rng.randrange(len(chunks))]
+            insights.append(
+                {
+                    "chunk_id": chunk["chunk_id"],
+                    "insight_type": INSIGHT_TYPES[(doc_idx + insight_idx) % len(INSIGHT_TYPES)],
+                    "text": _sentence(rng, theme_words + FILLER, 14),
+                    "topic_tags": [theme],
+                    "problem_tags": rng.sample(theme_words, k=1),
+                    "intervention_tags": rng.sample(theme_words, k=1),
+                    "tradeoff_dimensions": ["speed_vs_control"] if insight_idx % 2 else [],
+                    "decision_domains": ["retrieval"],
+                    "source_class": "external_secondary",
+                    "confidence": round(0.4 + rng.random() * 0.6, 3),
+                    "evidence_strength": round(rng.random(), 3),
+                    "evidence_quality": round(rng.random(), 3),
+                    "coverage_score": round(rng.random(), 3),
+                }
+            )
+        insight_total += len(replace_research_document_insights(engine, document_id=document_id, insights=insights))
+        vectors = embed(texts=[chunk["content"] for chunk in chunks], model=spec.embedding_model_id, api_key="")
+        replace_research_embeddings(
+            engine,
+            document_id=document_id,
+            embedding_model_id=spec.embedding_model_id,
+            embeddings=[{"chunk_id": chunk["chunk_id"], "vector": vector} for chunk, vector in zip(chunks, vectors)],
+            storage_format=storage_format,
+        )
+        mark_research_document_embedded(engine, document_id=document_id, embedding_model_id=spec.embedding_model_id)
+        chunk_total += len(chunks)
+        if progress is not None:
+            progress(doc_idx + 1, spec.documents)
+
+    return {
+        "topic_key": spec.topic_key,
+        "source_ids": source_ids,
+        "sources": len(source_ids),
+        "documents": spec.documents,
+        "chunks": chunk_total,
+        "insights": insight_total,
+    }
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.config import Settings
+from app.main import create_app
+from app.research.benchmark.corpus import SyntheticCorpusSpec, build_query_mix, corpus_embedder, seed_synthetic_corpus
+from app.research.embedding_cache import QueryEmbeddingCache
+from app.research.pack_cache import ContextPackCache
+from app.storage.db import create_db_engine, delete_research_topic_corpus
+
+SCANNED_TABLES = (
+    "research_sources",
+    "research_documents",
+    "research_chunks",
+    "research_embeddings",
+    "research_document_insights",
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50": round(percentile(values, 50), 2),
+        "p95": round(percentile(values, 95), 2),
+        "p99": round(percentile(values, 99), 2),
+        "mean": round(statistics.fmean(values), 2) if values else 0.0,
+        "max": round(max(values), 2) if values else 0.0,
+    }
+
+
+def _table_scan_counters(engine: Any) -> Dict[str, int]:
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT relname,
+                       coalesce(seq_tup_read, 0) + coalesce(idx_tup_fetch, 0) AS tuples_read
+                FROM pg_stat_user_tables
+                WHERE relname = ANY(:tables)
+                """
+            ),
+            {"tables": list(SCANNED_TABLES)},
+        ).mappings().all()
+    return {str(row["relname"]): int(row["tuples_read"] or 0) for row in rows}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def replay_queries(
+    client: TestClient,
+    queries: List[Dict[str, Any]],
+    *,
+    token: str,
+    path: str = "/v2/research/context/pack",
+) -> Dict[str, Any]:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: List[float] = []
+    stages: Dict[str, List[float]] = defaultdict(list)
+    counts: Dict[str, List[float]] = defaultdict(list)
+    errors = 0
+    for request in queries:
+        started = time.perf_counter()
+        response = client.post(path, json=request, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000.0)
+        if response.status_code != 200:
+            errors += 1
+            continue
+        for name, value in (response.json().get("trace") or {}).get("timing_ms", {}).items():
+            if name.endswith(("_candidates", "_passes", "_chunks")):
+                counts[name].append(float(value))
+            elif name != "total":
+                stages[name].append(float(value))
+    return {
+        "queries": len(queries),
+        "errors": errors,
+        "latency_ms": _summary(latencies),
+        "stages_ms": {name: _summary(values) for name, values in sorted(stages.items())},
+        "candidates": {name: round(statistics.fmean(values), 2) for name, values in sorted(counts.items())},
+    }
+
+
+def run_size(
+    settings: Settings,
+    spec: SyntheticCorpusSpec,
+    *,
+    queries: int,
+    warmup: int = 5,
+    use_pack_cache: bool = False,
+    keep_corpus: bool = False,
+    progress: Optional[Any] = None,
+) -> Dict[str, Any]:
+    engine = create_db_engine(settings.database_url)
+    embedder = corpus_embedder(spec)
+    delete_research_topic_corpus(engine, topic_key=spec.topic_key)
+    seed_started = time.perf_counter()
+    corpus = seed_synthetic_corpus(
+        engine,
+        spec,
+        embedder=embedder,
+        storage_format=os.getenv("RESEARCH_EMBEDDING_STORAGE_FORMAT", "float32"),
+        progress=progress,
+    )
+    seed_seconds = time.perf_counter() - seed_started
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE research_documents, research_chunks, research_embeddings, research_document_insights"))
+
+    app = create_app(settings)
+    app.state.query_embeddings = QueryEmbeddingCache(embedder=embedder)
+    if not use_pack_cache:
+        app.state.context_pack_cache = ContextPackCache(max_entries=0)
+    client = TestClient(app)
+    query_mix = build_query_mix(spec, count=queries, source_ids=corpus["source_ids"])
+    replay_queries(client, query_mix[: max(warmup, 0)], token=settings.context_api_token)
+
+    app.state.telemetry.flush()
+    app.state.engine.dispose()
+    time.sleep(0.5)
+    scans_before = _table_scan_counters(engine)
+    result = replay_queries(client, query_mix, token=settings.context_api_token)
+    app.state.telemetry.flush()
+    app.state.engine.dispose()
+    time.sleep(0.5)
+    scans_after = _table_scan_counters(engine)
+    rows_scanned = {table: scans_after.get(table, 0) - scans_before.get(table, 0) for table in SCANNED_TABLES}
+    total_scanned = sum(rows_scanned.values())
+
+    if not keep_corpus:
+        delete_research_topic_corpus(engine, topic_key=spec.topic_key)
+    engine.dispose()
+    return {
+        "target_chunks": spec.total_chunks,
+        "corpus": {key: value for key, value in corpus.items() if key != "source_ids"},
+        "seed_seconds": round(seed_seconds, 2),
+        **result,
+        "rows_scanned": {
+            "total": total_scanned,
+            "per_query": round(total_scanned / max(len(query_mix), 1), 1),
+            "by_table": rows_scanned,
+        },
+    }
+
+
+def run_retrieval_benchmark(
+    settings: Settings,
+    *,
+    sizes: List[int],
+    queries: int = 200,
+    chunks_per_document: int = 10,
+    insights_per_document: int = 3,
+    sources: int = 4,
+    embedding_model_id: str = "hash-64",
+    embedding_mode: str = "projection",
+    use_pack_cache: bool = False,
+    keep_corpus: bool = False,
+    seed: int = 7,
+    progress: Optional[Any] = None,
+) -> Dict[str, Any]:
+    results = []
+    for size in sizes:
+        documents = max(size // max(chunks_per_document, 1), 1)
+        spec = SyntheticCorpusSpec(
+            topic_key=f"bench_{size}",
+            sources=sources,
+            documents=documents,
+            chunks_per_document=chunks_per_document,
+            insights_per_document=insights_per_document,
+            embedding_model_id=embedding_model_id,
+            embedding_mode=embedding_mode,
+            seed=seed,
+        )
+        results.append(
+            run_size(
+                settings,
+                spec,
+                queries=queries,
+                use_pack_cache=use_pack_cache,
+                keep_corpus=keep_corpus,
+                progress=progress,
+            )
+        )
+    return {
+        "benchmark": "research_context_pack",
+        "git_revision": git_revision(),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "parameters": {
+            "sizes": sizes,
+            "queries": queries,
+            "chunks_per_document": chunks_per_document,
+            "insights_per_document": insights_per_document,
+            "sources": sources,
+            "embedding_model_id": embedding_model_id,
+            "embedding_mode": embedding_mode,
+            "use_pack_cache": use_pack_cache,
+            "embedding_storage_format": os.getenv("RESEARCH_EMBEDDING_STORAGE_FORMAT", "float32"),
+        },
+        "results": results,
+    }
+
+
+def write_results(payload: Dict[str, Any], path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+        handle.write("\n")
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event, text
+
+from app.config import Settings
+from app.research.benchmark.runner import _summary, git_revision
+from app.research.discovery import discover_candidate_items
+from app.research.ids import compute_document_id, compute_source_id
+from app.storage.db import (
+    create_db_engine,
+    delete_research_topic_corpus,
+    seed_research_documents,
+    upsert_research_document_seed,
+    upsert_research_source,
+)
+
+SEED_METHODS = ("per_item", "bulk")
+
+
+def build_sitemap(base_url: str, count: int) -> str:
+    urls = "".join(f"<url><loc>{base_url}/posts/{n}</loc></url>" for n in range(count))
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+
+
+def _seed_rows(source_id: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = []
+    for item in items:
+        url = str(item["url"])
+        rows.append(
+            {
+                "document_id": compute_document_id(source_id=source_id, canonical_url=url, external_id=item.get("external_id") or None),
+                "canonical_url": url,
+                "url_original": url,
+                "external_id": item.get("external_id") or None,
+            }
+        )
+    return rows
+
+
+def _seed_per_item(engine: Any, *, source_id: str, run_id: Any, items: List[Dict[str, Any]]) -> List[str]:
+    # The pre-bulk path: one seed call (SELECT, then INSERT or UPDATE) per discovered item.
+    return [
+        upsert_research_document_seed(
+            engine,
+            document_id=row["document_id"],
+            source_id=source_id,
+            run_id=run_id,
+            canonical_url=row["canonical_url"],
+            url_original=row["url_original"],
+            external_id=row["external_id"],
+        )
+        for row in _seed_rows(source_id, items)
+    ]
+
+
+def _seed_bulk(engine: Any, *, source_id: str, run_id: Any, items: List[Dict[str, Any]]) -> List[str]:
+    rows = seed_research_documents(engine, source_id=source_id, run_id=run_id, items=_seed_rows(source_id, items))
+    return [str(row["seed_state"]) for row in rows]
+
+
+_SEEDERS: Dict[str, Callable[..., List[str]]] = {"per_item": _seed_per_item, "bulk": _seed_bulk}
+
+
+def _prepare_source(engine: Any, *, topic_key: str, base_url: str, items: List[Dict[str, Any]], known: int) -> str:
+    # A fresh source whose first `known` sitemap entries are already embedded documents.
+    source_id = compute_source_id(topic_key=topic_key, kind="site_map", base_url=base_url)
+    upsert_research_source(
+        engine,
+        source_id=source_id,
+        topic_key=topic_key,
+        kind="site_map",
+        name=f"Seed benchmark {base_url}",
+        base_url_original=f"{base_url}/sitemap.xml",
+        base_url_canonical=f"{base_url}/sitemap.xml",
+        enabled=True,
+        tags=["benchmark"],
+        publisher_type="independent",
+        source_class="external_commentary",
+        default_decision_domains=[],
+        poll_interval_minutes=60,
+        rate_limit_per_hour=30,
+        robots_mode="ignore",
+        max_items_per_run=len(items),
+        source_weight=1.0,
+    )
+    if known > 0:
+        seed_research_documents(engine, source_id=source_id, run_id=None, items=_seed_rows(source_id, items[:known]))
+        with engine.begin() as conn:
+            conn.execute(
+                text("UPDATE research_documents SET status = 'embedded' WHERE source_id = :source_id"),
+                {"source_id": source_id},
+            )
+    return source_id
+
+
+def run_seed_benchmark(
+    settings: Settings,
+    *,
+    items: int = 500,
+    known_ratio: float = 0.95,
+    repeats: int = 5,
+    topic_key: str = "bench_seed",
+    keep_corpus: bool = False,
+    progress: Optional[Any] = None,
+) -> Dict[str, Any]:
+    engine = create_db_engine(settings.database_url)
+    statements = {"count": 0}
+
+    def _count_statement(*_args: Any, **_kwargs: Any) -> None:
+        statements["count"] += 1
+
+    event.listen(engine, "before_cursor_execute", _count_statement)
+    known = min(max(int(items * known_ratio), 0), items)
+    delete_research_topic_corpus(engine, topic_key=topic_key)
+    timings: Dict[str, List[float]] = {method: [] for method in SEED_METHODS}
+    round_trips: Dict[str, List[int]] = {method: [] for method in SEED_METHODS}
+    states: Dict[str, Dict[str, int]] = {}
+    try:
+        for repeat in range(max(repeats, 1)):
+            for method in SEED_METHODS:
+                base_url = f"https://{method.replace('_', '-')}-{repeat}.bench-seed.example.com"
+                discovered = discover_candidate_items(
+                    kind="site_map",
+                    raw_text=build_sitemap(base_url, items),
+                    base_url=f"{base_url}/sitemap.xml",
+                    max_items=items,
+                )
+                source_id = _prepare_source(engine, topic_key=topic_key, base_url=base_url, items=discovered, known=known)
+                statements["count"] = 0
+                started = time.perf_counter()
+                seeded = _SEEDERS[method](engine, source_id=source_id, run_id=None, items=discovered)
+                timings[method].append((time.perf_counter() - started) * 1000.0)
+                round_trips[method].append(statements["count"])
+                states[method] = {state: seeded.count(state) for state in sorted(set(seeded))}
+            if progress is not None:
+                progress(repeat + 1, max(repeats, 1))
+    finally:
+        event.remove(engine, "before_cursor_execute", _count_statement)
+        if not keep_corpus:
+            delete_research_topic_corpus(engine, topic_key=topic_key)
+        engine.dispose()
+
+    results = {
+        method: {
+            "latency_ms": _summary(timings[method]),
+            "statements_per_listing": round(statistics.fmean(round_trips[method]), 1),
+            "seed_states": states.get(method, {}),
+        }
+        for method in SEED_METHODS
+    }
+    bulk_p50 = results["bulk"]["latency_ms"]["p50"]
+    return {
+        "benchmark": "research_document_seed",
+        "git_revision": git_revision(),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "parameters": {"items": items, "known_ratio": known_ratio, "known_items": known, "repeats": max(repeats, 1)},
+        "results": results,
+        "speedup_p50": round(results["per_item"]["latency_ms"]["p50"] / bulk_p50, 2) if bulk_p50 else 0.0,
+    }
@@ -104,6 +104,7 @@ class ResearchIngestRunStatusResponse(BaseModel):
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
     counters: ResearchRunCounters = Field(default_factory=ResearchRunCounters)
+    metrics: Dict[str, float] = Field(default_factory=dict)
     errors: List[str] = Field(default_factory=list)
 
 
@@ -259,6 +260,7 @@ class ResearchContextPackTrace(BaseModel):
     embedding_model_id: str = ""
     embedding_mode: str = ""
     embedding_warning: Optional[str] = None
+    cache_hit: bool = False
 
 
 class ResearchContextPackResponse(BaseModel):
@@ -346,6 +348,7 @@ class ResearchEvidenceRelatedResponse(BaseModel):
     related_items: List[ResearchEvidenceItem] = Field(default_factory=list)
     relations: List[ResearchEvidenceRelation] = Field(default_factory=list)
     coverage_summary: Dict[str, float] = Field(default_factory=dict)
+    trace: Optional[ResearchContextPackTrace] = None
 
 
 class ResearchEvidenceCompareCluster(BaseModel):
@@ -447,6 +450,101 @@ class ResearchStorageUsageResponse(BaseModel):
     chunks_bytes: int = 0
     embeddings_bytes: int = 0
     total_bytes: int = 0
+    embeddings_packed_count: int = 0
+    embeddings_jsonb_count: int = 0
+    embeddings_packed_bytes: int = 0
+    embeddings_jsonb_bytes: int = 0
+    embedding_read_sample_rows: int = 0
+    embedding_read_ms: float = 0.0
+
+
+class ResearchQueryEmbeddingCacheStats(BaseModel):
+    hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    evictions: int = 0
+    entries: int = 0
+    max_entries: int = 0
+    ttl_seconds: int = 0
+    shared_tier_enabled: bool = False
+    in_flight: int = 0
+    hit_ratio: float = 0.0
+
+
+class ResearchContextPackCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    evictions: int = 0
+    prewarmed: int = 0
+    entries: int = 0
+    max_entries: int = 0
+    ttl_seconds: int = 0
+    hit_ratio: float = 0.0
+
+
+class ResearchTelemetryWriterStats(BaseModel):
+    enqueued: int = 0
+    written_query_logs: int = 0
+    written_relevance_scores: int = 0
+    batches: int = 0
+    dropped: int = 0
+    blocked: int = 0
+    write_errors: int = 0
+    queued: int = 0
+    max_queue: int = 0
+    batch_size: int = 0
+    overflow: str = "drop"
+    enabled: bool = True
+
+
+class ResearchStageLatency(BaseModel):
+    endpoint: str
+    stage: str
+    samples: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class ResearchOpsLatencyResponse(BaseModel):
+    topic_key: str
+    since_hours: int
+    stages: List[ResearchStageLatency] = Field(default_factory=list)
+
+
+class ResearchOpsCachesResponse(BaseModel):
+    query_embedding: ResearchQueryEmbeddingCacheStats
+    context_pack: ResearchContextPackCacheStats
+    telemetry: ResearchTelemetryWriterStats
+
+
+class ResearchDbPoolStats(BaseModel):
+    role: str
+    engine: str
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    overflow_checkouts: int = 0
+    timeouts: int = 0
+    invalidations: int = 0
+    pool_size: int = 0
+    max_overflow: int = 0
+    timeout_seconds: float = 0.0
+    recycle_seconds: int = -1
+    checked_out: int = 0
+    checked_in: int = 0
+    overflow: int = 0
+    checkout_wait_avg_ms: float = 0.0
+    checkout_wait_p50_ms: float = 0.0
+    checkout_wait_p95_ms: float = 0.0
+    checkout_wait_max_ms: float = 0.0
+
+
+class ResearchOpsPoolResponse(BaseModel):
+    pools: List[ResearchDbPoolStats] = Field(default_factory=list)
 
 
 class ResearchRunProgressRecord(BaseModel):
@@ -473,6 +571,17 @@ class ResearchAiUsageModelRecord(BaseModel):
     external_api: bool = False
 
 
+class ResearchPipelineStageRecord(BaseModel):
+    stage: str
+    workers: int = 0
+    queue_depth: int = 0
+    queue_capacity: int = 0
+    in_flight: int = 0
+    processed: int = 0
+    failed: int = 0
+    throughput_per_min: float = 0.0
+
+
 class ResearchOpsProgressResponse(BaseModel):
     topic_key: str
     queued_runs: int = 0
@@ -509,6 +618,8 @@ class ResearchOpsProgressResponse(BaseModel):
     active_embedding_mode: str = ""
     embedding_warning: Optional[str] = None
     ai_models: List[ResearchAiUsageModelRecord] = Field(default_factory=list)
+    pipeline_workers: int = 0
+    pipeline_stages: List[ResearchPipelineStageRecord] = Field(default_factory=list)
     runs: List[ResearchRunProgressRecord] = Field(default_factory=list)
 
 
@@ -697,6 +808,7 @@ class ResearchTopicSummarizeResponse(BaseModel):
     suggested_queries: List[str] = Field(default_factory=list)
     items: List[ResearchTopicDocument] = Field(default_factory=list)
     citations: List[ResearchCitation] = Field(default_factory=list)
+    trace: Optional[ResearchContextPackTrace] = None
 
 
 class ResearchDecisionAlternative(BaseModel):
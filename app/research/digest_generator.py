@@ -17,6 +17,7 @@ from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
+from app.http_client import get_http_client
 from app.research.brief_ops import resolve_website_repo_paths
 from app.storage.db import create_db_engine, search_research_document_chunks
 
@@ -726,7 +727,7 @@ def parse_request(argv: Optional[Sequence[str]] = None) -> GeneratorRequest:
 
 
 def create_generator_engine(settings: DigestGeneratorSettings) -> Engine:
-    return create_db_engine(settings.database_url)
+    return create_db_engine(settings.database_url, role="digest")
 
 
 def get_existing_digest_dates(digest_dir: Path) -> set[date]:
@@ -746,11 +747,9 @@ def get_earliest_digestable_date(engine: Engine, topic_key: str) -> Optional[dat
     sql = """
         SELECT min(date(({effective_sql}) AT TIME ZONE 'UTC')) AS earliest_date
         FROM research_documents d
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.status IN ('embedded', 'extracted', 'enriched')
-          AND coalesce(d.suppressed, false) = false
+          AND NOT d.suppressed
     """.format(effective_sql=effective_sql)
     with engine.begin() as conn:
         value = conn.execute(text(sql), {"topic_key": topic_key}).scalar_one_or_none()
@@ -866,9 +865,9 @@ def load_candidates_for_window(
         FROM research_documents d
         JOIN research_sources s
           ON s.source_id = d.source_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.status IN ('embedded', 'extracted', 'enriched')
-          AND coalesce(d.suppressed, false) = false
+          AND NOT d.suppressed
           AND {effective_sql} >= :window_start
           AND {effective_sql} < :window_end
         ORDER BY {effective_sql} DESC NULLS LAST, d.document_signal_score DESC, d.updated_at DESC
@@ -1016,7 +1015,7 @@ def _openai_chat_completion(
     system_prompt: str,
     user_prompt: str,
 ) -> Dict[str, Any]:
-    response = httpx.post(
+    response = get_http_client("openai").post(
         os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1/chat/completions"),
         headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
         json={
@@ -4,8 +4,6 @@ from html import unescape
 import re
 from typing import Dict, List
 from urllib.parse import urljoin, urlparse, urlunparse
-from urllib.request import Request, urlopen
-from urllib.robotparser import RobotFileParser
 from xml.etree import ElementTree
 
 from bs4 import BeautifulSoup
@@ -176,29 +174,6 @@ def discover_candidate_items(
     return discover_from_html_listing(raw_text, base_url=base_url, max_items=bounded_max)
 
 
-def is_allowed_by_robots(
-    *,
-    url: str,
-    user_agent: str,
-    timeout_seconds: int = 5,
-) -> bool:
-    parsed = urlparse(url)
-    if not parsed.scheme or not parsed.netloc:
-        return False
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-    parser = RobotFileParser()
-    parser.set_url(robots_url)
-    try:
-        req = Request(robots_url, headers={"User-Agent": user_agent})
-        with urlopen(req, timeout=timeout_seconds) as response:
-            body = response.read().decode("utf-8", errors="ignore")
-        parser.parse(body.splitlines())
-    except Exception:
-        # Fail-open for unavailable robots files; strict deny only when explicitly disallowed.
-        return True
-    return parser.can_fetch(user_agent, url)
-
-
 def extract_title_from_html(raw_html: str) -> str:
     match = re.search(r"<title>(.*?)</title>", raw_html, re.IGNORECASE | re.DOTALL)
     if not match:
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.research.embeddings import embed_texts
+from app.storage.db import get_research_query_embedding, run_db, upsert_research_query_embedding
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+def normalize_query_text(query: str) -> str:
+    return " ".join(str(query or "").lower().split())
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(normalize_query_text(query).encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = Event()
+        self.vector: Optional[List[float]] = None
+        self.error: Optional[BaseException] = None
+
+
+class QueryEmbeddingCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: int = 3600,
+        engine: Any = None,
+        shared: bool = False,
+        embedder: Callable[..., List[List[float]]] = embed_texts,
+        async_engine: Any = None,
+        async_embedder: Optional[Callable[..., Awaitable[List[List[float]]]]] = None,
+        http_client: Any = None,
+    ) -> None:
+        self._max_entries = max(max_entries, 1)
+        self._ttl_seconds = max(ttl_seconds, 1)
+        self._engine = engine
+        self._async_engine = async_engine
+        self._shared = bool(shared and engine is not None)
+        self._embedder = embedder
+        self._async_embedder = async_embedder
+        self._http_client = http_client
+        self._lock = Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[List[float], float]]" = OrderedDict()
+        self._flights: Dict[CacheKey, _Flight] = {}
+        self._async_flights: Dict[CacheKey, "asyncio.Future[List[float]]"] = {}
+        self._counters = {
+            "hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "evictions": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        self._counters[name] += 1
+
+    def _lookup(self, key: CacheKey) -> Optional[List[float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        vector, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return vector
+
+    def _store(self, key: CacheKey, vector: List[float]) -> None:
+        self._entries[key] = (vector, time.monotonic() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._count("evictions")
+
+    def embed_query(self, *, query: str, model: str, api_key: str = "") -> List[float]:
+        normalized = normalize_query_text(query)
+        if not normalized:
+            return []
+        key = (model, normalized)
+        with self._lock:
+            vector = self._lookup(key)
+            if vector is not None:
+                self._count("hits")
+                return vector
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                self._count("coalesced")
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return list(flight.vector or [])
+        try:
+            vector = self._load_shared(model, normalized)
+            if vector is not None:
+                with self._lock:
+                    self._count("shared_hits")
+            else:
+                vectors = self._embedder(texts=[normalized], model=model, api_key=api_key)
+                vector = list(vectors[0]) if vectors else []
+                with self._lock:
+                    self._count("misses")
+                if vector:
+                    self._save_shared(model, normalized, vector)
+            if vector:
+                with self._lock:
+                    self._store(key, vector)
+            flight.vector = vector
+            return vector
+        except BaseException as exc:
+            with self._lock:
+                self._count("errors")
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def embed_query_async(self, *, query: str, model: str, api_key: str = "") -> List[float]:
+        # Event-loop counterpart of embed_query; concurrent misses for the same key share one
+        # provider call through a future instead of blocking a thread on an Event.
+        normalized = normalize_query_text(query)
+        if not normalized:
+            return []
+        key = (model, normalized)
+        with self._lock:
+            vector = self._lookup(key)
+            if vector is not None:
+                self._count("hits")
+                return vector
+            flight = self._async_flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = asyncio.get_running_loop().create_future()
+                self._async_flights[key] = flight
+            else:
+                self._count("coalesced")
+        if not leader:
+            try:
+                return list(await asyncio.shield(flight))
+            except asyncio.CancelledError:
+                # The leader was cancelled, not this caller: retry, becoming the leader if needed.
+                if flight.cancelled():
+                    return await self.embed_query_async(query=query, model=model, api_key=api_key)
+                raise
+        try:
+            vector = await self._load_shared_async(model, normalized)
+            if vector is not None:
+                with self._lock:
+                    self._count("shared_hits")
+            else:
+                vectors = await self._embed_async(normalized, model=model, api_key=api_key)
+                vector = list(vectors[0]) if vectors else []
+                with self._lock:
+                    self._count("misses")
+                if vector:
+                    await self._save_shared_async(model, normalized, vector)
+            if vector:
+                with self._lock:
+                    self._store(key, vector)
+            flight.set_result(vector)
+            return vector
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as exc:
+            with self._lock:
+                self._count("errors")
+            flight.set_exception(exc)
+            # Mark the exception retrieved so an un-awaited flight does not log it again.
+            flight.exception()
+            raise
+        finally:
+            with self._lock:
+                self._async_flights.pop(key, None)
+
+    async def _embed_async(self, normalized: str, *, model: str, api_key: str) -> List[List[float]]:
+        if self._async_embedder is None:
+            return await asyncio.to_thread(self._embedder, texts=[normalized], model=model, api_key=api_key)
+        return await self._async_embedder(texts=[normalized], model=model, api_key=api_key, client=self._http_client)
+
+    async def _load_shared_async(self, model: str, normalized: str) -> Optional[List[float]]:
+        if not self._shared:
+            return None
+        if self._async_engine is None:
+            return await asyncio.to_thread(self._load_shared, model, normalized)
+        try:
+            return await run_db(
+                self._async_engine,
+                get_research_query_embedding,
+                embedding_model_id=model,
+                query_hash=query_hash(normalized),
+            )
+        except Exception as exc:
+            logger.warning("query embedding cache lookup failed: %s", exc)
+            return None
+
+    async def _save_shared_async(self, model: str, normalized: str, vector: List[float]) -> None:
+        if not self._shared:
+            return
+        if self._async_engine is None:
+            await asyncio.to_thread(self._save_shared, model, normalized, vector)
+            return
+        try:
+            await run_db(
+                self._async_engine,
+                upsert_research_query_embedding,
+                embedding_model_id=model,
+                query_hash=query_hash(normalized),
+                query_text=normalized,
+                vector=vector,
+                ttl_seconds=self._ttl_seconds,
+            )
+        except Exception as exc:
+            logger.warning("query embedding cache write failed: %s", exc)
+
+    def _load_shared(self, model: str, normalized: str) -> Optional[List[float]]:
+        if not self._shared:
+            return None
+        try:
+            return get_research_query_embedding(
+                self._engine,
+                embedding_model_id=model,
+                query_hash=query_hash(normalized),
+            )
+        except Exception as exc:
+            logger.warning("query embedding cache lookup failed: %s", exc)
+            return None
+
+    def _save_shared(self, model: str, normalized: str, vector: List[float]) -> None:
+        if not self._shared:
+            return
+        try:
+            upsert_research_query_embedding(
+                self._engine,
+                embedding_model_id=model,
+                query_hash=query_hash(normalized),
+                query_text=normalized,
+                vector=vector,
+                ttl_seconds=self._ttl_seconds,
+            )
+        except Exception as exc:
+            logger.warning("query embedding cache write failed: %s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+            in_flight = len(self._flights) + len(self._async_flights)
+        lookups = counters["hits"] + counters["shared_hits"] + counters["misses"] + counters["coalesced"]
+        hit_total = counters["hits"] + counters["shared_hits"] + counters["coalesced"]
+        return {
+            **counters,
+            "entries": entries,
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "shared_tier_enabled": self._shared,
+            "in_flight": in_flight,
+            "hit_ratio": round(hit_total / lookups, 4) if lookups else 0.0,
+        }
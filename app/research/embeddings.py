@@ -3,12 +3,33 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
-from typing import Iterable, List
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import httpx
 
+from app.http_client import get_http_client
+from app.metrics import REGISTRY, SIZE_BUCKETS
+
 logger = logging.getLogger(__name__)
 
+EMBEDDING_REQUEST_SECONDS = REGISTRY.histogram(
+    "context_api_embedding_request_seconds",
+    "Embedding API latency per batch request.",
+    ("client",),
+)
+EMBEDDING_BATCH_SIZE = REGISTRY.histogram(
+    "context_api_embedding_batch_size",
+    "Texts per embedding API batch request.",
+    ("client",),
+    buckets=SIZE_BUCKETS,
+)
+EMBEDDING_ERRORS = REGISTRY.counter(
+    "context_api_embedding_errors_total",
+    "Failed embedding API batch requests.",
+    ("client",),
+)
+
 
 def _hash_embedding(text: str, *, dims: int = 64) -> List[float]:
     digest = hashlib.sha256(text.encode("utf-8")).digest()
@@ -65,15 +86,10 @@ def resolve_embedding_runtime(*, model: str, api_key: str = "") -> dict:
     }
 
 
-def embed_texts(
-    *,
-    texts: Iterable[str],
-    model: str,
-    api_key: str = "",
-) -> List[List[float]]:
-    text_list = [str(text) for text in texts]
-    if not text_list:
-        return []
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+
+
+def _local_embeddings(text_list: List[str], *, model: str, api_key: str) -> Optional[List[List[float]]]:
     runtime = resolve_embedding_runtime(model=model, api_key=api_key)
     if runtime["mode"] == "hash":
         logger.warning(runtime["warning"])
@@ -85,38 +101,104 @@ def embed_texts(
             dims = _hash_model_dims("hash-64")
             return [_hash_embedding(text, dims=dims) for text in text_list]
         raise RuntimeError(runtime["warning"])
+    return None
 
-    base_url = "https://api.openai.com/v1/embeddings"
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    vectors = []
+
+def _embedding_batches(text_list: List[str]) -> Iterator[List[str]]:
     batch: List[str] = []
     batch_chars = 0
-
-    def flush(current_batch: List[str]) -> None:
-        nonlocal vectors
-        payload = {"model": model, "input": current_batch}
-        response = httpx.post(base_url, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        batch_vectors = []
-        for row in data.get("data", []):
-            embedding = row.get("embedding")
-            if isinstance(embedding, list):
-                batch_vectors.append([float(value) for value in embedding])
-        if len(batch_vectors) != len(current_batch):
-            raise RuntimeError("embedding response length mismatch")
-        vectors.extend(batch_vectors)
-
     for text in text_list:
         text_chars = len(text)
         if batch and (len(batch) >= 32 or batch_chars + text_chars > 20000):
-            flush(batch)
+            yield batch
             batch = []
             batch_chars = 0
         batch.append(text)
         batch_chars += text_chars
     if batch:
-        flush(batch)
+        yield batch
+
+
+def _parse_embedding_response(data: Dict[str, Any], *, expected: int) -> List[List[float]]:
+    batch_vectors = []
+    for row in data.get("data", []):
+        embedding = row.get("embedding")
+        if isinstance(embedding, list):
+            batch_vectors.append([float(value) for value in embedding])
+    if len(batch_vectors) != expected:
+        raise RuntimeError("embedding response length mismatch")
+    return batch_vectors
+
+
+def embed_texts(
+    *,
+    texts: Iterable[str],
+    model: str,
+    api_key: str = "",
+) -> List[List[float]]:
+    text_list = [str(text) for text in texts]
+    if not text_list:
+        return []
+    local = _local_embeddings(text_list, model=model, api_key=api_key)
+    if local is not None:
+        return local
+
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    vectors: List[List[float]] = []
+    for batch in _embedding_batches(text_list):
+        EMBEDDING_BATCH_SIZE.observe(len(batch), client="sync")
+        started = time.perf_counter()
+        try:
+            response = get_http_client("openai").post(
+                OPENAI_EMBEDDINGS_URL, headers=headers, json={"model": model, "input": batch}, timeout=30
+            )
+            response.raise_for_status()
+            vectors.extend(_parse_embedding_response(response.json(), expected=len(batch)))
+        except Exception:
+            EMBEDDING_ERRORS.inc(client="sync")
+            raise
+        finally:
+            EMBEDDING_REQUEST_SECONDS.observe(time.perf_counter() - started, client="sync")
+    if len(vectors) != len(text_list):
+        raise RuntimeError("embedding response length mismatch")
+    return vectors
+
+
+async def embed_texts_async(
+    *,
+    texts: Iterable[str],
+    model: str,
+    api_key: str = "",
+    client: Optional[httpx.AsyncClient] = None,
+) -> List[List[float]]:
+    # Same contract as embed_texts; pass the app's shared client to reuse pooled connections.
+    text_list = [str(text) for text in texts]
+    if not text_list:
+        return []
+    local = _local_embeddings(text_list, model=model, api_key=api_key)
+    if local is not None:
+        return local
+
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    owned_client = client is None
+    http = client or httpx.AsyncClient(timeout=30)
+    vectors: List[List[float]] = []
+    try:
+        for batch in _embedding_batches(text_list):
+            EMBEDDING_BATCH_SIZE.observe(len(batch), client="async")
+            started = time.perf_counter()
+            try:
+                response = await http.post(OPENAI_EMBEDDINGS_URL, headers=headers, json={"model": model, "input": batch}, timeout=30)
+                response.raise_for_status()
+                vectors.extend(_parse_embedding_response(response.json(), expected=len(batch)))
+            except Exception:
+                EMBEDDING_ERRORS.inc(client="async")
+                raise
+            finally:
+                EMBEDDING_REQUEST_SECONDS.observe(time.perf_counter() - started, client="async")
+    finally:
+        if owned_client:
+            await http.aclose()
     if len(vectors) != len(text_list):
         raise RuntimeError("embedding response length mismatch")
     return vectors
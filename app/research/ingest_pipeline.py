@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.intel.extract import extract_readable_text
+from app.metrics import REGISTRY, Counter, Gauge
+from app.research.pdf_extract import extract_pdf_text
+
+logger = logging.getLogger(__name__)
+
+THROUGHPUT_WINDOW_S = 60.0
+
+_STOP = object()
+
+_STATS_LOCK = threading.Lock()
+_STAGE_STATS: Dict[Tuple[str, str], "StageStats"] = {}
+_LIVE_STAGES: "weakref.WeakSet[PipelineStage]" = weakref.WeakSet()
+
+_EXTRACT_POOL: Optional[ProcessPoolExecutor] = None
+_EXTRACT_POOL_SIZE = 0
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+
+class StageStats:
+    # Lifetime totals per (pipeline, stage) in this process; pipelines come and go per worker
+    # loop iteration but their counts accumulate here.
+    def __init__(self, pipeline: str, stage: str) -> None:
+        self.pipeline = pipeline
+        self.stage = stage
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self._recent: Deque[float] = deque(maxlen=8192)
+
+    def record(self, *, items: int, seconds: float, failed: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if failed:
+                self.failed += items
+            else:
+                self.processed += items
+            self.busy_seconds += seconds
+            self._recent.extend([now] * items)
+
+    def snapshot(self) -> Dict[str, Any]:
+        cutoff = time.monotonic() - THROUGHPUT_WINDOW_S
+        with self._lock:
+            while self._recent and self._recent[0] < cutoff:
+                self._recent.popleft()
+            return {
+                "processed": self.processed,
+                "failed": self.failed,
+                "busy_seconds": round(self.busy_seconds, 3),
+                "throughput_per_min": float(len(self._recent)) * 60.0 / THROUGHPUT_WINDOW_S,
+            }
+
+
+def stage_stats(pipeline: str, stage: str) -> StageStats:
+    with _STATS_LOCK:
+        stats = _STAGE_STATS.get((pipeline, stage))
+        if stats is None:
+            stats = StageStats(pipeline, stage)
+            _STAGE_STATS[(pipeline, stage)] = stats
+        return stats
+
+
+class PipelineStage:
+    # A bounded queue drained by `workers` threads. put() blocks while the queue is full, so a
+    # slow stage holds back the stage feeding it. With batch_size > 1 a worker keeps taking items
+    # until their summed weight reaches batch_size or batch_wait_s passes, then handles them
+    # together. Handler exceptions go to on_error with the whole batch.
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[List[Any]], None],
+        *,
+        on_error: Callable[[List[Any], BaseException], None],
+        workers: int = 1,
+        queue_size: int = 16,
+        batch_size: int = 1,
+        batch_wait_s: float = 0.0,
+        weight: Optional[Callable[[Any], int]] = None,
+        pipeline: str = "research",
+    ) -> None:
+        self.name = name
+        self.pipeline = pipeline
+        self.workers = max(workers, 1)
+        self._handler = handler
+        self._on_error = on_error
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(queue_size, 1))
+        self._batch_size = max(batch_size, 1)
+        self._batch_wait_s = max(batch_wait_s, 0.0)
+        self._weight = weight or (lambda _item: 1)
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._threads: List[threading.Thread] = []
+        self.stats = stage_stats(pipeline, name)
+
+    def start(self) -> None:
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.pipeline}-{self.name}-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        _LIVE_STAGES.add(self)
+
+    def stop(self) -> None:
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        _LIVE_STAGES.discard(self)
+
+    def put(self, item: Any) -> None:
+        self._queue.put(item)
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._queue.qsize() + self._busy
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            busy = self._busy
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "in_flight": busy,
+        }
+
+    def _next_batch(self) -> Tuple[List[Any], bool]:
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        if self._batch_size == 1:
+            return batch, False
+        weight = self._weight(first)
+        deadline = time.monotonic() + self._batch_wait_s
+        while weight < self._batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+            weight += self._weight(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if not batch:
+                continue
+            with self._lock:
+                self._busy += len(batch)
+            started = time.perf_counter()
+            failed = False
+            try:
+                self._handler(batch)
+            except BaseException as exc:
+                failed = True
+                try:
+                    self._on_error(batch, exc)
+                except Exception:  # pragma: no cover - defensive runtime path
+                    logger.exception("pipeline stage %s error handler failed", self.name)
+            finally:
+                with self._lock:
+                    self._busy -= len(batch)
+                self.stats.record(items=len(batch), seconds=time.perf_counter() - started, failed=failed)
+
+
+def pipeline_stats(pipeline: str = "research") -> List[Dict[str, Any]]:
+    # One row per stage seen in this process: live queue depth / in-flight / worker counts of
+    # running stages plus lifetime totals and recent throughput.
+    with _STATS_LOCK:
+        stats = [value for key, value in _STAGE_STATS.items() if key[0] == pipeline]
+    live: Dict[str, Dict[str, Any]] = {}
+    for stage in list(_LIVE_STAGES):
+        if stage.pipeline != pipeline:
+            continue
+        row = stage.snapshot()
+        current = live.setdefault(stage.name, {"workers": 0, "queue_depth": 0, "queue_capacity": 0, "in_flight": 0})
+        for key in current:
+            current[key] += int(row[key])
+    rows = []
+    for stat in stats:
+        row = {"stage": stat.stage, "workers": 0, "queue_depth": 0, "queue_capacity": 0, "in_flight": 0}
+        row.update(live.get(stat.stage, {}))
+        row.update(stat.snapshot())
+        rows.append(row)
+    return rows
+
+
+def extract_document(*, raw_payload: str, content_bytes: bytes, is_pdf: bool, url: str) -> Dict[str, Any]:
+    # Top-level so it can run in the extraction process pool.
+    if is_pdf:
+        extraction = extract_pdf_text(content_bytes)
+        extraction["published_at"] = None
+        extraction["confidence"] = 0.6 if extraction.get("text") else 0.0
+        return extraction
+    return extract_readable_text(raw_payload, url)
+
+
+def _extraction_pool(processes: int) -> Optional[ProcessPoolExecutor]:
+    global _EXTRACT_POOL, _EXTRACT_POOL_SIZE
+    if processes <= 0:
+        return None
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None or _EXTRACT_POOL_SIZE != processes:
+            if _EXTRACT_POOL is not None:
+                _EXTRACT_POOL.shutdown(wait=False)
+            # spawn: the worker process holds DB pools and threads that must not be forked.
+            _EXTRACT_POOL = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+            _EXTRACT_POOL_SIZE = processes
+        return _EXTRACT_POOL
+
+
+def run_extraction(*, raw_payload: str, content_bytes: bytes, is_pdf: bool, url: str, processes: int) -> Dict[str, Any]:
+    global _EXTRACT_POOL
+    kwargs = {"raw_payload": raw_payload, "content_bytes": content_bytes, "is_pdf": is_pdf, "url": url}
+    pool = _extraction_pool(processes)
+    if pool is None:
+        return extract_document(**kwargs)
+    try:
+        return pool.submit(extract_document, **kwargs).result()
+    except BrokenProcessPool:
+        # A crashed extraction process breaks the pool; rebuild it next time and extract here.
+        logger.warning("research extraction pool broken; extracting in-process url=%s", url)
+        with _EXTRACT_POOL_LOCK:
+            if _EXTRACT_POOL is pool:
+                _EXTRACT_POOL = None
+        return extract_document(**kwargs)
+
+
+def shutdown_extraction_pool() -> None:
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        pool, _EXTRACT_POOL = _EXTRACT_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _collect_pipeline_metrics() -> List[Any]:
+    depth = Gauge("context_api_pipeline_queue_depth", "Items waiting in a pipeline stage queue.", ("pipeline", "stage"))
+    in_flight = Gauge("context_api_pipeline_stage_in_flight", "Items being handled by a pipeline stage.", ("pipeline", "stage"))
+    items = Counter(
+        "context_api_pipeline_stage_items_total",
+        "Items handled by a pipeline stage by result.",
+        ("pipeline", "stage", "result"),
+    )
+    with _STATS_LOCK:
+        pipelines = sorted({key[0] for key in _STAGE_STATS})
+    for pipeline in pipelines:
+        for row in pipeline_stats(pipeline):
+            depth.set(row["queue_depth"], pipeline=pipeline, stage=row["stage"])
+            in_flight.set(row["in_flight"], pipeline=pipeline, stage=row["stage"])
+            items.inc(row["processed"], pipeline=pipeline, stage=row["stage"], result="ok")
+            items.inc(row["failed"], pipeline=pipeline, stage=row["stage"], result="error")
+    return [depth, in_flight, items]
+
+
+REGISTRY.register_collector(_collect_pipeline_metrics)
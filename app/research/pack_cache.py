@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+# Fields the retrieval path itself case-folds (query embedding cache, tag filters, topic key);
+# every other string, e.g. source_ids or content_types, is matched as given.
+_CASEFOLDED_FIELDS = frozenset({"query", "topic_key", "problem_tags", "intervention_tags"})
+
+
+def _normalize_value(value: Any, *, casefold: bool = False) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.lower().split()) if casefold else value
+    if isinstance(value, (list, tuple, set)):
+        normalized = [_normalize_value(item, casefold=casefold) for item in value]
+        return sorted(normalized, key=lambda item: json.dumps(item, sort_keys=True, default=str))
+    if isinstance(value, dict):
+        return {str(key): _normalize_value(item, casefold=key in _CASEFOLDED_FIELDS) for key, item in value.items()}
+    return value
+
+
+def context_pack_cache_key(request: Dict[str, Any]) -> str:
+    normalized = _normalize_value(request)
+    encoded = json.dumps(normalized, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ContextPackCache:
+    def __init__(self, *, max_entries: int = 256, ttl_seconds: int = 300) -> None:
+        self._max_entries = max(max_entries, 0)
+        self._ttl_seconds = max(ttl_seconds, 1)
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, Tuple[int, float, Dict[str, Any]]]" = OrderedDict()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "evictions": 0,
+            "prewarmed": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def get(self, key: str, *, corpus_version: int) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            version, expires_at, value = entry
+            if version != corpus_version or expires_at <= time.monotonic():
+                del self._entries[key]
+                self._counters["stale"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Dict[str, Any], *, corpus_version: int, prewarm: bool = False) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (corpus_version, time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if prewarm:
+                self._counters["prewarmed"] += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "entries": entries,
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from app.intel.fetch import fetch_url
+from app.metrics import REGISTRY, Counter
+from app.storage.db import get_research_robots_policy, upsert_research_robots_policy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_S = 86_400
+MIN_TTL_S = 300
+ERROR_TTL_S = 600
+MAX_BODY_CHARS = 512_000
+
+_MAX_AGE_RE = re.compile(r"(?:s-maxage|max-age)\s*=\s*(\d+)")
+
+# lookup() result -> stats counter.
+_RESULT_COUNTERS = {"hit": "hits", "shared_hit": "shared_hits", "coalesced": "coalesced", "miss": "misses", "error": "errors"}
+
+_LIVE_CACHES: "weakref.WeakSet[RobotsPolicyCache]" = weakref.WeakSet()
+
+
+def robots_origin(url: str) -> str:
+    parsed = urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        return ""
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}"
+
+
+def ttl_from_headers(headers: Dict[str, str], *, default: float, minimum: float, maximum: float) -> float:
+    cache_control = str(headers.get("cache-control") or "").lower()
+    ttl: Optional[float] = None
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        ttl = minimum
+    else:
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            ttl = float(match.group(1))
+        elif headers.get("expires"):
+            try:
+                expires = parsedate_to_datetime(str(headers["expires"]))
+                if expires.tzinfo is None:
+                    expires = expires.replace(tzinfo=timezone.utc)
+                ttl = (expires - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                ttl = None
+    if ttl is None:
+        ttl = default
+    return min(max(ttl, minimum), maximum)
+
+
+class RobotsPolicy:
+    # Only a 2xx robots.txt restricts anything: 4xx means no rules, and 5xx or network errors
+    # fail open (as before) but are cached for a short ERROR_TTL_S only.
+    def __init__(self, *, origin: str, status_code: int, body: str, expires_at: float) -> None:
+        self.origin = origin
+        self.status_code = status_code
+        self.body = body
+        self.expires_at = expires_at
+        self._parser: Optional[RobotFileParser] = None
+        if 200 <= status_code < 300:
+            parser = RobotFileParser()
+            parser.set_url(f"{origin}/robots.txt")
+            parser.parse(body.splitlines())
+            self._parser = parser
+
+    def allows(self, url: str, user_agent: str) -> bool:
+        if self._parser is None:
+            return True
+        return self._parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, user_agent: str) -> float:
+        if self._parser is None:
+            return 0.0
+        try:
+            delay = self._parser.crawl_delay(user_agent)
+        except (TypeError, ValueError):
+            return 0.0
+        return max(float(delay or 0.0), 0.0)
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.policy: Optional[RobotsPolicy] = None
+        self.error: Optional[BaseException] = None
+
+
+class RobotsPolicyCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = 4096,
+        engine: Any = None,
+        shared: bool = False,
+        default_ttl_seconds: float = DEFAULT_TTL_S,
+        min_ttl_seconds: float = MIN_TTL_S,
+        error_ttl_seconds: float = ERROR_TTL_S,
+        fetcher: Callable[[str], Dict[str, Any]] = fetch_url,
+    ) -> None:
+        self._max_entries = max(max_entries, 1)
+        self._engine = engine
+        self._shared = bool(shared and engine is not None)
+        self._default_ttl = max(float(default_ttl_seconds), 1.0)
+        self._min_ttl = min(max(float(min_ttl_seconds), 1.0), self._default_ttl)
+        self._error_ttl = max(float(error_ttl_seconds), 1.0)
+        self._fetcher = fetcher
+        self._lock = threading.Lock()
+        self._entries: Dict[str, RobotsPolicy] = {}
+        self._flights: Dict[str, _Flight] = {}
+        self._counters = {"hits": 0, "shared_hits": 0, "misses": 0, "coalesced": 0, "errors": 0, "evictions": 0}
+        _LIVE_CACHES.add(self)
+
+    def lookup(self, url: str) -> Tuple[RobotsPolicy, str]:
+        # Returns the policy and how it was served: hit, shared_hit, coalesced, miss or error.
+        origin = robots_origin(url)
+        with self._lock:
+            policy = self._entries.get(origin)
+            if policy is not None and policy.expires_at > time.monotonic():
+                self._counters["hits"] += 1
+                return policy, "hit"
+            flight = self._flights.get(origin)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[origin] = flight
+            else:
+                self._counters["coalesced"] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None or flight.policy is None:
+                raise flight.error or RuntimeError("robots lookup failed")
+            return flight.policy, "coalesced"
+        try:
+            policy, result = self._resolve(origin)
+            with self._lock:
+                self._counters[_RESULT_COUNTERS[result]] += 1
+                self._store(origin, policy)
+            flight.policy = policy
+            return policy, result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(origin, None)
+            flight.done.set()
+
+    def _resolve(self, origin: str) -> Tuple[RobotsPolicy, str]:
+        stored = self._load_shared(origin)
+        if stored is not None:
+            remaining = (stored["expires_at"] - datetime.now(timezone.utc)).total_seconds()
+            policy = RobotsPolicy(
+                origin=origin,
+                status_code=int(stored["status_code"]),
+                body=str(stored.get("body") or ""),
+                expires_at=time.monotonic() + max(remaining, 1.0),
+            )
+            return policy, "shared_hit"
+        try:
+            response = self._fetcher(f"{origin}/robots.txt")
+            status_code = int(response.get("status_code") or 0)
+            headers = response.get("headers") or {}
+            body = str(response.get("html") or "")[:MAX_BODY_CHARS]
+        except Exception as exc:
+            logger.info("robots fetch failed origin=%s error=%s", origin, exc)
+            status_code, headers, body = 0, {}, ""
+        if status_code >= 500 or status_code in {0, 429}:
+            ttl, result, body = self._error_ttl, "error", ""
+        else:
+            ttl = ttl_from_headers(headers, default=self._default_ttl, minimum=self._min_ttl, maximum=self._default_ttl)
+            result = "miss"
+            if status_code >= 300:
+                body = ""
+        self._save_shared(origin, status_code, body, ttl)
+        return RobotsPolicy(origin=origin, status_code=status_code, body=body, expires_at=time.monotonic() + ttl), result
+
+    def _store(self, origin: str, policy: RobotsPolicy) -> None:
+        self._entries[origin] = policy
+        if len(self._entries) <= self._max_entries:
+            return
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[key]
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+            self._counters["evictions"] += 1
+
+    def _load_shared(self, origin: str) -> Optional[Dict[str, Any]]:
+        if not self._shared:
+            return None
+        try:
+            return get_research_robots_policy(self._engine, origin=origin)
+        except Exception as exc:
+            logger.warning("robots cache lookup failed: %s", exc)
+            return None
+
+    def _save_shared(self, origin: str, status_code: int, body: str, ttl: float) -> None:
+        if not self._shared:
+            return
+        try:
+            upsert_research_robots_policy(self._engine, origin=origin, status_code=status_code, body=body, ttl_seconds=ttl)
+        except Exception as exc:
+            logger.warning("robots cache write failed: %s", exc)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+        lookups = sum(counters[name] for name in _RESULT_COUNTERS.values())
+        hit_total = counters["hits"] + counters["shared_hits"] + counters["coalesced"]
+        return {
+            **counters,
+            "entries": entries,
+            "shared_tier_enabled": self._shared,
+            "hit_ratio": round(hit_total / lookups, 4) if lookups else 0.0,
+        }
+
+
+def _collect_robots_metrics() -> List[Any]:
+    lookups = Counter("context_api_robots_cache_lookups_total", "robots.txt policy cache lookups by result.", ("result",))
+    caches = [cache.stats() for cache in list(_LIVE_CACHES)]
+    if caches:
+        for result, name in _RESULT_COUNTERS.items():
+            lookups.inc(sum(float(stats[name]) for stats in caches), result=result)
+    return [lookups]
+
+
+REGISTRY.register_collector(_collect_robots_metrics)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
 
 
 def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
@@ -38,6 +38,10 @@ def recency_score(
     return _clamp(0.5 ** (age_seconds / half_life_seconds))
 
 
+def recency_cutoff_days(min_score: float, *, half_life_days: float = 30.0) -> float:
+    return max(half_life_days, 0.0) * math.log2(1.0 / _clamp(min_score, 1e-6, 1.0))
+
+
 def source_weight_score(source_weight: float) -> float:
     return _clamp(source_weight / 2.0)
 
@@ -74,3 +78,15 @@ def blend_score(
         "recency": _clamp(recency),
         "source_weight": _clamp(source_weight),
     }
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[Sequence[Hashable]],
+    *,
+    k: int = 60,
+) -> Dict[Hashable, float]:
+    fused: Dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            fused[key] = fused.get(key, 0.0) + 1.0 / (max(k, 0) + rank)
+    return fused
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Dict, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+
+class StageTimer:
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self.stages: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    async def timed(self, name: str, awaitable: Awaitable[_T]) -> _T:
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.record(name, started)
+
+    def record(self, name: str, started: float) -> None:
+        elapsed = int((time.perf_counter() - started) * 1000)
+        self.stages[name] = self.stages.get(name, 0) + max(elapsed, 0)
+
+    def count(self, name: str, value: int) -> None:
+        self.counts[name] = int(value)
+
+    def total_ms(self) -> int:
+        return int((time.perf_counter() - self._started) * 1000)
+
+    def trace_timing(self) -> Dict[str, int]:
+        return {**self.stages, **self.counts, "total": self.total_ms()}
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import logging
+from collections import Counter, deque
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.storage.db import (
+    build_research_query_log_row,
+    build_research_relevance_score_rows,
+    insert_research_telemetry_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_OVERFLOW_POLICIES = ("drop", "block")
+
+_Record = Tuple[str, str, Any]
+
+
+def normalize_overflow_policy(value: Optional[str]) -> str:
+    normalized = str(value or "").strip().lower()
+    return normalized if normalized in TELEMETRY_OVERFLOW_POLICIES else "drop"
+
+
+class ResearchTelemetryWriter:
+    def __init__(
+        self,
+        engine: Any,
+        *,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 0.25,
+        overflow: str = "drop",
+        writer: Callable[..., Dict[str, int]] = insert_research_telemetry_batch,
+    ) -> None:
+        self._engine = engine
+        self._max_queue = max(max_queue, 0)
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval_seconds = max(flush_interval_seconds, 0.01)
+        self._overflow = normalize_overflow_policy(overflow)
+        self._writer = writer
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+        self._write_lock = Lock()
+        self._queue: Deque[_Record] = deque()
+        self._pending_traces: Counter = Counter()
+        self._thread: Optional[Thread] = None
+        self._closed = False
+        self._counters = {
+            "enqueued": 0,
+            "written_query_logs": 0,
+            "written_relevance_scores": 0,
+            "batches": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "write_errors": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_queue > 0
+
+    @property
+    def may_block(self) -> bool:
+        return not self.enabled or self._closed or self._overflow == "block"
+
+    def submit_query_log(self, **fields: Any) -> str:
+        row = build_research_query_log_row(**fields)
+        self._submit(("query_log", str(row["trace_id"]), row))
+        return str(row["query_log_id"])
+
+    def submit_relevance_scores(
+        self,
+        *,
+        trace_id: str,
+        topic_key: str,
+        query_text: str,
+        items: List[Dict[str, Any]],
+    ) -> int:
+        rows = build_research_relevance_score_rows(
+            trace_id=trace_id,
+            topic_key=topic_key,
+            query_text=query_text,
+            items=items,
+        )
+        if rows:
+            self._submit(("relevance_scores", trace_id, rows))
+        return len(rows)
+
+    def _submit(self, record: _Record) -> None:
+        if not self.enabled or self._closed:
+            self._write([record])
+            return
+        with self._lock:
+            if len(self._queue) >= self._max_queue:
+                if self._overflow == "drop":
+                    self._counters["dropped"] += 1
+                    return
+                self._counters["blocked"] += 1
+                while len(self._queue) >= self._max_queue and not self._closed:
+                    self._not_full.wait(timeout=self._flush_interval_seconds)
+            self._queue.append(record)
+            self._pending_traces[record[1]] += 1
+            self._counters["enqueued"] += 1
+            self._not_empty.notify()
+            self._ensure_thread()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = Thread(target=self._run, name="research-telemetry-writer", daemon=True)
+            self._thread.start()
+
+    def _take_batch(self) -> List[_Record]:
+        batch: List[_Record] = []
+        while self._queue and len(batch) < self._batch_size:
+            batch.append(self._queue.popleft())
+        if batch:
+            self._not_full.notify_all()
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._queue and not self._closed:
+                    self._not_empty.wait(timeout=self._flush_interval_seconds)
+                if self._closed and not self._queue:
+                    return
+            self._drain()
+
+    def _drain(self) -> int:
+        written = 0
+        with self._write_lock:
+            while True:
+                with self._lock:
+                    batch = self._take_batch()
+                if not batch:
+                    return written
+                try:
+                    self._write(batch)
+                    written += len(batch)
+                finally:
+                    with self._lock:
+                        for _, trace_id, _ in batch:
+                            self._pending_traces[trace_id] -= 1
+                            if self._pending_traces[trace_id] <= 0:
+                                del self._pending_traces[trace_id]
+
+    def _write(self, batch: List[_Record]) -> None:
+        query_logs: List[Dict[str, Any]] = []
+        relevance_scores: List[Dict[str, Any]] = []
+        for kind, _, payload in batch:
+            if kind == "query_log":
+                query_logs.append(payload)
+            else:
+                relevance_scores.extend(payload)
+        try:
+            self._writer(self._engine, query_logs=query_logs, relevance_scores=relevance_scores)
+        except Exception as exc:
+            with self._lock:
+                self._counters["write_errors"] += 1
+            logger.warning("research telemetry batch write failed (%s records): %s", len(batch), exc)
+            return
+        with self._lock:
+            self._counters["batches"] += 1
+            self._counters["written_query_logs"] += len(query_logs)
+            self._counters["written_relevance_scores"] += len(relevance_scores)
+
+    def is_pending(self, trace_id: str) -> bool:
+        with self._lock:
+            return trace_id in self._pending_traces
+
+    def ensure_written(self, trace_id: str) -> None:
+        if self.is_pending(trace_id):
+            self._drain()
+
+    def flush(self) -> int:
+        return self._drain()
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._drain()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            queued = len(self._queue)
+        return {
+            **counters,
+            "queued": queued,
+            "max_queue": self._max_queue,
+            "batch_size": self._batch_size,
+            "overflow": self._overflow,
+            "enabled": self.enabled,
+        }
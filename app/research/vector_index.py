@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Engine
+
+from app.storage.db import (
+    get_research_corpus_version,
+    get_research_embedding_watermark,
+    list_research_embeddings_for_topic,
+)
+from app.storage.vector_codec import decode_embedding_row
+
+ChunkKey = Tuple[str, str]
+
+
+def _as_vector(value: Any) -> Optional[np.ndarray]:
+    if value is None:
+        return None
+    try:
+        vector = np.asarray(value, dtype=np.float32).reshape(-1)
+    except (TypeError, ValueError):
+        return None
+    if vector.size == 0:
+        return None
+    return vector
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return np.ascontiguousarray(matrix / norms, dtype=np.float32)
+
+
+@dataclass(frozen=True)
+class _IndexState:
+    matrix: np.ndarray
+    keys: List[ChunkKey]
+    source_ids: np.ndarray
+    positions: Dict[ChunkKey, int]
+
+    @classmethod
+    def empty(cls) -> "_IndexState":
+        return cls(
+            matrix=np.zeros((0, 0), dtype=np.float32),
+            keys=[],
+            source_ids=np.zeros(0, dtype=object),
+            positions={},
+        )
+
+
+class TopicVectorIndex:
+    def __init__(self, *, topic_key: str, embedding_model_id: str) -> None:
+        self.topic_key = topic_key
+        self.embedding_model_id = embedding_model_id
+        self._lock = Lock()
+        self._state = _IndexState.empty()
+        self._watermark: Optional[datetime] = None
+        self._suppressed_watermark: Optional[datetime] = None
+        self._corpus_version: Optional[int] = None
+        self._checked_at = 0.0
+        self.full_builds = 0
+        self.incremental_refreshes = 0
+
+    def __len__(self) -> int:
+        return len(self._state.keys)
+
+    @property
+    def dimensions(self) -> int:
+        return int(self._state.matrix.shape[1])
+
+    def refresh(self, engine: Engine, *, min_interval_seconds: float = 0.0) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._watermark is not None and now - self._checked_at < min_interval_seconds:
+                return
+            self._checked_at = now
+            # Embedding, suppression and source changes all bump the topic's corpus version, so the
+            # watermark query (a count over the topic's embeddings) only runs after one of them.
+            corpus_version = get_research_corpus_version(engine, topic_key=self.topic_key)
+            if corpus_version == self._corpus_version:
+                return
+            self._corpus_version = corpus_version
+            state = get_research_embedding_watermark(
+                engine,
+                topic_key=self.topic_key,
+                embedding_model_id=self.embedding_model_id,
+            )
+            max_created_at = state.get("max_created_at")
+            max_suppressed_at = state.get("max_suppressed_at")
+            expected_count = int(state.get("embedding_count") or 0)
+            if (
+                self._watermark is None
+                or max_created_at is None
+                or max_suppressed_at != self._suppressed_watermark
+            ):
+                self._rebuild(engine, suppressed_watermark=max_suppressed_at)
+                return
+            if max_created_at > self._watermark:
+                rows = list_research_embeddings_for_topic(
+                    engine,
+                    topic_key=self.topic_key,
+                    embedding_model_id=self.embedding_model_id,
+                    created_since=self._watermark,
+                )
+                self._apply(rows)
+                self.incremental_refreshes += 1
+            if len(self._state.keys) != expected_count:
+                self._rebuild(engine, suppressed_watermark=max_suppressed_at)
+
+    def _rebuild(self, engine: Engine, *, suppressed_watermark: Optional[datetime]) -> None:
+        rows = list_research_embeddings_for_topic(
+            engine,
+            topic_key=self.topic_key,
+            embedding_model_id=self.embedding_model_id,
+        )
+        self._state = _IndexState.empty()
+        self._watermark = None
+        self._suppressed_watermark = suppressed_watermark
+        self._apply(rows)
+        self.full_builds += 1
+
+    def _apply(self, rows: Sequence[Dict[str, Any]]) -> None:
+        current = self._state
+        dimensions = self.dimensions
+        matrix = current.matrix
+        keys = list(current.keys)
+        source_ids = list(current.source_ids)
+        positions = dict(current.positions)
+        updates: Dict[int, np.ndarray] = {}
+        appended: List[np.ndarray] = []
+        watermark = self._watermark
+        for row in rows:
+            created_at = row.get("created_at")
+            if created_at is not None and (watermark is None or created_at > watermark):
+                watermark = created_at
+            vector = decode_embedding_row(row)
+            if vector is None:
+                continue
+            if not dimensions:
+                dimensions = int(vector.size)
+            if vector.size != dimensions:
+                continue
+            key = (str(row.get("document_id") or ""), str(row.get("chunk_id") or ""))
+            position = positions.get(key)
+            if position is None:
+                positions[key] = len(keys)
+                keys.append(key)
+                source_ids.append(str(row.get("source_id") or ""))
+                appended.append(vector)
+            elif position < matrix.shape[0]:
+                updates[position] = vector
+            else:
+                appended[position - matrix.shape[0]] = vector
+        if updates:
+            matrix = matrix.copy()
+            indexes = np.fromiter(updates.keys(), dtype=np.int64, count=len(updates))
+            matrix[indexes] = _normalize_rows(np.stack(list(updates.values())))
+        if appended:
+            fresh = _normalize_rows(np.stack(appended))
+            matrix = fresh if matrix.shape[0] == 0 else np.ascontiguousarray(np.vstack([matrix, fresh]))
+        if matrix.shape[0] == 0:
+            matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self._state = _IndexState(
+            matrix=matrix,
+            keys=keys,
+            source_ids=np.asarray(source_ids, dtype=object),
+            positions=positions,
+        )
+        self._watermark = watermark
+
+    def _query(self, query_vector: Iterable[float], dimensions: int) -> Optional[np.ndarray]:
+        query = _as_vector(list(query_vector))
+        if query is None or query.size != dimensions:
+            return None
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return None
+        return query / norm
+
+    def search(
+        self,
+        query_vector: Iterable[float],
+        *,
+        k: int,
+        source_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[ChunkKey, float]]:
+        state = self._state
+        matrix = state.matrix
+        if k <= 0 or matrix.shape[0] == 0:
+            return []
+        query = self._query(query_vector, int(matrix.shape[1]))
+        if query is None:
+            return []
+        scores = matrix @ query
+        candidates = np.arange(scores.shape[0])
+        if source_ids:
+            allowed = np.isin(state.source_ids, list(source_ids))
+            candidates = candidates[allowed]
+            scores = scores[allowed]
+        if scores.shape[0] == 0:
+            return []
+        limit = min(k, scores.shape[0])
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(state.keys[int(candidates[idx])], float(scores[idx])) for idx in top]
+
+    def score(self, query_vector: Iterable[float], keys: Iterable[ChunkKey]) -> Dict[ChunkKey, float]:
+        state = self._state
+        matrix, positions = state.matrix, state.positions
+        if matrix.shape[0] == 0:
+            return {}
+        query = self._query(query_vector, int(matrix.shape[1]))
+        if query is None:
+            return {}
+        present = [key for key in keys if key in positions]
+        if not present:
+            return {}
+        indexes = np.fromiter((positions[key] for key in present), dtype=np.int64, count=len(present))
+        scores = matrix[indexes] @ query
+        return {key: float(value) for key, value in zip(present, scores)}
+
+
+class TopicVectorIndexRegistry:
+    def __init__(self, engine: Engine, *, refresh_interval_seconds: float = 0.0) -> None:
+        self._engine = engine
+        self._refresh_interval_seconds = max(refresh_interval_seconds, 0.0)
+        self._lock = Lock()
+        self._indexes: Dict[Tuple[str, str], TopicVectorIndex] = {}
+
+    def get(self, topic_key: str, embedding_model_id: str) -> TopicVectorIndex:
+        with self._lock:
+            index = self._indexes.get((topic_key, embedding_model_id))
+            if index is None:
+                index = TopicVectorIndex(topic_key=topic_key, embedding_model_id=embedding_model_id)
+                self._indexes[(topic_key, embedding_model_id)] = index
+        index.refresh(self._engine, min_interval_seconds=self._refresh_interval_seconds)
+        return index
+
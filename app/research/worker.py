@@ -4,25 +4,38 @@ import argparse
 import hashlib
 import logging
 import os
+import socket
+import threading
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
-from app.intel.fetch import fetch_url
-from app.intel.extract import extract_readable_text
+from app.intel.fetch import HOST_THROTTLE_WAIT_SECONDS, fetch_url
+from app.metrics import PIPELINE_ITEMS, PIPELINE_STAGE_SECONDS, configure_worker_metrics, write_metrics_file
 from app.research.chunking import chunk_document
-from app.research.discovery import discover_candidate_items, extract_title_from_html, is_allowed_by_robots
+from app.research.discovery import discover_candidate_items, extract_title_from_html
 from app.research.embeddings import embed_texts, resolve_embedding_runtime
 from app.research.enrichment import derive_evidence_relations, enrich_chunks, enrich_document
 from app.research.hygiene import detect_junk_document
 from app.research.ids import compute_document_id
-from app.research.pdf_extract import extract_pdf_text
+from app.research.ingest_pipeline import PipelineStage, pipeline_stats, run_extraction
+from app.research.robots import RobotsPolicyCache, robots_origin
 from app.storage.db import (
     append_research_run_error,
     claim_next_research_ingestion_run,
+    claim_research_document_jobs,
+    clear_research_source_listing_validators,
+    complete_research_run_if_done,
     create_db_engine,
     create_research_ingestion_run,
+    enqueue_research_document_jobs,
     fail_stale_research_ingestion_runs,
+    finish_research_document_job,
     get_research_document,
+    get_research_ingestion_run,
+    increment_research_run_metrics,
     has_open_research_run_for_topic,
     list_due_research_sources,
     list_research_sources,
@@ -32,19 +45,39 @@ from app.storage.db import (
     mark_research_document_fetched,
     mark_research_document_extracted,
     mark_research_ingestion_run_finished,
+    mark_research_run_jobs_enqueued,
     mark_research_source_failure,
     mark_research_source_success,
     replace_research_chunks,
     replace_research_document_insights,
     replace_research_evidence_relations,
     replace_research_embeddings,
+    renew_research_document_job_leases,
+    retry_research_document_job,
+    seed_research_documents,
     set_research_document_suppressed,
     set_research_source_polled,
+    summarize_research_run_jobs,
+    touch_research_document_fetched,
+    unit_of_work,
     update_research_run_counters,
     upsert_research_document_seed,
+    upsert_research_pipeline_stats,
 )
 logger = logging.getLogger(__name__)
 
+_SOURCE_LOCK = threading.Lock()
+_SOURCE_LAST_REQUEST: Dict[str, float] = {}
+_REEMBED_COUNTS: Dict[Tuple[str, str], int] = {}
+_ROBOTS_CACHE: Optional[RobotsPolicyCache] = None
+
+_SOURCE_JOB_FIELDS = ("name", "source_class", "default_decision_domains", "robots_mode", "rate_limit_per_hour")
+
+# Extract, enrich, chunk and embed: the stages an unchanged refreshed document does not rerun.
+_DOCUMENT_STAGES_AFTER_FETCH = 4
+
+_REEMBED_STATUSES = frozenset({"embedded", "enriched", "extracted"})
+
 
 def _safe_log(message: str, **kwargs: Any) -> None:
     logger.info(message, extra={key: value for key, value in kwargs.items() if value is not None})
@@ -57,19 +90,33 @@ def _int_env(name: str, default: int) -> int:
         return default
 
 
+def _robots_cache(engine: Any) -> RobotsPolicyCache:
+    global _ROBOTS_CACHE
+    with _SOURCE_LOCK:
+        if _ROBOTS_CACHE is None:
+            _ROBOTS_CACHE = RobotsPolicyCache(
+                max_entries=_int_env("RESEARCH_ROBOTS_CACHE_SIZE", 4096),
+                engine=engine,
+                shared=os.getenv("RESEARCH_ROBOTS_CACHE_SHARED", "").strip().lower() in {"1", "true", "yes", "on"},
+                default_ttl_seconds=_int_env("RESEARCH_ROBOTS_CACHE_TTL_S", 86_400),
+                error_ttl_seconds=_int_env("RESEARCH_ROBOTS_CACHE_ERROR_TTL_S", 600),
+            )
+        return _ROBOTS_CACHE
+
+
 def _strip_nul_bytes(value: str) -> str:
     if not value:
         return ""
     return value.replace("\x00", "")
 
 
-def _fetch_with_retries(url: str) -> Dict[str, Any]:
+def _fetch_with_retries(url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     max_attempts = _int_env("RESEARCH_FETCH_MAX_ATTEMPTS", 3)
     backoff_base = max(_int_env("RESEARCH_FETCH_BACKOFF_S", 1), 1)
     last_error = ""
     for attempt in range(1, max_attempts + 1):
         try:
-            result = fetch_url(url)
+            result = fetch_url(url, headers=headers)
             status = int(result.get("status_code") or 0)
             if status in {429, 500, 502, 503, 504} and attempt < max_attempts:
                 time.sleep(backoff_base * attempt)
@@ -83,41 +130,95 @@ def _fetch_with_retries(url: str) -> Dict[str, Any]:
     return {"status_code": 599, "html": "", "headers": {}, "error": last_error}
 
 
-def _throttle_source(last_request_at: float | None, *, rate_limit_per_hour: int) -> float:
-    if rate_limit_per_hour <= 0:
-        return time.monotonic()
-    min_interval = 3600.0 / float(rate_limit_per_hour)
-    now = time.monotonic()
-    if last_request_at is not None:
-        wait = min_interval - (now - last_request_at)
-        if wait > 0:
-            time.sleep(wait)
-    return time.monotonic()
+def _conditional_headers(etag: Any, last_modified: Any) -> Dict[str, str]:
+    if os.getenv("RESEARCH_CONDITIONAL_GET", "true").strip().lower() in {"0", "false", "no", "off"}:
+        return {}
+    headers: Dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = str(etag)
+    if last_modified:
+        headers["If-Modified-Since"] = str(last_modified)
+    return headers
 
 
-def _embed_existing_document(
-    engine: Any,
+def _is_pdf_fetch(item_fetch: Dict[str, Any], url: str) -> bool:
+    content_type = str((item_fetch.get("headers") or {}).get("content-type") or "").lower()
+    return "application/pdf" in content_type or url.lower().endswith(".pdf")
+
+
+def _fetched_content_hash(item_fetch: Dict[str, Any], url: str) -> str:
+    if _is_pdf_fetch(item_fetch, url):
+        return hashlib.sha256(item_fetch.get("content_bytes") or b"").hexdigest()
+    return hashlib.sha256(_strip_nul_bytes(str(item_fetch.get("html") or "")).encode("utf-8")).hexdigest()
+
+
+def _throttle_source(source_id: str, *, rate_limit_per_hour: int, host: str = "", crawl_delay_s: float = 0.0) -> None:
+    # Items of one source run on several threads, so each reserves its start against the rate limit.
+    min_interval = 3600.0 / float(rate_limit_per_hour) if rate_limit_per_hour > 0 else 0.0
+    min_interval = max(min_interval, crawl_delay_s)
+    if min_interval <= 0:
+        return
+    with _SOURCE_LOCK:
+        now = time.monotonic()
+        last = _SOURCE_LAST_REQUEST.get(source_id)
+        start_at = now if last is None else max(now, last + min_interval)
+        _SOURCE_LAST_REQUEST[source_id] = start_at
+    wait = start_at - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+        HOST_THROTTLE_WAIT_SECONDS.inc(wait, host=host, throttle="source")
+
+
+def _take_reembed_slot(run_id: Any, source_id: str, *, budget: int) -> bool:
+    with _SOURCE_LOCK:
+        if len(_REEMBED_COUNTS) > 1024:
+            _REEMBED_COUNTS.clear()
+        key = (str(run_id), source_id)
+        used = _REEMBED_COUNTS.get(key, 0)
+        if used >= budget:
+            return False
+        _REEMBED_COUNTS[key] = used + 1
+        return True
+
+
+def _document_chunks(*, document_id: str, extracted_text: str, chunk_max_chars: int) -> List[Dict[str, Any]]:
+    return enrich_chunks(chunk_document(
+        document_id=document_id,
+        text=extracted_text,
+        max_chars=max(chunk_max_chars, 200),
+    ))
+
+
+def _embed_document_chunks(
     *,
     document_id: str,
     extracted_text: str,
     embedding_model_id: str,
     embedding_api_key: str,
     chunk_max_chars: int,
-) -> None:
-    chunks = enrich_chunks(chunk_document(
-        document_id=document_id,
-        text=extracted_text,
-        max_chars=max(chunk_max_chars, 200),
-    ))
+) -> Tuple[List[Dict[str, Any]], List[List[float]]]:
+    chunks = _document_chunks(document_id=document_id, extracted_text=extracted_text, chunk_max_chars=chunk_max_chars)
     if not chunks:
         raise RuntimeError("empty chunk set")
-    vectors = embed_texts(
-        texts=[str(chunk["content"]) for chunk in chunks],
-        model=embedding_model_id,
-        api_key=embedding_api_key,
-    )
+    with PIPELINE_STAGE_SECONDS.time(pipeline="research", stage="embed"):
+        vectors = embed_texts(
+            texts=[str(chunk["content"]) for chunk in chunks],
+            model=embedding_model_id,
+            api_key=embedding_api_key,
+        )
     if len(vectors) != len(chunks):
         raise RuntimeError("embedding vector count mismatch")
+    return chunks, vectors
+
+
+def _store_document_embeddings(
+    engine: Any,
+    *,
+    document_id: str,
+    chunks: List[Dict[str, Any]],
+    vectors: List[List[float]],
+    embedding_model_id: str,
+) -> None:
     replace_research_chunks(
         engine,
         document_id=document_id,
@@ -131,6 +232,7 @@ def _embed_existing_document(
             {"chunk_id": str(chunk["chunk_id"]), "vector": vector}
             for chunk, vector in zip(chunks, vectors)
         ],
+        storage_format=os.getenv("RESEARCH_EMBEDDING_STORAGE_FORMAT", "float32"),
     )
     mark_research_document_embedded(
         engine,
@@ -139,45 +241,68 @@ def _embed_existing_document(
     )
 
 
-def _process_source(
+def _embed_existing_document(
+    engine: Any,
+    *,
+    document_id: str,
+    extracted_text: str,
+    embedding_model_id: str,
+    embedding_api_key: str,
+    chunk_max_chars: int,
+) -> None:
+    chunks, vectors = _embed_document_chunks(
+        document_id=document_id,
+        extracted_text=extracted_text,
+        embedding_model_id=embedding_model_id,
+        embedding_api_key=embedding_api_key,
+        chunk_max_chars=chunk_max_chars,
+    )
+    with unit_of_work(engine) as uow:
+        _store_document_embeddings(
+            uow,
+            document_id=document_id,
+            chunks=chunks,
+            vectors=vectors,
+            embedding_model_id=embedding_model_id,
+        )
+
+
+def _source_job_snapshot(source: Dict[str, Any]) -> Dict[str, Any]:
+    snapshot = {key: source.get(key) for key in _SOURCE_JOB_FIELDS}
+    snapshot["default_decision_domains"] = [str(value) for value in (source.get("default_decision_domains") or [])]
+    return snapshot
+
+
+def _discover_source(
     engine: Any,
     *,
     run_id: Any,
     source: Dict[str, Any],
-    max_new_items: int = 0,
 ) -> Dict[str, Any]:
     source_id = str(source["source_id"])
     base_url = str(source.get("base_url_canonical") or source.get("base_url_original") or "")
     kind = str(source.get("kind") or "html_listing")
-    robots_mode = str(source.get("robots_mode") or "strict")
-    user_agent = os.getenv("INTEL_USER_AGENT", "context_api/1.0")
     max_items_default = _int_env("RESEARCH_MAX_ITEMS_PER_SOURCE", 50)
     max_items = int(source.get("max_items_per_run") or max_items_default)
-    rate_limit_per_hour = int(source.get("rate_limit_per_hour") or 30)
-    chunk_max_chars = _int_env("RESEARCH_CHUNK_MAX_CHARS", 1200)
-    embedding_model_id = os.getenv("RESEARCH_EMBEDDING_MODEL", "text-embedding-3-small")
-    embedding_api_key = os.getenv("OPENAI_API_KEY", "")
-    embedding_runtime = resolve_embedding_runtime(model=embedding_model_id, api_key=embedding_api_key)
-    if embedding_runtime.get("warning"):
-        logger.warning("research_embedding_runtime %s", embedding_runtime["warning"])
-    reembed_budget = _int_env("RESEARCH_REEMBED_MAX_PER_RUN", 25)
-    reembedded = 0
-
-    counters: Dict[str, Any] = {"seen": 0, "new": 0, "deduped": 0, "failed": 0}
-    source_error = ""
-    source_fetch = _fetch_with_retries(base_url)
+    result: Dict[str, Any] = {"jobs": 0, "deduped": 0, "failed": 0, "source_error": "", "metrics": {}}
+    listing_headers = _conditional_headers(source.get("listing_etag"), source.get("listing_last_modified"))
+    with PIPELINE_STAGE_SECONDS.time(pipeline="research", stage="discover"):
+        source_fetch = _fetch_with_retries(base_url, headers=listing_headers)
     source_status = int(source_fetch.get("status_code") or 0)
+    if source_status == 304 and listing_headers:
+        result["metrics"] = {"listings_not_modified": 1, "bytes_avoided": int(source.get("listing_bytes") or 0)}
+        set_research_source_polled(engine, source_id=source_id)
+        return result
     if source_status >= 400:
-        counters["failed"] += 1
-        source_error = f"source_fetch_failed status={source_status}"
+        result["failed"] = 1
+        result["source_error"] = f"source_fetch_failed status={source_status}"
         append_research_run_error(
             engine,
             run_id=run_id,
             message=f"source_fetch_failed source_id={source_id} status={source_status} url={base_url}",
         )
         set_research_source_polled(engine, source_id=source_id)
-        counters["source_error"] = source_error
-        return counters
+        return result
 
     discovered = discover_candidate_items(
         kind=kind,
@@ -185,98 +310,298 @@ def _process_source(
         base_url=base_url,
         max_items=max_items,
     )
-    last_request_at: float | None = None
-    for item in discovered:
-        if max_new_items > 0 and counters["new"] >= max_new_items:
-            break
-        item_url = str(item.get("url") or "").strip()
-        item_title = str(item.get("title") or "").strip()
-        item_summary = str(item.get("summary") or "").strip()
-        if not item_url:
-            continue
-        counters["seen"] += 1
-        if robots_mode == "strict":
-            allowed = is_allowed_by_robots(url=item_url, user_agent=user_agent)
-            if not allowed:
-                counters["failed"] += 1
-                append_research_run_error(
-                    engine,
-                    run_id=run_id,
-                    message=f"robots_blocked source_id={source_id} url={item_url}",
-                )
-                source_error = "robots_blocked"
-                continue
+    items = [
+        {key: value for key, value in item.items() if value not in (None, "")}
+        for item in discovered
+        if str(item.get("url") or "").strip()
+    ]
+    result["jobs"] = enqueue_research_document_jobs(
+        engine,
+        run_id=run_id,
+        source_id=source_id,
+        source=_source_job_snapshot(source),
+        items=_seed_discovered_items(engine, run_id=run_id, source_id=source_id, items=items),
+    )
+    result["deduped"] = len(items) - result["jobs"]
+    listing_headers = source_fetch.get("headers") or {}
+    set_research_source_polled(
+        engine,
+        source_id=source_id,
+        listing={
+            "etag": listing_headers.get("etag"),
+            "last_modified": listing_headers.get("last-modified"),
+            "bytes": len(source_fetch.get("content_bytes") or b""),
+        },
+    )
+    return result
+
 
+def _seed_discovered_items(engine: Any, *, run_id: Any, source_id: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    keyed = []
+    for item in items:
+        item_url = str(item["url"]).strip()
         document_id = compute_document_id(
             source_id=source_id,
             canonical_url=item_url,
             external_id=(item.get("external_id") or None),
         )
+        keyed.append((document_id, item_url, item))
+    seeds = seed_research_documents(
+        engine,
+        source_id=source_id,
+        run_id=run_id,
+        items=[
+            {
+                "document_id": document_id,
+                "canonical_url": item_url,
+                "url_original": item_url,
+                "external_id": item.get("external_id") or None,
+            }
+            for document_id, item_url, item in keyed
+        ],
+    )
+    states = {str(seed["document_id"]): seed for seed in seeds}
+    embedding_model_id = os.getenv("RESEARCH_EMBEDDING_MODEL", "text-embedding-3-small")
+    reembed_budget = _int_env("RESEARCH_REEMBED_MAX_PER_RUN", 25)
+    pending: List[Dict[str, Any]] = []
+    for document_id, _item_url, item in keyed:
+        seed = states.pop(document_id, None)
+        if seed is None:
+            continue
+        state = str(seed["seed_state"])
+        if state == "deduped" and not (
+            _document_refresh_due(seed)
+            or (
+                reembed_budget > 0
+                and seed.get("has_text")
+                and str(seed.get("status") or "") in _REEMBED_STATUSES
+                and str(seed.get("embedding_model_id") or "") != embedding_model_id
+            )
+        ):
+            continue
+        pending.append({**item, "seed_state": state})
+    return pending
+
+
+class _DocumentWork:
+    def __init__(self, job: Dict[str, Any]) -> None:
+        self.job = job
+        self.run_id = job["run_id"]
+        self.source_id = str(job["source_id"])
+        self.source = dict(job.get("source") or {})
+        self.item = dict(job.get("item") or {})
+        self.counters: Dict[str, Any] = {"seen": 0, "new": 0, "deduped": 0, "failed": 0, "metrics": {}, "source_error": ""}
+        self.item_url = str(self.item.get("url") or "").strip()
+        self.item_title = _strip_nul_bytes(str(self.item.get("title") or "").strip())
+        self.item_summary = _strip_nul_bytes(str(self.item.get("summary") or "").strip())
+        self.document_id = ""
+        self.item_fetch: Dict[str, Any] = {}
+        self.is_pdf = False
+        self.raw_payload = ""
+        self.fetched: Dict[str, Any] = {}
+        self.extraction: Optional[Dict[str, Any]] = None
+        self.extracted_text = ""
+        self.chunks: List[Dict[str, Any]] = []
+        self.vectors: List[List[float]] = []
+        self.embedding_error = ""
+        self.reembed_from: Optional[str] = None
+
+    def fail(self, source_error: str) -> bool:
+        self.counters["failed"] += 1
+        self.counters["source_error"] = source_error
+        return False
+
+
+def _embedding_config() -> Dict[str, Any]:
+    model = os.getenv("RESEARCH_EMBEDDING_MODEL", "text-embedding-3-small")
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    runtime = resolve_embedding_runtime(model=model, api_key=api_key)
+    if runtime.get("warning"):
+        logger.warning("research_embedding_runtime %s", runtime["warning"])
+    return {"model": model, "api_key": api_key, "chunk_max_chars": _int_env("RESEARCH_CHUNK_MAX_CHARS", 1200)}
+
+
+def _document_refresh_due(existing: Dict[str, Any]) -> bool:
+    refresh_hours = _int_env("RESEARCH_DOCUMENT_REFRESH_HOURS", 0)
+    if refresh_hours <= 0 or str(existing.get("status") or "") != "embedded" or existing.get("suppressed"):
+        return False
+    fetched_at = existing.get("fetched_at")
+    return fetched_at is None or datetime.now(timezone.utc) - fetched_at >= timedelta(hours=refresh_hours)
+
+
+def _refresh_document(
+    engine: Any,
+    *,
+    document_id: str,
+    item_url: str,
+    existing: Dict[str, Any],
+    counters: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    fetch_meta = dict(existing.get("fetch_meta") or {})
+    headers = _conditional_headers(fetch_meta.get("etag"), fetch_meta.get("last_modified"))
+    with PIPELINE_STAGE_SECONDS.time(pipeline="research", stage="fetch"):
+        item_fetch = _fetch_with_retries(item_url, headers=headers)
+    status = int(item_fetch.get("status_code") or 0)
+    refreshed: Dict[str, Any] = {
+        "refresh_status": status,
+        "refreshed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+    if status == 304:
+        metrics = {
+            "documents_not_modified": 1,
+            "bytes_avoided": int(fetch_meta.get("bytes") or 0),
+            "stages_skipped": _DOCUMENT_STAGES_AFTER_FETCH,
+        }
+    elif status < 400 and _fetched_content_hash(item_fetch, item_url) == existing.get("content_hash"):
+        response_headers = item_fetch.get("headers") or {}
+        refreshed["etag"] = response_headers.get("etag")
+        refreshed["last_modified"] = response_headers.get("last-modified")
+        metrics = {"documents_unchanged": 1, "stages_skipped": _DOCUMENT_STAGES_AFTER_FETCH}
+    elif status < 400 and (item_fetch.get("content_bytes") or str(item_fetch.get("html") or "").strip()):
+        counters["metrics"]["documents_changed"] = 1
+        return item_fetch
+    else:
+        metrics = {"document_refresh_failed": 1}
+    touch_research_document_fetched(engine, document_id=document_id, fetch_meta=refreshed)
+    counters["metrics"].update(metrics)
+    return None
+
+
+def _summary_fallback(work: _DocumentWork, *, http_status: int, content_type: str, error: Any, confidence: float, warning: str) -> None:
+    work.fetched = {
+        "title": work.item_title or None,
+        "raw_payload": "",
+        "content_hash": hashlib.sha256(work.item_summary.encode("utf-8")).hexdigest(),
+        "published_at": work.item.get("published_at"),
+        "fetch_meta": {
+            "http_status": http_status,
+            "content_type": content_type,
+            "error": error,
+            "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "raw_payload_stored": False,
+            "fallback": "feed_summary",
+        },
+    }
+    work.extraction = {
+        "text": work.item_summary,
+        "method": "feed_summary",
+        "confidence": confidence,
+        "warnings": [warning],
+        "published_at": None,
+    }
+
+
+def _fetch_document(engine: Any, work: _DocumentWork, *, embedding: Dict[str, Any]) -> bool:
+    robots_mode = str(work.source.get("robots_mode") or "strict")
+    user_agent = os.getenv("INTEL_USER_AGENT", "context_api/1.0")
+    rate_limit_per_hour = int(work.source.get("rate_limit_per_hour") or 30)
+    reembed_budget = _int_env("RESEARCH_REEMBED_MAX_PER_RUN", 25)
+    counters = work.counters
+    item_url = work.item_url
+    source_id = work.source_id
+    if not item_url:
+        return False
+    counters["seen"] += 1
+    document_id = compute_document_id(
+        source_id=source_id,
+        canonical_url=item_url,
+        external_id=(work.item.get("external_id") or None),
+    )
+    work.document_id = document_id
+    crawl_delay_s = 0.0
+    if robots_mode == "strict":
+        allowed = False
+        if robots_origin(item_url):
+            policy, lookup = _robots_cache(engine).lookup(item_url)
+            cache_metric = "robots_cache_misses" if lookup in {"miss", "error"} else "robots_cache_hits"
+            counters["metrics"][cache_metric] = 1
+            allowed = policy.allows(item_url, user_agent)
+            crawl_delay_s = min(policy.crawl_delay(user_agent), float(_int_env("RESEARCH_ROBOTS_MAX_CRAWL_DELAY_S", 30)))
+        if not allowed:
+            with unit_of_work(engine) as uow:
+                if work.item.get("seed_state") in {"new", "retry"}:
+                    # Seeded at discovery; leave it failed so it is not mistaken for pending work.
+                    mark_research_document_failed(uow, document_id=document_id, fetch_meta={"error": "robots_blocked"})
+                append_research_run_error(
+                    uow,
+                    run_id=work.run_id,
+                    message=f"robots_blocked source_id={source_id} url={item_url}",
+                )
+            return work.fail("robots_blocked")
+
+    seed_state = str(work.item.get("seed_state") or "")
+    if not seed_state:
+        # Jobs enqueued before discovery seeded items in bulk.
         seed_state = upsert_research_document_seed(
             engine,
             document_id=document_id,
             source_id=source_id,
-            run_id=run_id,
+            run_id=work.run_id,
             canonical_url=item_url,
             url_original=item_url,
-            external_id=item.get("external_id") or None,
+            external_id=work.item.get("external_id") or None,
         )
-        if seed_state == "deduped":
-            counters["deduped"] += 1
-            if reembed_budget > 0 and reembedded < reembed_budget:
-                existing = get_research_document(engine, document_id=document_id)
-                if existing:
-                    existing_text = str(existing.get("extracted_text") or "").strip()
-                    existing_model = str(existing.get("embedding_model_id") or "").strip()
-                    existing_status = str(existing.get("status") or "")
-                    if (
-                        existing_text
-                        and existing_status in {"embedded", "extracted"}
-                        and existing_model != embedding_model_id
-                    ):
-                        try:
-                            _embed_existing_document(
-                                engine,
-                                document_id=document_id,
-                                extracted_text=existing_text,
-                                embedding_model_id=embedding_model_id,
-                                embedding_api_key=embedding_api_key,
-                                chunk_max_chars=chunk_max_chars,
-                            )
-                            reembedded += 1
-                            _safe_log(
-                                "research_document_reembedded",
-                                document_id=document_id,
-                                previous_model=existing_model or "none",
-                                embedding_model_id=embedding_model_id,
-                            )
-                        except Exception as exc:
-                            counters["failed"] += 1
-                            append_research_run_error(
-                                engine,
-                                run_id=run_id,
-                                message=f"reembed_failed source_id={source_id} document_id={document_id} error={exc}",
-                            )
-            continue
-        if seed_state == "new":
-            counters["new"] += 1
-
-        last_request_at = _throttle_source(last_request_at, rate_limit_per_hour=rate_limit_per_hour)
-        item_fetch = _fetch_with_retries(item_url)
-        item_status = int(item_fetch.get("status_code") or 0)
-        content_type = str((item_fetch.get("headers") or {}).get("content-type") or "").lower()
-        content_bytes = item_fetch.get("content_bytes") or b""
-        is_pdf = "application/pdf" in content_type or item_url.lower().endswith(".pdf")
-        raw_payload = "" if is_pdf else _strip_nul_bytes(str(item_fetch.get("html") or ""))
-        safe_item_title = _strip_nul_bytes(item_title)
-        safe_item_summary = _strip_nul_bytes(item_summary)
-        has_payload = bool(content_bytes) if is_pdf else bool(raw_payload)
-        if item_status >= 400 or not has_payload:
-            if not safe_item_summary:
-                counters["failed"] += 1
-                source_error = f"item_fetch_failed status={item_status}"
+    item_fetch: Optional[Dict[str, Any]] = None
+    if seed_state == "deduped":
+        counters["deduped"] += 1
+        existing = get_research_document(engine, document_id=document_id)
+        if existing and _document_refresh_due(existing):
+            _throttle_source(
+                source_id,
+                rate_limit_per_hour=rate_limit_per_hour,
+                host=urlparse(item_url).netloc,
+                crawl_delay_s=crawl_delay_s,
+            )
+            item_fetch = _refresh_document(
+                engine,
+                document_id=document_id,
+                item_url=item_url,
+                existing=existing,
+                counters=counters,
+            )
+        if item_fetch is None and existing and reembed_budget > 0:
+            existing_text = str(existing.get("extracted_text") or "").strip()
+            existing_model = str(existing.get("embedding_model_id") or "").strip()
+            existing_status = str(existing.get("status") or "")
+            if (
+                existing_text
+                and existing_status in _REEMBED_STATUSES
+                and existing_model != embedding["model"]
+                and _take_reembed_slot(work.run_id, source_id, budget=reembed_budget)
+            ):
+                work.reembed_from = existing_model or "none"
+                work.chunks = _document_chunks(
+                    document_id=document_id,
+                    extracted_text=existing_text,
+                    chunk_max_chars=embedding["chunk_max_chars"],
+                )
+                return True
+        if item_fetch is None:
+            return False
+    if seed_state == "new":
+        counters["new"] += 1
+
+    if item_fetch is None:
+        _throttle_source(
+            source_id,
+            rate_limit_per_hour=rate_limit_per_hour,
+            host=urlparse(item_url).netloc,
+            crawl_delay_s=crawl_delay_s,
+        )
+        with PIPELINE_STAGE_SECONDS.time(pipeline="research", stage="fetch"):
+            item_fetch = _fetch_with_retries(item_url)
+    work.item_fetch = item_fetch
+    item_status = int(item_fetch.get("status_code") or 0)
+    content_type = str((item_fetch.get("headers") or {}).get("content-type") or "").lower()
+    content_bytes = item_fetch.get("content_bytes") or b""
+    work.is_pdf = _is_pdf_fetch(item_fetch, item_url)
+    work.raw_payload = "" if work.is_pdf else _strip_nul_bytes(str(item_fetch.get("html") or ""))
+    has_payload = bool(content_bytes) if work.is_pdf else bool(work.raw_payload)
+    if item_status >= 400 or not has_payload:
+        if not work.item_summary:
+            with unit_of_work(engine) as uow:
                 mark_research_document_failed(
-                    engine,
+                    uow,
                     document_id=document_id,
                     fetch_meta={
                         "http_status": item_status,
@@ -285,100 +610,65 @@ def _process_source(
                     },
                 )
                 append_research_run_error(
-                    engine,
-                    run_id=run_id,
+                    uow,
+                    run_id=work.run_id,
                     message=f"item_fetch_failed source_id={source_id} status={item_status} url={item_url}",
                 )
-                continue
+            return work.fail(f"item_fetch_failed status={item_status}")
+        _summary_fallback(
+            work,
+            http_status=item_status,
+            content_type=content_type,
+            error=item_fetch.get("error"),
+            confidence=0.35,
+            warning=f"fetch_failed_status_{item_status}",
+        )
+        return True
+    response_headers = item_fetch.get("headers") or {}
+    if work.is_pdf:
+        title = work.item_title or None
+    else:
+        title = _strip_nul_bytes(extract_title_from_html(work.raw_payload)) or work.item_title or None
+    work.fetched = {
+        "title": title,
+        "raw_payload": work.raw_payload,
+        "content_hash": _fetched_content_hash(item_fetch, item_url),
+        "published_at": work.item.get("published_at"),
+        "fetch_meta": {
+            "http_status": item_status,
+            "content_type": content_type,
+            "etag": response_headers.get("etag"),
+            "last_modified": response_headers.get("last-modified"),
+            "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "bytes": len(content_bytes),
+            "binary_bytes": len(content_bytes) if work.is_pdf else 0,
+            "raw_payload_stored": not work.is_pdf,
+            "warnings": ["truncated"] if item_fetch.get("truncated") else [],
+        },
+    }
+    return True
 
-            # Fallback for blocked fetches: ingest feed summary text so retrieval still has signal.
-            content_hash = hashlib.sha256(safe_item_summary.encode("utf-8")).hexdigest()
-            mark_research_document_fetched(
-                engine,
-                document_id=document_id,
-                title=safe_item_title or None,
-                raw_payload="",
-                content_hash=content_hash,
-                published_at=item.get("published_at"),
-                fetch_meta={
-                    "http_status": item_status,
-                    "content_type": content_type,
-                    "error": item_fetch.get("error"),
-                    "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                    "raw_payload_stored": False,
-                    "fallback": "feed_summary",
-                },
-            )
-            extraction = {
-                "text": safe_item_summary,
-                "method": "feed_summary",
-                "confidence": 0.35,
-                "warnings": [f"fetch_failed_status_{item_status}"],
-                "published_at": None,
-            }
-        else:
-            if is_pdf:
-                content_hash = hashlib.sha256(content_bytes).hexdigest()
-            else:
-                content_hash = hashlib.sha256(raw_payload.encode("utf-8")).hexdigest()
-            mark_research_document_fetched(
-                engine,
-                document_id=document_id,
-                title=(_strip_nul_bytes(extract_title_from_html(raw_payload)) or safe_item_title or None) if not is_pdf else (safe_item_title or None),
-                raw_payload=raw_payload,
-                content_hash=content_hash,
-                published_at=item.get("published_at"),
-                fetch_meta={
-                    "http_status": item_status,
-                    "content_type": content_type,
-                    "etag": (item_fetch.get("headers") or {}).get("etag"),
-                    "last_modified": (item_fetch.get("headers") or {}).get("last-modified"),
-                    "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                    "binary_bytes": len(content_bytes) if is_pdf else 0,
-                    "raw_payload_stored": not is_pdf,
-                    "warnings": ["truncated"] if item_fetch.get("truncated") else [],
-                },
-            )
 
-            if is_pdf:
-                extraction = extract_pdf_text(content_bytes)
-                extraction["published_at"] = None
-                extraction["confidence"] = 0.6 if extraction.get("text") else 0.0
-            else:
-                extraction = extract_readable_text(raw_payload, item_url)
-        extracted_text = _strip_nul_bytes(str(extraction.get("text") or "")).strip()
-        if not extracted_text:
-            if safe_item_summary:
-                extraction = {
-                    "text": safe_item_summary,
-                    "method": "feed_summary",
-                    "confidence": 0.3,
-                    "warnings": ["empty_extraction_fallback_to_feed_summary"],
-                    "published_at": None,
-                }
-                extracted_text = safe_item_summary
-                mark_research_document_fetched(
-                    engine,
-                    document_id=document_id,
-                    title=safe_item_title or None,
-                    raw_payload="",
-                    content_hash=hashlib.sha256(safe_item_summary.encode("utf-8")).hexdigest(),
-                    published_at=item.get("published_at"),
-                    fetch_meta={
-                        "http_status": item_status,
-                        "content_type": content_type,
-                        "error": "empty extracted text",
-                        "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                        "raw_payload_stored": False,
-                        "fallback": "feed_summary",
-                    },
-                )
-            else:
-                counters["failed"] += 1
-                source_error = "extraction_failed"
+def _extract_document(engine: Any, work: _DocumentWork, *, processes: int) -> bool:
+    item_status = int(work.item_fetch.get("status_code") or 0)
+    content_type = str((work.item_fetch.get("headers") or {}).get("content-type") or "").lower()
+    if work.extraction is None:
+        with PIPELINE_STAGE_SECONDS.time(pipeline="research", stage="extract"):
+            work.extraction = run_extraction(
+                raw_payload=work.raw_payload,
+                content_bytes=work.item_fetch.get("content_bytes") or b"",
+                is_pdf=work.is_pdf,
+                url=work.item_url,
+                processes=processes,
+            )
+    work.extracted_text = _strip_nul_bytes(str(work.extraction.get("text") or "")).strip()
+    if not work.extracted_text:
+        if not work.item_summary:
+            with unit_of_work(engine) as uow:
+                mark_research_document_fetched(uow, document_id=work.document_id, **work.fetched)
                 mark_research_document_failed(
-                    engine,
-                    document_id=document_id,
+                    uow,
+                    document_id=work.document_id,
                     fetch_meta={
                         "http_status": item_status,
                         "content_type": content_type,
@@ -386,120 +676,538 @@ def _process_source(
                     },
                 )
                 append_research_run_error(
-                    engine,
-                    run_id=run_id,
-                    message=f"extraction_failed source_id={source_id} url={item_url}",
+                    uow,
+                    run_id=work.run_id,
+                    message=f"extraction_failed source_id={work.source_id} url={work.item_url}",
                 )
-                continue
-        junk_reason = detect_junk_document(
-            url=item_url,
-            title=safe_item_title or str(extract_title_from_html(raw_payload) or ""),
-            extracted_text=extracted_text,
-            item_summary=safe_item_summary,
-            fetch_status=item_status,
-            fetch_fallback=str((get_research_document(engine, document_id=document_id) or {}).get("fetch_meta", {}).get("fallback") or ""),
+            return work.fail("extraction_failed")
+        _summary_fallback(
+            work,
+            http_status=item_status,
+            content_type=content_type,
+            error="empty extracted text",
+            confidence=0.3,
+            warning="empty_extraction_fallback_to_feed_summary",
         )
-        if junk_reason:
+        work.extracted_text = work.item_summary
+    junk_reason = detect_junk_document(
+        url=work.item_url,
+        title=work.item_title or str(extract_title_from_html(work.raw_payload) or ""),
+        extracted_text=work.extracted_text,
+        item_summary=work.item_summary,
+        fetch_status=item_status,
+        fetch_fallback=str(work.fetched["fetch_meta"].get("fallback") or ""),
+    )
+    if junk_reason:
+        with unit_of_work(engine) as uow:
+            mark_research_document_fetched(uow, document_id=work.document_id, **work.fetched)
             set_research_document_suppressed(
-                engine,
-                document_id=document_id,
+                uow,
+                document_id=work.document_id,
                 suppressed=True,
                 reason=junk_reason,
             )
             append_research_run_error(
-                engine,
-                run_id=run_id,
-                message=f"document_suppressed source_id={source_id} document_id={document_id} reason={junk_reason} url={item_url}",
+                uow,
+                run_id=work.run_id,
+                message=f"document_suppressed source_id={work.source_id} document_id={work.document_id} reason={junk_reason} url={work.item_url}",
             )
-            _safe_log(
-                "research_document_suppressed",
-                source_id=source_id,
-                document_id=document_id,
-                reason=junk_reason,
-                url=item_url,
-            )
-            continue
-        mark_research_document_extracted(
-            engine,
-            document_id=document_id,
-            extracted_text=extracted_text,
-            extraction_meta={
-                "method": extraction.get("method"),
-                "confidence": extraction.get("confidence"),
-                "format": "pdf" if is_pdf else "html",
-                "warnings": extraction.get("warnings") or [],
-                "published_at_source": "feed" if item.get("published_at") else "",
-            },
-            published_at=extraction.get("published_at") or item.get("published_at"),
-            summary_short=extracted_text[:320],
+        _safe_log(
+            "research_document_suppressed",
+            source_id=work.source_id,
+            document_id=work.document_id,
+            reason=junk_reason,
+            url=work.item_url,
         )
-        existing_doc = get_research_document(engine, document_id=document_id) or {}
-        enriched_chunks = enrich_chunks(
-            chunk_document(
-                document_id=document_id,
-                text=extracted_text,
-                max_chars=max(chunk_max_chars, 200),
-            )
+        return False
+    return True
+
+
+def _enrich_document(engine: Any, work: _DocumentWork, *, embedding: Dict[str, Any]) -> bool:
+    extraction = work.extraction or {}
+    published_at = extraction.get("published_at") or work.item.get("published_at")
+    extraction_meta = {
+        "method": extraction.get("method"),
+        "confidence": extraction.get("confidence"),
+        "format": "pdf" if work.is_pdf else "html",
+        "warnings": extraction.get("warnings") or [],
+        "published_at_source": "feed" if work.item.get("published_at") else "",
+    }
+    with PIPELINE_STAGE_SECONDS.time(pipeline="research", stage="enrich"):
+        work.chunks = _document_chunks(
+            document_id=work.document_id,
+            extracted_text=work.extracted_text,
+            chunk_max_chars=embedding["chunk_max_chars"],
         )
         enrichment, insights = enrich_document(
-            canonical_url=item_url,
-            source_name=str(source.get("name") or ""),
-            source_class=str(source.get("source_class") or "external_commentary"),
-            default_decision_domains=[str(value) for value in (source.get("default_decision_domains") or [])],
-            extracted_text=extracted_text,
-            chunks=enriched_chunks,
-            fetch_meta=dict(existing_doc.get("fetch_meta") or {}),
-            extraction_meta=dict(existing_doc.get("extraction_meta") or {}),
-            published_at=(extraction.get("published_at") or item.get("published_at")),
+            canonical_url=work.item_url,
+            source_name=str(work.source.get("name") or ""),
+            source_class=str(work.source.get("source_class") or "external_commentary"),
+            default_decision_domains=[str(value) for value in (work.source.get("default_decision_domains") or [])],
+            extracted_text=work.extracted_text,
+            chunks=work.chunks,
+            fetch_meta=dict(work.fetched["fetch_meta"]),
+            extraction_meta=dict(extraction_meta),
+            published_at=published_at,
+        )
+    with unit_of_work(engine) as uow:
+        mark_research_document_fetched(uow, document_id=work.document_id, **work.fetched)
+        mark_research_document_extracted(
+            uow,
+            document_id=work.document_id,
+            extracted_text=work.extracted_text,
+            extraction_meta=extraction_meta,
+            published_at=published_at,
+            summary_short=work.extracted_text[:320],
         )
         mark_research_document_enriched(
-            engine,
-            document_id=document_id,
+            uow,
+            document_id=work.document_id,
             enrichment=enrichment,
         )
         insight_rows = replace_research_document_insights(
-            engine,
-            document_id=document_id,
+            uow,
+            document_id=work.document_id,
             insights=insights,
         )
         replace_research_evidence_relations(
-            engine,
+            uow,
             relations=derive_evidence_relations(insight_rows),
         )
-        try:
-            _embed_existing_document(
-                engine,
-                document_id=document_id,
-                extracted_text=extracted_text,
-                embedding_model_id=embedding_model_id,
-                embedding_api_key=embedding_api_key,
-                chunk_max_chars=chunk_max_chars,
+    return True
+
+
+def _embed_chunk_batch(works: List[_DocumentWork], *, embedding: Dict[str, Any]) -> None:
+    pending = []
+    for work in works:
+        if work.chunks:
+            pending.append(work)
+        else:
+            work.embedding_error = "empty chunk set"
+    if not pending:
+        return
+    try:
+        with PIPELINE_STAGE_SECONDS.time(pipeline="research", stage="embed"):
+            vectors = embed_texts(
+                texts=[str(chunk["content"]) for work in pending for chunk in work.chunks],
+                model=embedding["model"],
+                api_key=embedding["api_key"],
+            )
+        if len(vectors) != sum(len(work.chunks) for work in pending):
+            raise RuntimeError("embedding vector count mismatch")
+    except Exception as exc:
+        if len(pending) == 1:
+            pending[0].embedding_error = str(exc) or exc.__class__.__name__
+        else:
+            for work in pending:
+                _embed_chunk_batch([work], embedding=embedding)
+        return
+    offset = 0
+    for work in pending:
+        work.vectors = vectors[offset:offset + len(work.chunks)]
+        offset += len(work.chunks)
+
+
+def _store_document_embedding(engine: Any, work: _DocumentWork, *, embedding: Dict[str, Any]) -> None:
+    if not work.embedding_error:
+        with unit_of_work(engine) as uow:
+            _store_document_embeddings(
+                uow,
+                document_id=work.document_id,
+                chunks=work.chunks,
+                vectors=work.vectors,
+                embedding_model_id=embedding["model"],
+            )
+        if work.reembed_from is not None:
+            _safe_log(
+                "research_document_reembedded",
+                document_id=work.document_id,
+                previous_model=work.reembed_from,
+                embedding_model_id=embedding["model"],
             )
+        return
+    if work.reembed_from is not None:
+        work.counters["failed"] += 1
+        append_research_run_error(
+            engine,
+            run_id=work.run_id,
+            message=f"reembed_failed source_id={work.source_id} document_id={work.document_id} error={work.embedding_error}",
+        )
+        return
+    with unit_of_work(engine) as uow:
+        mark_research_document_failed(
+            uow,
+            document_id=work.document_id,
+            fetch_meta={
+                "http_status": int(work.item_fetch.get("status_code") or 0),
+                "content_type": (work.item_fetch.get("headers") or {}).get("content-type"),
+                "error": f"embedding_error: {work.embedding_error}",
+            },
+        )
+        append_research_run_error(
+            uow,
+            run_id=work.run_id,
+            message=f"embedding_failed source_id={work.source_id} url={work.item_url} error={work.embedding_error}",
+        )
+    work.fail(f"embedding_failed error={work.embedding_error}")
+
+
+class _LeaseLost(RuntimeError):
+    pass
+
+
+def _worker_id() -> str:
+    return os.getenv("RESEARCH_WORKER_ID", "").strip() or f"{socket.gethostname()}:{os.getpid()}"
+
+
+class _LeaseHeartbeat:
+    def __init__(self, engine: Any, *, worker_id: str, lease_seconds: int) -> None:
+        self._engine = engine
+        self._worker_id = worker_id
+        self._lease_seconds = lease_seconds
+        self._job_ids: set = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="research-job-heartbeat", daemon=True)
+
+    def __enter__(self) -> "_LeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def add(self, job_id: Any) -> None:
+        with self._lock:
+            self._job_ids.add(job_id)
+
+    def discard(self, job_id: Any) -> None:
+        with self._lock:
+            self._job_ids.discard(job_id)
+
+    def _run(self) -> None:
+        interval = max(self._lease_seconds / 3.0, 0.5)
+        while not self._stop.wait(interval):
+            with self._lock:
+                job_ids = list(self._job_ids)
+            if not job_ids:
+                continue
+            try:
+                renew_research_document_job_leases(
+                    self._engine,
+                    job_ids=job_ids,
+                    worker_id=self._worker_id,
+                    lease_seconds=self._lease_seconds,
+                )
+            except Exception as exc:  # pragma: no cover - defensive runtime path
+                logger.warning("research_job_heartbeat_failed error=%s", exc)
+
+
+def _run_budget_exhausted(engine: Any, run_id: Any) -> bool:
+    budget = _int_env("RESEARCH_RUN_MAX_NEW_ITEMS", 0)
+    if budget <= 0:
+        return False
+    run = get_research_ingestion_run(engine, run_id=str(run_id)) or {}
+    return int(run.get("items_new") or 0) >= budget
+
+
+def _job_outcome(counters: Dict[str, Any]) -> str:
+    if int(counters["failed"]) > 0:
+        return "failed"
+    if int(counters["new"]) > 0:
+        return "new"
+    if int(counters["deduped"]) > 0:
+        return "deduped"
+    return "skipped"
+
+
+class _DocumentPipeline:
+    def __init__(self, engine: Any, *, worker_id: str, heartbeat: _LeaseHeartbeat) -> None:
+        self._engine = engine
+        self._worker_id = worker_id
+        self._heartbeat = heartbeat
+        self._embedding = _embedding_config()
+        self._extract_processes = max(_int_env("RESEARCH_PIPELINE_EXTRACT_PROCESSES", 2), 0)
+        self._max_attempts = max(_int_env("RESEARCH_DOCUMENT_JOB_MAX_ATTEMPTS", 3), 1)
+        self._changed = threading.Condition()
+        self._dirty = False
+        self._in_flight = 0
+        queue_size = max(_int_env("RESEARCH_PIPELINE_QUEUE_SIZE", 16), 1)
+        self.fetch = PipelineStage(
+            "fetch",
+            self._fetch,
+            on_error=self._stage_error,
+            workers=max(_int_env("RESEARCH_DOCUMENT_JOB_CONCURRENCY", 4), 1),
+            queue_size=queue_size,
+        )
+        self.extract = PipelineStage(
+            "extract",
+            self._extract,
+            on_error=self._stage_error,
+            workers=max(self._extract_processes, 1),
+            queue_size=queue_size,
+        )
+        self.enrich = PipelineStage(
+            "enrich",
+            self._enrich,
+            on_error=self._stage_error,
+            workers=max(_int_env("RESEARCH_PIPELINE_ENRICH_WORKERS", 2), 1),
+            queue_size=queue_size,
+        )
+        self.embed = PipelineStage(
+            "embed",
+            self._embed,
+            on_error=self._stage_error,
+            workers=max(_int_env("RESEARCH_PIPELINE_EMBED_WORKERS", 1), 1),
+            queue_size=queue_size,
+            batch_size=max(_int_env("RESEARCH_PIPELINE_EMBED_BATCH_TEXTS", 32), 1),
+            batch_wait_s=max(_int_env("RESEARCH_PIPELINE_EMBED_BATCH_WAIT_MS", 200), 0) / 1000.0,
+            weight=lambda work: max(len(work.chunks), 1),
+        )
+        self._stages = [self.fetch, self.extract, self.enrich, self.embed]
+
+    def __enter__(self) -> "_DocumentPipeline":
+        for stage in self._stages:
+            stage.start()
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        # Upstream first, so nothing is handed to a stage that already stopped.
+        for stage in self._stages:
+            stage.stop()
+
+    def submit(self, job: Dict[str, Any]) -> None:
+        with self._changed:
+            self._in_flight += 1
+        self.fetch.put(_DocumentWork(job))
+
+    def in_flight(self) -> int:
+        with self._changed:
+            return self._in_flight
+
+    def wait(self, timeout: float) -> None:
+        with self._changed:
+            if not self._dirty:
+                self._changed.wait(timeout)
+            self._dirty = False
+
+    def _notify(self, *, released: int = 0) -> None:
+        with self._changed:
+            self._in_flight -= released
+            self._dirty = True
+            self._changed.notify_all()
+
+    def _step(
+        self,
+        work: _DocumentWork,
+        handler: Any,
+        next_stage: Callable[[_DocumentWork], Optional[PipelineStage]],
+    ) -> None:
+        try:
+            advance = handler(work)
         except Exception as exc:
-            counters["failed"] += 1
-            source_error = f"embedding_failed error={exc}"
-            mark_research_document_failed(
-                engine,
-                document_id=document_id,
-                fetch_meta={
-                    "http_status": item_status,
-                    "content_type": (item_fetch.get("headers") or {}).get("content-type"),
-                    "error": f"embedding_error: {exc}",
-                },
+            self._retry(work, exc)
+            return
+        stage = next_stage(work) if advance else None
+        if stage is not None:
+            stage.put(work)
+        else:
+            self._finish(work)
+
+    def _fetch(self, batch: List[_DocumentWork]) -> None:
+        for work in batch:
+            self._step(work, self._fetch_or_skip, self._after_fetch)
+            self._notify()
+
+    def _after_fetch(self, work: _DocumentWork) -> PipelineStage:
+        # reembed_from is only known once _fetch_document has looked at the stored document.
+        return self.embed if work.reembed_from is not None else self.extract
+
+    def _fetch_or_skip(self, work: _DocumentWork) -> bool:
+        if int(work.job.get("attempts") or 0) > self._max_attempts:
+            work.counters["seen"] = 1
+            work.fail("job_attempts_exhausted")
+            return False
+        if _run_budget_exhausted(self._engine, work.run_id):
+            return False
+        return _fetch_document(self._engine, work, embedding=self._embedding)
+
+    def _extract(self, batch: List[_DocumentWork]) -> None:
+        for work in batch:
+            self._step(
+                work,
+                lambda item: _extract_document(self._engine, item, processes=self._extract_processes),
+                lambda _item: self.enrich,
+            )
+
+    def _enrich(self, batch: List[_DocumentWork]) -> None:
+        for work in batch:
+            self._step(
+                work,
+                lambda item: _enrich_document(self._engine, item, embedding=self._embedding),
+                lambda _item: self.embed,
+            )
+
+    def _embed(self, batch: List[_DocumentWork]) -> None:
+        _embed_chunk_batch(batch, embedding=self._embedding)
+        for work in batch:
+            self._step(
+                work,
+                lambda item: _store_document_embedding(self._engine, item, embedding=self._embedding),
+                lambda _item: None,
             )
+
+    def _stage_error(self, batch: List[_DocumentWork], exc: BaseException) -> None:
+        for work in batch:
+            self._retry(work, exc)
+
+    def _retry(self, work: _DocumentWork, exc: BaseException) -> None:
+        job_id = work.job["job_id"]
+        error = str(exc) or exc.__class__.__name__
+        try:
+            backoff_seconds = float(_int_env("RESEARCH_DOCUMENT_JOB_BACKOFF_S", 30))
+            with unit_of_work(self._engine) as uow:
+                status = retry_research_document_job(
+                    uow,
+                    job_id=job_id,
+                    worker_id=self._worker_id,
+                    error=error,
+                    max_attempts=self._max_attempts,
+                    backoff_seconds=backoff_seconds,
+                )
+                if status == "failed":
+                    update_research_run_counters(uow, run_id=work.run_id, items_seen=1, items_failed=1)
+                    append_research_run_error(
+                        uow,
+                        run_id=work.run_id,
+                        message=f"document_job_failed source_id={work.source_id} url={work.job.get('item_url')} error={error}",
+                    )
+            _safe_log("research_document_job_error", job_id=str(job_id), status=status, error=error)
+            if status == "failed":
+                PIPELINE_ITEMS.inc(pipeline="research", outcome="failed")
+        except Exception as retry_exc:  # pragma: no cover - defensive runtime path
+            logger.warning("research_document_job_retry_failed job_id=%s error=%s", job_id, retry_exc)
+        finally:
+            self._release(work)
+
+    def _finish(self, work: _DocumentWork) -> None:
+        job_id = work.job["job_id"]
+        counters = work.counters
+        outcome = _job_outcome(counters)
+        try:
+            # Counters are applied with the job transition, so a job that lost its lease to another
+            # replica (and will be processed again) is not counted twice.
+            with unit_of_work(self._engine) as uow:
+                if not finish_research_document_job(
+                    uow,
+                    job_id=job_id,
+                    worker_id=self._worker_id,
+                    outcome=outcome,
+                    last_error=str(counters.get("source_error") or "") if outcome == "failed" else None,
+                ):
+                    raise _LeaseLost(str(job_id))
+                update_research_run_counters(
+                    uow,
+                    run_id=work.run_id,
+                    items_seen=counters["seen"],
+                    items_new=counters["new"],
+                    items_deduped=counters["deduped"],
+                    items_failed=counters["failed"],
+                )
+                increment_research_run_metrics(uow, run_id=work.run_id, metrics=counters.get("metrics") or {})
+            for name in ("seen", "new", "deduped", "failed"):
+                PIPELINE_ITEMS.inc(int(counters[name]), pipeline="research", outcome=name)
+        except _LeaseLost:
+            _safe_log("research_document_job_lease_lost", job_id=str(job_id), worker_id=self._worker_id)
+        except Exception as exc:  # pragma: no cover - defensive runtime path
+            logger.warning("research_document_job_finish_failed job_id=%s error=%s", job_id, exc)
+        finally:
+            self._release(work)
+
+    def _release(self, work: _DocumentWork) -> None:
+        self._heartbeat.discard(work.job["job_id"])
+        try:
+            _finalize_run_if_done(self._engine, work.run_id)
+        except Exception as exc:  # pragma: no cover - defensive runtime path
+            logger.warning("research_run_finalize_failed run_id=%s error=%s", work.run_id, exc)
+        finally:
+            self._notify(released=1)
+
+
+def _report_pipeline_stats(engine: Any, worker_id: str) -> None:
+    try:
+        upsert_research_pipeline_stats(engine, worker_id=worker_id, stages=pipeline_stats("research"))
+    except Exception as exc:  # pragma: no cover - defensive runtime path
+        logger.warning("research_pipeline_stats_failed error=%s", exc)
+
+
+def _finalize_run_if_done(engine: Any, run_id: Any) -> bool:
+    failure_threshold = _int_env("RESEARCH_SOURCE_FAILURE_THRESHOLD", 3)
+    cooldown_minutes = _int_env("RESEARCH_SOURCE_COOLDOWN_MINUTES", 60)
+    with unit_of_work(engine) as uow:
+        if not complete_research_run_if_done(uow, run_id=run_id):
+            return False
+        for row in summarize_research_run_jobs(uow, run_id=run_id):
+            if int(row.get("failed") or 0) > 0 or int(row.get("skipped") or 0) > 0:
+                # Items left unprocessed are only rediscovered from a full listing, so the next
+                # poll must not be answered with a 304.
+                clear_research_source_listing_validators(uow, source_id=str(row["source_id"]))
+            if int(row.get("failed") or 0) > 0:
+                mark_research_source_failure(
+                    uow,
+                    source_id=str(row["source_id"]),
+                    error=str(row.get("last_error") or "source_processing_failed"),
+                    failure_threshold=failure_threshold,
+                    cooldown_minutes=cooldown_minutes,
+                )
+            else:
+                mark_research_source_success(uow, source_id=str(row["source_id"]))
+        if _run_budget_exhausted(uow, run_id):
             append_research_run_error(
-                engine,
+                uow,
                 run_id=run_id,
-                message=f"embedding_failed source_id={source_id} url={item_url} error={exc}",
+                message=f"run_budget_exhausted max_new_items={_int_env('RESEARCH_RUN_MAX_NEW_ITEMS', 0)}",
             )
-            continue
+    _safe_log("research_run_completed", run_id=str(run_id))
+    return True
 
-    set_research_source_polled(engine, source_id=source_id)
-    counters["source_error"] = source_error
-    return counters
+
+def process_document_jobs(engine: Any, *, run_id: Any = None, worker_id: Optional[str] = None) -> int:
+    lease_seconds = max(_int_env("RESEARCH_DOCUMENT_JOB_LEASE_S", 120), 3)
+    stats_interval = max(_int_env("RESEARCH_PIPELINE_STATS_INTERVAL_S", 10), 1)
+    owner = worker_id or _worker_id()
+    processed = 0
+    with _LeaseHeartbeat(engine, worker_id=owner, lease_seconds=lease_seconds) as heartbeat:
+        with _DocumentPipeline(engine, worker_id=owner, heartbeat=heartbeat) as pipeline:
+            next_report = time.monotonic() + stats_interval
+            while True:
+                free = pipeline.fetch.workers - pipeline.fetch.pending()
+                jobs: List[Dict[str, Any]] = []
+                if free > 0:
+                    jobs = claim_research_document_jobs(
+                        engine,
+                        worker_id=owner,
+                        limit=free,
+                        lease_seconds=lease_seconds,
+                        run_id=run_id,
+                    )
+                    for job in jobs:
+                        heartbeat.add(job["job_id"])
+                        pipeline.submit(job)
+                    processed += len(jobs)
+                if not jobs and pipeline.in_flight() == 0:
+                    break
+                if time.monotonic() >= next_report:
+                    _report_pipeline_stats(engine, owner)
+                    next_report = time.monotonic() + stats_interval
+                pipeline.wait(timeout=1.0)
+    if processed:
+        _report_pipeline_stats(engine, owner)
+    return processed
 
 
-def process_run(engine: Any, run: Dict[str, Any]) -> None:
+def process_run(engine: Any, run: Dict[str, Any], *, worker_id: Optional[str] = None) -> None:
     run_id = run.get("run_id")
     topic_key = str(run.get("topic_key") or "")
     selected_source_ids = run.get("selected_source_ids") or []
@@ -512,60 +1220,50 @@ def process_run(engine: Any, run: Dict[str, Any]) -> None:
     )
     failure_threshold = _int_env("RESEARCH_SOURCE_FAILURE_THRESHOLD", 3)
     cooldown_minutes = _int_env("RESEARCH_SOURCE_COOLDOWN_MINUTES", 60)
-    run_new_item_budget = _int_env("RESEARCH_RUN_MAX_NEW_ITEMS", 0)
-    run_new_items = 0
-    try:
-        for source in sources:
-            source_id = str(source.get("source_id") or "")
-            remaining_budget = 0
-            if run_new_item_budget > 0:
-                remaining_budget = max(run_new_item_budget - run_new_items, 0)
-                if remaining_budget <= 0:
-                    append_research_run_error(
-                        engine,
-                        run_id=run_id,
-                        message=f"run_budget_exhausted max_new_items={run_new_item_budget}",
-                    )
-                    break
-            counters = _process_source(
-                engine,
-                run_id=run_id,
-                source=source,
-                max_new_items=remaining_budget,
-            )
+    concurrency = max(_int_env("RESEARCH_RUN_SOURCE_CONCURRENCY", 4), 1)
+
+    def _discover(source: Dict[str, Any]) -> None:
+        source_id = str(source.get("source_id") or "")
+        result = _discover_source(engine, run_id=run_id, source=source)
+        with unit_of_work(engine) as uow:
             update_research_run_counters(
-                engine,
+                uow,
                 run_id=run_id,
-                items_seen=counters["seen"],
-                items_new=counters["new"],
-                items_deduped=counters["deduped"],
-                items_failed=counters["failed"],
+                items_seen=int(result["deduped"]),
+                items_deduped=int(result["deduped"]),
+                items_failed=int(result["failed"]),
             )
-            run_new_items += int(counters["new"])
-            if source_id:
-                if int(counters["failed"]) > 0:
+            increment_research_run_metrics(uow, run_id=run_id, metrics=result["metrics"])
+            if source_id and result["jobs"] == 0:
+                if int(result["failed"]) > 0:
                     mark_research_source_failure(
-                        engine,
+                        uow,
                         source_id=source_id,
-                        error=str(counters.get("source_error") or "source_processing_failed"),
+                        error=str(result["source_error"] or "source_processing_failed"),
                         failure_threshold=failure_threshold,
                         cooldown_minutes=cooldown_minutes,
                     )
                 else:
-                    mark_research_source_success(engine, source_id=source_id)
-            if run_new_item_budget > 0 and run_new_items >= run_new_item_budget:
-                append_research_run_error(
-                    engine,
-                    run_id=run_id,
-                    message=f"run_budget_exhausted max_new_items={run_new_item_budget}",
-                )
-                break
-        mark_research_ingestion_run_finished(engine, run_id=run_id, status="completed")
-        _safe_log("research_run_completed", run_id=str(run_id), topic_key=topic_key)
+                    mark_research_source_success(uow, source_id=source_id)
+        PIPELINE_ITEMS.inc(int(result["deduped"]), pipeline="research", outcome="deduped")
+        PIPELINE_ITEMS.inc(int(result["failed"]), pipeline="research", outcome="failed")
+
+    try:
+        if concurrency == 1 or len(sources) <= 1:
+            for source in sources:
+                _discover(source)
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(sources)), thread_name_prefix="research-source") as executor:
+                for future in [executor.submit(_discover, source) for source in sources]:
+                    future.result()
+        mark_research_run_jobs_enqueued(engine, run_id=run_id)
     except Exception as exc:  # pragma: no cover - defensive runtime path
         append_research_run_error(engine, run_id=run_id, message=f"run_failed error={exc}")
         mark_research_ingestion_run_finished(engine, run_id=run_id, status="failed")
         _safe_log("research_run_failed", run_id=str(run_id), topic_key=topic_key, error=str(exc))
+        return
+    process_document_jobs(engine, run_id=run_id, worker_id=worker_id)
+    _finalize_run_if_done(engine, run_id)
 
 
 def enqueue_due_schedule_runs(engine: Any) -> int:
@@ -595,15 +1293,17 @@ def enqueue_due_schedule_runs(engine: Any) -> int:
     return created
 
 
-def run_once(engine: Any) -> bool:
+def run_once(engine: Any, *, worker_id: Optional[str] = None) -> bool:
     stale_after_seconds = _int_env("RESEARCH_RUN_STALE_AFTER_S", 300)
     recovered = fail_stale_research_ingestion_runs(engine, stale_after_seconds=stale_after_seconds)
     if recovered:
         _safe_log("research_stale_runs_failed", count=recovered, stale_after_seconds=stale_after_seconds)
+    if process_document_jobs(engine, worker_id=worker_id) > 0:
+        return True
     run = claim_next_research_ingestion_run(engine)
     if not run:
         return False
-    process_run(engine, run)
+    process_run(engine, run, worker_id=worker_id)
     return True
 
 
@@ -621,10 +1321,13 @@ def main() -> None:
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
         raise RuntimeError("DATABASE_URL is not set")
-    engine = create_db_engine(database_url)
+    engine = create_db_engine(database_url, role="research_worker")
+    metrics_file = configure_worker_metrics("RESEARCH_WORKER")
 
     while True:
         processed = run_once(engine)
+        if metrics_file:
+            write_metrics_file(metrics_file)
         if args.once:
             break
         if not processed:
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, AsyncIterator, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
+import asyncio
 import hashlib
+import json
 import re
+import time
 import uuid
 from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
-from sqlalchemy import Engine, create_engine, select, text
+from sqlalchemy import Connection, Engine, create_engine, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from app.storage.schema import (
     intel_article_sections,
@@ -18,7 +25,9 @@ from app.storage.schema import (
     projects,
     research_decision_feedback,
     research_digest_feedback,
+    research_chunk_insight_rollup,
     research_document_insights,
+    research_document_jobs,
     research_evidence_relations,
     research_documents,
     research_chunks,
@@ -30,8 +39,11 @@ from app.storage.schema import (
     research_query_logs,
     research_source_policies,
     research_sources,
+    research_topic_corpus_versions,
     tasks,
 )
+from app.storage.pool import PoolMetrics, instrument_engine_pool, pool_config_for_role, timed_pool_class
+from app.storage.vector_codec import decode_embedding_row, normalize_embedding_storage_format, pack_vector, unpack_vector
 
 
 def _list_text(value: Any) -> List[str]:
@@ -55,8 +67,131 @@ def _strip_nul_from_value(value: Any) -> Any:
     return value
 
 
-def create_db_engine(database_url: str) -> Engine:
-    return create_engine(database_url, pool_pre_ping=True, future=True)
+_T = TypeVar("_T")
+
+
+def create_db_engine(database_url: str, *, role: str = "script") -> Engine:
+    metrics = PoolMetrics(role=role, name="sync")
+    engine = create_engine(
+        database_url,
+        pool_pre_ping=True,
+        future=True,
+        poolclass=timed_pool_class(metrics),
+        **pool_config_for_role(role),
+    )
+    instrument_engine_pool(engine, metrics)
+    return engine
+
+
+def create_async_db_engine(database_url: str, *, role: str = "api") -> AsyncEngine:
+    # postgresql+psycopg resolves to psycopg's async connection under create_async_engine.
+    metrics = PoolMetrics(role=role, name="async")
+    engine = create_async_engine(
+        database_url,
+        pool_pre_ping=True,
+        poolclass=timed_pool_class(metrics, is_async=True),
+        **pool_config_for_role(role),
+    )
+    instrument_engine_pool(engine, metrics)
+    return engine
+
+
+_statement_timeout_ms: ContextVar[int] = ContextVar("statement_timeout_ms", default=0)
+
+
+@contextmanager
+def statement_timeout(milliseconds: int) -> Iterator[None]:
+    token = _statement_timeout_ms.set(max(int(milliseconds or 0), 0))
+    try:
+        yield
+    finally:
+        _statement_timeout_ms.reset(token)
+
+
+def _apply_statement_timeout(conn: Connection, milliseconds: int) -> None:
+    if milliseconds > 0:
+        conn.execute(text("SELECT set_config('statement_timeout', :value, true)"), {"value": f"{milliseconds}ms"})
+
+
+class UnitOfWork:
+    # Passed as `engine` to the storage functions below so their calls share one transaction.
+    def __init__(self, conn: Connection) -> None:
+        self._conn = conn
+
+    @contextmanager
+    def begin(self) -> Iterator[Connection]:
+        yield self._conn
+
+    connect = begin
+
+
+@contextmanager
+def unit_of_work(engine: Any) -> Iterator[UnitOfWork]:
+    if isinstance(engine, UnitOfWork):
+        yield engine
+        return
+    with engine.begin() as conn:
+        _apply_statement_timeout(conn, _statement_timeout_ms.get())
+        yield UnitOfWork(conn)
+
+
+async def run_db(engine: AsyncEngine, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+    timeout_ms = _statement_timeout_ms.get()
+
+    def call(sync_conn: Connection) -> _T:
+        _apply_statement_timeout(sync_conn, timeout_ms)
+        return fn(UnitOfWork(sync_conn), *args, **kwargs)
+
+    async with engine.begin() as conn:
+        return await conn.run_sync(call)
+
+
+class AsyncUnitOfWork:
+    # The connection is checked out on the first run(); after release() the next run() takes another.
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self._conn: Optional[AsyncConnection] = None
+        self._lock = asyncio.Lock()
+
+    async def run(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        async with self._lock:
+            if self._conn is None:
+                conn = await self._engine.connect()
+                try:
+                    await conn.begin()
+                    await conn.run_sync(_apply_statement_timeout, _statement_timeout_ms.get())
+                except BaseException:
+                    await conn.close()
+                    raise
+                self._conn = conn
+            return await self._conn.run_sync(lambda sync_conn: fn(UnitOfWork(sync_conn), *args, **kwargs))
+
+    async def release(self) -> None:
+        await self.close()
+
+    async def close(self, *, commit: bool = True) -> None:
+        async with self._lock:
+            conn, self._conn = self._conn, None
+            if conn is None:
+                return
+            try:
+                if commit:
+                    await conn.commit()
+                else:
+                    await conn.rollback()
+            finally:
+                await conn.close()
+
+
+@asynccontextmanager
+async def async_unit_of_work(engine: AsyncEngine) -> AsyncIterator[AsyncUnitOfWork]:
+    uow = AsyncUnitOfWork(engine)
+    try:
+        yield uow
+    except BaseException:
+        await uow.close(commit=False)
+        raise
+    await uow.close()
 
 
 def check_db(engine: Engine) -> None:
@@ -296,6 +431,16 @@ def replace_intel_sections(engine: Engine, *, article_id: str, sections: Iterabl
         )
         if rows:
             conn.execute(intel_article_sections.insert(), rows)
+            conn.execute(
+                text(
+                    """
+                    UPDATE intel_article_sections
+                    SET search_vector = to_tsvector('english', coalesce(content, ''))
+                    WHERE article_id = :article_id
+                    """
+                ),
+                {"article_id": article_id},
+            )
 
 
 def search_intel_articles(
@@ -381,10 +526,7 @@ def search_intel_sections(
     sql = """
         SELECT
             section_id,
-            ts_rank(
-                to_tsvector('english', coalesce(content, '')),
-                plainto_tsquery('english', :query)
-            ) AS score,
+            ts_rank(search_vector, plainto_tsquery('english', :query)) AS score,
             ts_headline(
                 'english',
                 content,
@@ -394,7 +536,7 @@ def search_intel_sections(
             rank
         FROM intel_article_sections
         WHERE article_id = :article_id
-          AND to_tsvector('english', coalesce(content, '')) @@ plainto_tsquery('english', :query)
+          AND search_vector @@ plainto_tsquery('english', :query)
         ORDER BY score DESC, rank ASC
         LIMIT :limit
     """
@@ -686,6 +828,11 @@ def get_latest_job_error(engine: Engine, article_id: str) -> Optional[str]:
     return str(row["last_error"]) if row and row.get("last_error") else None
 
 
+# Source fields that retrieval filters, scores or returns with pack items; changing one on an
+# existing source invalidates cached context packs for its topic.
+_RESEARCH_SOURCE_RANKING_FIELDS = ("enabled", "name", "tags", "publisher_type", "source_class", "default_decision_domains")
+
+
 def upsert_research_source(
     engine: Engine,
     *,
@@ -708,7 +855,19 @@ def upsert_research_source(
 ) -> Dict[str, Any]:
     with engine.begin() as conn:
         existing = conn.execute(
-            select(research_sources.c.source_id).where(research_sources.c.source_id == source_id)
+            select(
+                research_sources.c.source_id,
+                research_sources.c.topic_key,
+                *[research_sources.c[name] for name in _RESEARCH_SOURCE_RANKING_FIELDS],
+                research_source_policies.c.source_weight,
+            )
+            .select_from(
+                research_sources.outerjoin(
+                    research_source_policies,
+                    research_source_policies.c.source_id == research_sources.c.source_id,
+                )
+            )
+            .where(research_sources.c.source_id == source_id)
         ).mappings().first()
         source_stmt = pg_insert(research_sources).values(
             {
@@ -742,6 +901,8 @@ def upsert_research_source(
             },
         )
         conn.execute(source_stmt)
+        if existing is not None and existing["topic_key"] != topic_key:
+            _move_research_source_topic(conn, source_id=source_id, previous_topic_key=str(existing["topic_key"]))
 
         policy_stmt = pg_insert(research_source_policies).values(
             {
@@ -765,10 +926,62 @@ def upsert_research_source(
             },
         )
         conn.execute(policy_stmt)
+        if existing is not None and existing["topic_key"] == topic_key:
+            ranking = {
+                "enabled": enabled,
+                "name": name,
+                "tags": tags,
+                "publisher_type": publisher_type,
+                "source_class": source_class,
+                "default_decision_domains": default_decision_domains,
+                "source_weight": source_weight,
+            }
+            if any(existing[key] != value for key, value in ranking.items()):
+                _bump_research_corpus_version(conn, source_id=source_id)
 
     return {"source_id": source_id, "status": "created" if existing is None else "updated"}
 
 
+def _move_research_source_topic(
+    conn: Connection,
+    *,
+    source_id: str,
+    previous_topic_key: str,
+) -> None:
+    # Documents and chunks carry a denormalized topic_key; re-home them with their source.
+    moved = conn.execute(
+        text(
+            """
+            UPDATE research_documents d
+            SET topic_key = s.topic_key,
+                updated_at = now()
+            FROM research_sources s
+            WHERE s.source_id = :source_id
+              AND d.source_id = s.source_id
+              AND d.topic_key <> s.topic_key
+            """
+        ),
+        {"source_id": source_id},
+    ).rowcount
+    if not moved:
+        return
+    conn.execute(
+        text(
+            """
+            UPDATE research_chunks c
+            SET topic_key = d.topic_key
+            FROM research_documents d
+            WHERE d.source_id = :source_id
+              AND c.document_id = d.document_id
+              AND c.topic_key <> d.topic_key
+            """
+        ),
+        {"source_id": source_id},
+    )
+    _bump_research_corpus_version(conn, source_id=source_id)
+    _bump_research_corpus_version(conn, topic_key=previous_topic_key)
+
+
 def list_research_sources(
     engine: Engine,
     *,
@@ -788,6 +1001,9 @@ def list_research_sources(
             research_source_policies.c.consecutive_failures,
             research_source_policies.c.cooldown_until,
             research_source_policies.c.last_error,
+            research_source_policies.c.listing_etag,
+            research_source_policies.c.listing_last_modified,
+            research_source_policies.c.listing_bytes,
         )
         .join(
             research_source_policies,
@@ -805,6 +1021,59 @@ def list_research_sources(
     return [dict(row) for row in rows]
 
 
+_BUMP_CORPUS_VERSION_SQL = """
+    INSERT INTO research_topic_corpus_versions (topic_key, version, updated_at)
+    SELECT DISTINCT s.topic_key, 1, now()
+    FROM research_sources s
+    {join}
+    WHERE {where}
+    ON CONFLICT (topic_key) DO UPDATE
+    SET version = research_topic_corpus_versions.version + 1,
+        updated_at = now()
+"""
+
+
+def _bump_research_corpus_version(
+    conn: Connection,
+    *,
+    source_id: Optional[str] = None,
+    document_id: Optional[str] = None,
+    topic_key: Optional[str] = None,
+) -> None:
+    if topic_key:
+        stmt = pg_insert(research_topic_corpus_versions).values(topic_key=topic_key, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[research_topic_corpus_versions.c.topic_key],
+            set_={
+                "version": research_topic_corpus_versions.c.version + 1,
+                "updated_at": text("now()"),
+            },
+        )
+        conn.execute(stmt)
+    elif document_id:
+        sql = _BUMP_CORPUS_VERSION_SQL.format(
+            join="JOIN research_documents d ON d.source_id = s.source_id",
+            where="d.document_id = :document_id",
+        )
+        conn.execute(text(sql), {"document_id": document_id})
+    elif source_id:
+        sql = _BUMP_CORPUS_VERSION_SQL.format(join="", where="s.source_id = :source_id")
+        conn.execute(text(sql), {"source_id": source_id})
+
+
+def get_research_corpus_version(
+    engine: Engine,
+    *,
+    topic_key: str,
+) -> int:
+    with engine.begin() as conn:
+        value = conn.execute(
+            text("SELECT version FROM research_topic_corpus_versions WHERE topic_key = :topic_key"),
+            {"topic_key": topic_key},
+        ).scalar()
+    return int(value or 0)
+
+
 def set_research_source_enabled(
     engine: Engine,
     *,
@@ -817,6 +1086,7 @@ def set_research_source_enabled(
             .where(research_sources.c.source_id == source_id)
             .values(enabled=enabled, updated_at=text("now()"))
         )
+        _bump_research_corpus_version(conn, source_id=source_id)
     return int(result.rowcount or 0) > 0
 
 
@@ -824,12 +1094,31 @@ def set_research_source_polled(
     engine: Engine,
     *,
     source_id: str,
+    listing: Optional[Dict[str, Any]] = None,
+) -> None:
+    values: Dict[str, Any] = {"last_polled_at": text("now()"), "updated_at": text("now()")}
+    if listing is not None:
+        values["listing_etag"] = listing.get("etag") or None
+        values["listing_last_modified"] = listing.get("last_modified") or None
+        values["listing_bytes"] = int(listing.get("bytes") or 0)
+    with engine.begin() as conn:
+        conn.execute(
+            research_source_policies.update()
+            .where(research_source_policies.c.source_id == source_id)
+            .values(**values)
+        )
+
+
+def clear_research_source_listing_validators(
+    engine: Engine,
+    *,
+    source_id: str,
 ) -> None:
     with engine.begin() as conn:
         conn.execute(
             research_source_policies.update()
             .where(research_source_policies.c.source_id == source_id)
-            .values(last_polled_at=text("now()"), updated_at=text("now()"))
+            .values(listing_etag=None, listing_last_modified=None, updated_at=text("now()"))
         )
 
 
@@ -1013,6 +1302,12 @@ def fail_stale_research_ingestion_runs(
             errors = coalesce(errors, '[]'::jsonb) || jsonb_build_array(CAST(:message AS text))
         WHERE status = 'running'
           AND updated_at < now() - (:threshold_seconds * interval '1 second')
+          AND NOT EXISTS (
+              SELECT 1
+              FROM research_document_jobs j
+              WHERE j.run_id = research_ingestion_runs.run_id
+                AND (j.status IN ('queued', 'retry') OR (j.status = 'running' AND j.lease_expires_at > now()))
+          )
     """
     with engine.begin() as conn:
         result = conn.execute(
@@ -1094,6 +1389,281 @@ def mark_research_ingestion_run_finished(
         )
 
 
+def enqueue_research_document_jobs(
+    engine: Engine,
+    *,
+    run_id: Any,
+    source_id: str,
+    source: Dict[str, Any],
+    items: List[Dict[str, Any]],
+) -> int:
+    rows = [
+        {
+            "job_id": uuid.uuid4(),
+            "run_id": run_id,
+            "source_id": source_id,
+            # Keyed by canonical URL so tracking-parameter variants of one link become one job.
+            "item_url": canonicalize_url(str(item["url"])) or str(item["url"]),
+            "item": item,
+            "source": source,
+        }
+        for item in items
+        if item.get("url")
+    ]
+    if not rows:
+        return 0
+    stmt = (
+        pg_insert(research_document_jobs)
+        .values(rows)
+        .on_conflict_do_nothing(constraint="uq_research_document_jobs_run_item")
+        .returning(research_document_jobs.c.job_id)
+    )
+    with engine.begin() as conn:
+        return len(conn.execute(stmt).fetchall())
+
+
+def increment_research_run_metrics(
+    engine: Engine,
+    *,
+    run_id: Any,
+    metrics: Dict[str, float],
+) -> None:
+    deltas = {str(key): float(value) for key, value in metrics.items() if value}
+    if not deltas:
+        return
+    sql = """
+        UPDATE research_ingestion_runs r
+        SET metrics = r.metrics || (
+                SELECT jsonb_object_agg(d.key, COALESCE((r.metrics ->> d.key)::numeric, 0) + d.value::numeric)
+                FROM jsonb_each_text(CAST(:deltas AS jsonb)) AS d
+            ),
+            updated_at = now()
+        WHERE r.run_id = :run_id
+    """
+    with engine.begin() as conn:
+        conn.execute(text(sql), {"run_id": run_id, "deltas": json.dumps(deltas)})
+
+
+def mark_research_run_jobs_enqueued(
+    engine: Engine,
+    *,
+    run_id: Any,
+) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            research_ingestion_runs.update()
+            .where(research_ingestion_runs.c.run_id == run_id)
+            .values(jobs_enqueued_at=text("now()"), updated_at=text("now()"))
+        )
+
+
+def claim_research_document_jobs(
+    engine: Engine,
+    *,
+    worker_id: str,
+    limit: int = 1,
+    lease_seconds: int = 120,
+    run_id: Optional[Any] = None,
+) -> List[Dict[str, Any]]:
+    run_filter = "AND run_id = :run_id" if run_id is not None else ""
+    sql = f"""
+        WITH claimable AS (
+            SELECT job_id
+            FROM research_document_jobs
+            WHERE (
+                (status IN ('queued', 'retry') AND available_at <= now())
+                OR (status = 'running' AND lease_expires_at < now())
+            )
+            {run_filter}
+            ORDER BY available_at ASC, created_at ASC
+            FOR UPDATE SKIP LOCKED
+            LIMIT :limit
+        )
+        UPDATE research_document_jobs j
+        SET status = 'running',
+            attempts = j.attempts + 1,
+            lease_owner = :worker_id,
+            lease_expires_at = now() + (:lease_seconds * interval '1 second'),
+            updated_at = now()
+        FROM claimable
+        WHERE j.job_id = claimable.job_id
+        RETURNING j.*
+    """
+    params: Dict[str, Any] = {
+        "worker_id": worker_id,
+        "limit": max(int(limit), 1),
+        "lease_seconds": max(int(lease_seconds), 1),
+    }
+    if run_id is not None:
+        params["run_id"] = run_id
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), params).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def renew_research_document_job_leases(
+    engine: Engine,
+    *,
+    job_ids: List[Any],
+    worker_id: str,
+    lease_seconds: int = 120,
+) -> int:
+    if not job_ids:
+        return 0
+    sql = """
+        UPDATE research_document_jobs
+        SET lease_expires_at = now() + (:lease_seconds * interval '1 second'),
+            updated_at = now()
+        WHERE job_id = ANY(:job_ids)
+          AND lease_owner = :worker_id
+          AND status = 'running'
+    """
+    with engine.begin() as conn:
+        result = conn.execute(
+            text(sql),
+            {"job_ids": list(job_ids), "worker_id": worker_id, "lease_seconds": max(int(lease_seconds), 1)},
+        )
+    return int(result.rowcount or 0)
+
+
+def finish_research_document_job(
+    engine: Engine,
+    *,
+    job_id: Any,
+    worker_id: str,
+    outcome: str,
+    status: str = "done",
+    last_error: Optional[str] = None,
+) -> bool:
+    sql = """
+        UPDATE research_document_jobs
+        SET status = :status,
+            outcome = :outcome,
+            last_error = :last_error,
+            lease_expires_at = NULL,
+            finished_at = now(),
+            updated_at = now()
+        WHERE job_id = :job_id
+          AND lease_owner = :worker_id
+          AND status = 'running'
+    """
+    with engine.begin() as conn:
+        result = conn.execute(
+            text(sql),
+            {
+                "job_id": job_id,
+                "worker_id": worker_id,
+                "status": status,
+                "outcome": outcome,
+                "last_error": (last_error or None) and last_error[:500],
+            },
+        )
+    return bool(result.rowcount)
+
+
+def retry_research_document_job(
+    engine: Engine,
+    *,
+    job_id: Any,
+    worker_id: str,
+    error: str,
+    max_attempts: int = 3,
+    backoff_seconds: float = 30.0,
+) -> Optional[str]:
+    sql = """
+        UPDATE research_document_jobs
+        SET status = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE 'retry' END,
+            outcome = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE NULL END,
+            finished_at = CASE WHEN attempts >= :max_attempts THEN now() ELSE NULL END,
+            available_at = now() + (:backoff_seconds * power(2, greatest(attempts - 1, 0)) * interval '1 second'),
+            last_error = :error,
+            lease_owner = NULL,
+            lease_expires_at = NULL,
+            updated_at = now()
+        WHERE job_id = :job_id
+          AND lease_owner = :worker_id
+          AND status = 'running'
+        RETURNING status
+    """
+    with engine.begin() as conn:
+        row = conn.execute(
+            text(sql),
+            {
+                "job_id": job_id,
+                "worker_id": worker_id,
+                "error": error[:500],
+                "max_attempts": max(int(max_attempts), 1),
+                "backoff_seconds": max(float(backoff_seconds), 0.0),
+            },
+        ).first()
+    return str(row[0]) if row else None
+
+
+def complete_research_run_if_done(
+    engine: Engine,
+    *,
+    run_id: Any,
+) -> bool:
+    sql = """
+        UPDATE research_ingestion_runs r
+        SET status = 'completed',
+            finished_at = now(),
+            updated_at = now()
+        WHERE r.run_id = :run_id
+          AND r.status = 'running'
+          AND r.jobs_enqueued_at IS NOT NULL
+          AND NOT EXISTS (
+              SELECT 1
+              FROM research_document_jobs j
+              WHERE j.run_id = r.run_id
+                AND j.status IN ('queued', 'retry', 'running')
+          )
+        RETURNING r.run_id
+    """
+    with engine.begin() as conn:
+        row = conn.execute(text(sql), {"run_id": run_id}).first()
+    return row is not None
+
+
+def summarize_research_run_jobs(
+    engine: Engine,
+    *,
+    run_id: Any,
+) -> List[Dict[str, Any]]:
+    sql = """
+        SELECT
+            source_id,
+            count(*) AS jobs,
+            count(*) FILTER (WHERE outcome = 'failed') AS failed,
+            count(*) FILTER (WHERE outcome = 'skipped') AS skipped,
+            (array_agg(last_error ORDER BY finished_at DESC) FILTER (WHERE outcome = 'failed'))[1] AS last_error
+        FROM research_document_jobs
+        WHERE run_id = :run_id
+        GROUP BY source_id
+        ORDER BY source_id
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), {"run_id": run_id}).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def count_research_document_jobs(
+    engine: Engine,
+    *,
+    run_id: Any,
+    status: Optional[str] = None,
+) -> int:
+    sql = """
+        SELECT count(*) AS c
+        FROM research_document_jobs
+        WHERE run_id = :run_id
+          AND (CAST(:status AS text) IS NULL OR status = :status)
+    """
+    with engine.begin() as conn:
+        row = conn.execute(text(sql), {"run_id": run_id, "status": status}).mappings().first()
+    return int(row["c"]) if row else 0
+
+
 def upsert_research_document_seed(
     engine: Engine,
     *,
@@ -1111,11 +1681,14 @@ def upsert_research_document_seed(
             )
         ).mappings().first()
         if not existing:
-            conn.execute(
-                research_documents.insert().values(
+            inserted = conn.execute(
+                pg_insert(research_documents).values(
                     {
                         "document_id": document_id,
                         "source_id": source_id,
+                        "topic_key": select(research_sources.c.topic_key)
+                        .where(research_sources.c.source_id == source_id)
+                        .scalar_subquery(),
                         "run_id": run_id,
                         "canonical_url": canonical_url,
                         "url_original": url_original,
@@ -1123,8 +1696,10 @@ def upsert_research_document_seed(
                         "status": "discovered",
                     }
                 )
-            )
-            return "new"
+                .on_conflict_do_nothing(index_elements=[research_documents.c.document_id])
+                .returning(research_documents.c.document_id)
+            ).first()
+            return "new" if inserted else "deduped"
         status = str(existing.get("status") or "discovered")
         if status in {"failed", "discovered"}:
             conn.execute(
@@ -1136,6 +1711,100 @@ def upsert_research_document_seed(
         return "deduped"
 
 
+_SEED_RESEARCH_DOCUMENTS_SQL = """
+    WITH input AS (
+        SELECT DISTINCT ON (x.document_id) x.document_id, x.canonical_url, x.url_original, x.external_id, x.ordinal
+        FROM jsonb_to_recordset(CAST(:items AS jsonb))
+            AS x(document_id text, canonical_url text, url_original text, external_id text, ordinal int)
+        ORDER BY x.document_id, x.ordinal
+    ),
+    existing AS (
+        SELECT
+            d.document_id,
+            d.status,
+            d.suppressed,
+            d.fetched_at,
+            d.embedding_model_id,
+            coalesce(d.extracted_text, '') <> '' AS has_text
+        FROM research_documents d
+        JOIN input i ON i.document_id = d.document_id
+    ),
+    inserted AS (
+        INSERT INTO research_documents (document_id, source_id, topic_key, run_id, canonical_url, url_original, external_id, status)
+        SELECT
+            i.document_id,
+            :source_id,
+            (SELECT topic_key FROM research_sources WHERE source_id = :source_id),
+            CAST(:run_id AS uuid),
+            i.canonical_url,
+            i.url_original,
+            i.external_id,
+            'discovered'
+        FROM input i
+        WHERE NOT EXISTS (SELECT 1 FROM existing e WHERE e.document_id = i.document_id)
+        ORDER BY i.ordinal
+        ON CONFLICT (document_id) DO NOTHING
+        RETURNING document_id
+    ),
+    retried AS (
+        UPDATE research_documents d
+        SET status = 'discovered', run_id = CAST(:run_id AS uuid), updated_at = now()
+        FROM existing e
+        WHERE d.document_id = e.document_id
+          AND e.status IN ('failed', 'discovered')
+        RETURNING d.document_id
+    )
+    SELECT
+        i.document_id,
+        CASE
+            WHEN n.document_id IS NOT NULL THEN 'new'
+            WHEN r.document_id IS NOT NULL THEN 'retry'
+            ELSE 'deduped'
+        END AS seed_state,
+        e.status,
+        e.suppressed,
+        e.fetched_at,
+        e.embedding_model_id,
+        coalesce(e.has_text, false) AS has_text
+    FROM input i
+    LEFT JOIN inserted n ON n.document_id = i.document_id
+    LEFT JOIN retried r ON r.document_id = i.document_id
+    LEFT JOIN existing e ON e.document_id = i.document_id
+    ORDER BY i.ordinal
+"""
+
+
+def seed_research_documents(
+    engine: Engine,
+    *,
+    source_id: str,
+    run_id: Any,
+    items: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    # Repeated document_ids keep their first entry.
+    rows = [
+        {
+            "document_id": str(item["document_id"]),
+            "canonical_url": str(item["canonical_url"]),
+            "url_original": item.get("url_original"),
+            "external_id": item.get("external_id") or None,
+            "ordinal": ordinal,
+        }
+        for ordinal, item in enumerate(items)
+        if item.get("document_id")
+    ]
+    if not rows:
+        return []
+    params = {
+        "items": json.dumps(_strip_nul_from_value(rows)),
+        "source_id": source_id,
+        "run_id": str(run_id) if run_id is not None else None,
+    }
+    with engine.begin() as conn:
+        result = conn.execute(text(_SEED_RESEARCH_DOCUMENTS_SQL), params).mappings().all()
+    return [dict(row) for row in result]
+
+
 def mark_research_document_fetched(
     engine: Engine,
     *,
@@ -1167,21 +1836,41 @@ def mark_research_document_fetched(
         )
 
 
-def mark_research_document_extracted(
+def touch_research_document_fetched(
     engine: Engine,
     *,
     document_id: str,
-    extracted_text: str,
-    extraction_meta: Dict[str, Any],
-    published_at: Optional[Any] = None,
-    summary_short: Optional[str] = None,
+    fetch_meta: Dict[str, Any],
 ) -> None:
-    normalized_published_at = published_at if published_at not in {"", "null", "None"} else None
-    safe_extracted_text = _strip_nul_from_value(extracted_text)
-    safe_summary = _strip_nul_from_value(summary_short)
-    safe_extraction_meta = _strip_nul_from_value(extraction_meta)
-    with engine.begin() as conn:
-        conn.execute(
+    sql = """
+        UPDATE research_documents
+        SET fetch_meta = COALESCE(fetch_meta, '{}'::jsonb) || CAST(:fetch_meta AS jsonb),
+            fetched_at = now(),
+            updated_at = now()
+        WHERE document_id = :document_id
+    """
+    with engine.begin() as conn:
+        conn.execute(
+            text(sql),
+            {"document_id": document_id, "fetch_meta": json.dumps(_strip_nul_from_value(fetch_meta))},
+        )
+
+
+def mark_research_document_extracted(
+    engine: Engine,
+    *,
+    document_id: str,
+    extracted_text: str,
+    extraction_meta: Dict[str, Any],
+    published_at: Optional[Any] = None,
+    summary_short: Optional[str] = None,
+) -> None:
+    normalized_published_at = published_at if published_at not in {"", "null", "None"} else None
+    safe_extracted_text = _strip_nul_from_value(extracted_text)
+    safe_summary = _strip_nul_from_value(summary_short)
+    safe_extraction_meta = _strip_nul_from_value(extraction_meta)
+    with engine.begin() as conn:
+        conn.execute(
             research_documents.update()
             .where(research_documents.c.document_id == document_id)
             .values(
@@ -1196,6 +1885,113 @@ def mark_research_document_extracted(
         )
 
 
+# Kept in sync with migration 0022.
+_RESEARCH_CHUNK_INSIGHT_ROLLUP_SQL = """
+    INSERT INTO research_chunk_insight_rollup (
+        document_id, chunk_id, insight_count, max_confidence, max_evidence_quality, max_freshness_score,
+        max_coverage_score, corroboration_count, contradiction_count, insight_types, problem_tags,
+        intervention_tags, tradeoff_dimensions, insight_text
+    )
+    SELECT
+        i.document_id,
+        i.chunk_id,
+        count(*) AS insight_count,
+        max(i.confidence) AS max_confidence,
+        max(i.evidence_quality) AS max_evidence_quality,
+        max(i.freshness_score) AS max_freshness_score,
+        max(i.coverage_score) AS max_coverage_score,
+        max(i.corroboration_count) AS corroboration_count,
+        max(i.contradiction_count) AS contradiction_count,
+        array_agg(DISTINCT i.insight_type ORDER BY i.insight_type) AS insight_types,
+        ARRAY(
+            SELECT DISTINCT tag.value
+            FROM research_document_insights t,
+                 jsonb_array_elements_text(coalesce(t.problem_tags, '[]'::jsonb)) AS tag(value)
+            WHERE t.document_id = i.document_id AND t.chunk_id = i.chunk_id
+            ORDER BY tag.value
+        ) AS problem_tags,
+        ARRAY(
+            SELECT DISTINCT tag.value
+            FROM research_document_insights t,
+                 jsonb_array_elements_text(coalesce(t.intervention_tags, '[]'::jsonb)) AS tag(value)
+            WHERE t.document_id = i.document_id AND t.chunk_id = i.chunk_id
+            ORDER BY tag.value
+        ) AS intervention_tags,
+        ARRAY(
+            SELECT DISTINCT tag.value
+            FROM research_document_insights t,
+                 jsonb_array_elements_text(coalesce(t.tradeoff_dimensions, '[]'::jsonb)) AS tag(value)
+            WHERE t.document_id = i.document_id AND t.chunk_id = i.chunk_id
+            ORDER BY tag.value
+        ) AS tradeoff_dimensions,
+        string_agg(i.text, ' ' ORDER BY i.created_at, i.insight_id) AS insight_text
+    FROM research_document_insights i
+    WHERE i.document_id = :document_id
+    GROUP BY i.document_id, i.chunk_id
+"""
+
+
+def _replace_research_document_insight_rows(
+    conn: Connection,
+    *,
+    document_id: str,
+    rows: List[Dict[str, Any]],
+    keep_chunk_ids: Collection[str] = (),
+) -> None:
+    # The only writer of a document's insights, so the rollup is rebuilt with every change.
+    stmt = research_document_insights.delete().where(research_document_insights.c.document_id == document_id)
+    if keep_chunk_ids:
+        stmt = stmt.where(research_document_insights.c.chunk_id.notin_(list(keep_chunk_ids)))
+    conn.execute(stmt)
+    if rows:
+        conn.execute(research_document_insights.insert(), rows)
+    conn.execute(
+        research_chunk_insight_rollup.delete().where(research_chunk_insight_rollup.c.document_id == document_id)
+    )
+    conn.execute(text(_RESEARCH_CHUNK_INSIGHT_ROLLUP_SQL), {"document_id": document_id})
+
+
+# Kept in sync with migration 0015.
+_RESEARCH_CHUNK_SEARCH_VECTOR_SQL = """
+    UPDATE research_chunks c
+    SET search_vector =
+        setweight(to_tsvector('english', coalesce(d.title, '')), 'A') ||
+        setweight(
+            to_tsvector(
+                'english',
+                coalesce(d.summary_short, '') || ' ' ||
+                coalesce(d.why_it_matters, '') || ' ' ||
+                coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.topic_tags)), ' '), '') || ' ' ||
+                coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.decision_domains)), ' '), '')
+            ),
+            'B'
+        ) ||
+        setweight(to_tsvector('english', coalesce(c.content, '')), 'C') ||
+        setweight(
+            to_tsvector(
+                'english',
+                coalesce(
+                    (
+                        SELECT r.insight_text
+                        FROM research_chunk_insight_rollup r
+                        WHERE r.document_id = c.document_id
+                          AND r.chunk_id = c.chunk_id
+                    ),
+                    ''
+                )
+            ),
+            'D'
+        )
+    FROM research_documents d
+    WHERE d.document_id = c.document_id
+      AND c.document_id = :document_id
+"""
+
+
+def _refresh_research_chunk_search_vectors(conn: Connection, *, document_id: str) -> None:
+    conn.execute(text(_RESEARCH_CHUNK_SEARCH_VECTOR_SQL), {"document_id": document_id})
+
+
 def mark_research_document_enriched(
     engine: Engine,
     *,
@@ -1235,6 +2031,7 @@ def mark_research_document_enriched(
             .where(research_documents.c.document_id == document_id)
             .values(**values)
         )
+        _refresh_research_chunk_search_vectors(conn, document_id=document_id)
 
 
 def replace_research_document_insights(
@@ -1282,11 +2079,8 @@ def replace_research_document_insights(
             }
         )
     with engine.begin() as conn:
-        conn.execute(
-            research_document_insights.delete().where(research_document_insights.c.document_id == document_id)
-        )
-        if rows:
-            conn.execute(research_document_insights.insert(), rows)
+        _replace_research_document_insight_rows(conn, document_id=document_id, rows=rows)
+        _refresh_research_chunk_search_vectors(conn, document_id=document_id)
     return rows
 
 
@@ -1358,7 +2152,20 @@ def replace_research_chunks(
             research_chunks.delete().where(research_chunks.c.document_id == document_id)
         )
         if rows:
-            conn.execute(research_chunks.insert(), rows)
+            topic_key = (
+                select(research_documents.c.topic_key)
+                .where(research_documents.c.document_id == document_id)
+                .scalar_subquery()
+            )
+            conn.execute(research_chunks.insert().values(topic_key=topic_key), rows)
+        _replace_research_document_insight_rows(
+            conn,
+            document_id=document_id,
+            rows=[],
+            keep_chunk_ids={row["chunk_id"] for row in rows},
+        )
+        if rows:
+            _refresh_research_chunk_search_vectors(conn, document_id=document_id)
 
 
 def replace_research_embeddings(
@@ -1367,21 +2174,32 @@ def replace_research_embeddings(
     document_id: str,
     embedding_model_id: str,
     embeddings: List[Dict[str, Any]],
+    storage_format: str = "float32",
 ) -> None:
+    storage_format = normalize_embedding_storage_format(storage_format)
     rows: List[Dict[str, Any]] = []
     for item in embeddings:
         chunk_id = str(item.get("chunk_id") or "").strip()
         vector = item.get("vector")
         if not chunk_id or not isinstance(vector, list) or not vector:
             continue
-        rows.append(
-            {
-                "document_id": document_id,
-                "chunk_id": chunk_id,
-                "embedding_model_id": embedding_model_id,
-                "vector": vector,
-            }
-        )
+        row: Dict[str, Any] = {
+            "document_id": document_id,
+            "chunk_id": chunk_id,
+            "embedding_model_id": embedding_model_id,
+            "vector": None,
+            "vector_packed": None,
+            "vector_encoding": None,
+            "vector_scale": None,
+        }
+        if storage_format == "jsonb":
+            row["vector"] = vector
+        else:
+            packed, scale = pack_vector(vector, encoding=storage_format)
+            row["vector_packed"] = packed
+            row["vector_encoding"] = storage_format
+            row["vector_scale"] = scale
+        rows.append(row)
     with engine.begin() as conn:
         conn.execute(
             research_embeddings.delete()
@@ -1409,6 +2227,7 @@ def mark_research_document_embedded(
                 updated_at=text("now()"),
             )
         )
+        _bump_research_corpus_version(conn, document_id=document_id)
 
 
 def mark_research_document_failed(
@@ -1449,9 +2268,7 @@ def set_research_document_suppressed(
             conn.execute(
                 research_embeddings.delete().where(research_embeddings.c.document_id == document_id)
             )
-            conn.execute(
-                research_document_insights.delete().where(research_document_insights.c.document_id == document_id)
-            )
+            _replace_research_document_insight_rows(conn, document_id=document_id, rows=[])
             conn.execute(
                 research_documents.update()
                 .where(research_documents.c.document_id == document_id)
@@ -1483,6 +2300,7 @@ def set_research_document_suppressed(
                     updated_at=text("now()"),
                 )
             )
+        _bump_research_corpus_version(conn, document_id=document_id)
     return True
 
 
@@ -1616,11 +2434,25 @@ def list_research_documents(
     return [dict(row) for row in rows]
 
 
-def search_research_chunks(
-    engine: Engine,
+_RESEARCH_MUST_HAVE_COLUMNS = {
+    "metrics": "metrics",
+    "quotes": "notable_quotes",
+    "recommendations": "recommendations",
+    "tradeoffs": "tradeoffs",
+}
+
+_RESEARCH_CHUNK_FROM_SQL = """
+        FROM research_chunks c
+        JOIN research_documents d
+          ON d.document_id = c.document_id
+        JOIN research_source_policies p
+          ON p.source_id = d.source_id
+"""
+
+
+def _research_chunk_filters(
+    params: Dict[str, Any],
     *,
-    topic_key: str,
-    query: str,
     source_ids: Optional[List[str]] = None,
     recency_days: Optional[int] = None,
     decision_domain: Optional[str] = None,
@@ -1634,96 +2466,25 @@ def search_research_chunks(
     tradeoff_dimensions: Optional[List[str]] = None,
     corpus_preference: str = "mixed",
     source_trust_min: Optional[float] = None,
-    limit: int = 20,
-) -> List[Dict[str, Any]]:
-    if not query.strip():
-        return []
-    params: Dict[str, Any] = {
-        "topic_key": topic_key,
-        "query": query,
-        "limit": max(limit, 1),
-    }
+    must_have: Optional[List[str]] = None,
+    recent_within_days: Optional[float] = None,
+    chunk_keys: Optional[List[Tuple[str, str]]] = None,
+) -> Tuple[str, List[str]]:
     sql = """
-        SELECT
-            d.document_id,
-            d.source_id,
-            d.title,
-            d.canonical_url,
-            d.published_at,
-            d.content_type,
-            d.publisher_type,
-            d.source_class,
-            d.summary_short,
-            d.why_it_matters,
-            d.topic_tags,
-            d.decision_domains,
-            d.metrics,
-            d.notable_quotes,
-            d.tradeoffs,
-            d.recommendations,
-            d.document_signal_score,
-            d.quality_signals,
-            p.source_weight,
-            c.chunk_id,
-            c.ordinal,
-            c.content,
-            c.chunk_meta,
-            coalesce(max(i.confidence), 0.0) AS insight_confidence,
-            coalesce(max(i.evidence_quality), 0.0) AS evidence_quality,
-            coalesce(max(i.corroboration_count), 0) AS corroboration_count,
-            coalesce(max(i.contradiction_count), 0) AS contradiction_count,
-            coalesce(max(i.freshness_score), 0.0) AS freshness_score,
-            coalesce(max(i.coverage_score), 0.0) AS coverage_score,
-            coalesce(array_agg(DISTINCT tag_problem.value) FILTER (WHERE tag_problem.value IS NOT NULL), ARRAY[]::text[]) AS problem_tags,
-            coalesce(array_agg(DISTINCT tag_intervention.value) FILTER (WHERE tag_intervention.value IS NOT NULL), ARRAY[]::text[]) AS intervention_tags,
-            coalesce(array_agg(DISTINCT tag_tradeoff.value) FILTER (WHERE tag_tradeoff.value IS NOT NULL), ARRAY[]::text[]) AS tradeoff_dimensions,
-            ts_rank(
-                to_tsvector(
-                    'english',
-                    coalesce(c.content, '') || ' ' ||
-                    coalesce(d.title, '') || ' ' ||
-                    coalesce(d.summary_short, '') || ' ' ||
-                    coalesce(d.why_it_matters, '') || ' ' ||
-                    coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.topic_tags)), ' '), '') || ' ' ||
-                    coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.decision_domains)), ' '), '') || ' ' ||
-                    coalesce(string_agg(i.text, ' '), '')
-                ),
-                plainto_tsquery('english', :query)
-            ) AS lexical_score,
-            ts_headline(
-                'english',
-                c.content,
-                plainto_tsquery('english', :query),
-                'MaxWords=35, MinWords=12, ShortWord=3'
-            ) AS snippet
-        FROM research_chunks c
-        JOIN research_documents d
-          ON d.document_id = c.document_id
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        JOIN research_source_policies p
-          ON p.source_id = d.source_id
-        LEFT JOIN research_document_insights i
-          ON i.document_id = d.document_id
-         AND i.chunk_id = c.chunk_id
-        LEFT JOIN LATERAL jsonb_array_elements_text(coalesce(i.problem_tags, '[]'::jsonb)) AS tag_problem(value) ON TRUE
-        LEFT JOIN LATERAL jsonb_array_elements_text(coalesce(i.intervention_tags, '[]'::jsonb)) AS tag_intervention(value) ON TRUE
-        LEFT JOIN LATERAL jsonb_array_elements_text(coalesce(i.tradeoff_dimensions, '[]'::jsonb)) AS tag_tradeoff(value) ON TRUE
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.status IN ('embedded', 'extracted', 'enriched')
-          AND coalesce(d.suppressed, false) = false
-          AND to_tsvector(
-                'english',
-                coalesce(c.content, '') || ' ' ||
-                coalesce(d.title, '') || ' ' ||
-                coalesce(d.summary_short, '') || ' ' ||
-                coalesce(d.why_it_matters, '') || ' ' ||
-                coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.topic_tags)), ' '), '') || ' ' ||
-                coalesce(array_to_string(ARRAY(SELECT jsonb_array_elements_text(d.decision_domains)), ' '), '') || ' ' ||
-                coalesce(i.text, '')
-              )
-              @@ plainto_tsquery('english', :query)
+          AND NOT d.suppressed
     """
+    insight_clauses: List[str] = []
+    if chunk_keys:
+        pairs: List[str] = []
+        for idx, (document_id, chunk_id) in enumerate(chunk_keys):
+            pairs.append(f"(:key_document_id_{idx}, :key_chunk_id_{idx})")
+            params[f"key_document_id_{idx}"] = document_id
+            params[f"key_chunk_id_{idx}"] = chunk_id
+        sql += f" AND (c.document_id, c.chunk_id) IN ({', '.join(pairs)})"
+    else:
+        sql += " AND c.search_vector @@ plainto_tsquery('english', :query)"
     if source_ids:
         placeholders: List[str] = []
         for idx, source_id in enumerate(source_ids):
@@ -1765,34 +2526,43 @@ def search_research_chunks(
             placeholders.append(f":{key}")
             params[key] = value
         sql += f" AND d.content_type NOT IN ({', '.join(placeholders)})"
+    per_insight_clauses: List[str] = []
     if evidence_types:
-        placeholders = []
-        for idx, value in enumerate(evidence_types):
-            key = f"evidence_type_{idx}"
-            placeholders.append(f":{key}")
-            params[key] = value
-        sql += f" AND i.insight_type IN ({', '.join(placeholders)})"
+        insight_clauses.append("r.insight_types && CAST(:evidence_types AS text[])")
+        per_insight_clauses.append("i.insight_type = ANY(CAST(:evidence_types AS text[]))")
+        params["evidence_types"] = list(evidence_types)
     if problem_tags:
-        clauses = []
-        for idx, value in enumerate(problem_tags):
-            key = f"problem_tag_{idx}"
-            clauses.append(f"i.problem_tags @> CAST(:{key} AS jsonb)")
-            params[key] = '["%s"]' % value
-        sql += " AND (" + " OR ".join(clauses) + ")"
+        insight_clauses.append("r.problem_tags && CAST(:problem_tags AS text[])")
+        per_insight_clauses.append("i.problem_tags ?| CAST(:problem_tags AS text[])")
+        params["problem_tags"] = list(problem_tags)
     if intervention_tags:
-        clauses = []
-        for idx, value in enumerate(intervention_tags):
-            key = f"intervention_tag_{idx}"
-            clauses.append(f"i.intervention_tags @> CAST(:{key} AS jsonb)")
-            params[key] = '["%s"]' % value
-        sql += " AND (" + " OR ".join(clauses) + ")"
+        insight_clauses.append("r.intervention_tags && CAST(:intervention_tags AS text[])")
+        per_insight_clauses.append("i.intervention_tags ?| CAST(:intervention_tags AS text[])")
+        params["intervention_tags"] = list(intervention_tags)
     if tradeoff_dimensions:
-        clauses = []
-        for idx, value in enumerate(tradeoff_dimensions):
-            key = f"tradeoff_dimension_{idx}"
-            clauses.append(f"i.tradeoff_dimensions @> CAST(:{key} AS jsonb)")
-            params[key] = '["%s"]' % value
-        sql += " AND (" + " OR ".join(clauses) + ")"
+        insight_clauses.append("r.tradeoff_dimensions && CAST(:tradeoff_dimensions AS text[])")
+        per_insight_clauses.append("i.tradeoff_dimensions ?| CAST(:tradeoff_dimensions AS text[])")
+        params["tradeoff_dimensions"] = list(tradeoff_dimensions)
+    if len(per_insight_clauses) > 1:
+        # The rollup holds per-chunk unions; combined insight filters must hold for a single insight.
+        sql += """
+          AND EXISTS (
+                SELECT 1
+                FROM research_document_insights i
+                WHERE i.document_id = c.document_id
+                  AND i.chunk_id = c.chunk_id
+                  AND """ + " AND ".join(per_insight_clauses) + """
+          )
+        """
+    for requirement in must_have or []:
+        column = _RESEARCH_MUST_HAVE_COLUMNS.get(requirement)
+        if column:
+            sql += f" AND d.{column} <> '[]'::jsonb"
+        elif requirement == "internal":
+            sql += " AND d.source_class = 'internal_authoritative'"
+    if recent_within_days is not None:
+        sql += " AND (d.published_at IS NULL OR d.published_at >= now() - (:recent_within_days * interval '1 day'))"
+        params["recent_within_days"] = max(float(recent_within_days), 0.0)
     if corpus_preference == "internal":
         sql += " AND d.source_class LIKE 'internal_%'"
     elif corpus_preference == "external":
@@ -1810,12 +2580,285 @@ def search_research_chunks(
               ) >= :source_trust_min
         """
         params["source_trust_min"] = max(min(source_trust_min, 1.0), 0.0)
+    return sql, insight_clauses
+
+
+def search_research_chunk_candidates(
+    engine: Engine,
+    *,
+    topic_key: str,
+    query: str,
+    chunk_keys: Optional[List[Tuple[str, str]]] = None,
+    limit: int = 20,
+    **filters: Any,
+) -> List[Dict[str, Any]]:
+    if not query.strip():
+        return []
+    if chunk_keys is not None and not chunk_keys:
+        return []
+    params: Dict[str, Any] = {
+        "topic_key": topic_key,
+        "query": query,
+        "limit": max(limit, 1),
+    }
+    where_sql, insight_clauses = _research_chunk_filters(params, chunk_keys=chunk_keys, **filters)
+    sql = (
+        """
+        SELECT
+            d.document_id,
+            d.source_id,
+            d.published_at,
+            d.source_class,
+            d.decision_domains,
+            d.document_signal_score,
+            CASE WHEN jsonb_typeof(d.topic_tags) = 'array' THEN jsonb_array_length(d.topic_tags) ELSE 0 END AS topic_tag_count,
+            d.metrics <> '[]'::jsonb AS has_metrics,
+            d.notable_quotes <> '[]'::jsonb AS has_quotes,
+            d.recommendations <> '[]'::jsonb AS has_recommendations,
+            d.tradeoffs <> '[]'::jsonb AS has_tradeoffs,
+            p.source_weight,
+            c.chunk_id,
+            c.ordinal,
+            ts_rank(c.search_vector, plainto_tsquery('english', :query)) AS lexical_score
+        """
+        + _RESEARCH_CHUNK_FROM_SQL
+        + (
+            """
+        JOIN research_chunk_insight_rollup r
+          ON r.document_id = c.document_id
+         AND r.chunk_id = c.chunk_id
+        """
+            if insight_clauses
+            else ""
+        )
+        + where_sql
+    )
+    for clause in insight_clauses:
+        sql += f" AND {clause}"
+    sql += """
+        ORDER BY lexical_score DESC, coalesce(d.document_signal_score, 0.0) DESC, coalesce(d.published_at, d.discovered_at) DESC NULLS LAST, c.ordinal ASC
+        LIMIT :limit
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), params).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def rank_research_chunk_candidates(
+    engine: Engine,
+    *,
+    query: str,
+    candidates: List[Dict[str, Any]],
+    weights: Dict[str, float],
+    intent_mode: str = "general",
+    decision_domain: Optional[str] = None,
+    half_life_days: float = 30.0,
+    max_documents: int = 3,
+    chunks_per_document: int = 3,
+    limit: int = 15,
+) -> List[Dict[str, Any]]:
+    # Mirrors the context pack's Python scoring; keep the two in sync.
+    if not candidates:
+        return []
+    params: Dict[str, Any] = {
+        "query": query,
+        "half_life_seconds": max(float(half_life_days) * 24 * 3600, 1.0),
+        "lexical_weight": float(weights["lexical"]),
+        "embedding_weight": float(weights["embedding"]),
+        "recency_weight": float(weights["recency"]),
+        "source_weight_factor": float(weights["source_weight"]),
+        "max_documents": max(max_documents, 0),
+        "chunks_per_document": max(chunks_per_document, 0),
+        "limit": max(limit, 0),
+    }
+    values: List[str] = []
+    for idx, candidate in enumerate(candidates):
+        values.append(
+            f"(CAST(:position_{idx} AS integer), CAST(:document_id_{idx} AS text), "
+            f"CAST(:chunk_id_{idx} AS text), CAST(:cosine_{idx} AS double precision))"
+        )
+        params[f"position_{idx}"] = idx
+        params[f"document_id_{idx}"] = str(candidate["document_id"])
+        params[f"chunk_id_{idx}"] = str(candidate["chunk_id"])
+        params[f"cosine_{idx}"] = float(candidate.get("cosine") or 0.0)
+    if intent_mode == "decision_support":
+        intent_sql = "CASE"
+        if decision_domain:
+            intent_sql += " WHEN d.decision_domains @> jsonb_build_array(CAST(:intent_domain AS text)) THEN 1.0::float8"
+            params["intent_domain"] = decision_domain
+        intent_sql += " WHEN d.recommendations <> '[]'::jsonb OR d.tradeoffs <> '[]'::jsonb THEN 0.8::float8 ELSE 0.5::float8 END"
+    elif intent_mode == "editorial":
+        intent_sql = "CASE WHEN d.metrics <> '[]'::jsonb OR d.notable_quotes <> '[]'::jsonb THEN 1.0::float8 ELSE 0.55::float8 END"
+    else:
+        intent_sql = "0.5::float8"
+    sql = f"""
+        WITH candidates(position, document_id, chunk_id, cosine) AS (
+            VALUES {', '.join(values)}
+        ),
+        features AS (
+            SELECT
+                k.position,
+                k.document_id,
+                k.chunk_id,
+                least(greatest(ts_rank(c.search_vector, plainto_tsquery('english', :query))::float8, 0.0::float8), 1.0::float8) AS lexical,
+                least(greatest((k.cosine + 1.0::float8) / 2.0::float8, 0.0::float8), 1.0::float8) AS embedding,
+                CASE
+                    WHEN d.published_at IS NULL THEN 0.5::float8
+                    ELSE least(
+                        greatest(
+                            power(0.5::float8, greatest(extract(epoch FROM now() - d.published_at)::float8, 0.0::float8) / :half_life_seconds),
+                            0.0::float8
+                        ),
+                        1.0::float8
+                    )
+                END AS recency,
+                least(greatest(coalesce(nullif(p.source_weight, 0.0), 1.0)::float8 / 2.0::float8, 0.0::float8), 1.0::float8) AS source_weight,
+                least(1.0::float8, coalesce(d.document_signal_score, 0.0)::float8) AS signal,
+                CASE
+                    WHEN d.source_class = 'internal_authoritative' THEN 1.0::float8
+                    WHEN d.source_class = 'external_primary' THEN 0.8::float8
+                    ELSE 0.55::float8
+                END AS trust,
+                {intent_sql} AS intent_fit
+            FROM candidates k
+            JOIN research_chunks c
+              ON c.document_id = k.document_id
+             AND c.chunk_id = k.chunk_id
+            JOIN research_documents d
+              ON d.document_id = k.document_id
+            JOIN research_source_policies p
+              ON p.source_id = d.source_id
+        ),
+        scored AS (
+            SELECT
+                f.*,
+                least(
+                    1.0::float8,
+                    least(
+                        greatest(
+                            :lexical_weight * f.lexical
+                            + :embedding_weight * f.embedding
+                            + :recency_weight * f.recency
+                            + :source_weight_factor * f.source_weight,
+                            0.0::float8
+                        ),
+                        1.0::float8
+                    )
+                    + 0.1::float8 * f.signal
+                    + 0.05::float8 * f.trust
+                    + 0.1::float8 * f.intent_fit
+                ) AS total
+            FROM features f
+        ),
+        ordered AS (
+            SELECT s.*, row_number() OVER (ORDER BY s.total DESC, s.lexical DESC, s.position ASC) AS overall_rank
+            FROM scored s
+        ),
+        grouped AS (
+            SELECT
+                o.*,
+                row_number() OVER (PARTITION BY o.document_id ORDER BY o.overall_rank) AS document_chunk_rank,
+                min(o.overall_rank) OVER (PARTITION BY o.document_id) AS document_first_rank
+            FROM ordered o
+        ),
+        ranked AS (
+            SELECT g.*, dense_rank() OVER (ORDER BY g.document_first_rank) AS document_rank
+            FROM grouped g
+        )
+        SELECT
+            document_id,
+            chunk_id,
+            total,
+            lexical,
+            embedding,
+            recency,
+            source_weight,
+            signal,
+            trust,
+            intent_fit
+        FROM ranked
+        WHERE overall_rank <= :limit
+           OR (document_rank <= :max_documents AND document_chunk_rank <= :chunks_per_document)
+        ORDER BY overall_rank
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), params).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def search_research_chunks(
+    engine: Engine,
+    *,
+    topic_key: str,
+    query: str,
+    chunk_keys: Optional[List[Tuple[str, str]]] = None,
+    limit: int = 20,
+    **filters: Any,
+) -> List[Dict[str, Any]]:
+    if not query.strip():
+        return []
+    if chunk_keys is not None and not chunk_keys:
+        return []
+    params: Dict[str, Any] = {
+        "topic_key": topic_key,
+        "query": query,
+        "limit": max(limit, 1),
+    }
+    where_sql, insight_clauses = _research_chunk_filters(params, chunk_keys=chunk_keys, **filters)
+    sql = (
+        """
+        SELECT
+            d.document_id,
+            d.source_id,
+            d.title,
+            d.canonical_url,
+            d.published_at,
+            d.content_type,
+            d.publisher_type,
+            d.source_class,
+            d.summary_short,
+            d.why_it_matters,
+            d.topic_tags,
+            d.decision_domains,
+            d.metrics,
+            d.notable_quotes,
+            d.tradeoffs,
+            d.recommendations,
+            d.document_signal_score,
+            d.quality_signals,
+            p.source_weight,
+            c.chunk_id,
+            c.ordinal,
+            c.content,
+            c.chunk_meta,
+            coalesce(r.max_confidence, 0.0) AS insight_confidence,
+            coalesce(r.max_evidence_quality, 0.0) AS evidence_quality,
+            coalesce(r.corroboration_count, 0) AS corroboration_count,
+            coalesce(r.contradiction_count, 0) AS contradiction_count,
+            coalesce(r.max_freshness_score, 0.0) AS freshness_score,
+            coalesce(r.max_coverage_score, 0.0) AS coverage_score,
+            coalesce(r.problem_tags, ARRAY[]::text[]) AS problem_tags,
+            coalesce(r.intervention_tags, ARRAY[]::text[]) AS intervention_tags,
+            coalesce(r.tradeoff_dimensions, ARRAY[]::text[]) AS tradeoff_dimensions,
+            ts_rank(c.search_vector, plainto_tsquery('english', :query)) AS lexical_score,
+            ts_headline(
+                'english',
+                c.content,
+                plainto_tsquery('english', :query),
+                'MaxWords=35, MinWords=12, ShortWord=3'
+            ) AS snippet
+        """
+        + _RESEARCH_CHUNK_FROM_SQL
+        + """
+        LEFT JOIN research_chunk_insight_rollup r
+          ON r.document_id = c.document_id
+         AND r.chunk_id = c.chunk_id
+        """
+        + where_sql
+    )
+    for clause in insight_clauses:
+        sql += f" AND {clause}"
     sql += """
-        GROUP BY
-            d.document_id, d.source_id, d.title, d.canonical_url, d.published_at, d.content_type,
-            d.publisher_type, d.source_class, d.summary_short, d.why_it_matters, d.topic_tags,
-            d.decision_domains, d.metrics, d.notable_quotes, d.tradeoffs, d.recommendations,
-            d.document_signal_score, d.quality_signals, d.discovered_at, p.source_weight, c.chunk_id, c.ordinal, c.content, c.chunk_meta
         ORDER BY lexical_score DESC, coalesce(d.document_signal_score, 0.0) DESC, coalesce(d.published_at, d.discovered_at) DESC NULLS LAST, c.ordinal ASC
         LIMIT :limit
     """
@@ -1838,10 +2881,7 @@ def search_research_document_chunks(
             c.chunk_id,
             c.ordinal,
             c.chunk_meta,
-            ts_rank(
-                to_tsvector('english', coalesce(c.content, '')),
-                plainto_tsquery('english', :query)
-            ) AS score,
+            ts_rank(ts_filter(c.search_vector, '{c}'), plainto_tsquery('english', :query)) AS score,
             ts_headline(
                 'english',
                 c.content,
@@ -1852,8 +2892,8 @@ def search_research_document_chunks(
         JOIN research_documents d
           ON d.document_id = c.document_id
         WHERE c.document_id = :document_id
-          AND coalesce(d.suppressed, false) = false
-          AND to_tsvector('english', coalesce(c.content, '')) @@ plainto_tsquery('english', :query)
+          AND NOT d.suppressed
+          AND ts_filter(c.search_vector, '{c}') @@ plainto_tsquery('english', :query)
         ORDER BY score DESC, c.ordinal ASC
         LIMIT :limit
     """
@@ -1876,7 +2916,7 @@ def search_research_document_chunks(
                 JOIN research_documents d
                   ON d.document_id = c.document_id
                 WHERE c.document_id = :document_id
-                  AND coalesce(d.suppressed, false) = false
+                  AND NOT d.suppressed
                 ORDER BY c.ordinal ASC
                 LIMIT :limit
             """
@@ -1904,7 +2944,7 @@ def list_research_topics(
         FROM research_sources s
         LEFT JOIN research_documents d
           ON d.source_id = s.source_id
-         AND coalesce(d.suppressed, false) = false
+         AND NOT d.suppressed
     """
     if query and query.strip():
         params["query"] = f"%{query.strip().lower()}%"
@@ -1955,11 +2995,9 @@ def list_research_documents_for_topic(
             d.metrics,
             d.notable_quotes
         FROM research_documents d
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.status IN ('embedded', 'extracted', 'enriched')
-          AND coalesce(d.suppressed, false) = false
+          AND NOT d.suppressed
         ORDER BY {order_clause}
         LIMIT :limit
     """
@@ -1981,11 +3019,9 @@ def list_research_documents_for_reembed(
             d.embedding_model_id,
             d.extracted_text
         FROM research_documents d
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.status IN ('embedded', 'extracted')
-          AND coalesce(d.suppressed, false) = false
+          AND NOT d.suppressed
           AND coalesce(d.extracted_text, '') <> ''
           AND coalesce(d.embedding_model_id, '') <> :embedding_model_id
         ORDER BY coalesce(d.embedded_at, d.extracted_at, d.discovered_at) ASC, d.document_id ASC
@@ -2028,11 +3064,11 @@ def list_research_documents_for_enrichment_backfill(
         JOIN research_sources s
           ON s.source_id = d.source_id
         WHERE d.status IN ('embedded', 'extracted', 'enriched')
-          AND coalesce(d.suppressed, false) = false
+          AND NOT d.suppressed
           AND coalesce(d.extracted_text, '') <> ''
     """
     if topic_key:
-        sql += " AND s.topic_key = :topic_key"
+        sql += " AND d.topic_key = :topic_key"
         params["topic_key"] = topic_key
     if only_missing_reasoning_fields:
         sql += """
@@ -2129,13 +3165,11 @@ def collect_research_topic_themes(
             c.chunk_meta,
             c.content
         FROM research_documents d
-        JOIN research_sources s
-          ON s.source_id = d.source_id
         LEFT JOIN research_chunks c
           ON c.document_id = d.document_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.status IN ('embedded', 'extracted', 'enriched')
-          AND coalesce(d.suppressed, false) = false
+          AND NOT d.suppressed
         ORDER BY coalesce(d.published_at, d.discovered_at) DESC NULLS LAST, c.ordinal ASC
         LIMIT 200
     """
@@ -2177,6 +3211,70 @@ def get_research_topic_detail(
     return None
 
 
+def list_frequent_research_queries(
+    engine: Engine,
+    *,
+    limit: int = 20,
+    since_days: int = 7,
+) -> List[Dict[str, Any]]:
+    sql = """
+        SELECT
+            topic_key,
+            lower(query_text) AS query_text,
+            count(*) AS query_count
+        FROM research_query_logs
+        WHERE status = 'ok'
+          AND created_at >= now() - (:since_days * interval '1 day')
+        GROUP BY topic_key, lower(query_text)
+        ORDER BY query_count DESC, topic_key ASC
+        LIMIT :limit
+    """
+    params = {"limit": max(limit, 1), "since_days": max(since_days, 1)}
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), params).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def build_research_query_log_row(
+    *,
+    trace_id: str,
+    topic_key: str,
+    query_text: str,
+    source_ids: List[str],
+    token_budget: Optional[int],
+    max_items: Optional[int],
+    recency_days: Optional[int],
+    min_relevance_score: Optional[float],
+    candidate_count: int,
+    returned_document_ids: List[str],
+    returned_chunk_ids: List[str],
+    timing_ms: int,
+    status: str = "ok",
+    error: Optional[str] = None,
+    endpoint: str = "context_pack",
+    stage_timings: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    return {
+        "query_log_id": uuid.uuid4(),
+        "trace_id": trace_id,
+        "topic_key": topic_key,
+        "query_text": query_text[:500],
+        "source_ids": source_ids,
+        "token_budget": token_budget,
+        "max_items": max_items,
+        "recency_days": recency_days,
+        "min_relevance_score": min_relevance_score,
+        "candidate_count": max(candidate_count, 0),
+        "returned_document_ids": returned_document_ids,
+        "returned_chunk_ids": returned_chunk_ids,
+        "timing_ms": max(timing_ms, 0),
+        "status": status,
+        "error": error[:1000] if error else None,
+        "endpoint": endpoint,
+        "stage_timings": {str(name): max(int(value), 0) for name, value in (stage_timings or {}).items()},
+    }
+
+
 def create_research_query_log(
     engine: Engine,
     *,
@@ -2194,33 +3292,232 @@ def create_research_query_log(
     timing_ms: int,
     status: str = "ok",
     error: Optional[str] = None,
+    endpoint: str = "context_pack",
+    stage_timings: Optional[Dict[str, int]] = None,
 ) -> str:
-    query_log_id = uuid.uuid4()
+    row = build_research_query_log_row(
+        trace_id=trace_id,
+        topic_key=topic_key,
+        query_text=query_text,
+        source_ids=source_ids,
+        token_budget=token_budget,
+        max_items=max_items,
+        recency_days=recency_days,
+        min_relevance_score=min_relevance_score,
+        candidate_count=candidate_count,
+        returned_document_ids=returned_document_ids,
+        returned_chunk_ids=returned_chunk_ids,
+        timing_ms=timing_ms,
+        status=status,
+        error=error,
+        endpoint=endpoint,
+        stage_timings=stage_timings,
+    )
+    with engine.begin() as conn:
+        conn.execute(research_query_logs.insert().values(row))
+    return str(row["query_log_id"])
+
+
+def insert_research_telemetry_batch(
+    engine: Engine,
+    *,
+    query_logs: List[Dict[str, Any]],
+    relevance_scores: List[Dict[str, Any]],
+) -> Dict[str, int]:
+    if not query_logs and not relevance_scores:
+        return {"query_logs": 0, "relevance_scores": 0}
     with engine.begin() as conn:
+        if query_logs:
+            conn.execute(research_query_logs.insert(), query_logs)
+        if relevance_scores:
+            conn.execute(research_relevance_scores.insert(), relevance_scores)
+    return {"query_logs": len(query_logs), "relevance_scores": len(relevance_scores)}
+
+
+def delete_research_topic_corpus(engine: Engine, *, topic_key: str) -> Dict[str, int]:
+    with engine.begin() as conn:
+        sources = conn.execute(research_sources.delete().where(research_sources.c.topic_key == topic_key)).rowcount
+        query_logs = conn.execute(research_query_logs.delete().where(research_query_logs.c.topic_key == topic_key)).rowcount
+        conn.execute(research_relevance_scores.delete().where(research_relevance_scores.c.topic_key == topic_key))
+        conn.execute(research_ingestion_runs.delete().where(research_ingestion_runs.c.topic_key == topic_key))
         conn.execute(
-            research_query_logs.insert().values(
-                {
-                    "query_log_id": query_log_id,
-                    "trace_id": trace_id,
-                    "topic_key": topic_key,
-                    "query_text": query_text[:500],
-                    "source_ids": source_ids,
-                    "token_budget": token_budget,
-                    "max_items": max_items,
-                    "recency_days": recency_days,
-                    "min_relevance_score": min_relevance_score,
-                    "candidate_count": max(candidate_count, 0),
-                    "returned_document_ids": returned_document_ids,
-                    "returned_chunk_ids": returned_chunk_ids,
-                    "timing_ms": max(timing_ms, 0),
-                    "status": status,
-                    "error": error[:1000] if error else None,
-                }
-            )
+            research_topic_corpus_versions.delete().where(research_topic_corpus_versions.c.topic_key == topic_key)
         )
-    return str(query_log_id)
+    return {"sources": int(sources or 0), "query_logs": int(query_logs or 0)}
+
+
+def get_research_query_stage_latency(
+    engine: Engine,
+    *,
+    topic_key: str,
+    since_hours: int = 24,
+    endpoint: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    params: Dict[str, Any] = {"topic_key": topic_key, "since_hours": max(int(since_hours), 1)}
+    endpoint_clause = ""
+    if endpoint:
+        endpoint_clause = "AND q.endpoint = :endpoint"
+        params["endpoint"] = endpoint
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text(
+                f"""
+                SELECT
+                  q.endpoint,
+                  s.key AS stage,
+                  count(*) AS samples,
+                  percentile_cont(0.5) WITHIN GROUP (ORDER BY s.value::numeric) AS p50_ms,
+                  percentile_cont(0.95) WITHIN GROUP (ORDER BY s.value::numeric) AS p95_ms,
+                  max(s.value::numeric) AS max_ms
+                FROM research_query_logs q
+                CROSS JOIN LATERAL jsonb_each_text(q.stage_timings || jsonb_build_object('total', q.timing_ms)) s
+                WHERE q.topic_key = :topic_key
+                  AND q.status = 'ok'
+                  AND q.created_at >= now() - make_interval(hours => :since_hours)
+                  {endpoint_clause}
+                GROUP BY q.endpoint, s.key
+                ORDER BY q.endpoint, (s.key = 'total') DESC, p95_ms DESC
+                """
+            ),
+            params,
+        ).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def get_research_query_embedding(
+    engine: Engine,
+    *,
+    embedding_model_id: str,
+    query_hash: str,
+) -> Optional[List[float]]:
+    sql = """
+        SELECT vector_packed
+        FROM research_query_embeddings
+        WHERE embedding_model_id = :embedding_model_id
+          AND query_hash = :query_hash
+          AND expires_at > now()
+    """
+    params = {"embedding_model_id": embedding_model_id, "query_hash": query_hash}
+    with engine.begin() as conn:
+        row = conn.execute(text(sql), params).mappings().first()
+    if not row or row.get("vector_packed") is None:
+        return None
+    return unpack_vector(row["vector_packed"], encoding="float32").tolist()
 
 
+def upsert_research_query_embedding(
+    engine: Engine,
+    *,
+    embedding_model_id: str,
+    query_hash: str,
+    query_text: str,
+    vector: List[float],
+    ttl_seconds: int,
+) -> None:
+    packed, _ = pack_vector(vector, encoding="float32")
+    sql = """
+        INSERT INTO research_query_embeddings (
+            embedding_model_id, query_hash, query_text, vector_packed, created_at, expires_at
+        )
+        VALUES (
+            :embedding_model_id, :query_hash, :query_text, :vector_packed, now(),
+            now() + (:ttl_seconds * interval '1 second')
+        )
+        ON CONFLICT (embedding_model_id, query_hash) DO UPDATE
+        SET query_text = EXCLUDED.query_text,
+            vector_packed = EXCLUDED.vector_packed,
+            created_at = EXCLUDED.created_at,
+            expires_at = EXCLUDED.expires_at
+    """
+    params = {
+        "embedding_model_id": embedding_model_id,
+        "query_hash": query_hash,
+        "query_text": query_text[:500],
+        "vector_packed": packed,
+        "ttl_seconds": max(ttl_seconds, 1),
+    }
+    with engine.begin() as conn:
+        conn.execute(text(sql), params)
+        conn.execute(text("DELETE FROM research_query_embeddings WHERE expires_at <= now()"))
+
+
+def get_research_robots_policy(
+    engine: Engine,
+    *,
+    origin: str,
+) -> Optional[Dict[str, Any]]:
+    sql = """
+        SELECT origin, status_code, body, fetched_at, expires_at
+        FROM research_robots_policies
+        WHERE origin = :origin
+          AND expires_at > now()
+    """
+    with engine.begin() as conn:
+        row = conn.execute(text(sql), {"origin": origin}).mappings().first()
+    return dict(row) if row else None
+
+
+def upsert_research_robots_policy(
+    engine: Engine,
+    *,
+    origin: str,
+    status_code: int,
+    body: str,
+    ttl_seconds: float,
+) -> None:
+    sql = """
+        INSERT INTO research_robots_policies (origin, status_code, body, fetched_at, expires_at)
+        VALUES (:origin, :status_code, :body, now(), now() + (:ttl_seconds * interval '1 second'))
+        ON CONFLICT (origin) DO UPDATE
+        SET status_code = EXCLUDED.status_code,
+            body = EXCLUDED.body,
+            fetched_at = EXCLUDED.fetched_at,
+            expires_at = EXCLUDED.expires_at
+    """
+    params = {
+        "origin": origin,
+        "status_code": int(status_code),
+        "body": _strip_nul_from_value(body),
+        "ttl_seconds": max(float(ttl_seconds), 1.0),
+    }
+    with engine.begin() as conn:
+        conn.execute(text(sql), params)
+        conn.execute(text("DELETE FROM research_robots_policies WHERE expires_at <= now() - interval '1 day'"))
+
+
+def upsert_research_pipeline_stats(
+    engine: Engine,
+    *,
+    worker_id: str,
+    stages: List[Dict[str, Any]],
+) -> None:
+    sql = """
+        INSERT INTO research_pipeline_stats (worker_id, stages, updated_at)
+        VALUES (:worker_id, CAST(:stages AS jsonb), now())
+        ON CONFLICT (worker_id) DO UPDATE
+        SET stages = EXCLUDED.stages,
+            updated_at = EXCLUDED.updated_at
+    """
+    with engine.begin() as conn:
+        conn.execute(text(sql), {"worker_id": worker_id, "stages": json.dumps(stages)})
+        conn.execute(text("DELETE FROM research_pipeline_stats WHERE updated_at <= now() - interval '1 day'"))
+
+
+def list_research_pipeline_stats(
+    engine: Engine,
+    *,
+    max_age_seconds: float,
+) -> List[Dict[str, Any]]:
+    sql = """
+        SELECT worker_id, stages, updated_at
+        FROM research_pipeline_stats
+        WHERE updated_at > now() - (:max_age_seconds * interval '1 second')
+        ORDER BY worker_id
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), {"max_age_seconds": max(float(max_age_seconds), 1.0)}).mappings().all()
+    return [dict(row) for row in rows]
+
 def list_research_embeddings_for_documents(
     engine: Engine,
     *,
@@ -2239,6 +3536,141 @@ def list_research_embeddings_for_documents(
     return [dict(row) for row in rows]
 
 
+def list_research_embeddings_for_topic(
+    engine: Engine,
+    *,
+    topic_key: str,
+    embedding_model_id: str,
+    source_ids: Optional[List[str]] = None,
+    created_since: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    params: Dict[str, Any] = {
+        "topic_key": topic_key,
+        "embedding_model_id": embedding_model_id,
+    }
+    sql = """
+        SELECT
+            e.document_id,
+            e.chunk_id,
+            d.source_id,
+            e.vector,
+            e.vector_packed,
+            e.vector_encoding,
+            e.vector_scale,
+            e.created_at
+        FROM research_embeddings e
+        JOIN research_documents d
+          ON d.document_id = e.document_id
+        WHERE d.topic_key = :topic_key
+          AND e.embedding_model_id = :embedding_model_id
+          AND d.status IN ('embedded', 'extracted', 'enriched')
+          AND NOT d.suppressed
+    """
+    if source_ids:
+        placeholders: List[str] = []
+        for idx, source_id in enumerate(source_ids):
+            key = f"source_id_{idx}"
+            placeholders.append(f":{key}")
+            params[key] = source_id
+        sql += f" AND d.source_id IN ({', '.join(placeholders)})"
+    if created_since is not None:
+        sql += " AND e.created_at >= :created_since"
+        params["created_since"] = created_since
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), params).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def pack_research_embeddings_batch(
+    engine: Engine,
+    *,
+    after: Optional[Tuple[str, str, str]] = None,
+    limit: int = 500,
+) -> Dict[str, Any]:
+    # Keyset page over the primary key; the legacy JSONB vector is kept for a later migration to drop.
+    where = ["vector_packed IS NULL", "vector IS NOT NULL"]
+    params: Dict[str, Any] = {"limit": max(int(limit), 1)}
+    if after is not None:
+        where.append("(document_id, chunk_id, embedding_model_id) > (:after_document_id, :after_chunk_id, :after_model_id)")
+        params.update(after_document_id=after[0], after_chunk_id=after[1], after_model_id=after[2])
+    select_sql = f"""
+        SELECT document_id, chunk_id, embedding_model_id, vector
+        FROM research_embeddings
+        WHERE {" AND ".join(where)}
+        ORDER BY document_id, chunk_id, embedding_model_id
+        LIMIT :limit
+        FOR UPDATE
+    """
+    update_sql = """
+        UPDATE research_embeddings
+        SET vector_packed = :vector_packed,
+            vector_encoding = 'float32',
+            vector_scale = NULL
+        WHERE document_id = :document_id
+          AND chunk_id = :chunk_id
+          AND embedding_model_id = :embedding_model_id
+          AND vector_packed IS NULL
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(text(select_sql), params).mappings().all()
+        updates = []
+        for row in rows:
+            vector = row["vector"]
+            if not isinstance(vector, list) or not vector:
+                continue
+            packed, _scale = pack_vector(vector, encoding="float32")
+            updates.append(
+                {
+                    "document_id": row["document_id"],
+                    "chunk_id": row["chunk_id"],
+                    "embedding_model_id": row["embedding_model_id"],
+                    "vector_packed": packed,
+                }
+            )
+        if updates:
+            conn.execute(text(update_sql), updates)
+    last = rows[-1] if rows else None
+    return {
+        "scanned": len(rows),
+        "packed": len(updates),
+        "last_key": (last["document_id"], last["chunk_id"], last["embedding_model_id"]) if last else None,
+    }
+
+
+def get_research_embedding_watermark(
+    engine: Engine,
+    *,
+    topic_key: str,
+    embedding_model_id: str,
+) -> Dict[str, Any]:
+    sql = """
+        SELECT
+            count(*) AS embedding_count,
+            max(e.created_at) AS max_created_at,
+            (
+                SELECT max(s.suppressed_at)
+                FROM research_documents s
+                WHERE s.topic_key = :topic_key
+                  AND s.suppressed
+            ) AS max_suppressed_at
+        FROM research_embeddings e
+        JOIN research_documents d
+          ON d.document_id = e.document_id
+        WHERE d.topic_key = :topic_key
+          AND e.embedding_model_id = :embedding_model_id
+          AND d.status IN ('embedded', 'extracted', 'enriched')
+          AND NOT d.suppressed
+    """
+    params = {"topic_key": topic_key, "embedding_model_id": embedding_model_id}
+    with engine.begin() as conn:
+        row = conn.execute(text(sql), params).mappings().first()
+    return {
+        "embedding_count": int((row or {}).get("embedding_count") or 0),
+        "max_created_at": (row or {}).get("max_created_at"),
+        "max_suppressed_at": (row or {}).get("max_suppressed_at"),
+    }
+
+
 def list_research_document_insights(
     engine: Engine,
     *,
@@ -2266,12 +3698,10 @@ def list_research_document_insights(
         FROM research_document_insights i
         JOIN research_documents d
           ON d.document_id = i.document_id
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        WHERE coalesce(d.suppressed, false) = false
+        WHERE NOT d.suppressed
     """
     if topic_key:
-        sql += " AND s.topic_key = :topic_key"
+        sql += " AND d.topic_key = :topic_key"
         params["topic_key"] = topic_key
     if document_ids:
         placeholders = []
@@ -2309,24 +3739,42 @@ def search_research_evidence(
     corpus_preference: str = "mixed",
     source_trust_min: Optional[float] = None,
     recency_days: Optional[int] = None,
+    vector_scores: Optional[Dict[Tuple[str, str], float]] = None,
     limit: int = 20,
 ) -> List[Dict[str, Any]]:
     if not query.strip():
         return []
+    filters: Dict[str, Any] = {
+        "recency_days": recency_days,
+        "decision_domain": decision_domain,
+        "evidence_types": evidence_types,
+        "problem_tags": problem_tags,
+        "intervention_tags": intervention_tags,
+        "tradeoff_dimensions": tradeoff_dimensions,
+        "corpus_preference": corpus_preference,
+        "source_trust_min": source_trust_min,
+    }
     rows = search_research_chunks(
         engine,
         topic_key=topic_key,
         query=query,
-        recency_days=recency_days,
-        decision_domain=decision_domain,
-        evidence_types=evidence_types,
-        problem_tags=problem_tags,
-        intervention_tags=intervention_tags,
-        tradeoff_dimensions=tradeoff_dimensions,
-        corpus_preference=corpus_preference,
-        source_trust_min=source_trust_min,
         limit=max(limit * 3, 10),
+        **filters,
     )
+    vector_scores = vector_scores or {}
+    lexical_keys = {(str(row.get("document_id") or ""), str(row.get("chunk_id") or "")) for row in rows}
+    missing_keys = [key for key in vector_scores if key not in lexical_keys]
+    if missing_keys:
+        rows.extend(
+            search_research_chunks(
+                engine,
+                topic_key=topic_key,
+                query=query,
+                chunk_keys=missing_keys,
+                limit=len(missing_keys),
+                **filters,
+            )
+        )
     document_ids = sorted({str(row.get("document_id") or "") for row in rows if row.get("document_id")})
     insights = list_research_document_insights(
         engine,
@@ -2347,6 +3795,7 @@ def search_research_evidence(
         row = row_index.get(key, {})
         merged = dict(insight)
         merged["lexical_score"] = float(row.get("lexical_score") or 0.0)
+        merged["embedding_score"] = float(vector_scores.get(key, 0.0))
         merged["evidence_quality"] = float(insight.get("evidence_quality") or row.get("evidence_quality") or 0.0)
         merged["coverage_score"] = float(insight.get("coverage_score") or row.get("coverage_score") or 0.0)
         merged["freshness_score"] = float(insight.get("freshness_score") or row.get("freshness_score") or 0.0)
@@ -2358,6 +3807,7 @@ def search_research_evidence(
             float(item.get("evidence_quality") or 0.0),
             float(item.get("confidence") or 0.0),
             float(item.get("lexical_score") or 0.0),
+            float(item.get("embedding_score") or 0.0),
             float(item.get("freshness_score") or 0.0),
         ),
         reverse=True,
@@ -2429,11 +3879,9 @@ def list_recent_research_documents(
             d.decision_domains,
             d.content_type
         FROM research_documents d
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.status IN ('embedded', 'extracted', 'enriched')
-          AND coalesce(d.suppressed, false) = false
+          AND NOT d.suppressed
           AND coalesce(d.published_at, d.discovered_at) >= now() - (:days * interval '1 day')
         ORDER BY coalesce(d.published_at, d.discovered_at) DESC NULLS LAST, d.document_signal_score DESC, d.updated_at DESC
         LIMIT :limit
@@ -2443,14 +3891,13 @@ def list_recent_research_documents(
     return [dict(row) for row in rows]
 
 
-def insert_research_relevance_scores(
-    engine: Engine,
+def build_research_relevance_score_rows(
     *,
     trace_id: str,
     topic_key: str,
     query_text: str,
     items: List[Dict[str, Any]],
-) -> int:
+) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     for item in items:
         document_id = str(item.get("document_id") or "")
@@ -2472,6 +3919,23 @@ def insert_research_relevance_scores(
                 "score_source_weight": float(item.get("score_source_weight") or 0.0),
             }
         )
+    return rows
+
+
+def insert_research_relevance_scores(
+    engine: Engine,
+    *,
+    trace_id: str,
+    topic_key: str,
+    query_text: str,
+    items: List[Dict[str, Any]],
+) -> int:
+    rows = build_research_relevance_score_rows(
+        trace_id=trace_id,
+        topic_key=topic_key,
+        query_text=query_text,
+        items=items,
+    )
     if not rows:
         return 0
     with engine.begin() as conn:
@@ -2568,9 +4032,8 @@ def get_research_ops_summary(
                 count(*) FILTER (WHERE d.status = 'embedded') AS documents_embedded,
                 count(*) FILTER (WHERE d.status = 'failed') AS documents_failed
             FROM research_documents d
-            JOIN research_sources s ON s.source_id = d.source_id
-            WHERE s.topic_key = :topic_key
-              AND coalesce(d.suppressed, false) = false
+            WHERE d.topic_key = :topic_key
+              AND NOT d.suppressed
         ),
         run_stats AS (
             SELECT
@@ -2662,9 +4125,7 @@ def list_research_document_stage_counts(
             d.status,
             count(*) AS count
         FROM research_documents d
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
         GROUP BY d.status
         ORDER BY d.status ASC
     """
@@ -2685,9 +4146,7 @@ def get_research_storage_usage(
                 d.raw_payload,
                 d.extracted_text
             FROM research_documents d
-            JOIN research_sources s
-              ON s.source_id = d.source_id
-            WHERE s.topic_key = :topic_key
+            WHERE d.topic_key = :topic_key
         ),
         chunks AS (
             SELECT
@@ -2695,14 +4154,14 @@ def get_research_storage_usage(
                 c.chunk_id,
                 c.content
             FROM research_chunks c
-            JOIN docs d
-              ON d.document_id = c.document_id
+            WHERE c.topic_key = :topic_key
         ),
         embs AS (
             SELECT
                 e.document_id,
                 e.chunk_id,
-                e.vector
+                e.vector,
+                e.vector_packed
             FROM research_embeddings e
             JOIN docs d
               ON d.document_id = e.document_id
@@ -2714,13 +4173,48 @@ def get_research_storage_usage(
             (SELECT COALESCE(sum(octet_length(COALESCE(raw_payload, ''))), 0) FROM docs) AS raw_payload_bytes,
             (SELECT COALESCE(sum(octet_length(COALESCE(extracted_text, ''))), 0) FROM docs) AS extracted_text_bytes,
             (SELECT COALESCE(sum(octet_length(COALESCE(content, ''))), 0) FROM chunks) AS chunks_bytes,
-            (SELECT COALESCE(sum(pg_column_size(vector)), 0) FROM embs) AS embeddings_bytes
+            (
+                SELECT COALESCE(sum(COALESCE(pg_column_size(vector), 0) + COALESCE(pg_column_size(vector_packed), 0)), 0)
+                FROM embs
+            ) AS embeddings_bytes,
+            (SELECT count(*) FROM embs WHERE vector_packed IS NOT NULL) AS embeddings_packed_count,
+            (SELECT count(*) FROM embs WHERE vector_packed IS NULL) AS embeddings_jsonb_count,
+            (SELECT COALESCE(sum(pg_column_size(vector_packed)), 0) FROM embs) AS embeddings_packed_bytes,
+            (SELECT COALESCE(sum(pg_column_size(vector)), 0) FROM embs) AS embeddings_jsonb_bytes
     """
     with engine.begin() as conn:
         row = conn.execute(text(sql), {"topic_key": topic_key}).mappings().first()
     return dict(row or {})
 
 
+def measure_research_embedding_reads(
+    engine: Engine,
+    *,
+    topic_key: str,
+    limit: int = 200,
+) -> Dict[str, Any]:
+    sql = """
+        SELECT
+            e.vector,
+            e.vector_packed,
+            e.vector_encoding,
+            e.vector_scale
+        FROM research_embeddings e
+        JOIN research_documents d
+          ON d.document_id = e.document_id
+        WHERE d.topic_key = :topic_key
+        LIMIT :limit
+    """
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        rows = conn.execute(text(sql), {"topic_key": topic_key, "limit": max(limit, 1)}).mappings().all()
+    decoded = sum(1 for row in rows if decode_embedding_row(row) is not None)
+    return {
+        "rows": decoded,
+        "read_ms": round((time.perf_counter() - started) * 1000.0, 3),
+    }
+
+
 def list_research_run_progress(
     engine: Engine,
     *,
@@ -2761,21 +4255,20 @@ def get_research_pipeline_counts(
                 d.document_id,
                 d.status
             FROM research_documents d
-            JOIN research_sources s
-              ON s.source_id = d.source_id
-            WHERE s.topic_key = :topic_key
+            WHERE d.topic_key = :topic_key
         )
         SELECT
             count(*) AS documents_total,
             count(*) FILTER (WHERE d.status = 'discovered') AS discovered_count,
             count(*) FILTER (WHERE d.status = 'fetched') AS fetched_count,
             count(*) FILTER (WHERE d.status = 'extracted') AS extracted_count,
+            count(*) FILTER (WHERE d.status = 'enriched') AS enriched_count,
             count(*) FILTER (WHERE d.status = 'embedded') AS embedded_count,
             count(*) FILTER (WHERE d.status = 'failed') AS failed_count,
             (
                 SELECT count(*)
                 FROM research_chunks c
-                JOIN docs d ON d.document_id = c.document_id
+                WHERE c.topic_key = :topic_key
             ) AS chunks_count,
             (
                 SELECT count(*)
@@ -2802,13 +4295,11 @@ def get_research_ai_usage_by_model(
                 d.embedded_at,
                 c.content
             FROM research_documents d
-            JOIN research_sources s
-              ON s.source_id = d.source_id
             LEFT JOIN research_chunks c
               ON c.document_id = d.document_id
-            WHERE s.topic_key = :topic_key
+            WHERE d.topic_key = :topic_key
               AND d.status = 'embedded'
-              AND coalesce(d.suppressed, false) = false
+              AND NOT d.suppressed
               AND d.embedding_model_id IS NOT NULL
         )
         SELECT
@@ -2852,9 +4343,7 @@ def redact_research_raw_payloads(
         UPDATE research_documents d
         SET raw_payload = NULL,
             updated_at = now()
-        FROM research_sources s
-        WHERE s.source_id = d.source_id
-          AND s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
           AND d.raw_payload IS NOT NULL
           AND d.created_at < now() - (:older_than_days * interval '1 day')
     """
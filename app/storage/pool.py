@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.metrics import REGISTRY, Counter, Gauge
+
+# Defaults per process role: the API serves concurrent requests, the intel worker and the digest
+# generator run one unit of work at a time, and the research worker's pool_size is derived from
+# its thread counts (_research_worker_connections). Overridden by DB_POOL_* and then
+# <ROLE>_DB_POOL_*.
+POOL_ROLE_DEFAULTS: Dict[str, Dict[str, int]] = {
+    "api": {"pool_size": 5, "max_overflow": 10, "pool_timeout": 30, "pool_recycle": -1},
+    "research_worker": {"pool_size": 2, "max_overflow": 2, "pool_timeout": 30, "pool_recycle": -1},
+    "intel_worker": {"pool_size": 2, "max_overflow": 2, "pool_timeout": 30, "pool_recycle": -1},
+    "digest": {"pool_size": 2, "max_overflow": 2, "pool_timeout": 30, "pool_recycle": -1},
+    "script": {"pool_size": 5, "max_overflow": 10, "pool_timeout": 30, "pool_recycle": -1},
+}
+
+_POOL_ENV_KEYS = {
+    "pool_size": "POOL_SIZE",
+    "max_overflow": "POOL_MAX_OVERFLOW",
+    "pool_timeout": "POOL_TIMEOUT_S",
+    "pool_recycle": "POOL_RECYCLE_S",
+}
+
+_WAIT_SAMPLES = 1024
+
+_LIVE_POOL_METRICS: "weakref.WeakSet[PoolMetrics]" = weakref.WeakSet()
+
+
+def _env_count(name: str, default: int) -> int:
+    try:
+        return max(int(os.getenv(name, str(default))), 0)
+    except ValueError:
+        return default
+
+
+def _research_worker_connections() -> int:
+    # Every thread that can hold a connection at once: source listing threads, the document
+    # pipeline's fetch/extract/enrich/embed workers, the lease heartbeat and the claim loop
+    # (which also writes pipeline stats).
+    return (
+        max(_env_count("RESEARCH_RUN_SOURCE_CONCURRENCY", 4), 1)
+        + max(_env_count("RESEARCH_DOCUMENT_JOB_CONCURRENCY", 4), 1)
+        + max(_env_count("RESEARCH_PIPELINE_EXTRACT_PROCESSES", 2), 1)
+        + max(_env_count("RESEARCH_PIPELINE_ENRICH_WORKERS", 2), 1)
+        + max(_env_count("RESEARCH_PIPELINE_EMBED_WORKERS", 1), 1)
+        + 2
+    )
+
+
+def pool_config_for_role(role: str) -> Dict[str, int]:
+    config = dict(POOL_ROLE_DEFAULTS.get(role) or POOL_ROLE_DEFAULTS["script"])
+    if role == "research_worker":
+        config["pool_size"] = _research_worker_connections()
+    for key, suffix in _POOL_ENV_KEYS.items():
+        for name in (f"DB_{suffix}", f"{role.upper()}_DB_{suffix}"):
+            raw = os.getenv(name, "").strip()
+            if not raw:
+                continue
+            try:
+                config[key] = int(raw)
+            except ValueError:
+                continue
+    config["pool_size"] = max(config["pool_size"], 1)
+    config["max_overflow"] = max(config["max_overflow"], -1)
+    config["pool_timeout"] = max(config["pool_timeout"], 1)
+    return config
+
+
+class PoolMetrics:
+    def __init__(self, *, role: str, name: str) -> None:
+        self.role = role
+        self.name = name
+        self._lock = threading.Lock()
+        self._waits_ms: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._pool: Any = None
+        self._counters = {
+            "checkouts": 0,
+            "checkins": 0,
+            "connects": 0,
+            "overflow_checkouts": 0,
+            "timeouts": 0,
+            "invalidations": 0,
+        }
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        _LIVE_POOL_METRICS.add(self)
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self._waits_ms.append(elapsed_ms)
+            self._wait_total_ms += elapsed_ms
+            self._wait_max_ms = max(self._wait_max_ms, elapsed_ms)
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def wait_total_ms(self) -> float:
+        with self._lock:
+            return self._wait_total_ms
+
+    def attach(self, pool: Any) -> None:
+        self._pool = pool
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            waits = sorted(self._waits_ms)
+            wait_total_ms = self._wait_total_ms
+            wait_max_ms = self._wait_max_ms
+        pool = self._pool
+        checked_out = int(pool.checkedout()) if pool is not None else 0
+        pool_size = int(pool.size()) if pool is not None else 0
+        return {
+            "role": self.role,
+            "engine": self.name,
+            **counters,
+            "pool_size": pool_size,
+            "max_overflow": int(getattr(pool, "_max_overflow", 0)) if pool is not None else 0,
+            "timeout_seconds": float(getattr(pool, "_timeout", 0.0)) if pool is not None else 0.0,
+            "recycle_seconds": int(getattr(pool, "_recycle", -1)) if pool is not None else -1,
+            "checked_out": checked_out,
+            "checked_in": int(pool.checkedin()) if pool is not None else 0,
+            "overflow": max(int(pool.overflow()), 0) if pool is not None else 0,
+            "checkout_wait_avg_ms": round(wait_total_ms / counters["checkouts"], 3) if counters["checkouts"] else 0.0,
+            "checkout_wait_p50_ms": round(_percentile(waits, 0.5), 3),
+            "checkout_wait_p95_ms": round(_percentile(waits, 0.95), 3),
+            "checkout_wait_max_ms": round(wait_max_ms, 3),
+        }
+
+
+def _percentile(values: Any, fraction: float) -> float:
+    if not values:
+        return 0.0
+    index = min(int(round(fraction * (len(values) - 1))), len(values) - 1)
+    return float(values[index])
+
+
+class _TimedPoolMixin:
+    # Engine.connect() reaches the pool through Pool.connect(); timing it captures the wait for
+    # a free slot (plus connect/pre-ping), which no pool event exposes.
+    _metrics: PoolMetrics
+
+    def connect(self) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self._metrics.incr("timeouts")
+            raise
+        self._metrics.record_wait((time.perf_counter() - started) * 1000.0)
+        return connection
+
+
+def timed_pool_class(metrics: PoolMetrics, *, is_async: bool = False) -> Type[QueuePool]:
+    # A class per engine so the metrics survive Pool.recreate() on engine.dispose().
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    return type(f"Timed{base.__name__}", (_TimedPoolMixin, base), {"_metrics": metrics})
+
+
+def instrument_engine_pool(engine: Any, metrics: PoolMetrics) -> None:
+    sync_engine = getattr(engine, "sync_engine", engine)
+    metrics.attach(sync_engine.pool)
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(*_args: Any) -> None:
+        metrics.incr("connects")
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(_dbapi_conn: Any, _record: Any, _proxy: Any) -> None:
+        metrics.incr("checkouts")
+        pool = sync_engine.pool
+        if pool.checkedout() > pool.size():
+            metrics.incr("overflow_checkouts")
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(*_args: Any) -> None:
+        metrics.incr("checkins")
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(*_args: Any) -> None:
+        metrics.incr("invalidations")
+
+    @event.listens_for(sync_engine, "engine_disposed")
+    def _on_disposed(*_args: Any) -> None:
+        metrics.attach(sync_engine.pool)
+
+
+def engine_pool_metrics(engine: Any) -> Optional[PoolMetrics]:
+    sync_engine = getattr(engine, "sync_engine", engine)
+    return getattr(sync_engine.pool, "_metrics", None)
+
+
+_POOL_COUNTERS = ("checkouts", "connects", "overflow_checkouts", "timeouts", "invalidations")
+_POOL_GAUGES = ("pool_size", "max_overflow", "checked_out", "checked_in", "overflow")
+
+
+def _collect_pool_metrics() -> List[Any]:
+    # Engines sharing a role/engine label (e.g. several apps in one process) are summed.
+    totals: Dict[Tuple[str, str], Dict[str, float]] = {}
+    for metrics in list(_LIVE_POOL_METRICS):
+        stats = metrics.stats()
+        row = totals.setdefault((metrics.role, metrics.name), {})
+        for key in (*_POOL_COUNTERS, *_POOL_GAUGES):
+            row[key] = row.get(key, 0.0) + float(stats[key])
+        row["wait_ms"] = row.get("wait_ms", 0.0) + metrics.wait_total_ms()
+    families: List[Any] = []
+    labels = ("role", "engine")
+    for key in _POOL_COUNTERS:
+        family = Counter(f"context_api_db_pool_{key}_total", f"DB pool {key.replace('_', ' ')}.", labels)
+        for (role, name), row in totals.items():
+            family.inc(row[key], role=role, engine=name)
+        families.append(family)
+    for key in _POOL_GAUGES:
+        family = Gauge(f"context_api_db_pool_{key}", f"DB pool {key.replace('_', ' ')}.", labels)
+        for (role, name), row in totals.items():
+            family.set(row[key], role=role, engine=name)
+        families.append(family)
+    wait = Counter(
+        "context_api_db_pool_checkout_wait_seconds_total",
+        "Total time spent waiting for a pooled connection.",
+        labels,
+    )
+    for (role, name), row in totals.items():
+        wait.inc(row["wait_ms"] / 1000.0, role=role, engine=name)
+    families.append(wait)
+    return families
+
+
+REGISTRY.register_collector(_collect_pool_metrics)
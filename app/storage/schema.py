@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, ForeignKeyConstraint, Index, Integer, MetaData, Table, Text, text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, Float, ForeignKey, ForeignKeyConstraint, Index, Integer, LargeBinary, MetaData, Table, Text, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 from sqlalchemy.sql import func
 
 metadata = MetaData()
@@ -83,6 +83,8 @@ intel_article_sections = Table(
     Column("heading", Text, nullable=False, server_default=text("''")),
     Column("content", Text, nullable=False),
     Column("rank", Integer, nullable=False, server_default=text("0")),
+    Column("search_vector", TSVECTOR, nullable=True),
+    Index("ix_intel_article_sections_search_vector", "search_vector", postgresql_using="gin"),
 )
 
 intel_ingest_jobs = Table(
@@ -135,6 +137,9 @@ research_source_policies = Table(
     Column("consecutive_failures", Integer, nullable=False, server_default=text("0")),
     Column("cooldown_until", DateTime(timezone=True), nullable=True),
     Column("last_error", Text, nullable=True),
+    Column("listing_etag", Text, nullable=True),
+    Column("listing_last_modified", Text, nullable=True),
+    Column("listing_bytes", Integer, nullable=False, server_default=text("0")),
     Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
     Index("ix_research_source_policies_cooldown_until", "cooldown_until"),
 )
@@ -158,16 +163,44 @@ research_ingestion_runs = Table(
     Column("started_at", DateTime(timezone=True), nullable=True),
     Column("finished_at", DateTime(timezone=True), nullable=True),
     Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("jobs_enqueued_at", DateTime(timezone=True), nullable=True),
+    Column("metrics", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
     Index("ix_research_runs_status_created_at", "status", "created_at"),
     Index("ix_research_runs_topic_key", "topic_key"),
     Index("ix_research_runs_idempotency_key", "idempotency_key"),
 )
 
+research_document_jobs = Table(
+    "research_document_jobs",
+    metadata,
+    Column("job_id", UUID(as_uuid=True), primary_key=True),
+    Column("run_id", UUID(as_uuid=True), ForeignKey("research_ingestion_runs.run_id", ondelete="CASCADE"), nullable=False),
+    Column("source_id", Text, nullable=False),
+    Column("item_url", Text, nullable=False),
+    Column("item", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    Column("source", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    Column("status", Text, nullable=False, server_default=text("'queued'")),
+    Column("outcome", Text, nullable=True),
+    Column("attempts", Integer, nullable=False, server_default=text("0")),
+    Column("lease_owner", Text, nullable=True),
+    Column("lease_expires_at", DateTime(timezone=True), nullable=True),
+    Column("available_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("last_error", Text, nullable=True),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("finished_at", DateTime(timezone=True), nullable=True),
+    UniqueConstraint("run_id", "source_id", "item_url", name="uq_research_document_jobs_run_item"),
+    Index("ix_research_document_jobs_claimable", "available_at", "created_at", postgresql_where=text("status IN ('queued', 'retry')")),
+    Index("ix_research_document_jobs_leased", "lease_expires_at", postgresql_where=text("status = 'running'")),
+    Index("ix_research_document_jobs_run_status", "run_id", "status"),
+)
+
 research_documents = Table(
     "research_documents",
     metadata,
     Column("document_id", Text, primary_key=True),
     Column("source_id", Text, ForeignKey("research_sources.source_id", ondelete="CASCADE"), nullable=False),
+    Column("topic_key", Text, nullable=False),
     Column("run_id", UUID(as_uuid=True), ForeignKey("research_ingestion_runs.run_id", ondelete="SET NULL"), nullable=True),
     Column("canonical_url", Text, nullable=False),
     Column("url_original", Text, nullable=True),
@@ -215,6 +248,30 @@ research_documents = Table(
     Index("ix_research_documents_status", "status"),
     Index("ix_research_documents_suppressed", "suppressed"),
     Index("ix_research_documents_canonical_url", "canonical_url"),
+    Index("ix_research_documents_published_at", "published_at"),
+    Index("ix_research_documents_recency", text("coalesce(published_at, discovered_at)")),
+    Index("ix_research_documents_with_metrics", "source_id", "document_id", postgresql_where=text("metrics <> '[]'::jsonb")),
+    Index("ix_research_documents_with_quotes", "source_id", "document_id", postgresql_where=text("notable_quotes <> '[]'::jsonb")),
+    Index(
+        "ix_research_documents_with_recommendations",
+        "source_id",
+        "document_id",
+        postgresql_where=text("recommendations <> '[]'::jsonb"),
+    ),
+    Index("ix_research_documents_with_tradeoffs", "source_id", "document_id", postgresql_where=text("tradeoffs <> '[]'::jsonb")),
+    Index(
+        "ix_research_documents_internal_authoritative",
+        "source_id",
+        "document_id",
+        postgresql_where=text("source_class = 'internal_authoritative'"),
+    ),
+    Index("ix_research_documents_topic_status", "topic_key", "status"),
+    Index(
+        "ix_research_documents_topic_live_recency",
+        "topic_key",
+        text("coalesce(published_at, discovered_at) DESC NULLS LAST"),
+        postgresql_where=text("status IN ('embedded', 'extracted', 'enriched') AND NOT suppressed"),
+    ),
 )
 
 research_chunks = Table(
@@ -222,13 +279,17 @@ research_chunks = Table(
     metadata,
     Column("document_id", Text, ForeignKey("research_documents.document_id", ondelete="CASCADE"), primary_key=True),
     Column("chunk_id", Text, primary_key=True),
+    Column("topic_key", Text, nullable=False),
     Column("ordinal", Integer, nullable=False),
     Column("content", Text, nullable=False),
     Column("content_hash", Text, nullable=False),
     Column("chunk_meta", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    Column("search_vector", TSVECTOR, nullable=True),
     Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
     Index("ix_research_chunks_document_id", "document_id"),
     Index("ix_research_chunks_ordinal", "ordinal"),
+    Index("ix_research_chunks_topic_key", "topic_key", "document_id"),
+    Index("ix_research_chunks_search_vector", "search_vector", postgresql_using="gin"),
 )
 
 research_embeddings = Table(
@@ -237,15 +298,23 @@ research_embeddings = Table(
     Column("document_id", Text, nullable=False, primary_key=True),
     Column("chunk_id", Text, nullable=False, primary_key=True),
     Column("embedding_model_id", Text, nullable=False, primary_key=True),
-    Column("vector", JSONB, nullable=False),
+    Column("vector", JSONB(none_as_null=True), nullable=True),
+    Column("vector_packed", LargeBinary, nullable=True),
+    Column("vector_encoding", Text, nullable=True),
+    Column("vector_scale", Float, nullable=True),
     Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
     Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    CheckConstraint(
+        "vector IS NOT NULL OR vector_packed IS NOT NULL",
+        name="ck_research_embeddings_vector_present",
+    ),
     ForeignKeyConstraint(
         ["document_id", "chunk_id"],
         ["research_chunks.document_id", "research_chunks.chunk_id"],
         ondelete="CASCADE",
     ),
     Index("ix_research_embeddings_document_model", "document_id", "embedding_model_id"),
+    Index("ix_research_embeddings_model_created", "embedding_model_id", "created_at"),
 )
 
 research_query_logs = Table(
@@ -264,13 +333,55 @@ research_query_logs = Table(
     Column("returned_document_ids", JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     Column("returned_chunk_ids", JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     Column("timing_ms", Integer, nullable=False, server_default=text("0")),
+    Column("endpoint", Text, nullable=False, server_default=text("'context_pack'")),
+    Column("stage_timings", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
     Column("status", Text, nullable=False, server_default=text("'ok'")),
     Column("error", Text, nullable=True),
     Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
     Index("ix_research_query_logs_topic_created_at", "topic_key", "created_at"),
+    Index("ix_research_query_logs_topic_endpoint_created", "topic_key", "endpoint", "created_at"),
     Index("ix_research_query_logs_trace_id", "trace_id", unique=True),
 )
 
+research_topic_corpus_versions = Table(
+    "research_topic_corpus_versions",
+    metadata,
+    Column("topic_key", Text, primary_key=True),
+    Column("version", Integer, nullable=False, server_default=text("1")),
+    Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+research_query_embeddings = Table(
+    "research_query_embeddings",
+    metadata,
+    Column("embedding_model_id", Text, primary_key=True),
+    Column("query_hash", Text, primary_key=True),
+    Column("query_text", Text, nullable=False),
+    Column("vector_packed", LargeBinary, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Index("ix_research_query_embeddings_expires_at", "expires_at"),
+)
+
+research_robots_policies = Table(
+    "research_robots_policies",
+    metadata,
+    Column("origin", Text, primary_key=True),
+    Column("status_code", Integer, nullable=False),
+    Column("body", Text, nullable=False, server_default=text("''")),
+    Column("fetched_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Index("ix_research_robots_policies_expires_at", "expires_at"),
+)
+
+research_pipeline_stats = Table(
+    "research_pipeline_stats",
+    metadata,
+    Column("worker_id", Text, primary_key=True),
+    Column("stages", JSONB, nullable=False, server_default=text("'[]'::jsonb")),
+    Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
 research_relevance_scores = Table(
     "research_relevance_scores",
     metadata,
@@ -362,6 +473,30 @@ research_document_insights = Table(
     Index("ix_research_document_insights_topic_tags", "topic_tags", postgresql_using="gin"),
 )
 
+research_chunk_insight_rollup = Table(
+    "research_chunk_insight_rollup",
+    metadata,
+    Column("document_id", Text, ForeignKey("research_documents.document_id", ondelete="CASCADE"), primary_key=True),
+    Column("chunk_id", Text, primary_key=True),
+    Column("insight_count", Integer, nullable=False, server_default=text("0")),
+    Column("max_confidence", Float, nullable=False, server_default=text("0.0")),
+    Column("max_evidence_quality", Float, nullable=False, server_default=text("0.0")),
+    Column("max_freshness_score", Float, nullable=False, server_default=text("0.0")),
+    Column("max_coverage_score", Float, nullable=False, server_default=text("0.0")),
+    Column("corroboration_count", Integer, nullable=False, server_default=text("0")),
+    Column("contradiction_count", Integer, nullable=False, server_default=text("0")),
+    Column("insight_types", ARRAY(Text), nullable=False, server_default=text("ARRAY[]::text[]")),
+    Column("problem_tags", ARRAY(Text), nullable=False, server_default=text("ARRAY[]::text[]")),
+    Column("intervention_tags", ARRAY(Text), nullable=False, server_default=text("ARRAY[]::text[]")),
+    Column("tradeoff_dimensions", ARRAY(Text), nullable=False, server_default=text("ARRAY[]::text[]")),
+    Column("insight_text", Text, nullable=False, server_default=text("''")),
+    Column("updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Index("ix_research_chunk_insight_rollup_insight_types", "insight_types", postgresql_using="gin"),
+    Index("ix_research_chunk_insight_rollup_problem_tags", "problem_tags", postgresql_using="gin"),
+    Index("ix_research_chunk_insight_rollup_intervention_tags", "intervention_tags", postgresql_using="gin"),
+    Index("ix_research_chunk_insight_rollup_tradeoff_dimensions", "tradeoff_dimensions", postgresql_using="gin"),
+)
+
 research_evidence_relations = Table(
     "research_evidence_relations",
     metadata,
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+EMBEDDING_STORAGE_FORMATS = ("float32", "float16", "int8", "jsonb")
+PACKED_EMBEDDING_ENCODINGS = ("float32", "float16", "int8")
+
+_DTYPES = {
+    "float32": np.dtype("<f4"),
+    "float16": np.dtype("<f2"),
+    "int8": np.dtype("i1"),
+}
+
+
+def normalize_embedding_storage_format(value: Optional[str]) -> str:
+    normalized = str(value or "").strip().lower()
+    return normalized if normalized in EMBEDDING_STORAGE_FORMATS else "float32"
+
+
+def pack_vector(vector: Iterable[float], *, encoding: str = "float32") -> Tuple[bytes, Optional[float]]:
+    if encoding not in _DTYPES:
+        raise ValueError(f"unsupported embedding encoding: {encoding}")
+    values = np.asarray(list(vector), dtype=np.float32)
+    if encoding == "int8":
+        peak = float(np.max(np.abs(values))) if values.size else 0.0
+        scale = peak / 127.0 if peak > 0.0 else 1.0
+        quantized = np.clip(np.rint(values / scale), -127, 127).astype(_DTYPES["int8"])
+        return quantized.tobytes(), scale
+    return values.astype(_DTYPES[encoding]).tobytes(), None
+
+
+def unpack_vector(data: Any, *, encoding: Optional[str] = "float32", scale: Optional[float] = None) -> np.ndarray:
+    dtype = _DTYPES.get(encoding or "float32")
+    if dtype is None:
+        raise ValueError(f"unsupported embedding encoding: {encoding}")
+    values = np.frombuffer(data, dtype=dtype)
+    if encoding == "float32":
+        return values
+    values = values.astype(np.float32)
+    if encoding == "int8":
+        values *= np.float32(scale if scale else 1.0)
+    return values
+
+
+def decode_embedding_row(row: Any) -> Optional[np.ndarray]:
+    packed = row.get("vector_packed")
+    if packed is not None:
+        vector = unpack_vector(packed, encoding=row.get("vector_encoding"), scale=row.get("vector_scale"))
+        return vector if vector.size else None
+    value = row.get("vector")
+    if isinstance(value, list) and value:
+        try:
+            return np.asarray(value, dtype=np.float32)
+        except (TypeError, ValueError):
+            return None
+    return None
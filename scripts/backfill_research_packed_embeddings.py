@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+import os
+
+from app.storage.db import create_db_engine, pack_research_embeddings_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pack legacy JSONB research embeddings into vector_packed, one commit per batch.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--max-batches", type=int, default=0, help="Stop after this many batches (0 = until done).")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL", "").strip()
+    if not database_url:
+        raise RuntimeError("DATABASE_URL is not set")
+
+    engine = create_db_engine(database_url)
+    after = None
+    batches = 0
+    scanned = 0
+    packed = 0
+    while True:
+        result = pack_research_embeddings_batch(engine, after=after, limit=max(args.batch_size, 1))
+        if not result["scanned"]:
+            break
+        after = result["last_key"]
+        batches += 1
+        scanned += result["scanned"]
+        packed += result["packed"]
+        print({"batch": batches, "packed": result["packed"], "last_key": list(after)})
+        if args.max_batches > 0 and batches >= args.max_batches:
+            break
+    print({"batches": batches, "scanned": scanned, "packed": packed})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from app.config import Settings
+from app.research.benchmark import run_retrieval_benchmark, write_results
+
+
+def _parse_sizes(value: str) -> list[int]:
+    return [int(part.strip().replace("k", "000")) for part in value.split(",") if part.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark /v2/research/context/pack against a synthetic corpus.")
+    parser.add_argument("--sizes", default="1k,10k,100k", help="comma-separated chunk counts, e.g. 1k,10k,100k")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--chunks-per-document", type=int, default=10)
+    parser.add_argument("--insights-per-document", type=int, default=3)
+    parser.add_argument("--sources", type=int, default=4)
+    parser.add_argument("--embedding-model", default="hash-64")
+    parser.add_argument("--embedding-mode", choices=["projection", "hash"], default="projection")
+    parser.add_argument("--with-pack-cache", action="store_true")
+    parser.add_argument("--keep-corpus", action="store_true")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default="benchmarks/results/context_pack.json")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL", "").strip()
+    if not database_url:
+        raise RuntimeError("DATABASE_URL is not set")
+    os.environ["RESEARCH_EMBEDDING_MODEL"] = args.embedding_model
+    os.environ["RESEARCH_ALLOW_HASH_EMBEDDINGS"] = "true"
+
+    def progress(done: int, total: int) -> None:
+        if done == total or done % 500 == 0:
+            print(f"seeded {done}/{total} documents", file=sys.stderr)
+
+    payload = run_retrieval_benchmark(
+        Settings(database_url=database_url, context_api_token=os.getenv("CONTEXT_API_TOKEN", "benchmark")),
+        sizes=_parse_sizes(args.sizes),
+        queries=max(args.queries, 1),
+        chunks_per_document=max(args.chunks_per_document, 1),
+        insights_per_document=max(args.insights_per_document, 0),
+        sources=max(args.sources, 1),
+        embedding_model_id=args.embedding_model,
+        embedding_mode=args.embedding_mode,
+        use_pack_cache=args.with_pack_cache,
+        keep_corpus=args.keep_corpus,
+        seed=args.seed,
+        progress=progress,
+    )
+    write_results(payload, args.output)
+    for result in payload["results"]:
+        print(
+            {
+                "chunks": result["corpus"]["chunks"],
+                "p50_ms": result["latency_ms"]["p50"],
+                "p95_ms": result["latency_ms"]["p95"],
+                "p99_ms": result["latency_ms"]["p99"],
+                "rows_scanned_per_query": result["rows_scanned"]["per_query"],
+            }
+        )
+    print({"output": args.output})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from app.config import Settings
+from app.research.benchmark import run_seed_benchmark, write_results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-item vs bulk seeding of a discovered sitemap.")
+    parser.add_argument("--items", type=int, default=500, help="sitemap entries per listing (discovery caps at 500)")
+    parser.add_argument("--known-ratio", type=float, default=0.95, help="share of entries already stored as embedded documents")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--keep-corpus", action="store_true")
+    parser.add_argument("--output", default="benchmarks/results/document_seed.json")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL", "").strip()
+    if not database_url:
+        raise RuntimeError("DATABASE_URL is not set")
+
+    def progress(done: int, total: int) -> None:
+        print(f"repeat {done}/{total}", file=sys.stderr)
+
+    payload = run_seed_benchmark(
+        Settings(database_url=database_url, context_api_token=os.getenv("CONTEXT_API_TOKEN", "benchmark")),
+        items=max(args.items, 1),
+        known_ratio=min(max(args.known_ratio, 0.0), 1.0),
+        repeats=max(args.repeats, 1),
+        keep_corpus=args.keep_corpus,
+        progress=progress,
+    )
+    write_results(payload, args.output)
+    for method, result in payload["results"].items():
+        print(
+            {
+                "method": method,
+                "p50_ms": result["latency_ms"]["p50"],
+                "p95_ms": result["latency_ms"]["p95"],
+                "statements_per_listing": result["statements_per_listing"],
+                "seed_states": result["seed_states"],
+            }
+        )
+    print({"speedup_p50": payload["speedup_p50"], "output": args.output})
+
+
+if __name__ == "__main__":
+    main()
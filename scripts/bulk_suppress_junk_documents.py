@@ -24,9 +24,7 @@ def _iter_candidates(engine: Any, *, topic_key: str) -> list[dict[str, Any]]:
             d.suppression_reason,
             d.status
         FROM research_documents d
-        JOIN research_sources s
-          ON s.source_id = d.source_id
-        WHERE s.topic_key = :topic_key
+        WHERE d.topic_key = :topic_key
         ORDER BY coalesce(d.published_at, d.discovered_at) DESC NULLS LAST, d.updated_at DESC
     """
     with engine.begin() as conn:
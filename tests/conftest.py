@@ -29,14 +29,20 @@ def reset_database() -> None:
                 TRUNCATE
                     research_digest_feedback,
                     research_decision_feedback,
+                    research_chunk_insight_rollup,
                     research_document_insights,
                     research_retrieval_feedback,
                     research_bootstrap_events,
                     research_relevance_scores,
                     research_query_logs,
+                    research_query_embeddings,
+                    research_robots_policies,
+                    research_pipeline_stats,
+                    research_topic_corpus_versions,
                     research_embeddings,
                     research_chunks,
                     research_documents,
+                    research_document_jobs,
                     research_ingestion_runs,
                     research_source_policies,
                     research_sources,
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+import sqlalchemy as sa
+
+from app.storage.db import create_db_engine, statement_timeout, unit_of_work
+from app.storage.pool import engine_pool_metrics, pool_config_for_role
+
+
+def test_pool_config_for_role_applies_global_then_role_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert pool_config_for_role("api")["pool_size"] == 5
+    assert pool_config_for_role("research_worker")["max_overflow"] == 2
+    # 4 source threads + 4 fetch + 2 extract + 2 enrich + 1 embed + heartbeat + claim loop.
+    assert pool_config_for_role("research_worker")["pool_size"] == 15
+    monkeypatch.setenv("RESEARCH_DOCUMENT_JOB_CONCURRENCY", "8")
+    monkeypatch.setenv("RESEARCH_PIPELINE_EXTRACT_PROCESSES", "0")
+    assert pool_config_for_role("research_worker")["pool_size"] == 18
+    monkeypatch.setenv("DB_POOL_SIZE", "8")
+    monkeypatch.setenv("DB_POOL_TIMEOUT_S", "not-a-number")
+    monkeypatch.setenv("RESEARCH_WORKER_DB_POOL_SIZE", "3")
+    monkeypatch.setenv("RESEARCH_WORKER_DB_POOL_RECYCLE_S", "900")
+    assert pool_config_for_role("api")["pool_size"] == 8
+    worker = pool_config_for_role("research_worker")
+    assert worker["pool_size"] == 3
+    assert worker["pool_recycle"] == 900
+    assert worker["pool_timeout"] == 30
+
+
+def test_pool_metrics_track_checkouts_overflow_and_timeouts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SCRIPT_DB_POOL_SIZE", "1")
+    monkeypatch.setenv("SCRIPT_DB_POOL_MAX_OVERFLOW", "1")
+    monkeypatch.setenv("SCRIPT_DB_POOL_TIMEOUT_S", "1")
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    metrics = engine_pool_metrics(engine)
+    assert metrics is not None
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(sa.text("SELECT 1"))
+        second.execute(sa.text("SELECT 1"))
+        busy = metrics.stats()
+        with pytest.raises(sa.exc.TimeoutError):
+            engine.connect()
+    stats = metrics.stats()
+    assert busy["checked_out"] == 2
+    assert busy["overflow"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["overflow_checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["checkout_wait_max_ms"] > 0.0
+    assert (stats["pool_size"], stats["max_overflow"], stats["timeout_seconds"]) == (1, 1, 1.0)
+    engine.dispose()
+    assert metrics.stats()["checked_out"] == 0
+
+
+def test_statement_timeout_applies_to_units_of_work() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    with statement_timeout(50):
+        with unit_of_work(engine) as uow:
+            with uow.begin() as conn:
+                assert conn.execute(sa.text("SHOW statement_timeout")).scalar_one() == "50ms"
+        with pytest.raises(sa.exc.OperationalError):
+            with unit_of_work(engine) as uow:
+                with uow.begin() as conn:
+                    conn.execute(sa.text("SELECT pg_sleep(1)"))
+    with unit_of_work(engine) as uow:
+        with uow.begin() as conn:
+            assert conn.execute(sa.text("SHOW statement_timeout")).scalar_one() == "0"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.http_client import DNSCache, close_http_clients, get_http_client, http_client_stats
+from app.intel.fetch import fetch_url
+from app.metrics import REGISTRY
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.peers.add(self.client_address)
+        payload = f"<html><body><p>{self.path}</p></body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args: object, **_kwargs: object) -> None:
+        return
+
+
+def test_fetch_url_reuses_pooled_connections_per_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INTEL_HOST_THROTTLE_MS", "0")
+    close_http_clients()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.peers = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://localhost:{server.server_address[1]}"
+    try:
+        for n in range(5):
+            result = fetch_url(f"{base_url}/article-{n}")
+            assert result["status_code"] == 200
+            assert f"/article-{n}" in result["html"]
+    finally:
+        server.shutdown()
+
+    assert len(server.peers) == 1
+    stats = {row["client"]: row for row in http_client_stats()["clients"]}["fetch"]
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reused_requests"] == 4
+    assert stats["reuse_ratio"] == 0.8
+    assert get_http_client("fetch") is get_http_client("fetch")
+
+    rendered = REGISTRY.render()
+    assert 'context_api_http_client_requests_total{client="fetch",connection="reused"} 4' in rendered
+    assert 'context_api_http_client_connection_reuse_ratio{client="fetch"} 0.8' in rendered
+    assert "context_api_http_client_handshake_seconds_saved" in rendered
+    close_http_clients()
+
+
+def test_dns_cache_serves_repeat_lookups_until_ttl_or_forget() -> None:
+    cache = DNSCache(ttl_seconds=60)
+    first = cache.resolve("localhost", 80)
+    assert first
+    assert cache.resolve("localhost", 80) == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.forget("localhost", 80)
+    cache.resolve("localhost", 80)
+    assert cache.misses == 2
+
+    expired = DNSCache(ttl_seconds=0)
+    expired.resolve("localhost", 80)
+    expired.resolve("localhost", 80)
+    assert expired.hits == 0
+
+
+def test_fetch_client_resolves_through_the_dns_cache_and_raises_httpx_errors() -> None:
+    close_http_clients()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.peers = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    before = http_client_stats()["dns_cache"]
+    try:
+        response = get_http_client("fetch").get(f"http://localhost:{port}/cached")
+        assert response.status_code == 200 and "/cached" in response.text
+    finally:
+        server.shutdown()
+        server.server_close()
+    after = http_client_stats()["dns_cache"]
+    assert after["hits"] + after["misses"] == before["hits"] + before["misses"] + 1
+
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        closed_port = unused.getsockname()[1]
+    with pytest.raises(httpx.ConnectError):
+        get_http_client("fetch").get(f"http://localhost:{closed_port}/closed")
+    close_http_clients()
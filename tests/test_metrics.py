@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.metrics import Gauge, MetricsRegistry, start_metrics_server, write_metrics_file
+
+
+def test_registry_renders_text_exposition_format() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Demo requests.", ("route",))
+    latency = registry.histogram("demo_latency_seconds", "Demo latency.", ("route",), buckets=(0.1, 1.0))
+    requests.inc(route="/a")
+    requests.inc(2, route='/b"x')
+    latency.observe(0.05, route="/a")
+    latency.observe(0.1, route="/a")
+    latency.observe(3.0, route="/a")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE demo_requests_total counter" in lines
+    assert 'demo_requests_total{route="/a"} 1' in lines
+    assert 'demo_requests_total{route="/b\\"x"} 2' in lines
+    assert "# TYPE demo_latency_seconds histogram" in lines
+    assert 'demo_latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'demo_latency_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'demo_latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'demo_latency_seconds_count{route="/a"} 3' in lines
+    assert 'demo_latency_seconds_sum{route="/a"} 3.15' in lines
+
+    assert registry.counter("demo_requests_total", "Demo requests.", ("route",)) is requests
+    with pytest.raises(ValueError):
+        registry.gauge("demo_requests_total", "Demo requests.")
+    with pytest.raises(ValueError):
+        requests.inc(method="GET")
+
+
+def test_registry_collectors_and_worker_exports(tmp_path) -> None:
+    registry = MetricsRegistry()
+    registry.counter("demo_items_total", "Demo items.").inc(5)
+
+    def _collector():
+        gauge = Gauge("demo_queue_depth", "Demo queue depth.")
+        gauge.set(7)
+        return [gauge]
+
+    registry.register_collector(_collector)
+    rendered = registry.render()
+    assert "demo_items_total 5" in rendered
+    assert "demo_queue_depth 7" in rendered
+
+    path = tmp_path / "metrics" / "worker.prom"
+    write_metrics_file(str(path), registry)
+    assert path.read_text(encoding="utf-8") == rendered
+
+    server = start_metrics_server(0, host="127.0.0.1", registry=registry)
+    try:
+        response = httpx.get(f"http://127.0.0.1:{server.server_address[1]}/metrics", timeout=5)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "demo_items_total 5" in response.text
+    finally:
+        server.shutdown()
+        server.server_close()
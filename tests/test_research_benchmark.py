@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import math
+import os
+
+from app.config import Settings
+from app.research.benchmark.corpus import RandomProjectionEmbedder, SyntheticCorpusSpec, build_query_mix
+from app.research.benchmark.runner import percentile
+from app.research.benchmark.seeding import run_seed_benchmark
+
+
+def test_random_projection_embedder_is_deterministic_and_normalized() -> None:
+    embedder = RandomProjectionEmbedder(dims=32, seed=3)
+    first = embedder(texts=["gpu supply allocation", "retrieval ranking latency"])
+    second = RandomProjectionEmbedder(dims=32, seed=3)(texts=["gpu supply allocation", "retrieval ranking latency"])
+
+    assert first == second
+    assert all(len(vector) == 32 for vector in first)
+    assert all(math.isclose(sum(value * value for value in vector), 1.0, rel_tol=1e-4) for vector in first)
+    assert first[0] != first[1]
+
+
+def test_build_query_mix_covers_filters_and_is_seeded() -> None:
+    spec = SyntheticCorpusSpec(topic_key="bench_test", documents=10)
+    queries = build_query_mix(spec, count=20, source_ids=["src_a", "src_b"])
+
+    assert queries == build_query_mix(spec, count=20, source_ids=["src_a", "src_b"])
+    assert all(query["topic_key"] == "bench_test" for query in queries)
+    assert any("recency_days" in query for query in queries)
+    assert any(query.get("source_ids") for query in queries)
+    assert spec.total_chunks == 100
+
+
+def test_percentile_interpolates_between_ranks() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.5
+    assert round(percentile(values, 99), 2) == 99.01
+    assert percentile([], 95) == 0.0
+
+
+def test_seed_benchmark_compares_per_item_and_bulk_seeding() -> None:
+    settings = Settings(database_url=os.environ["DATABASE_URL"], context_api_token="benchmark")
+    payload = run_seed_benchmark(settings, items=40, known_ratio=0.9, repeats=1, topic_key="bench_seed_test")
+
+    per_item, bulk = payload["results"]["per_item"], payload["results"]["bulk"]
+    assert per_item["seed_states"] == bulk["seed_states"] == {"deduped": 36, "new": 4}
+    assert bulk["statements_per_listing"] == 1.0
+    assert per_item["statements_per_listing"] == 44.0
+    assert payload["parameters"]["known_items"] == 36
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+import pytest
+import sqlalchemy as sa
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.research import worker
+from app.research.ids import compute_document_id
+from app.storage.db import (
+    create_db_engine,
+    replace_research_chunks,
+    replace_research_document_insights,
+    seed_research_documents,
+    set_research_document_suppressed,
+    upsert_research_source,
+)
+
+
+class _ConditionalHandler(BaseHTTPRequestHandler):
+    # /feed and /article-1 answer validators with 304; /article-2 has no validators and never
+    # changes; /article-3 changes with server.version.
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests.append((self.path, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")))
+        if self.path == "/robots.txt":
+            self._send(200, "text/plain", "User-agent: *\nAllow: /\n")
+            return
+        if self.path == "/feed":
+            etag = f'"feed-{self.server.feed_version}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._not_modified(etag)
+                return
+            items = "".join(
+                f"<item><guid>cond-{n}</guid><link>{self.server.base_url}/article-{n}</link></item>" for n in range(1, 4)
+            )
+            body = f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'
+            self._send(200, "application/rss+xml", body, {"ETag": etag})
+            return
+        version = self.server.version if self.path == "/article-3" else 1
+        paragraph = f"Conditional fetch fixture {self.path} revision {version} about validator reuse. "
+        headers: Dict[str, str] = {}
+        if self.path == "/article-1":
+            headers = {"ETag": '"article-1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}
+            if self.headers.get("If-None-Match") == '"article-1"':
+                self._not_modified('"article-1"')
+                return
+        self._send(200, "text/html", f"<html><head><title>{self.path}</title></head><body><p>{paragraph * 5}</p></body></html>", headers)
+
+    def _not_modified(self, etag: str) -> None:
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.end_headers()
+
+    def _send(self, status: int, content_type: str, body: str, headers: Dict[str, str] | None = None) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args: object, **_kwargs: object) -> None:
+        return
+
+
+def test_conditional_get_skips_unchanged_listings_and_documents(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INTEL_HOST_THROTTLE_MS", "0")
+    monkeypatch.setattr(worker, "_ROBOTS_CACHE", None)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ConditionalHandler)
+    server.daemon_threads = True
+    host, port = server.server_address
+    server.base_url = f"http://{host}:{port}"
+    server.lock = threading.Lock()
+    server.requests = []
+    server.feed_version = 1
+    server.version = 1
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings = Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+    client = TestClient(create_app(settings))
+    headers = {"Authorization": f"Bearer {settings.context_api_token}"}
+    topic_key = f"conditional-{uuid.uuid4().hex[:8]}"
+    upsert = client.post(
+        "/v2/research/sources/upsert",
+        json={
+            "topic_key": topic_key,
+            "kind": "rss",
+            "name": "Conditional feed",
+            "base_url": f"{server.base_url}/feed",
+            "poll_interval_minutes": 60,
+            "rate_limit_per_hour": 3600,
+            "robots_mode": "strict",
+            "enabled": True,
+            "tags": ["test"],
+        },
+        headers=headers,
+    )
+    assert upsert.status_code == 200
+    source_id = upsert.json()["source_id"]
+    engine = create_db_engine(settings.database_url)
+
+    def _run() -> Dict[str, Any]:
+        run = client.post(
+            "/v2/research/ingest/run",
+            json={"topic_key": topic_key, "source_ids": [source_id], "trigger": "manual"},
+            headers=headers,
+        )
+        assert run.status_code == 200
+        assert worker.run_once(engine)
+        payload = client.get(f"/v2/research/ingest/runs/{run.json()['run_id']}", headers=headers).json()
+        assert payload["status"] == "completed"
+        return payload
+
+    try:
+        first = _run()
+        assert first["counters"]["items_new"] == 3
+        assert "listings_not_modified" not in first["metrics"]
+
+        # Same feed ETag: the listing answers 304 and no document jobs are fanned out.
+        second = _run()
+        assert second["counters"]["items_seen"] == 0
+        assert second["metrics"]["listings_not_modified"] == 1.0
+        assert second["metrics"]["bytes_avoided"] > 0
+        assert ("/feed", '"feed-1"', None) in server.requests
+
+        # New listing with documents due for refresh: article-1 answers 304, article-2 returns the
+        # same bytes, article-3 changed and is reprocessed.
+        monkeypatch.setenv("RESEARCH_DOCUMENT_REFRESH_HOURS", "1")
+        server.feed_version = 2
+        server.version = 2
+        with engine.begin() as conn:
+            conn.execute(
+                sa.text("UPDATE research_documents SET fetched_at = now() - interval '2 days' WHERE source_id = :source_id"),
+                {"source_id": source_id},
+            )
+        third = _run()
+    finally:
+        server.shutdown()
+
+    assert third["counters"]["items_deduped"] == 3
+    assert third["counters"]["items_failed"] == 0
+    metrics = third["metrics"]
+    assert metrics["documents_not_modified"] == 1.0
+    assert metrics["documents_unchanged"] == 1.0
+    assert metrics["documents_changed"] == 1.0
+    assert metrics["stages_skipped"] == 8.0
+    assert metrics["bytes_avoided"] > 0
+    assert ("/article-1", '"article-1"', "Mon, 05 Oct 2026 10:00:00 GMT") in server.requests
+
+    with engine.begin() as conn:
+        rows = conn.execute(
+            sa.text("SELECT canonical_url, status, extracted_text, fetched_at > now() - interval '1 hour' AS fresh FROM research_documents WHERE source_id = :source_id"),
+            {"source_id": source_id},
+        ).mappings().all()
+    engine.dispose()
+    by_path = {row["canonical_url"].rsplit("/", 1)[-1]: row for row in rows}
+    assert all(row["status"] == "embedded" and row["fresh"] for row in rows)
+    assert "revision 2" in by_path["article-3"]["extracted_text"]
+    assert "revision 1" in by_path["article-2"]["extracted_text"]
+
+
+def test_rewriting_a_documents_chunks_drops_insights_and_rollup_rows_of_removed_chunks() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    source_id = f"src_rewrite_{uuid.uuid4().hex[:8]}"
+    upsert_research_source(
+        engine,
+        source_id=source_id,
+        topic_key=f"rewrite-{uuid.uuid4().hex[:8]}",
+        kind="site_map",
+        name="Rewrite",
+        base_url_original=f"https://{source_id}.example/sitemap.xml",
+        base_url_canonical=f"https://{source_id}.example/sitemap.xml",
+        enabled=True,
+        tags=[],
+        publisher_type="independent",
+        source_class="external_commentary",
+        default_decision_domains=[],
+        poll_interval_minutes=60,
+        rate_limit_per_hour=3600,
+        robots_mode="ignore",
+        max_items_per_run=50,
+        source_weight=1.0,
+    )
+    url = f"https://{source_id}.example/refreshed"
+    document_id = compute_document_id(source_id=source_id, canonical_url=url)
+    seed_research_documents(engine, source_id=source_id, run_id=None, items=[{"document_id": document_id, "canonical_url": url, "url_original": url}])
+
+    def _rows(table: str) -> list:
+        with engine.begin() as conn:
+            return sorted(
+                conn.execute(
+                    sa.text(f"SELECT chunk_id FROM {table} WHERE document_id = :document_id"),
+                    {"document_id": document_id},
+                ).scalars()
+            )
+
+    replace_research_chunks(
+        engine,
+        document_id=document_id,
+        chunks=[{"chunk_id": chunk_id, "ordinal": n, "content": f"Revision one chunk {n}."} for n, chunk_id in enumerate(["c1", "c2"])],
+    )
+    replace_research_document_insights(
+        engine,
+        document_id=document_id,
+        insights=[{"chunk_id": chunk_id, "insight_type": "claim", "text": f"Insight on {chunk_id}."} for chunk_id in ("c1", "c2")],
+    )
+    assert _rows("research_chunk_insight_rollup") == ["c1", "c2"]
+
+    replace_research_chunks(
+        engine,
+        document_id=document_id,
+        chunks=[{"chunk_id": chunk_id, "ordinal": n, "content": f"Revision two chunk {n}."} for n, chunk_id in enumerate(["c2", "c3"])],
+    )
+    assert _rows("research_chunks") == ["c2", "c3"]
+    assert _rows("research_document_insights") == ["c2"]
+    assert _rows("research_chunk_insight_rollup") == ["c2"]
+
+    assert set_research_document_suppressed(engine, document_id=document_id, suppressed=True, reason="test")
+    assert _rows("research_document_insights") == []
+    assert _rows("research_chunk_insight_rollup") == []
+    engine.dispose()
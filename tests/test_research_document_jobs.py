@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import pytest
+import sqlalchemy as sa
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.research import worker
+from app.research.ids import compute_document_id
+from app.research.worker import run_once
+from app.storage.db import (
+    claim_next_research_ingestion_run,
+    claim_research_document_jobs,
+    complete_research_run_if_done,
+    count_research_document_jobs,
+    create_db_engine,
+    create_research_ingestion_run,
+    enqueue_research_document_jobs,
+    finish_research_document_job,
+    get_research_ingestion_run,
+    mark_research_run_jobs_enqueued,
+    renew_research_document_job_leases,
+    retry_research_document_job,
+    seed_research_documents,
+    upsert_research_source,
+)
+
+
+def _queued_run(engine: Any, urls: List[str], *, expected_jobs: int) -> Dict[str, Any]:
+    run = create_research_ingestion_run(
+        engine,
+        topic_key=f"jobs-{uuid.uuid4().hex[:8]}",
+        trigger="manual",
+        requested_source_ids=[],
+        selected_source_ids=[],
+    )
+    claimed = claim_next_research_ingestion_run(engine)
+    assert claimed is not None and claimed["run_id"] == run["run_id"]
+    enqueued = enqueue_research_document_jobs(
+        engine,
+        run_id=run["run_id"],
+        source_id="src_jobs",
+        source={"name": "Jobs"},
+        items=[{"url": url} for url in urls],
+    )
+    assert enqueued == expected_jobs
+    return run
+
+
+def test_document_jobs_lease_retry_and_complete_run_once() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    run = _queued_run(
+        engine,
+        ["https://jobs.example/a", "https://jobs.example/a?utm_source=feed", "https://jobs.example/b"],
+        expected_jobs=2,
+    )
+    run_id = run["run_id"]
+    assert count_research_document_jobs(engine, run_id=run_id, status="queued") == 2
+
+    first = claim_research_document_jobs(engine, worker_id="worker-a", limit=1, lease_seconds=1, run_id=run_id)
+    second = claim_research_document_jobs(engine, worker_id="worker-b", limit=5, lease_seconds=60, run_id=run_id)
+    assert len(first) == 1 and len(second) == 1
+    assert first[0]["job_id"] != second[0]["job_id"]
+    assert claim_research_document_jobs(engine, worker_id="worker-b", limit=5, run_id=run_id) == []
+    assert renew_research_document_job_leases(
+        engine, job_ids=[first[0]["job_id"], second[0]["job_id"]], worker_id="worker-b", lease_seconds=60
+    ) == 1
+
+    # worker-a's lease expires and worker-b reclaims the job; worker-a can no longer finish it.
+    time.sleep(1.2)
+    reclaimed = claim_research_document_jobs(engine, worker_id="worker-b", limit=5, run_id=run_id)
+    assert [job["job_id"] for job in reclaimed] == [first[0]["job_id"]]
+    assert reclaimed[0]["attempts"] == 2
+    assert not finish_research_document_job(engine, job_id=first[0]["job_id"], worker_id="worker-a", outcome="new")
+
+    mark_research_run_jobs_enqueued(engine, run_id=run_id)
+    assert retry_research_document_job(
+        engine, job_id=second[0]["job_id"], worker_id="worker-b", error="boom", max_attempts=3, backoff_seconds=60
+    ) == "retry"
+    # Backed-off jobs are not claimable yet and keep the run open.
+    assert claim_research_document_jobs(engine, worker_id="worker-b", run_id=run_id) == []
+    assert finish_research_document_job(engine, job_id=first[0]["job_id"], worker_id="worker-b", outcome="new")
+    assert not complete_research_run_if_done(engine, run_id=run_id)
+
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text("UPDATE research_document_jobs SET available_at = now() WHERE job_id = :job_id"),
+            {"job_id": second[0]["job_id"]},
+        )
+    retried = claim_research_document_jobs(engine, worker_id="worker-a", run_id=run_id)
+    assert [job["job_id"] for job in retried] == [second[0]["job_id"]]
+    assert retry_research_document_job(
+        engine, job_id=second[0]["job_id"], worker_id="worker-a", error="boom again", max_attempts=2
+    ) == "failed"
+    assert complete_research_run_if_done(engine, run_id=run_id)
+    assert not complete_research_run_if_done(engine, run_id=run_id)
+    assert get_research_ingestion_run(engine, run_id=str(run_id))["status"] == "completed"
+    assert count_research_document_jobs(engine, run_id=run_id, status="failed") == 1
+    engine.dispose()
+
+
+def test_bulk_seed_resolves_states_and_keeps_only_items_needing_work(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RESEARCH_EMBEDDING_MODEL", "model-b")
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    source_id = f"src_seed_{uuid.uuid4().hex[:8]}"
+    upsert_research_source(
+        engine,
+        source_id=source_id,
+        topic_key=f"seed-{uuid.uuid4().hex[:8]}",
+        kind="site_map",
+        name="Seed",
+        base_url_original=f"https://{source_id}.example/sitemap.xml",
+        base_url_canonical=f"https://{source_id}.example/sitemap.xml",
+        enabled=True,
+        tags=[],
+        publisher_type="independent",
+        source_class="external_commentary",
+        default_decision_domains=[],
+        poll_interval_minutes=60,
+        rate_limit_per_hour=30,
+        robots_mode="strict",
+        max_items_per_run=50,
+        source_weight=1.0,
+    )
+    urls = [f"https://{source_id}.example/{name}" for name in ("embedded", "stale-model", "failed", "fresh")]
+    rows = [
+        {"document_id": compute_document_id(source_id=source_id, canonical_url=url), "canonical_url": url, "url_original": url}
+        for url in urls
+    ]
+    assert [row["seed_state"] for row in seed_research_documents(engine, source_id=source_id, run_id=None, items=rows[:3] + rows[:1])] == [
+        "new",
+        "new",
+        "new",
+    ]
+    with engine.begin() as conn:
+        for row, status, model in zip(rows, ("embedded", "embedded", "failed"), ("model-b", "model-a", None)):
+            conn.execute(
+                sa.text(
+                    "UPDATE research_documents SET status = :status, embedding_model_id = :model, extracted_text = 'text' "
+                    "WHERE document_id = :document_id"
+                ),
+                {"status": status, "model": model, "document_id": row["document_id"]},
+            )
+
+    seeded = seed_research_documents(engine, source_id=source_id, run_id=None, items=rows)
+    assert [(row["seed_state"], row["status"]) for row in seeded] == [
+        ("deduped", "embedded"),
+        ("deduped", "embedded"),
+        ("retry", "failed"),
+        ("new", None),
+    ]
+
+    # Discovery seeds the listing again in one statement and fans out only documents with work:
+    # the up-to-date embedded document is dropped, the stale-model one is kept for a re-embed.
+    with engine.begin() as conn:
+        conn.execute(sa.text("UPDATE research_documents SET status = 'failed' WHERE source_id = :source_id AND status = 'discovered'"), {"source_id": source_id})
+    pending = worker._seed_discovered_items(engine, run_id=None, source_id=source_id, items=[{"url": url} for url in urls])
+    assert [(item["url"].rsplit("/", 1)[-1], item["seed_state"]) for item in pending] == [
+        ("stale-model", "deduped"),
+        ("failed", "retry"),
+        ("fresh", "retry"),
+    ]
+    engine.dispose()
+
+
+
+def test_enriched_document_with_an_old_embedding_model_is_fanned_out_and_reembedded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RESEARCH_EMBEDDING_MODEL", "hash-b")
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    source_id = f"src_enriched_{uuid.uuid4().hex[:8]}"
+    topic_key = f"enriched-{uuid.uuid4().hex[:8]}"
+    upsert_research_source(
+        engine,
+        source_id=source_id,
+        topic_key=topic_key,
+        kind="site_map",
+        name="Enriched",
+        base_url_original=f"https://{source_id}.example/sitemap.xml",
+        base_url_canonical=f"https://{source_id}.example/sitemap.xml",
+        enabled=True,
+        tags=[],
+        publisher_type="independent",
+        source_class="external_commentary",
+        default_decision_domains=[],
+        poll_interval_minutes=60,
+        rate_limit_per_hour=3600,
+        robots_mode="ignore",
+        max_items_per_run=50,
+        source_weight=1.0,
+    )
+    url = f"https://{source_id}.example/enriched"
+    document_id = compute_document_id(source_id=source_id, canonical_url=url)
+    seed_research_documents(engine, source_id=source_id, run_id=None, items=[{"document_id": document_id, "canonical_url": url, "url_original": url}])
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "UPDATE research_documents SET status = 'enriched', embedding_model_id = 'hash-a', "
+                "extracted_text = :text WHERE document_id = :document_id"
+            ),
+            {"text": "Enriched document whose embedding predates the current model. " * 5, "document_id": document_id},
+        )
+
+    pending = worker._seed_discovered_items(engine, run_id=None, source_id=source_id, items=[{"url": url}])
+    assert [(item["url"], item["seed_state"]) for item in pending] == [(url, "deduped")]
+
+    run = create_research_ingestion_run(
+        engine, topic_key=topic_key, trigger="manual", requested_source_ids=[source_id], selected_source_ids=[source_id]
+    )
+    claimed = claim_next_research_ingestion_run(engine)
+    assert claimed is not None and claimed["run_id"] == run["run_id"]
+    assert enqueue_research_document_jobs(
+        engine, run_id=run["run_id"], source_id=source_id, source={"name": "Enriched", "robots_mode": "ignore"}, items=pending
+    ) == 1
+    extracted: List[str] = []
+    real_extract = worker._extract_document
+    monkeypatch.setattr(worker, "_extract_document", lambda *args, **kwargs: extracted.append("called") or real_extract(*args, **kwargs))
+    assert worker.process_document_jobs(engine, run_id=run["run_id"]) == 1
+
+    # The stale model sends the document from fetch straight to embed, keeping its extracted text.
+    assert extracted == []
+    with engine.begin() as conn:
+        row = conn.execute(
+            sa.text(
+                "SELECT status, embedding_model_id, extracted_text, "
+                "(SELECT count(*) FROM research_embeddings e WHERE e.document_id = d.document_id "
+                "AND e.embedding_model_id = 'hash-b') AS embeddings "
+                "FROM research_documents d WHERE document_id = :document_id"
+            ),
+            {"document_id": document_id},
+        ).one()
+    assert (row.status, row.embedding_model_id) == ("embedded", "hash-b")
+    assert row.extracted_text.startswith("Enriched document whose embedding predates")
+    assert row.embeddings > 0
+    assert count_research_document_jobs(engine, run_id=run["run_id"], status="done") == 1
+    engine.dispose()
+
+
+class _SlowArticleHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path == "/robots.txt":
+            self._send(200, "text/plain", "User-agent: *\nAllow: /\n")
+            return
+        if self.path == "/feed":
+            items = "".join(
+                f"<item><guid>job-{n}</guid><link>{self.server.base_url}/article-{n}</link></item>" for n in range(4)
+            )
+            self._send(200, "application/rss+xml", f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>')
+            return
+        time.sleep(0.3)
+        paragraph = f"Document job fixture {self.path} covering leased work queues for ingestion. "
+        self._send(200, "text/html", f"<html><head><title>{self.path}</title></head><body><p>{paragraph * 5}</p></body></html>")
+
+    def _send(self, status: int, content_type: str, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args: object, **_kwargs: object) -> None:
+        return
+
+
+def test_two_workers_share_the_document_jobs_of_one_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INTEL_HOST_THROTTLE_MS", "0")
+    monkeypatch.setenv("RESEARCH_DOCUMENT_JOB_CONCURRENCY", "1")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowArticleHandler)
+    server.daemon_threads = True
+    host, port = server.server_address
+    server.base_url = f"http://{host}:{port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings = Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+    client = TestClient(create_app(settings))
+    headers = {"Authorization": f"Bearer {settings.context_api_token}"}
+    topic_key = f"jobs-{uuid.uuid4().hex[:8]}"
+    upsert = client.post(
+        "/v2/research/sources/upsert",
+        json={
+            "topic_key": topic_key,
+            "kind": "rss",
+            "name": "Job feed",
+            "base_url": f"{server.base_url}/feed",
+            "poll_interval_minutes": 60,
+            "rate_limit_per_hour": 3600,
+            "robots_mode": "strict",
+            "enabled": True,
+            "tags": ["test"],
+        },
+        headers=headers,
+    )
+    assert upsert.status_code == 200
+    run = client.post(
+        "/v2/research/ingest/run",
+        json={"topic_key": topic_key, "source_ids": [upsert.json()["source_id"]], "trigger": "manual"},
+        headers=headers,
+    )
+    assert run.status_code == 200
+    run_id = run.json()["run_id"]
+
+    engine = create_db_engine(settings.database_url)
+    done = threading.Event()
+
+    def _replica() -> None:
+        # A second replica polls the queue while the first one fans the run out and drains it.
+        while not done.is_set() and get_research_ingestion_run(engine, run_id=run_id)["status"] == "queued":
+            time.sleep(0.01)
+        while not done.is_set():
+            if not run_once(engine, worker_id="worker-b"):
+                time.sleep(0.05)
+
+    replica = threading.Thread(target=_replica)
+    replica.start()
+    try:
+        assert run_once(engine, worker_id="worker-a")
+    finally:
+        done.set()
+        replica.join()
+        server.shutdown()
+
+    status = client.get(f"/v2/research/ingest/runs/{run_id}", headers=headers)
+    assert status.status_code == 200
+    payload = status.json()
+    assert payload["status"] == "completed"
+    assert payload["counters"]["items_seen"] == 4
+    assert payload["counters"]["items_new"] == 4
+    with engine.begin() as conn:
+        owners = conn.execute(
+            sa.text("SELECT DISTINCT lease_owner FROM research_document_jobs WHERE run_id = :run_id AND status = 'done'"),
+            {"run_id": run_id},
+        ).scalars().all()
+    assert set(owners) == {"worker-a", "worker-b"}
+    engine.dispose()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import uuid
+
+import sqlalchemy as sa
+
+from app.research.ids import compute_document_id
+from app.storage.db import (
+    create_db_engine,
+    pack_research_embeddings_batch,
+    replace_research_chunks,
+    replace_research_embeddings,
+    seed_research_documents,
+    upsert_research_source,
+)
+from app.storage.vector_codec import decode_embedding_row
+
+
+def test_packing_backfill_pages_by_key_commits_per_batch_and_keeps_jsonb() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    source_id = f"src_pack_{uuid.uuid4().hex[:8]}"
+    upsert_research_source(
+        engine,
+        source_id=source_id,
+        topic_key=f"pack-{uuid.uuid4().hex[:8]}",
+        kind="site_map",
+        name="Pack",
+        base_url_original=f"https://{source_id}.example/sitemap.xml",
+        base_url_canonical=f"https://{source_id}.example/sitemap.xml",
+        enabled=True,
+        tags=[],
+        publisher_type="independent",
+        source_class="external_commentary",
+        default_decision_domains=[],
+        poll_interval_minutes=60,
+        rate_limit_per_hour=3600,
+        robots_mode="ignore",
+        max_items_per_run=50,
+        source_weight=1.0,
+    )
+    url = f"https://{source_id}.example/packed"
+    document_id = compute_document_id(source_id=source_id, canonical_url=url)
+    seed_research_documents(engine, source_id=source_id, run_id=None, items=[{"document_id": document_id, "canonical_url": url, "url_original": url}])
+    chunk_ids = ["c1", "c2", "c3"]
+    replace_research_chunks(
+        engine,
+        document_id=document_id,
+        chunks=[{"chunk_id": chunk_id, "ordinal": n, "content": f"Packed chunk {n}."} for n, chunk_id in enumerate(chunk_ids)],
+    )
+    replace_research_embeddings(
+        engine,
+        document_id=document_id,
+        embedding_model_id="hash-pack",
+        embeddings=[{"chunk_id": chunk_id, "vector": [float(n), 0.5, -1.25]} for n, chunk_id in enumerate(chunk_ids)],
+        storage_format="jsonb",
+    )
+
+    def _rows() -> list:
+        with engine.begin() as conn:
+            return conn.execute(
+                sa.text(
+                    "SELECT chunk_id, vector, vector_packed, vector_encoding, vector_scale FROM research_embeddings "
+                    "WHERE document_id = :document_id ORDER BY chunk_id"
+                ),
+                {"document_id": document_id},
+            ).mappings().all()
+
+    # Start the key range just before this document so other tests' rows do not interfere.
+    after = (document_id, "", "")
+    first = pack_research_embeddings_batch(engine, after=after, limit=2)
+    assert (first["scanned"], first["packed"]) == (2, 2)
+    assert first["last_key"] == (document_id, "c2", "hash-pack")
+    assert [row["vector_packed"] is not None for row in _rows()] == [True, True, False]
+
+    second = pack_research_embeddings_batch(engine, after=first["last_key"], limit=2)
+    assert second["scanned"] >= 1 and second["last_key"] > first["last_key"]
+    rows = _rows()
+    assert all(row["vector_packed"] is not None and row["vector_encoding"] == "float32" for row in rows)
+    for n, row in enumerate(rows):
+        assert row["vector"] == [float(n), 0.5, -1.25]
+        assert decode_embedding_row(row).tolist() == [float(n), 0.5, -1.25]
+
+    engine.dispose()
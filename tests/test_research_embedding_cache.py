@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, List
+
+import pytest
+
+from app.research import embedding_cache as embedding_cache_module
+from app.research.embedding_cache import QueryEmbeddingCache, normalize_query_text
+from app.storage.db import create_db_engine
+
+
+class _CountingEmbedder:
+    def __init__(self, *, delay_s: float = 0.0, fail: bool = False) -> None:
+        self.calls: List[List[str]] = []
+        self.delay_s = delay_s
+        self.fail = fail
+
+    def __call__(self, *, texts: List[str], model: str, api_key: str = "") -> List[List[float]]:
+        self.calls.append(list(texts))
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("embedding provider unavailable")
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_normalize_query_text_collapses_case_and_whitespace() -> None:
+    assert normalize_query_text("  GPU\tSupply  Chain ") == "gpu supply chain"
+
+
+def test_query_embedding_cache_hits_by_model_and_normalised_query() -> None:
+    embedder = _CountingEmbedder()
+    cache = QueryEmbeddingCache(max_entries=8, ttl_seconds=60, embedder=embedder)
+    first = cache.embed_query(query="GPU supply", model="hash-2")
+    second = cache.embed_query(query="  gpu   SUPPLY ", model="hash-2")
+    other_model = cache.embed_query(query="gpu supply", model="hash-3")
+    assert first == second == other_model
+    assert len(embedder.calls) == 2
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 2
+
+
+def test_query_embedding_cache_evicts_lru_and_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(embedding_cache_module.time, "monotonic", lambda: clock["now"])
+    embedder = _CountingEmbedder()
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=30, embedder=embedder)
+    cache.embed_query(query="alpha", model="m")
+    cache.embed_query(query="beta", model="m")
+    cache.embed_query(query="alpha", model="m")
+    cache.embed_query(query="gamma", model="m")
+    assert cache.stats()["evictions"] == 1
+    cache.embed_query(query="alpha", model="m")
+    assert len(embedder.calls) == 3
+
+    clock["now"] += 31
+    cache.embed_query(query="alpha", model="m")
+    assert len(embedder.calls) == 4
+
+
+def test_query_embedding_cache_single_flights_concurrent_requests() -> None:
+    embedder = _CountingEmbedder(delay_s=0.2)
+    cache = QueryEmbeddingCache(embedder=embedder)
+    results: List[Any] = []
+
+    def worker() -> None:
+        results.append(cache.embed_query(query="same query", model="m"))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(embedder.calls) == 1
+    assert len(results) == 5
+    assert all(result == results[0] for result in results)
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_query_embedding_cache_async_single_flights_on_event_loop() -> None:
+    calls: List[List[str]] = []
+
+    async def async_embedder(*, texts: List[str], model: str, api_key: str = "", client: Any = None) -> List[List[float]]:
+        calls.append(list(texts))
+        await asyncio.sleep(0.05)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    cache = QueryEmbeddingCache(embedder=_CountingEmbedder(fail=True), async_embedder=async_embedder)
+
+    async def run() -> List[List[float]]:
+        return await asyncio.gather(*[cache.embed_query_async(query="Same  query", model="m") for _ in range(5)])
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+    assert cache.stats()["coalesced"] == 4
+    assert cache.embed_query(query="same query", model="m") == results[0]
+    assert cache.stats()["hits"] == 1
+
+
+def test_query_embedding_cache_does_not_cache_failures() -> None:
+    embedder = _CountingEmbedder(fail=True)
+    cache = QueryEmbeddingCache(embedder=embedder)
+    with pytest.raises(RuntimeError):
+        cache.embed_query(query="broken", model="m")
+    with pytest.raises(RuntimeError):
+        cache.embed_query(query="broken", model="m")
+    assert len(embedder.calls) == 2
+    assert cache.stats()["errors"] == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_query_embedding_cache_shares_vectors_through_postgres() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    first_embedder = _CountingEmbedder()
+    second_embedder = _CountingEmbedder()
+    first = QueryEmbeddingCache(engine=engine, shared=True, embedder=first_embedder)
+    second = QueryEmbeddingCache(engine=engine, shared=True, embedder=second_embedder)
+
+    vector = first.embed_query(query="shared query", model="hash-2")
+    assert second.embed_query(query="Shared  Query", model="hash-2") == pytest.approx(vector)
+    assert len(first_embedder.calls) == 1
+    assert second_embedder.calls == []
+    assert second.stats()["shared_hits"] == 1
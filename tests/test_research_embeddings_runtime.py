@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from typing import List
+
+import httpx
 import pytest
 
-from app.research.embeddings import embed_texts, resolve_embedding_runtime
+from app.research.embeddings import embed_texts, embed_texts_async, resolve_embedding_runtime
 
 
 def test_resolve_embedding_runtime_reports_openai_mode() -> None:
@@ -23,3 +28,42 @@ def test_embed_texts_allows_explicit_hash_fallback(monkeypatch: pytest.MonkeyPat
     vectors = embed_texts(texts=["hello world"], model="text-embedding-3-small", api_key="")
     assert len(vectors) == 1
     assert len(vectors[0]) == 64
+
+
+def test_embed_texts_async_batches_through_shared_client() -> None:
+    batch_sizes: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer sk-test"
+        payload = json.loads(request.content)
+        batch_sizes.append(len(payload["input"]))
+        data = [{"embedding": [float(len(text)), 1.0]} for text in payload["input"]]
+        return httpx.Response(200, json={"data": data})
+
+    async def run() -> List[List[float]]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            vectors = await embed_texts_async(
+                texts=[f"text {index}" for index in range(40)],
+                model="text-embedding-3-small",
+                api_key="sk-test",
+                client=client,
+            )
+            assert not client.is_closed
+            return vectors
+
+    vectors = asyncio.run(run())
+    assert batch_sizes == [32, 8]
+    assert len(vectors) == 40
+    assert vectors[0] == [6.0, 1.0]
+
+
+def test_embed_texts_async_rejects_length_mismatch() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": [{"embedding": [1.0]}]})
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await embed_texts_async(texts=["a", "b"], model="text-embedding-3-small", api_key="sk-test", client=client)
+
+    with pytest.raises(RuntimeError, match="length mismatch"):
+        asyncio.run(run())
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+
+import pytest
+import sqlalchemy as sa
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.research import worker
+from app.research.ingest_pipeline import PipelineStage, extract_document, pipeline_stats, run_extraction
+from app.storage.db import create_db_engine
+
+_ARTICLES = 4
+
+
+def test_pipeline_stage_blocks_producers_when_its_queue_is_full() -> None:
+    release = threading.Event()
+    handled: List[int] = []
+
+    def _handler(batch: List[int]) -> None:
+        release.wait(5)
+        handled.extend(batch)
+
+    stage = PipelineStage("slow", _handler, on_error=lambda batch, exc: None, queue_size=1, pipeline="test-backpressure")
+    stage.start()
+    stage.put(1)
+    deadline = time.monotonic() + 2
+    while stage.snapshot()["in_flight"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stage.put(2)
+    producer = threading.Thread(target=stage.put, args=(3,))
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+    assert stage.snapshot() == {"stage": "slow", "workers": 1, "queue_depth": 1, "queue_capacity": 1, "in_flight": 1}
+
+    release.set()
+    producer.join(2)
+    stage.stop()
+    assert handled == [1, 2, 3]
+    assert pipeline_stats("test-backpressure")[0]["processed"] == 3
+
+
+def test_pipeline_stage_batches_by_weight_and_hands_failed_batches_to_on_error() -> None:
+    batches: List[List[int]] = []
+    errors: List[List[int]] = []
+
+    def _handler(batch: List[int]) -> None:
+        if 4 in batch:
+            raise RuntimeError("boom")
+        batches.append(batch)
+
+    stage = PipelineStage(
+        "batch",
+        _handler,
+        on_error=lambda batch, exc: errors.append(batch),
+        batch_size=5,
+        batch_wait_s=0.05,
+        weight=lambda item: item,
+        pipeline="test-batching",
+    )
+    for item in (2, 3, 4):
+        stage.put(item)
+    stage.start()
+    stage.stop()
+    assert batches == [[2, 3]]
+    assert errors == [[4]]
+    row = pipeline_stats("test-batching")[0]
+    assert (row["processed"], row["failed"], row["queue_depth"]) == (2, 1, 0)
+
+
+def _work(document_id: str, contents: List[str]) -> Any:
+    work = worker._DocumentWork({"job_id": document_id, "run_id": "run", "source_id": "source", "item": {}})
+    work.document_id = document_id
+    work.chunks = [{"content": content} for content in contents]
+    return work
+
+
+def test_embed_batch_spans_documents_and_isolates_a_failing_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[List[str]] = []
+
+    def _embed(*, texts: Any, model: str, api_key: str = "") -> List[List[float]]:
+        texts = list(texts)
+        calls.append(texts)
+        if any("poison" in text for text in texts):
+            raise RuntimeError("bad input")
+        return [[float(len(text))] for text in texts]
+
+    monkeypatch.setattr(worker, "embed_texts", _embed)
+    good, bad, empty = _work("good", ["a", "bb"]), _work("bad", ["poison"]), _work("empty", [])
+    worker._embed_chunk_batch([good, bad, empty], embedding={"model": "m", "api_key": ""})
+    assert calls == [["a", "bb", "poison"], ["a", "bb"], ["poison"]]
+    assert good.vectors == [[1.0], [2.0]] and not good.embedding_error
+    assert bad.embedding_error == "bad input"
+    assert empty.embedding_error == "empty chunk set"
+
+
+def test_pool_extraction_matches_inline_extraction() -> None:
+    html = "<html><head><title>Pool</title></head><body><p>" + "Extraction in a worker process. " * 20 + "</p></body></html>"
+    kwargs = {"raw_payload": html, "content_bytes": b"", "is_pdf": False, "url": "https://example.org/pool"}
+    assert run_extraction(processes=1, **kwargs) == extract_document(**kwargs)
+    assert run_extraction(processes=0, **kwargs) == extract_document(**kwargs)
+
+
+class _ArticlesHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.startswith("/feed-"):
+            # One article per feed: a source's own items are spaced by its rate limit.
+            n = self.path.rsplit("-", 1)[1]
+            item = f"<item><guid>stage-{n}</guid><link>{self.server.base_url}/article-{n}</link></item>"
+            self._send("application/rss+xml", f'<?xml version="1.0"?><rss version="2.0"><channel>{item}</channel></rss>')
+            return
+        paragraph = f"Staged pipeline fixture {self.path} about bounded queues and batched embedding. "
+        self._send("text/html", f"<html><head><title>{self.path}</title></head><body><p>{paragraph * 8}</p></body></html>")
+
+    def _send(self, content_type: str, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args: object, **_kwargs: object) -> None:
+        return
+
+
+def test_staged_worker_embeds_documents_in_one_batch_and_reports_stages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INTEL_HOST_THROTTLE_MS", "0")
+    monkeypatch.setenv("RESEARCH_PIPELINE_EXTRACT_PROCESSES", "1")
+    monkeypatch.setenv("RESEARCH_PIPELINE_EMBED_BATCH_TEXTS", "1000")
+    monkeypatch.setenv("RESEARCH_PIPELINE_EMBED_BATCH_WAIT_MS", "1000")
+    real_embed_texts = worker.embed_texts
+    embed_calls: List[int] = []
+
+    def _counting_embed(**kwargs: Any) -> List[List[float]]:
+        texts = list(kwargs.pop("texts"))
+        embed_calls.append(len(texts))
+        return real_embed_texts(texts=texts, **kwargs)
+
+    monkeypatch.setattr(worker, "embed_texts", _counting_embed)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ArticlesHandler)
+    server.daemon_threads = True
+    host, port = server.server_address
+    server.base_url = f"http://{host}:{port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings = Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+    client = TestClient(create_app(settings))
+    headers = {"Authorization": f"Bearer {settings.context_api_token}"}
+    topic_key = f"staged-{uuid.uuid4().hex[:8]}"
+    source_ids = []
+    for n in range(_ARTICLES):
+        upsert = client.post(
+            "/v2/research/sources/upsert",
+            json={
+                "topic_key": topic_key,
+                "kind": "rss",
+                "name": f"Staged feed {n}",
+                "base_url": f"{server.base_url}/feed-{n}",
+                "poll_interval_minutes": 60,
+                "rate_limit_per_hour": 3600,
+                "robots_mode": "ignore",
+                "enabled": True,
+                "tags": ["test"],
+            },
+            headers=headers,
+        )
+        assert upsert.status_code == 200
+        source_ids.append(upsert.json()["source_id"])
+    run = client.post(
+        "/v2/research/ingest/run",
+        json={"topic_key": topic_key, "source_ids": source_ids, "trigger": "manual"},
+        headers=headers,
+    )
+    assert run.status_code == 200
+    engine = create_db_engine(settings.database_url)
+    try:
+        assert worker.run_once(engine)
+        with engine.begin() as conn:
+            statuses = conn.execute(
+                sa.text("SELECT status, count(*) FROM research_documents WHERE topic_key = :topic_key GROUP BY status"),
+                {"topic_key": topic_key},
+            ).all()
+            chunks = conn.execute(
+                sa.text("SELECT count(*) FROM research_chunks WHERE topic_key = :topic_key"),
+                {"topic_key": topic_key},
+            ).scalar_one()
+    finally:
+        server.shutdown()
+        engine.dispose()
+
+    payload = client.get(f"/v2/research/ingest/runs/{run.json()['run_id']}", headers=headers).json()
+    assert payload["status"] == "completed"
+    assert payload["counters"]["items_new"] == _ARTICLES
+    assert dict(statuses) == {"embedded": _ARTICLES}
+    # All documents' chunks went out in a single embedding call.
+    assert embed_calls == [chunks]
+
+    progress = client.get(f"/v2/research/ops/progress?topic_key={topic_key}", headers=headers).json()
+    assert progress["stages"]["embedded"] == _ARTICLES
+    assert "enriched" in progress["stages"]
+    assert progress["pipeline_workers"] >= 1
+    stages = {row["stage"]: row for row in progress["pipeline_stages"]}
+    assert list(stages) == ["fetch", "extract", "enrich", "embed"]
+    for row in stages.values():
+        assert row["processed"] >= _ARTICLES
+        assert row["queue_depth"] == 0 and row["in_flight"] == 0
+        assert row["throughput_per_min"] > 0
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.research.pack_cache import ContextPackCache, context_pack_cache_key
+from app.storage.db import create_db_engine, get_research_corpus_version, upsert_research_source
+
+
+def test_context_pack_cache_key_normalises_request() -> None:
+    first = context_pack_cache_key({"query": "GPU  Supply", "source_ids": ["b", "a"], "max_items": 3})
+    second = context_pack_cache_key({"max_items": 3, "source_ids": ["a", "b"], "query": " gpu supply "})
+    other = context_pack_cache_key({"query": "gpu supply", "source_ids": ["a", "b"], "max_items": 4})
+    assert first == second
+    assert first != other
+
+
+def test_context_pack_cache_key_keeps_case_sensitive_filters_apart() -> None:
+    def key(**request):
+        return context_pack_cache_key({"request": {"query": "gpu supply", **request}, "topic_key": "ops"})
+
+    assert key(problem_tags=["Drift"], intervention_tags=["Scope "]) == key(problem_tags=["drift"], intervention_tags=["scope"])
+    assert key(source_ids=["Src_A"]) != key(source_ids=["src_a"])
+    assert key(content_types=["PDF"]) != key(content_types=["pdf"])
+
+
+def test_context_pack_cache_misses_on_corpus_version_change() -> None:
+    cache = ContextPackCache(max_entries=4, ttl_seconds=60)
+    cache.put("k", {"items": [1]}, corpus_version=1)
+    assert cache.get("k", corpus_version=1) == {"items": [1]}
+    assert cache.get("k", corpus_version=2) is None
+    assert cache.get("k", corpus_version=1) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["stale"] == 1
+    assert stats["misses"] == 2
+
+
+def test_context_pack_cache_evicts_least_recently_used() -> None:
+    cache = ContextPackCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", {"v": "a"}, corpus_version=1)
+    cache.put("b", {"v": "b"}, corpus_version=1)
+    assert cache.get("a", corpus_version=1) is not None
+    cache.put("c", {"v": "c"}, corpus_version=1, prewarm=True)
+    assert cache.get("b", corpus_version=1) is None
+    assert cache.get("a", corpus_version=1) is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["prewarmed"] == 1
+    assert stats["entries"] == 2
+
+
+def test_context_pack_cache_expires_entries_and_can_be_disabled(monkeypatch) -> None:
+    cache = ContextPackCache(max_entries=2, ttl_seconds=1)
+    cache.put("a", {"v": "a"}, corpus_version=1)
+    now = time.monotonic()
+    monkeypatch.setattr("app.research.pack_cache.time.monotonic", lambda: now + 5)
+    assert cache.get("a", corpus_version=1) is None
+
+    disabled = ContextPackCache(max_entries=0)
+    disabled.put("a", {"v": "a"}, corpus_version=1)
+    assert disabled.enabled is False
+    assert disabled.get("a", corpus_version=1) is None
+
+
+def test_context_pack_is_not_cached_when_the_query_embedding_fails(monkeypatch) -> None:
+    settings = Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+    app = create_app(settings)
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {settings.context_api_token}"}
+    calls = []
+
+    async def _failing_embed(**kwargs):
+        calls.append(kwargs["query"])
+        raise RuntimeError("embedding endpoint unavailable")
+
+    monkeypatch.setattr(app.state.query_embeddings, "embed_query_async", _failing_embed)
+    request = {"query": "gpu supply", "topic_key": f"pack-cache-{uuid.uuid4().hex[:8]}", "max_items": 2}
+    for _ in range(2):
+        response = client.post("/v2/research/context/pack", json=request, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["trace"]["cache_hit"] is False
+    assert len(calls) == 2
+    assert app.state.context_pack_cache.stats()["entries"] == 0
+
+
+def test_context_pack_releases_its_connection_while_the_query_embedding_is_pending(monkeypatch) -> None:
+    settings = Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+    app = create_app(settings)
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {settings.context_api_token}"}
+    checked_out = []
+
+    async def _slow_embed(**kwargs):
+        await asyncio.sleep(0.3)
+        checked_out.append(app.state.async_engine.pool.checkedout())
+        return []
+
+    monkeypatch.setattr(app.state.query_embeddings, "embed_query_async", _slow_embed)
+    request = {"query": "gpu supply", "topic_key": f"pack-release-{uuid.uuid4().hex[:8]}", "max_items": 2}
+    response = client.post("/v2/research/context/pack", json=request, headers=headers)
+    assert response.status_code == 200
+    assert checked_out == [0]
+
+
+def test_source_ranking_changes_bump_the_topic_corpus_version() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    topic_key = f"pack-source-{uuid.uuid4().hex[:8]}"
+    source = {
+        "source_id": f"src_{uuid.uuid4().hex[:8]}",
+        "topic_key": topic_key,
+        "kind": "rss",
+        "name": "Weighted feed",
+        "base_url_original": "https://weighted.example/feed",
+        "base_url_canonical": "https://weighted.example/feed",
+        "enabled": True,
+        "tags": [],
+        "publisher_type": "independent",
+        "source_class": "external_commentary",
+        "default_decision_domains": [],
+        "poll_interval_minutes": 60,
+        "rate_limit_per_hour": 30,
+        "robots_mode": "strict",
+        "max_items_per_run": 10,
+        "source_weight": 1.0,
+    }
+    upsert_research_source(engine, **source)
+    version = get_research_corpus_version(engine, topic_key=topic_key)
+
+    upsert_research_source(engine, **{**source, "poll_interval_minutes": 30})
+    assert get_research_corpus_version(engine, topic_key=topic_key) == version
+
+    upsert_research_source(engine, **{**source, "source_weight": 1.8})
+    assert get_research_corpus_version(engine, topic_key=topic_key) == version + 1
+
+    upsert_research_source(engine, **{**source, "source_weight": 1.8, "publisher_type": "vendor"})
+    assert get_research_corpus_version(engine, topic_key=topic_key) == version + 2
+    engine.dispose()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import pytest
+
 from app.research.chunking import chunk_document
 from app.research.embeddings import embed_texts
+from app.storage.vector_codec import decode_embedding_row, pack_vector, unpack_vector
 
 
 def test_chunk_document_is_deterministic() -> None:
@@ -20,3 +23,24 @@ def test_hash_embeddings_are_deterministic() -> None:
     assert first == second
     assert len(first) == 2
     assert len(first[0]) == 16
+
+
+def test_packed_float32_vectors_round_trip_exactly() -> None:
+    vector = embed_texts(texts=["alpha chunk"], model="hash-16")[0]
+    packed, scale = pack_vector(vector, encoding="float32")
+    assert scale is None
+    assert len(packed) == 16 * 4
+    assert unpack_vector(packed, encoding="float32").tolist() == pytest.approx(vector, abs=1e-6)
+
+
+@pytest.mark.parametrize("encoding,tolerance", [("float16", 1e-3), ("int8", 1e-2)])
+def test_compact_vector_encodings_stay_close(encoding: str, tolerance: float) -> None:
+    vector = [0.5, -0.25, 0.125, 0.0, 0.9]
+    packed, scale = pack_vector(vector, encoding=encoding)
+    row = {"vector": None, "vector_packed": packed, "vector_encoding": encoding, "vector_scale": scale}
+    assert decode_embedding_row(row).tolist() == pytest.approx(vector, abs=tolerance)
+
+
+def test_decode_embedding_row_falls_back_to_jsonb_vector() -> None:
+    row = {"vector": [1.0, 2.0], "vector_packed": None, "vector_encoding": None, "vector_scale": None}
+    assert decode_embedding_row(row).tolist() == [1.0, 2.0]
@@ -5,12 +5,43 @@ import threading
 import uuid
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
+import pytest
+import sqlalchemy as sa
 from fastapi.testclient import TestClient
 
 from app.config import Settings
 from app.main import create_app
+from app.research.ids import compute_document_id
 from app.research.worker import run_once
-from app.storage.db import count_research_query_logs, create_db_engine
+from app.storage.db import (
+    count_research_query_logs,
+    create_db_engine,
+    list_research_sources,
+    replace_research_chunks,
+    replace_research_document_insights,
+    search_research_chunk_candidates,
+    seed_research_documents,
+    unit_of_work,
+    upsert_research_source,
+)
+
+_SOURCE_UPSERT_FIELDS = (
+    "source_id",
+    "kind",
+    "name",
+    "base_url_original",
+    "base_url_canonical",
+    "enabled",
+    "tags",
+    "publisher_type",
+    "source_class",
+    "default_decision_domains",
+    "poll_interval_minutes",
+    "rate_limit_per_hour",
+    "robots_mode",
+    "max_items_per_run",
+    "source_weight",
+)
 
 
 class _RetrievalFixtureHandler(BaseHTTPRequestHandler):
@@ -154,6 +185,13 @@ def test_phase4_research_retrieval_and_query_logging() -> None:
     pack_data = pack.json()
     assert pack_data["pack"]["items"]
     assert pack_data["trace"]["trace_id"]
+    timing = pack_data["trace"]["timing_ms"]
+    assert timing["lexical_candidates"] > 0
+    assert timing["vector_candidates"] > 0
+    assert timing["fused_candidates"] >= timing["lexical_candidates"]
+    assert "total" in timing
+    assert {"cache_lookup", "lexical", "query_embedding", "vector", "scoring", "assembly"} <= set(timing)
+    assert 0 < timing["hydrated_chunks"] <= 2 * 3
     first_item = pack_data["pack"]["items"][0]
     assert first_item["document_id"]
     assert first_item["citations"]
@@ -162,6 +200,120 @@ def test_phase4_research_retrieval_and_query_logging() -> None:
     assert "topic_tags" in first_item
     assert "recommendations" in first_item
 
+    with engine.begin() as conn:
+        missing_vectors = conn.execute(
+            sa.text(
+                """
+                SELECT count(*)
+                FROM research_chunks c
+                JOIN research_documents d ON d.document_id = c.document_id
+                WHERE d.source_id = :source_id
+                  AND c.search_vector IS NULL
+                """
+            ),
+            {"source_id": source_id},
+        ).scalar_one()
+        mismatched_topics = conn.execute(
+            sa.text(
+                """
+                SELECT count(*)
+                FROM research_chunks c
+                JOIN research_documents d ON d.document_id = c.document_id
+                WHERE d.source_id = :source_id
+                  AND (d.topic_key <> :topic_key OR c.topic_key <> :topic_key)
+                """
+            ),
+            {"source_id": source_id, "topic_key": topic_key},
+        ).scalar_one()
+    assert missing_vectors == 0
+    assert mismatched_topics == 0
+
+    with engine.begin() as conn:
+        rollup = conn.execute(
+            sa.text(
+                """
+                SELECT
+                    (
+                        SELECT count(DISTINCT (i.document_id, i.chunk_id))
+                        FROM research_document_insights i
+                        JOIN research_documents d ON d.document_id = i.document_id
+                        WHERE d.source_id = :source_id
+                    ) AS insight_chunks,
+                    (
+                        SELECT count(*)
+                        FROM research_chunk_insight_rollup r
+                        JOIN research_documents d ON d.document_id = r.document_id
+                        WHERE d.source_id = :source_id
+                    ) AS rollup_rows
+                """
+            ),
+            {"source_id": source_id},
+        ).mappings().one()
+    assert rollup["rollup_rows"] == rollup["insight_chunks"] > 0
+
+    checkouts = []
+    sa.event.listen(app.state.async_engine.sync_engine, "checkout", lambda *args: checkouts.append(1))
+    drift_pack = client.post(
+        "/v2/research/context/pack",
+        json={"query": "gpu supply", "topic_key": topic_key, "max_items": 2, "problem_tags": ["Drift"]},
+        headers=headers,
+    )
+    assert drift_pack.status_code == 200
+    assert drift_pack.json()["trace"]["cache_hit"] is False
+    # Corpus version, candidate, missing-key and hydration queries share the request's connection.
+    assert len(checkouts) == 1
+    assert drift_pack.json()["pack"]["items"]
+    assert all("drift" in item["problem_tags"] for item in drift_pack.json()["pack"]["items"])
+
+    title_only = client.post(
+        "/v2/research/context/pack",
+        json={"query": "semiconductor", "topic_key": topic_key, "max_items": 2},
+        headers=headers,
+    )
+    assert title_only.status_code == 200
+    assert title_only.json()["pack"]["items"]
+
+    vector_only = client.post(
+        "/v2/research/context/pack",
+        json={"query": "zyxwv qwertz", "topic_key": topic_key, "max_items": 2},
+        headers=headers,
+    )
+    assert vector_only.status_code == 200
+    assert vector_only.json()["trace"]["timing_ms"]["lexical_candidates"] == 0
+    assert vector_only.json()["pack"]["items"]
+
+    with_metrics = client.post(
+        "/v2/research/context/pack",
+        json={"query": "gpu supply", "topic_key": topic_key, "max_items": 2, "must_have": ["metrics", "recent"]},
+        headers=headers,
+    )
+    assert with_metrics.status_code == 200
+    assert all(item["metrics"] for item in with_metrics.json()["pack"]["items"])
+    assert with_metrics.json()["trace"]["timing_ms"]["candidate_passes"] >= 1
+
+    internal_only = client.post(
+        "/v2/research/context/pack",
+        json={"query": "gpu supply", "topic_key": topic_key, "max_items": 2, "must_have": ["internal"]},
+        headers=headers,
+    )
+    assert internal_only.status_code == 200
+    assert internal_only.json()["pack"]["items"] == []
+    assert internal_only.json()["trace"]["timing_ms"]["lexical_candidates"] == 0
+
+    repeated = client.post(
+        "/v2/research/context/pack",
+        json={"query": "GPU  Supply", "topic_key": topic_key, "max_items": 2},
+        headers=headers,
+    )
+    assert repeated.status_code == 200
+    assert pack_data["trace"]["cache_hit"] is False
+    assert repeated.json()["trace"]["cache_hit"] is True
+    assert repeated.json()["trace"]["trace_id"] != pack_data["trace"]["trace_id"]
+    assert repeated.json()["pack"]["items"] == pack_data["pack"]["items"]
+    caches = client.get("/v2/research/ops/caches", headers=headers)
+    assert caches.status_code == 200
+    assert caches.json()["context_pack"]["hits"] >= 1
+
     chunks = client.post(
         f"/v2/research/documents/{first_item['document_id']}/chunks:search",
         json={"query": "supply", "max_chunks": 2, "max_chars": 180},
@@ -194,6 +346,7 @@ def test_phase4_research_retrieval_and_query_logging() -> None:
     assert topic_summary.status_code == 200
     assert topic_summary.json()["synthesis"]
     assert topic_summary.json()["citations"]
+    assert "lexical" in topic_summary.json()["trace"]["timing_ms"]
 
     decision = client.post(
         "/v2/research/decision/pack",
@@ -208,6 +361,7 @@ def test_phase4_research_retrieval_and_query_logging() -> None:
     decision_payload = decision.json()
     assert decision_payload["recommended_approach"]
     assert "supporting_evidence" in decision_payload
+    assert "decision_assembly" in decision_payload["trace"]["timing_ms"]
 
     weekly = client.get(f"/v2/research/topics/{topic_key}/weekly?days=30&limit=2", headers=headers)
     assert weekly.status_code == 200
@@ -234,6 +388,7 @@ def test_phase4_research_retrieval_and_query_logging() -> None:
     assert evidence_payload["items"]
     assert any("drift" in item["problem_tags"] for item in evidence_payload["items"])
     assert any(item["evidence_quality"] >= 0.7 for item in evidence_payload["items"])
+    assert "evidence_sql" in evidence_payload["trace"]["timing_ms"]
     first_evidence = evidence_payload["items"][0]
     assert first_evidence["document_id"]
     assert first_evidence["chunk_id"]
@@ -271,5 +426,162 @@ def test_phase4_research_retrieval_and_query_logging() -> None:
     assert compare_payload["clusters"]
     assert any(cluster["tradeoffs"] for cluster in compare_payload["clusters"])
 
+    app.state.telemetry.flush()
     assert count_research_query_logs(engine, topic_key=topic_key) >= 1
+    latency = client.get(f"/v2/research/ops/latency?topic_key={topic_key}", headers=headers)
+    assert latency.status_code == 200
+    latency_rows = {(row["endpoint"], row["stage"]): row for row in latency.json()["stages"]}
+    assert latency_rows[("context_pack", "total")]["samples"] >= 1
+    assert ("context_pack", "lexical") in latency_rows
+    assert ("evidence_search", "evidence_sql") in latency_rows
+    assert ("topic_summarize", "lexical") in latency_rows
+    assert ("decision_pack", "decision_assembly") in latency_rows
+
+    query_logs_before = count_research_query_logs(engine, topic_key=topic_key)
+
+    suppressed = client.post(f"/v2/research/documents/{first_item['document_id']}/suppress", headers=headers)
+    assert suppressed.status_code == 200
+    after_suppress = client.post(
+        "/v2/research/context/pack",
+        json={"query": "gpu supply", "topic_key": topic_key, "max_items": 2},
+        headers=headers,
+    )
+    assert after_suppress.status_code == 200
+    assert after_suppress.json()["trace"]["cache_hit"] is False
+    app.state.telemetry.flush()
+    assert count_research_query_logs(engine, topic_key=topic_key) == query_logs_before + 1
+    caches = client.get("/v2/research/ops/caches", headers=headers)
+    assert caches.json()["query_embedding"]["hits"] >= 1
+    pools = client.get("/v2/research/ops/pool", headers=headers)
+    assert pools.status_code == 200
+    pool_rows = {(row["role"], row["engine"]): row for row in pools.json()["pools"]}
+    assert set(pool_rows) == {("api", "sync"), ("api", "async")}
+    assert pool_rows[("api", "async")]["checkouts"] >= 1
+    assert pool_rows[("api", "async")]["checked_out"] == 0
+    assert client.get("/metrics").status_code == 401
+    metrics = client.get("/metrics", headers=headers)
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'context_api_http_requests_total{method="POST",route="/v2/research/context/pack",status="200"}' in metrics.text
+    assert 'context_api_retrieval_stage_seconds_count{endpoint="context_pack",stage="lexical"}' in metrics.text
+    assert 'context_api_db_pool_checkouts_total{role="api",engine="async"}' in metrics.text
+    assert 'context_api_cache_events_total{cache="query_embedding",event="hits"}' in metrics.text
+
+    moved_topic_key = f"{topic_key}-moved"
+    source = list_research_sources(engine, topic_key=topic_key)[0]
+    upsert_research_source(
+        engine,
+        **{key: source[key] for key in _SOURCE_UPSERT_FIELDS},
+        topic_key=moved_topic_key,
+    )
+    old_topic_pack = client.post(
+        "/v2/research/context/pack",
+        json={"query": "semiconductor", "topic_key": topic_key, "max_items": 2},
+        headers=headers,
+    )
+    assert old_topic_pack.json()["pack"]["items"] == []
+    moved_pack = client.post(
+        "/v2/research/context/pack",
+        json={"query": "semiconductor", "topic_key": moved_topic_key, "max_items": 2},
+        headers=headers,
+    )
+    assert moved_pack.json()["pack"]["items"]
     server.shutdown()
+
+
+def test_combined_insight_filters_must_match_a_single_insight() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    topic_key = f"insight-filters-{uuid.uuid4().hex[:8]}"
+    source_id = f"src_{topic_key}"
+    upsert_research_source(
+        engine,
+        source_id=source_id,
+        topic_key=topic_key,
+        kind="rss",
+        name="Insight filters",
+        base_url_original=f"https://{source_id}.example/feed",
+        base_url_canonical=f"https://{source_id}.example/feed",
+        enabled=True,
+        tags=[],
+        publisher_type="independent",
+        source_class="external_commentary",
+        default_decision_domains=[],
+        poll_interval_minutes=60,
+        rate_limit_per_hour=30,
+        robots_mode="ignore",
+        max_items_per_run=10,
+        source_weight=1.0,
+    )
+    url = f"https://{source_id}.example/planning"
+    document_id = compute_document_id(source_id=source_id, canonical_url=url)
+    seed_research_documents(engine, source_id=source_id, run_id=None, items=[{"document_id": document_id, "canonical_url": url, "url_original": url}])
+    with engine.begin() as conn:
+        conn.execute(sa.text("UPDATE research_documents SET status = 'enriched' WHERE document_id = :document_id"), {"document_id": document_id})
+    replace_research_chunks(
+        engine,
+        document_id=document_id,
+        chunks=[{"chunk_id": chunk_id, "ordinal": n, "content": "Planning drift needs tighter scope."} for n, chunk_id in enumerate(["split", "joint"])],
+    )
+    replace_research_document_insights(
+        engine,
+        document_id=document_id,
+        insights=[
+            {"chunk_id": "split", "insight_type": "problem", "text": "Plans drift.", "problem_tags": ["drift"]},
+            {"chunk_id": "split", "insight_type": "recommendation", "text": "Narrow scope.", "intervention_tags": ["scope_narrowing"]},
+            {
+                "chunk_id": "joint",
+                "insight_type": "recommendation",
+                "text": "Narrow scope when plans drift.",
+                "problem_tags": ["drift"],
+                "intervention_tags": ["scope_narrowing"],
+            },
+        ],
+    )
+
+    def _chunks(**filters: object) -> list:
+        rows = search_research_chunk_candidates(engine, topic_key=topic_key, query="planning drift", **filters)
+        return sorted(row["chunk_id"] for row in rows)
+
+    assert _chunks(problem_tags=["drift"]) == ["joint", "split"]
+    assert _chunks(problem_tags=["drift"], intervention_tags=["scope_narrowing"]) == ["joint"]
+    assert _chunks(problem_tags=["drift"], evidence_types=["recommendation"]) == ["joint"]
+    assert _chunks(problem_tags=["drift"], evidence_types=["problem", "recommendation"]) == ["joint", "split"]
+    engine.dispose()
+
+
+def test_unit_of_work_rolls_back_every_call_on_error() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    topic_key = f"uow-{uuid.uuid4().hex[:8]}"
+    source = {
+        "kind": "rss",
+        "name": "Unit of work feed",
+        "enabled": True,
+        "tags": [],
+        "publisher_type": "independent",
+        "source_class": "external_commentary",
+        "default_decision_domains": [],
+        "poll_interval_minutes": 60,
+        "rate_limit_per_hour": 30,
+        "robots_mode": "strict",
+        "max_items_per_run": 10,
+        "source_weight": 1.0,
+    }
+    with pytest.raises(RuntimeError):
+        with unit_of_work(engine) as uow:
+            for index in range(2):
+                url = f"https://example.com/{topic_key}/{index}"
+                upsert_research_source(
+                    uow,
+                    source_id=f"{topic_key}-{index}",
+                    topic_key=topic_key,
+                    base_url_original=url,
+                    base_url_canonical=url,
+                    **source,
+                )
+            assert len(list_research_sources(uow, topic_key=topic_key)) == 2
+            raise RuntimeError("abort")
+    assert list_research_sources(engine, topic_key=topic_key) == []
+
+    with unit_of_work(engine) as uow:
+        with unit_of_work(uow) as nested:
+            assert nested is uow
@@ -178,6 +178,10 @@ def test_phase5_feedback_and_ops_summary() -> None:
     storage_payload = storage.json()
     assert int(storage_payload["documents_count"]) >= 1
     assert int(storage_payload["total_bytes"]) >= 1
+    assert int(storage_payload["embeddings_packed_count"]) >= 1
+    assert int(storage_payload["embeddings_jsonb_count"]) == 0
+    assert int(storage_payload["embedding_read_sample_rows"]) >= 1
+    assert float(storage_payload["embedding_read_ms"]) >= 0.0
 
     progress = client.get(f"/v2/research/ops/progress?topic_key={topic_key}&run_limit=5", headers=headers)
     assert progress.status_code == 200
@@ -4,7 +4,12 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from app.research.scoring import blend_score, cosine_similarity, recency_score
+from app.research.scoring import (
+    blend_score,
+    cosine_similarity,
+    recency_score,
+    reciprocal_rank_fusion,
+)
 
 
 def test_cosine_similarity_for_identical_vectors() -> None:
@@ -38,3 +43,11 @@ def test_blend_score_respects_custom_weights() -> None:
         source_weight_factor=0.05,
     )
     assert default["total"] > custom["total"]
+
+
+def test_reciprocal_rank_fusion_rewards_agreement() -> None:
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]], k=60)
+    assert fused["b"] == pytest.approx(1.0 / 62 + 1.0 / 61)
+    assert max(fused, key=fused.get) == "b"
+    assert fused["a"] > fused["c"]
+    assert set(fused) == {"a", "b", "c", "d"}
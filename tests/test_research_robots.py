@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.research import worker
+from app.research.robots import RobotsPolicyCache, ttl_from_headers
+from app.storage.db import create_db_engine
+
+_ROBOTS_BODY = "User-agent: *\nDisallow: /private\nCrawl-delay: 2\n"
+
+
+class _FakeFetcher:
+    def __init__(self, status_code: int, body: str = "", headers: Dict[str, str] | None = None, delay_s: float = 0.0) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+        self.delay_s = delay_s
+        self.calls: List[str] = []
+
+    def __call__(self, url: str) -> Dict[str, Any]:
+        self.calls.append(url)
+        time.sleep(self.delay_s)
+        return {"status_code": self.status_code, "html": self.body, "headers": self.headers}
+
+
+def test_robots_cache_serves_policy_and_crawl_delay_from_one_fetch() -> None:
+    fetcher = _FakeFetcher(200, _ROBOTS_BODY, {"cache-control": "public, max-age=3600"})
+    cache = RobotsPolicyCache(fetcher=fetcher)
+    policy, result = cache.lookup("https://Example.org/articles/1")
+    assert result == "miss"
+    assert policy.allows("https://example.org/articles/1", "context_api/1.0")
+    assert not policy.allows("https://example.org/private/a", "context_api/1.0")
+    assert policy.crawl_delay("context_api/1.0") == 2.0
+    assert 3500 < policy.expires_at - time.monotonic() <= 3600
+
+    again, result = cache.lookup("https://example.org/private/b")
+    assert (again, result) == (policy, "hit")
+    assert fetcher.calls == ["https://example.org/robots.txt"]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_robots_cache_negative_caches_missing_and_failing_robots() -> None:
+    missing = _FakeFetcher(404)
+    cache = RobotsPolicyCache(fetcher=missing, default_ttl_seconds=3600)
+    policy, result = cache.lookup("https://nofile.example/a")
+    assert result == "miss" and policy.allows("https://nofile.example/a", "bot")
+    assert cache.lookup("https://nofile.example/b")[1] == "hit"
+    assert len(missing.calls) == 1
+
+    failing = _FakeFetcher(503, "User-agent: *\nDisallow: /\n")
+    cache = RobotsPolicyCache(fetcher=failing, error_ttl_seconds=60)
+    policy, result = cache.lookup("https://down.example/a")
+    assert result == "error"
+    assert policy.allows("https://down.example/a", "bot")
+    assert policy.expires_at - time.monotonic() <= 60
+    assert cache.lookup("https://down.example/b")[1] == "hit"
+    assert cache.stats()["errors"] == 1
+
+
+def test_robots_cache_coalesces_concurrent_lookups_per_origin() -> None:
+    fetcher = _FakeFetcher(200, _ROBOTS_BODY, delay_s=0.2)
+    cache = RobotsPolicyCache(fetcher=fetcher)
+    results: List[str] = []
+    threads = [threading.Thread(target=lambda: results.append(cache.lookup("https://busy.example/x")[1])) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(fetcher.calls) == 1
+    assert sorted(results) == ["coalesced"] * 4 + ["miss"]
+
+
+def test_ttl_from_headers_honours_cache_control_and_expires() -> None:
+    bounds = {"default": 86_400, "minimum": 300, "maximum": 86_400}
+    assert ttl_from_headers({}, **bounds) == 86_400
+    assert ttl_from_headers({"cache-control": "max-age=7200"}, **bounds) == 7200
+    assert ttl_from_headers({"cache-control": "max-age=5"}, **bounds) == 300
+    assert ttl_from_headers({"cache-control": "max-age=999999"}, **bounds) == 86_400
+    assert ttl_from_headers({"cache-control": "no-cache"}, **bounds) == 300
+    assert ttl_from_headers({"expires": "Thu, 01 Jan 1970 00:00:00 GMT"}, **bounds) == 300
+
+
+def test_robots_cache_shares_policies_through_postgres() -> None:
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    origin_url = f"https://{uuid.uuid4().hex[:8]}.example/a"
+    first_fetcher = _FakeFetcher(200, _ROBOTS_BODY)
+    first = RobotsPolicyCache(engine=engine, shared=True, fetcher=first_fetcher)
+    assert first.lookup(origin_url)[1] == "miss"
+
+    second_fetcher = _FakeFetcher(500)
+    second = RobotsPolicyCache(engine=engine, shared=True, fetcher=second_fetcher)
+    policy, result = second.lookup(origin_url)
+    assert result == "shared_hit"
+    assert second_fetcher.calls == []
+    assert policy.crawl_delay("bot") == 2.0
+    assert not policy.allows(origin_url.replace("/a", "/private/1"), "bot")
+    engine.dispose()
+
+
+class _RobotsFixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path == "/robots.txt":
+            with self.server.lock:
+                self.server.robots_fetches += 1
+            time.sleep(0.1)
+            self._send(200, "text/plain", "User-agent: *\nDisallow: /private\n")
+            return
+        if self.path == "/feed":
+            links = ["/article-1", "/article-2", "/private/article-3"]
+            items = "".join(f"<item><guid>{link}</guid><link>{self.server.base_url}{link}</link></item>" for link in links)
+            self._send(200, "application/rss+xml", f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>')
+            return
+        paragraph = f"Robots fixture article {self.path} about crawler politeness and caching. "
+        self._send(200, "text/html", f"<html><head><title>{self.path}</title></head><body><p>{paragraph * 5}</p></body></html>")
+
+    def _send(self, status: int, content_type: str, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args: object, **_kwargs: object) -> None:
+        return
+
+
+def test_worker_fetches_robots_once_per_host_and_reports_run_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INTEL_HOST_THROTTLE_MS", "0")
+    monkeypatch.setattr(worker, "_ROBOTS_CACHE", None)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RobotsFixtureHandler)
+    server.daemon_threads = True
+    host, port = server.server_address
+    server.base_url = f"http://{host}:{port}"
+    server.lock = threading.Lock()
+    server.robots_fetches = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings = Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+    client = TestClient(create_app(settings))
+    headers = {"Authorization": f"Bearer {settings.context_api_token}"}
+    topic_key = f"robots-{uuid.uuid4().hex[:8]}"
+    upsert = client.post(
+        "/v2/research/sources/upsert",
+        json={
+            "topic_key": topic_key,
+            "kind": "rss",
+            "name": "Robots feed",
+            "base_url": f"{server.base_url}/feed",
+            "poll_interval_minutes": 60,
+            "rate_limit_per_hour": 3600,
+            "robots_mode": "strict",
+            "enabled": True,
+            "tags": ["test"],
+        },
+        headers=headers,
+    )
+    assert upsert.status_code == 200
+    run = client.post(
+        "/v2/research/ingest/run",
+        json={"topic_key": topic_key, "source_ids": [upsert.json()["source_id"]], "trigger": "manual"},
+        headers=headers,
+    )
+    assert run.status_code == 200
+    engine = create_db_engine(settings.database_url)
+    try:
+        assert worker.run_once(engine)
+    finally:
+        server.shutdown()
+        engine.dispose()
+
+    payload = client.get(f"/v2/research/ingest/runs/{run.json()['run_id']}", headers=headers).json()
+    assert payload["status"] == "completed"
+    assert payload["counters"]["items_new"] == 2
+    assert payload["counters"]["items_failed"] == 1
+    assert any("robots_blocked" in error for error in payload["errors"])
+    assert payload["metrics"] == {"robots_cache_hits": 2.0, "robots_cache_misses": 1.0}
+    assert server.robots_fetches == 1
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.research.benchmark.corpus import SyntheticCorpusSpec, seed_synthetic_corpus
+from app.storage.db import create_db_engine
+
+
+def _build_settings() -> Settings:
+    return Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+
+
+def _pack(client: TestClient, token: str, request: dict) -> dict:
+    response = client.post("/v2/research/context/pack", json=request, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_sql_scoring_matches_python_scoring(monkeypatch) -> None:
+    settings = _build_settings()
+    topic_key = f"sqlscore-{uuid.uuid4().hex[:8]}"
+    spec = SyntheticCorpusSpec(
+        topic_key=topic_key,
+        sources=3,
+        documents=24,
+        chunks_per_document=6,
+        words_per_chunk=40,
+        embedding_mode="hash",
+    )
+    seed_synthetic_corpus(create_db_engine(settings.database_url), spec)
+
+    requests = [
+        {"query": "retrieval ranking latency", "max_items": 5},
+        {"query": "gpu supply capacity", "max_items": 3, "intent_mode": "decision_support", "decision_domain": "retrieval"},
+        {"query": "evaluation benchmark", "max_items": 4, "intent_mode": "editorial"},
+        {"query": "agent planning tool", "max_items": 3, "min_relevance_score": 0.5},
+        {"query": "zyxwv qwertz", "max_items": 3},
+    ]
+    packs = {}
+    for mode in ("false", "true"):
+        monkeypatch.setenv("RESEARCH_SQL_SCORING", mode)
+        client = TestClient(create_app(settings))
+        packs[mode] = [_pack(client, settings.context_api_token, {**request, "topic_key": topic_key}) for request in requests]
+
+    for python_pack, sql_pack in zip(packs["false"], packs["true"]):
+        python_items = python_pack["pack"]["items"]
+        sql_items = sql_pack["pack"]["items"]
+        assert [item["document_id"] for item in sql_items] == [item["document_id"] for item in python_items]
+        assert [item["citations"] for item in sql_items] == [item["citations"] for item in python_items]
+        for python_item, sql_item in zip(python_items, sql_items):
+            for name, value in python_item["score_breakdown"].items():
+                assert abs(sql_item["score_breakdown"][name] - value) < 1e-6
+        assert sql_pack["retrieval_confidence"] == python_pack["retrieval_confidence"]
+    assert any(pack["pack"]["items"] for pack in packs["true"])
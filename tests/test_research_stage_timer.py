@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import time
+
+from app.research.stage_timer import StageTimer
+
+
+def test_stage_timer_accumulates_named_stages_and_counts() -> None:
+    timer = StageTimer()
+    with timer.stage("lexical"):
+        time.sleep(0.002)
+    started = time.perf_counter()
+    timer.record("lexical", started)
+    timer.count("lexical_candidates", 7)
+
+    timing = timer.trace_timing()
+    assert timing["lexical"] >= 2
+    assert timing["lexical_candidates"] == 7
+    assert timing["total"] >= timing["lexical"]
+    assert "lexical_candidates" not in timer.stages
+
+
+def test_stage_timer_records_stage_when_block_raises() -> None:
+    timer = StageTimer()
+    try:
+        with timer.stage("evidence_sql"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert "evidence_sql" in timer.stages
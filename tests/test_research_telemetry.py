@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List
+
+from app.research.telemetry import ResearchTelemetryWriter
+
+
+class _RecordingWriter:
+    def __init__(self, *, gate: threading.Event | None = None) -> None:
+        self.batches: List[Dict[str, List[Dict[str, Any]]]] = []
+        self.gate = gate
+
+    def __call__(self, engine: Any, *, query_logs: List[Dict[str, Any]], relevance_scores: List[Dict[str, Any]]) -> Dict[str, int]:
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.batches.append({"query_logs": list(query_logs), "relevance_scores": list(relevance_scores)})
+        return {"query_logs": len(query_logs), "relevance_scores": len(relevance_scores)}
+
+
+def _query_log_fields(trace_id: str) -> Dict[str, Any]:
+    return {
+        "trace_id": trace_id,
+        "topic_key": "telemetry",
+        "query_text": "gpu supply",
+        "source_ids": [],
+        "token_budget": None,
+        "max_items": 3,
+        "recency_days": None,
+        "min_relevance_score": None,
+        "candidate_count": 2,
+        "returned_document_ids": ["doc-1"],
+        "returned_chunk_ids": ["chunk-1"],
+        "timing_ms": 4,
+    }
+
+
+def test_telemetry_writer_batches_query_logs_and_scores() -> None:
+    writer = _RecordingWriter()
+    telemetry = ResearchTelemetryWriter(None, max_queue=100, batch_size=50, writer=writer)
+    gate = threading.Event()
+    writer.gate = gate
+    query_log_id = telemetry.submit_query_log(**_query_log_fields("trace-1"))
+    written = telemetry.submit_relevance_scores(
+        trace_id="trace-1",
+        topic_key="telemetry",
+        query_text="gpu supply",
+        items=[
+            {"document_id": "doc-1", "chunk_id": "chunk-1", "score_total": 0.9},
+            {"document_id": "", "chunk_id": "chunk-x"},
+        ],
+    )
+    assert query_log_id
+    assert written == 1
+    assert telemetry.is_pending("trace-1")
+    gate.set()
+    telemetry.ensure_written("trace-1")
+    assert not telemetry.is_pending("trace-1")
+    query_logs = [row for batch in writer.batches for row in batch["query_logs"]]
+    scores = [row for batch in writer.batches for row in batch["relevance_scores"]]
+    assert [str(row["query_log_id"]) for row in query_logs] == [query_log_id]
+    assert [row["chunk_id"] for row in scores] == ["chunk-1"]
+    stats = telemetry.stats()
+    assert stats["written_query_logs"] == 1
+    assert stats["written_relevance_scores"] == 1
+    assert stats["queued"] == 0
+    telemetry.close()
+
+
+def test_telemetry_writer_drops_and_counts_on_overflow() -> None:
+    gate = threading.Event()
+    writer = _RecordingWriter(gate=gate)
+    telemetry = ResearchTelemetryWriter(None, max_queue=1, batch_size=1, flush_interval_seconds=60, writer=writer)
+    telemetry._ensure_thread = lambda: None  # keep the queue full for the assertion
+    telemetry.submit_query_log(**_query_log_fields("trace-a"))
+    telemetry.submit_query_log(**_query_log_fields("trace-b"))
+    stats = telemetry.stats()
+    assert stats["dropped"] == 1
+    assert stats["queued"] == 1
+    gate.set()
+    telemetry.close()
+    assert [row["trace_id"] for batch in writer.batches for row in batch["query_logs"]] == ["trace-a"]
+
+
+def test_telemetry_writer_block_policy_waits_for_space() -> None:
+    writer = _RecordingWriter()
+    telemetry = ResearchTelemetryWriter(
+        None,
+        max_queue=1,
+        batch_size=1,
+        flush_interval_seconds=0.01,
+        overflow="block",
+        writer=writer,
+    )
+    for idx in range(5):
+        telemetry.submit_query_log(**_query_log_fields(f"trace-{idx}"))
+    telemetry.close()
+    stats = telemetry.stats()
+    assert stats["dropped"] == 0
+    assert stats["written_query_logs"] == 5
+
+
+def test_telemetry_writer_disabled_writes_synchronously() -> None:
+    writer = _RecordingWriter()
+    telemetry = ResearchTelemetryWriter(None, max_queue=0, writer=writer)
+    telemetry.submit_query_log(**_query_log_fields("trace-sync"))
+    assert len(writer.batches) == 1
+    assert not telemetry.is_pending("trace-sync")
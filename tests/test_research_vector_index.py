@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+from app.research import vector_index as vector_index_module
+from app.research.vector_index import TopicVectorIndex
+
+
+def _install_store(monkeypatch: pytest.MonkeyPatch, rows: List[Dict[str, Any]], suppressed: List[datetime] | None = None) -> None:
+    suppressed = suppressed if suppressed is not None else []
+
+    def fake_corpus_version(engine: Any, *, topic_key: str) -> int:
+        # Any change to the stored rows or suppressions stands in for a version bump.
+        return hash((tuple(id(row) for row in rows), tuple(suppressed)))
+
+    def fake_watermark(engine: Any, *, topic_key: str, embedding_model_id: str) -> Dict[str, Any]:
+        return {
+            "embedding_count": len(rows),
+            "max_created_at": max((row["created_at"] for row in rows), default=None),
+            "max_suppressed_at": max(suppressed, default=None),
+        }
+
+    def fake_list(
+        engine: Any,
+        *,
+        topic_key: str,
+        embedding_model_id: str,
+        source_ids: Any = None,
+        created_since: Any = None,
+    ) -> List[Dict[str, Any]]:
+        return [dict(row) for row in rows if created_since is None or row["created_at"] >= created_since]
+
+    monkeypatch.setattr(vector_index_module, "get_research_corpus_version", fake_corpus_version)
+    monkeypatch.setattr(vector_index_module, "get_research_embedding_watermark", fake_watermark)
+    monkeypatch.setattr(vector_index_module, "list_research_embeddings_for_topic", fake_list)
+
+
+def _row(document_id: str, chunk_id: str, vector: List[float], created_at: datetime, source_id: str = "src-a") -> Dict[str, Any]:
+    return {
+        "document_id": document_id,
+        "chunk_id": chunk_id,
+        "source_id": source_id,
+        "vector": vector,
+        "created_at": created_at,
+    }
+
+
+def test_topic_vector_index_ranks_by_cosine_and_filters_sources(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [
+        _row("doc-1", "c1", [1.0, 0.0, 0.0], now),
+        _row("doc-1", "c2", [0.0, 3.0, 0.0], now),
+        _row("doc-2", "c1", [2.0, 0.2, 0.0], now, source_id="src-b"),
+    ]
+    _install_store(monkeypatch, rows)
+    index = TopicVectorIndex(topic_key="topic", embedding_model_id="hash-3")
+    index.refresh(None)
+
+    assert len(index) == 3
+    assert index.dimensions == 3
+    ranked = index.search([1.0, 0.0, 0.0], k=2)
+    assert [key for key, _ in ranked] == [("doc-1", "c1"), ("doc-2", "c1")]
+    assert ranked[0][1] == pytest.approx(1.0)
+
+    filtered = index.search([1.0, 0.0, 0.0], k=5, source_ids=["src-a"])
+    assert [key for key, _ in filtered] == [("doc-1", "c1"), ("doc-1", "c2")]
+
+    scores = index.score([0.0, 1.0, 0.0], [("doc-1", "c2"), ("missing", "c9")])
+    assert scores == {("doc-1", "c2"): pytest.approx(1.0)}
+
+
+def test_topic_vector_index_refreshes_incrementally_and_rebuilds_on_deletes(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [_row("doc-1", "c1", [1.0, 0.0], now)]
+    _install_store(monkeypatch, rows)
+    index = TopicVectorIndex(topic_key="topic", embedding_model_id="hash-2")
+    index.refresh(None)
+    assert index.full_builds == 1
+
+    rows.append(_row("doc-2", "c1", [0.0, 1.0], now + timedelta(seconds=1)))
+    rows[0] = _row("doc-1", "c1", [0.0, -1.0], now + timedelta(seconds=1))
+    index.refresh(None)
+    assert index.full_builds == 1
+    assert index.incremental_refreshes == 1
+    assert len(index) == 2
+    assert index.score([0.0, 1.0], [("doc-1", "c1")])[("doc-1", "c1")] == pytest.approx(-1.0)
+
+    rows.pop()
+    index.refresh(None)
+    assert index.full_builds == 2
+    assert len(index) == 1
+
+
+
+def test_topic_vector_index_rebuilds_on_suppression_even_when_the_count_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [_row("doc-1", "c1", [1.0, 0.0], now), _row("doc-2", "c1", [0.0, 1.0], now)]
+    suppressed: List[datetime] = []
+    _install_store(monkeypatch, rows, suppressed)
+    index = TopicVectorIndex(topic_key="topic", embedding_model_id="hash-2")
+    index.refresh(None)
+    assert index.full_builds == 1
+
+    # doc-1 is suppressed while doc-3 commits late, behind the created_at watermark; the
+    # embedding count is unchanged and no rows are newer than the watermark.
+    rows[0] = _row("doc-3", "c1", [1.0, 1.0], now - timedelta(seconds=1))
+    suppressed.append(now + timedelta(seconds=1))
+    index.refresh(None)
+    assert index.full_builds == 2
+    assert [key for key, _ in index.search([1.0, 0.0], k=5)] == [("doc-3", "c1"), ("doc-2", "c1")]
+
+    rows.append(_row("doc-4", "c1", [1.0, 0.0], now + timedelta(seconds=2)))
+    index.refresh(None)
+    assert (index.full_builds, index.incremental_refreshes, len(index)) == (2, 1, 3)
+
+
+def test_topic_vector_index_skips_the_watermark_query_while_the_corpus_version_is_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [_row("doc-1", "c1", [1.0, 0.0], now)]
+    _install_store(monkeypatch, rows)
+    real_watermark = vector_index_module.get_research_embedding_watermark
+    watermark_calls: List[str] = []
+
+    def counting_watermark(engine: Any, **kwargs: Any) -> Dict[str, Any]:
+        watermark_calls.append(kwargs["topic_key"])
+        return real_watermark(engine, **kwargs)
+
+    monkeypatch.setattr(vector_index_module, "get_research_embedding_watermark", counting_watermark)
+    index = TopicVectorIndex(topic_key="topic", embedding_model_id="hash-2")
+    for _ in range(3):
+        index.refresh(None)
+    assert len(watermark_calls) == 1
+
+    rows.append(_row("doc-2", "c1", [0.0, 1.0], now + timedelta(seconds=1)))
+    index.refresh(None)
+    index.refresh(None)
+    assert len(watermark_calls) == 2
+    assert (index.full_builds, index.incremental_refreshes, len(index)) == (1, 1, 2)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.research.worker import run_once
+from app.storage.db import create_db_engine
+
+_RESPONSE_DELAY_S = 0.2
+
+
+class _SlowFixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path == "/robots.txt":
+            self._send(200, "text/plain", "User-agent: *\nAllow: /\n")
+            return
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.started.append(time.monotonic())
+        try:
+            time.sleep(_RESPONSE_DELAY_S)
+            parts = self.path.strip("/").split("/")
+            if len(parts) == 1 and parts[0].startswith("feed-"):
+                feed = parts[0]
+                items = "".join(
+                    f"<item><guid>{feed}-{n}</guid><link>{server.base_url}/{feed}/article-{n}</link></item>"
+                    for n in (1, 2)
+                )
+                body = f'<?xml version="1.0" encoding="UTF-8" ?><rss version="2.0"><channel><title>{feed}</title>{items}</channel></rss>'
+                self._send(200, "application/rss+xml", body)
+                return
+            if len(parts) == 2 and parts[1].startswith("article-"):
+                paragraph = f"Concurrency fixture article {parts[0]} {parts[1]} about retrieval pipelines and ingestion throughput. "
+                self._send(200, "text/html", f"<html><head><title>{parts[0]} {parts[1]}</title></head><body><p>{paragraph * 6}</p></body></html>")
+                return
+            self._send(404, "text/plain", "")
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status: int, content_type: str, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args: object, **_kwargs: object) -> None:
+        return
+
+
+def _start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowFixtureHandler)
+    server.daemon_threads = True
+    host, port = server.server_address
+    server.base_url = f"http://{host}:{port}"
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.started = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _build_settings() -> Settings:
+    return Settings(
+        database_url=os.environ["DATABASE_URL"],
+        context_api_token=os.environ.get("CONTEXT_API_TOKEN", "change-me"),
+        version="0.0.0",
+        git_sha="test",
+    )
+
+
+def _run_topic(feed_urls: List[str]) -> tuple[float, dict]:
+    settings = _build_settings()
+    client = TestClient(create_app(settings))
+    headers = {"Authorization": f"Bearer {settings.context_api_token}"}
+    topic_key = f"concurrency-{uuid.uuid4().hex[:8]}"
+    source_ids = []
+    for index, feed_url in enumerate(feed_urls):
+        upsert = client.post(
+            "/v2/research/sources/upsert",
+            json={
+                "topic_key": topic_key,
+                "kind": "rss",
+                "name": f"Concurrency feed {index}",
+                "base_url": feed_url,
+                "poll_interval_minutes": 60,
+                "rate_limit_per_hour": 3600,
+                "robots_mode": "strict",
+                "enabled": True,
+                "tags": ["test"],
+            },
+            headers=headers,
+        )
+        assert upsert.status_code == 200
+        source_ids.append(upsert.json()["source_id"])
+    run = client.post(
+        "/v2/research/ingest/run",
+        json={"topic_key": topic_key, "source_ids": source_ids, "trigger": "manual"},
+        headers=headers,
+    )
+    assert run.status_code == 200
+    engine = create_db_engine(settings.database_url)
+    started = time.perf_counter()
+    assert run_once(engine)
+    elapsed = time.perf_counter() - started
+    status = client.get(f"/v2/research/ingest/runs/{run.json()['run_id']}", headers=headers)
+    assert status.status_code == 200
+    engine.dispose()
+    return elapsed, status.json()
+
+
+def test_concurrent_sources_speed_up_runs_across_hosts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INTEL_HOST_THROTTLE_MS", "0")
+    servers = [_start_server() for _ in range(8)]
+    try:
+        monkeypatch.setenv("RESEARCH_RUN_SOURCE_CONCURRENCY", "1")
+        monkeypatch.setenv("RESEARCH_DOCUMENT_JOB_CONCURRENCY", "1")
+        sequential_s, sequential = _run_topic([f"{server.base_url}/feed-a" for server in servers[:4]])
+        monkeypatch.setenv("RESEARCH_RUN_SOURCE_CONCURRENCY", "4")
+        monkeypatch.setenv("RESEARCH_DOCUMENT_JOB_CONCURRENCY", "4")
+        concurrent_s, concurrent = _run_topic([f"{server.base_url}/feed-a" for server in servers[4:]])
+    finally:
+        for server in servers:
+            server.shutdown()
+
+    for payload in (sequential, concurrent):
+        assert payload["status"] == "completed"
+        assert payload["counters"]["items_seen"] == 8
+        assert payload["counters"]["items_new"] == 8
+        assert payload["counters"]["items_failed"] == 0
+    # Each source makes three slow requests; four hosts in parallel should take roughly a quarter.
+    assert sequential_s >= 4 * 3 * _RESPONSE_DELAY_S
+    assert concurrent_s < sequential_s * 0.6
+
+
+def test_sources_on_one_host_share_its_concurrency_and_throttle(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INTEL_HOST_THROTTLE_MS", "300")
+    monkeypatch.setenv("INTEL_HOST_MAX_CONCURRENCY", "1")
+    monkeypatch.setenv("RESEARCH_RUN_SOURCE_CONCURRENCY", "3")
+    server = _start_server()
+    try:
+        _, payload = _run_topic([f"{server.base_url}/feed-{name}" for name in ("a", "b", "c")])
+    finally:
+        server.shutdown()
+
+    assert payload["status"] == "completed"
+    assert payload["counters"]["items_new"] == 6
+    assert server.max_in_flight == 1
+    starts = sorted(server.started)
+    assert len(starts) == 9
+    # Request starts stay INTEL_HOST_THROTTLE_MS apart (the response delay is shorter).
+    assert min(later - earlier for earlier, later in zip(starts, starts[1:])) >= 0.29